@@ -0,0 +1,33 @@
+"""add_step_profile_to_arena_simulations
+
+Revision ID: f5a6b7c8d9e0
+Revises: e4f013928c7e
+Create Date: 2026-10-16 09:00:00.000000
+
+Trading Analyst Database Migration
+This migration was auto-generated using Alembic with async SQLAlchemy support.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a6b7c8d9e0'
+down_revision: Union[str, Sequence[str], None] = 'e4f013928c7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add step_profile column to arena_simulations for per-phase day timings."""
+    op.add_column(
+        'arena_simulations',
+        sa.Column('step_profile', sa.JSON(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove step_profile column from arena_simulations."""
+    op.drop_column('arena_simulations', 'step_profile')
@@ -0,0 +1,33 @@
+"""add_decision_log_to_arena_snapshots
+
+Revision ID: a6b7c8d9e0f1
+Revises: f5a6b7c8d9e0
+Create Date: 2026-10-16 10:00:00.000000
+
+Trading Analyst Database Migration
+This migration was auto-generated using Alembic with async SQLAlchemy support.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6b7c8d9e0f1'
+down_revision: Union[str, Sequence[str], None] = 'f5a6b7c8d9e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add decision_log column to arena_snapshots for compact per-day decisions."""
+    op.add_column(
+        'arena_snapshots',
+        sa.Column('decision_log', sa.LargeBinary(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove decision_log column from arena_snapshots."""
+    op.drop_column('arena_snapshots', 'decision_log')
@@ -0,0 +1,87 @@
+"""add_price_coverage_table
+
+Revision ID: b7c8d9e0f1a2
+Revises: a6b7c8d9e0f1
+Create Date: 2026-10-16 11:00:00.000000
+
+Trading Analyst Database Migration
+Creates price_coverage table recording which day ranges of price data have
+been fetched per symbol and interval, so cache freshness no longer has to be
+inferred from the stored price rows.
+
+Freshness is read from price_coverage alone: code that deletes stock_prices
+rows must also delete (or trim) the matching price_coverage segments, or the
+deleted days keep being reported as cached.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c8d9e0f1a2'
+down_revision: Union[str, Sequence[str], None] = 'a6b7c8d9e0f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create price_coverage table and backfill it from stock_prices.
+
+    The backfill gives each (symbol, interval) one segment from its first
+    cached day to its last day fetched after that day ended (US/Eastern),
+    which is the coverage the row-based freshness check assumed.
+    """
+    op.create_table(
+        "price_coverage",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("symbol", sa.String(10), nullable=False),
+        sa.Column("interval", sa.String(10), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("notes", sa.String(1000), nullable=True),
+        sa.CheckConstraint("end_date >= start_date", name="ck_price_coverage_end_gte_start"),
+    )
+    op.create_index("ix_price_coverage_id", "price_coverage", ["id"])
+    op.create_index(
+        "ix_price_coverage_symbol_interval_start",
+        "price_coverage",
+        ["symbol", "interval", "start_date"],
+    )
+    op.create_index("ix_price_coverage_created_at", "price_coverage", ["created_at"])
+    op.create_index("ix_price_coverage_updated_at", "price_coverage", ["updated_at"])
+    op.create_index("ix_price_coverage_deleted_at", "price_coverage", ["deleted_at"])
+
+    op.execute(
+        """
+        INSERT INTO price_coverage (symbol, interval, start_date, end_date, fetched_at)
+        SELECT symbol, interval, start_date, end_date, fetched_at
+        FROM (
+            SELECT
+                symbol,
+                interval,
+                MIN((timestamp AT TIME ZONE 'America/New_York')::date) AS start_date,
+                MAX(
+                    CASE
+                        WHEN (last_fetched_at AT TIME ZONE 'America/New_York')::date
+                            > (timestamp AT TIME ZONE 'America/New_York')::date
+                        THEN (timestamp AT TIME ZONE 'America/New_York')::date
+                    END
+                ) AS end_date,
+                MAX(last_fetched_at) AS fetched_at
+            FROM stock_prices
+            GROUP BY symbol, interval
+        ) AS cached
+        WHERE end_date IS NOT NULL AND end_date >= start_date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop price_coverage table."""
+    op.drop_table("price_coverage")
@@ -1,24 +1,32 @@
 """Arena simulation API endpoints.
 
 This module provides REST API endpoints for managing arena simulations,
-including creation, listing, retrieval, cancellation/deletion, and
-multi-strategy comparison groups.
+including creation, listing, retrieval, cancellation/deletion,
+multi-strategy comparison groups, parameter sweeps, and walk-forward runs.
 """
 
 import logging
 import uuid
-from datetime import datetime, time, timezone
+from collections.abc import AsyncIterator
+from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import defer, noload, selectinload
 
-from app.core.database import get_db_session
+from app.core.database import get_db_session, get_session_factory
 from app.core.deps import get_data_service
-from app.models.arena import ArenaSimulation, SimulationStatus
+from app.models.arena import (
+    ArenaPosition,
+    ArenaSimulation,
+    ArenaSnapshot,
+    PositionStatus,
+    SimulationStatus,
+)
 from app.repositories.agent_config_repository import AgentConfigRepository
 from app.schemas.arena import (
     AgentInfo,
@@ -27,22 +35,43 @@ from app.schemas.arena import (
     ComparisonResponse,
     CreateComparisonRequest,
     CreateSimulationRequest,
+    CreateSweepRequest,
+    CreateWalkForwardRequest,
     EquityCurvePoint,
+    PhaseTiming,
     PortfolioStrategyInfo,
+    PositionPage,
     PositionResponse,
+    RegimePoint,
     SimulationDetailResponse,
     SimulationEquityCurve,
     SimulationListResponse,
+    SimulationProfileResponse,
     SimulationResponse,
+    SnapshotDecisionsResponse,
+    SnapshotPage,
     SnapshotResponse,
+    SweepResponse,
+    SweepResultRow,
+    SweepSummaryResponse,
+    WalkForwardResponse,
+    WalkForwardSummaryResponse,
+    WalkForwardWindowResult,
 )
 from app.services.arena.agent_registry import list_agents
+from app.services.arena.decision_log import snapshot_decisions
+from app.services.arena.shared_price_cache import get_shared_price_cache
+from app.services.arena.simulation_engine import SimulationEngine
+from app.services.arena.walk_forward import build_walk_forward_windows, stitch_equity_curves
 from app.services.data_service import DataService
 from app.services.live20_evaluator import Live20Evaluator
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming an equity curve as NDJSON
+_EQUITY_CURVE_STREAM_BATCH = 1000
+
 
 async def _resolve_scoring_algorithm(
     request: CreateSimulationRequest | CreateComparisonRequest,
@@ -75,6 +104,117 @@ async def _resolve_scoring_algorithm(
     return request.scoring_algorithm
 
 
+async def _resolve_signal_config(
+    request: CreateSimulationRequest,
+    session: AsyncSession,
+) -> dict[str, object]:
+    """Resolve scoring algorithm and signal weights for a new simulation.
+
+    Uses the stored agent config when agent_config_id is provided, otherwise
+    the request's scoring_algorithm with the evaluator's default weights.
+
+    Args:
+        request: Simulation creation request
+        session: Database session for agent config lookup
+
+    Returns:
+        agent_config entries for scoring_algorithm and the four signal scores
+
+    Raises:
+        HTTPException: 404 if agent_config_id is provided but not found
+    """
+    if request.agent_config_id:
+        config_repo = AgentConfigRepository(session)
+        agent_config_obj = await config_repo.get_by_id(request.agent_config_id)
+        if not agent_config_obj:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Agent config {request.agent_config_id} not found",
+            )
+        return {
+            "scoring_algorithm": agent_config_obj.scoring_algorithm,
+            "volume_score": agent_config_obj.volume_score,
+            "candle_pattern_score": agent_config_obj.candle_pattern_score,
+            "cci_score": agent_config_obj.cci_score,
+            "ma20_distance_score": agent_config_obj.ma20_distance_score,
+        }
+
+    defaults = Live20Evaluator.DEFAULT_SIGNAL_SCORES
+    return {
+        "scoring_algorithm": request.scoring_algorithm,
+        "volume_score": defaults["volume"],
+        "candle_pattern_score": defaults["candle"],
+        "cci_score": defaults["momentum"],
+        "ma20_distance_score": defaults["ma20_distance"],
+    }
+
+
+def _build_agent_config(
+    request: CreateSimulationRequest,
+    signal_config: dict[str, object],
+) -> dict[str, object]:
+    """Build a simulation's agent_config from request parameters.
+
+    Args:
+        request: Simulation creation request
+        signal_config: Resolved scoring entries from _resolve_signal_config
+
+    Returns:
+        agent_config dictionary stored on the ArenaSimulation
+    """
+    agent_config: dict[str, object] = {
+        "trailing_stop_pct": request.trailing_stop_pct,
+        "min_buy_score": request.min_buy_score,
+        "scoring_algorithm": signal_config["scoring_algorithm"],
+        "volume_score": signal_config["volume_score"],
+        "candle_pattern_score": signal_config["candle_pattern_score"],
+        "cci_score": signal_config["cci_score"],
+        "ma20_distance_score": signal_config["ma20_distance_score"],
+        "portfolio_strategy": request.portfolio_strategy,
+        "max_per_sector": request.max_per_sector,
+        "max_open_positions": request.max_open_positions,
+        # Layer 4: ATR trailing stop
+        "stop_type": request.stop_type,
+        "atr_stop_multiplier": request.atr_stop_multiplier,
+        "atr_stop_min_pct": request.atr_stop_min_pct,
+        "atr_stop_max_pct": request.atr_stop_max_pct,
+        # Layer 5: Take profit
+        "take_profit_pct": request.take_profit_pct,
+        "take_profit_atr_mult": request.take_profit_atr_mult,
+        # Layer 6: Max holding period
+        "max_hold_days": request.max_hold_days,
+        "max_hold_days_profit": request.max_hold_days_profit,
+        # Layer 3: Percentage-based position sizing
+        "position_size_pct": request.position_size_pct,
+        # Layer 3 (risk-based): Volatility-adjusted position sizing
+        "sizing_mode": request.sizing_mode,
+        "risk_per_trade_pct": request.risk_per_trade_pct,
+        "win_streak_bonus_pct": request.win_streak_bonus_pct,
+        "max_risk_pct": request.max_risk_pct,
+        # Layer 8: Breakeven & profit ratcheting
+        "breakeven_trigger_pct": request.breakeven_trigger_pct,
+        "ratchet_trigger_pct": request.ratchet_trigger_pct,
+        "ratchet_trail_pct": request.ratchet_trail_pct,
+        # Layer 7: Market regime filter
+        "regime_filter": request.regime_filter,
+        "regime_symbol": request.regime_symbol,
+        "regime_sma_period": request.regime_sma_period,
+        "regime_bull_max_positions": request.regime_bull_max_positions,
+        "regime_bear_max_positions": request.regime_bear_max_positions,
+        # Layer 9: Portfolio selector tuning
+        "ma_sweet_spot_center": request.ma_sweet_spot_center,
+        # Layer 10: Entry filters
+        "ibs_max_threshold": request.ibs_max_threshold,
+        "record_decisions": request.record_decisions,
+        "accounting_mode": request.accounting_mode,
+        # Symbols failing the trend gate skip the remaining criteria
+        "short_circuit_trend": True,
+    }
+    if request.agent_config_id is not None:
+        agent_config["agent_config_id"] = request.agent_config_id
+    return agent_config
+
+
 def _build_simulation_response(simulation: ArenaSimulation) -> SimulationResponse:
     """Convert database model to response schema.
 
@@ -232,75 +372,8 @@ async def create_simulation(
     Raises:
         HTTPException: If validation fails
     """
-    # Look up agent config if provided
-    if request.agent_config_id:
-        config_repo = AgentConfigRepository(session)
-        agent_config_obj = await config_repo.get_by_id(request.agent_config_id)
-        if not agent_config_obj:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Agent config {request.agent_config_id} not found",
-            )
-        scoring_algorithm = agent_config_obj.scoring_algorithm
-        volume_score = agent_config_obj.volume_score
-        candle_pattern_score = agent_config_obj.candle_pattern_score
-        cci_score = agent_config_obj.cci_score
-        ma20_distance_score = agent_config_obj.ma20_distance_score
-    else:
-        scoring_algorithm = request.scoring_algorithm
-        defaults = Live20Evaluator.DEFAULT_SIGNAL_SCORES
-        volume_score = defaults["volume"]
-        candle_pattern_score = defaults["candle"]
-        cci_score = defaults["momentum"]
-        ma20_distance_score = defaults["ma20_distance"]
-
-    # Build agent_config dictionary from request parameters
-    agent_config = {
-        "trailing_stop_pct": request.trailing_stop_pct,
-        "min_buy_score": request.min_buy_score,
-        "scoring_algorithm": scoring_algorithm,
-        "volume_score": volume_score,
-        "candle_pattern_score": candle_pattern_score,
-        "cci_score": cci_score,
-        "ma20_distance_score": ma20_distance_score,
-        "portfolio_strategy": request.portfolio_strategy,
-        "max_per_sector": request.max_per_sector,
-        "max_open_positions": request.max_open_positions,
-        # Layer 4: ATR trailing stop
-        "stop_type": request.stop_type,
-        "atr_stop_multiplier": request.atr_stop_multiplier,
-        "atr_stop_min_pct": request.atr_stop_min_pct,
-        "atr_stop_max_pct": request.atr_stop_max_pct,
-        # Layer 5: Take profit
-        "take_profit_pct": request.take_profit_pct,
-        "take_profit_atr_mult": request.take_profit_atr_mult,
-        # Layer 6: Max holding period
-        "max_hold_days": request.max_hold_days,
-        "max_hold_days_profit": request.max_hold_days_profit,
-        # Layer 3: Percentage-based position sizing
-        "position_size_pct": request.position_size_pct,
-        # Layer 3 (risk-based): Volatility-adjusted position sizing
-        "sizing_mode": request.sizing_mode,
-        "risk_per_trade_pct": request.risk_per_trade_pct,
-        "win_streak_bonus_pct": request.win_streak_bonus_pct,
-        "max_risk_pct": request.max_risk_pct,
-        # Layer 8: Breakeven & profit ratcheting
-        "breakeven_trigger_pct": request.breakeven_trigger_pct,
-        "ratchet_trigger_pct": request.ratchet_trigger_pct,
-        "ratchet_trail_pct": request.ratchet_trail_pct,
-        # Layer 7: Market regime filter
-        "regime_filter": request.regime_filter,
-        "regime_symbol": request.regime_symbol,
-        "regime_sma_period": request.regime_sma_period,
-        "regime_bull_max_positions": request.regime_bull_max_positions,
-        "regime_bear_max_positions": request.regime_bear_max_positions,
-        # Layer 9: Portfolio selector tuning
-        "ma_sweet_spot_center": request.ma_sweet_spot_center,
-        # Layer 10: Entry filters
-        "ibs_max_threshold": request.ibs_max_threshold,
-    }
-    if request.agent_config_id is not None:
-        agent_config["agent_config_id"] = request.agent_config_id
+    signal_config = await _resolve_signal_config(request, session)
+    agent_config = _build_agent_config(request, signal_config)
 
     # Create simulation record
     simulation = ArenaSimulation(
@@ -365,6 +438,7 @@ async def list_simulations(
 
     stmt = (
         select(ArenaSimulation)
+        .options(noload(ArenaSimulation.positions), noload(ArenaSimulation.snapshots))
         .order_by(ArenaSimulation.created_at.desc())
         .limit(limit)
         .offset(offset)
@@ -380,12 +454,158 @@ async def list_simulations(
     )
 
 
+def _position_response(
+    pos: ArenaPosition, sector_map: dict[str, str | None]
+) -> PositionResponse:
+    """Convert a position model to its response schema."""
+    return PositionResponse(
+        id=pos.id,
+        symbol=pos.symbol,
+        status=pos.status,
+        signal_date=pos.signal_date,
+        entry_date=pos.entry_date,
+        entry_price=pos.entry_price,
+        shares=pos.shares,
+        highest_price=pos.highest_price,
+        current_stop=pos.current_stop,
+        exit_date=pos.exit_date,
+        exit_price=pos.exit_price,
+        exit_reason=pos.exit_reason,
+        realized_pnl=pos.realized_pnl,
+        return_pct=pos.return_pct,
+        agent_reasoning=pos.agent_reasoning,
+        agent_score=pos.agent_score,
+        sector=sector_map.get(pos.symbol),
+    )
+
+
+def _snapshot_response(
+    snap: ArenaSnapshot, symbols: list[str], include_decisions: bool
+) -> SnapshotResponse:
+    """Convert a snapshot model to its response schema.
+
+    Args:
+        snap: Snapshot, with decision columns loaded if include_decisions
+        symbols: The simulation's symbols (to decode decision logs)
+        include_decisions: Whether to decode and include decisions
+    """
+    return SnapshotResponse(
+        id=snap.id,
+        snapshot_date=snap.snapshot_date,
+        day_number=snap.day_number,
+        cash=snap.cash,
+        positions_value=snap.positions_value,
+        total_equity=snap.total_equity,
+        daily_pnl=snap.daily_pnl,
+        daily_return_pct=snap.daily_return_pct,
+        cumulative_return_pct=snap.cumulative_return_pct,
+        open_position_count=snap.open_position_count,
+        decisions=(
+            snapshot_decisions(symbols, snap.decision_log, snap.decisions)
+            if include_decisions
+            else None
+        ),
+    )
+
+
+def _snapshot_select(simulation_id: int, include_decisions: bool) -> Select:
+    """Select a simulation's snapshots in day order, deferring decisions unless needed."""
+    stmt = (
+        select(ArenaSnapshot)
+        .where(ArenaSnapshot.simulation_id == simulation_id)
+        .order_by(ArenaSnapshot.day_number)
+    )
+    if not include_decisions:
+        stmt = stmt.options(defer(ArenaSnapshot.decisions), defer(ArenaSnapshot.decision_log))
+    return stmt
+
+
+async def _get_simulation_or_404(session: AsyncSession, simulation_id: int) -> ArenaSimulation:
+    """Load a simulation row without its positions and snapshots.
+
+    Raises:
+        HTTPException: 404 if the simulation does not exist
+    """
+    simulation = await session.get(
+        ArenaSimulation,
+        simulation_id,
+        options=[noload(ArenaSimulation.positions), noload(ArenaSimulation.snapshots)],
+    )
+    if simulation is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Simulation {simulation_id} not found",
+        )
+    return simulation
+
+
+async def _build_simulation_detail(
+    simulation: ArenaSimulation,
+    session: AsyncSession,
+    data_service: DataService,
+    include_positions: bool = True,
+    include_snapshots: bool = True,
+    include_decisions: bool = False,
+) -> SimulationDetailResponse:
+    """Build the detail response (positions and snapshots) for a simulation.
+
+    Positions and snapshots are queried here rather than through the
+    relationships, so callers can load the simulation with ``noload``.
+
+    Args:
+        simulation: Simulation to describe
+        session: Database session
+        data_service: Market data service for sector prefetch
+        include_positions: Include all positions
+        include_snapshots: Include all snapshots
+        include_decisions: Include each snapshot's decisions
+
+    Returns:
+        SimulationDetailResponse with simulation, positions, and snapshots
+    """
+    positions: list[PositionResponse] = []
+    if include_positions:
+        result = await session.execute(
+            select(ArenaPosition)
+            .where(ArenaPosition.simulation_id == simulation.id)
+            .order_by(ArenaPosition.id)
+        )
+        position_rows = result.scalars().all()
+        # Build sector lookup map for all position symbols, backfilling any missing
+        # entries from Yahoo Finance via batch_prefetch_sectors.
+        sector_map: dict[str, str | None] = {}
+        if position_rows:
+            symbols = list({pos.symbol for pos in position_rows})
+            sector_map = await data_service.batch_prefetch_sectors(symbols, session)
+        positions = [_position_response(pos, sector_map) for pos in position_rows]
+
+    snapshots: list[SnapshotResponse] = []
+    if include_snapshots:
+        result = await session.execute(_snapshot_select(simulation.id, include_decisions))
+        snapshots = [
+            _snapshot_response(snap, simulation.symbols, include_decisions)
+            for snap in result.scalars().all()
+        ]
+
+    return SimulationDetailResponse(
+        simulation=_build_simulation_response(simulation),
+        positions=positions,
+        snapshots=snapshots,
+    )
+
+
 @router.get(
     "/simulations/{simulation_id}",
     response_model=SimulationDetailResponse,
     status_code=status.HTTP_200_OK,
     summary="Get Arena Simulation Details",
-    description="Get detailed simulation info including positions and daily snapshots.",
+    description=(
+        "Get detailed simulation info including positions and daily snapshots. "
+        "Snapshot decisions are only included with include_decisions=true; for "
+        "long simulations use the paginated positions/snapshots endpoints and the "
+        "equity curve instead. With include_regime=true the regime filter's "
+        "market regime per trading day is included, for shading charts."
+    ),
     operation_id="get_arena_simulation",
     responses={
         404: {"description": "Simulation not found"},
@@ -393,15 +613,29 @@ async def list_simulations(
 )
 async def get_simulation(
     simulation_id: int,
+    include_positions: bool = Query(default=True, description="Include all positions"),
+    include_snapshots: bool = Query(default=True, description="Include all daily snapshots"),
+    include_decisions: bool = Query(
+        default=False, description="Include each snapshot's agent decisions"
+    ),
+    include_regime: bool = Query(
+        default=False, description="Include the regime filter's market regime per day"
+    ),
     session: AsyncSession = Depends(get_db_session),
     data_service: DataService = Depends(get_data_service),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
 ) -> SimulationDetailResponse:
     """Get detailed simulation info.
 
     Args:
         simulation_id: Simulation primary key
+        include_positions: Include all positions
+        include_snapshots: Include all daily snapshots
+        include_decisions: Include snapshot decisions
+        include_regime: Include the market regime series
         session: Database session
         data_service: Market data service for sector prefetch
+        session_factory: Session factory for the engine's price loading
 
     Returns:
         SimulationDetailResponse with simulation, positions, and snapshots
@@ -409,69 +643,238 @@ async def get_simulation(
     Raises:
         HTTPException: If simulation not found
     """
-    stmt = select(ArenaSimulation).where(ArenaSimulation.id == simulation_id)
-    result = await session.execute(stmt)
-    simulation = result.scalar_one_or_none()
-
-    if not simulation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Simulation {simulation_id} not found",
+    simulation = await _get_simulation_or_404(session, simulation_id)
+    detail = await _build_simulation_detail(
+        simulation,
+        session,
+        data_service,
+        include_positions=include_positions,
+        include_snapshots=include_snapshots,
+        include_decisions=include_decisions,
+    )
+    if include_regime:
+        engine = SimulationEngine(
+            session, session_factory=session_factory, price_cache=get_shared_price_cache()
         )
+        detail.regime = [
+            RegimePoint(date=day, regime=regime)
+            for day, regime in await engine.market_regimes(simulation)
+        ]
+    return detail
+
+
+@router.get(
+    "/simulations/{simulation_id}/positions",
+    response_model=PositionPage,
+    status_code=status.HTTP_200_OK,
+    summary="List Simulation Positions",
+    description=(
+        "Cursor-paginated positions of a simulation, oldest first. Pass the "
+        "returned next_cursor as cursor to fetch the next page."
+    ),
+    operation_id="list_arena_simulation_positions",
+    responses={
+        404: {"description": "Simulation not found"},
+    },
+)
+async def list_simulation_positions(
+    simulation_id: int,
+    cursor: int | None = Query(default=None, description="next_cursor of the previous page"),
+    limit: int = Query(default=200, ge=1, le=1000, description="Maximum results"),
+    position_status: PositionStatus | None = Query(
+        default=None, alias="status", description="Only positions with this status"
+    ),
+    start_date: date | None = Query(default=None, description="Earliest signal date"),
+    end_date: date | None = Query(default=None, description="Latest signal date"),
+    session: AsyncSession = Depends(get_db_session),
+    data_service: DataService = Depends(get_data_service),
+) -> PositionPage:
+    """List one page of a simulation's positions.
 
-    # Build sector lookup map for all position symbols, backfilling any missing
-    # entries from Yahoo Finance via batch_prefetch_sectors.
+    Args:
+        simulation_id: Simulation primary key
+        cursor: Position ID to continue after
+        limit: Maximum positions per page
+        position_status: Optional status filter
+        start_date: Optional inclusive lower bound on signal_date
+        end_date: Optional inclusive upper bound on signal_date
+        session: Database session
+        data_service: Market data service for sector prefetch
+
+    Returns:
+        PositionPage with the positions and the next page's cursor
+
+    Raises:
+        HTTPException: If simulation not found
+    """
+    await _get_simulation_or_404(session, simulation_id)
+
+    stmt = select(ArenaPosition).where(ArenaPosition.simulation_id == simulation_id)
+    if cursor is not None:
+        stmt = stmt.where(ArenaPosition.id > cursor)
+    if position_status is not None:
+        stmt = stmt.where(ArenaPosition.status == position_status.value)
+    if start_date is not None:
+        stmt = stmt.where(ArenaPosition.signal_date >= start_date)
+    if end_date is not None:
+        stmt = stmt.where(ArenaPosition.signal_date <= end_date)
+    result = await session.execute(stmt.order_by(ArenaPosition.id).limit(limit + 1))
+    rows = result.scalars().all()
+
+    page = rows[:limit]
     sector_map: dict[str, str | None] = {}
-    if simulation.positions:
-        symbols = list({pos.symbol for pos in simulation.positions})
-        sector_map = await data_service.batch_prefetch_sectors(symbols, session)
-
-    # Positions and snapshots are loaded via selectin relationship
-    positions = [
-        PositionResponse(
-            id=pos.id,
-            symbol=pos.symbol,
-            status=pos.status,
-            signal_date=pos.signal_date,
-            entry_date=pos.entry_date,
-            entry_price=pos.entry_price,
-            shares=pos.shares,
-            highest_price=pos.highest_price,
-            current_stop=pos.current_stop,
-            exit_date=pos.exit_date,
-            exit_price=pos.exit_price,
-            exit_reason=pos.exit_reason,
-            realized_pnl=pos.realized_pnl,
-            return_pct=pos.return_pct,
-            agent_reasoning=pos.agent_reasoning,
-            agent_score=pos.agent_score,
-            sector=sector_map.get(pos.symbol),
+    if page:
+        sector_map = await data_service.batch_prefetch_sectors(
+            list({pos.symbol for pos in page}), session
         )
-        for pos in simulation.positions
-    ]
+    return PositionPage(
+        items=[_position_response(pos, sector_map) for pos in page],
+        next_cursor=page[-1].id if len(rows) > limit else None,
+    )
 
-    snapshots = [
-        SnapshotResponse(
-            id=snap.id,
-            snapshot_date=snap.snapshot_date,
-            day_number=snap.day_number,
-            cash=snap.cash,
-            positions_value=snap.positions_value,
-            total_equity=snap.total_equity,
-            daily_pnl=snap.daily_pnl,
-            daily_return_pct=snap.daily_return_pct,
-            cumulative_return_pct=snap.cumulative_return_pct,
-            open_position_count=snap.open_position_count,
-            decisions=snap.decisions,
-        )
-        for snap in simulation.snapshots
-    ]
 
-    return SimulationDetailResponse(
-        simulation=_build_simulation_response(simulation),
-        positions=positions,
-        snapshots=snapshots,
+@router.get(
+    "/simulations/{simulation_id}/snapshots",
+    response_model=SnapshotPage,
+    status_code=status.HTTP_200_OK,
+    summary="List Simulation Snapshots",
+    description=(
+        "Cursor-paginated daily snapshots of a simulation in day order. Pass the "
+        "returned next_cursor as cursor to fetch the next page."
+    ),
+    operation_id="list_arena_simulation_snapshots",
+    responses={
+        404: {"description": "Simulation not found"},
+    },
+)
+async def list_simulation_snapshots(
+    simulation_id: int,
+    cursor: int | None = Query(default=None, description="next_cursor of the previous page"),
+    limit: int = Query(default=250, ge=1, le=1000, description="Maximum results"),
+    start_date: date | None = Query(default=None, description="Earliest snapshot date"),
+    end_date: date | None = Query(default=None, description="Latest snapshot date"),
+    include_decisions: bool = Query(
+        default=False, description="Include each snapshot's agent decisions"
+    ),
+    session: AsyncSession = Depends(get_db_session),
+) -> SnapshotPage:
+    """List one page of a simulation's snapshots.
+
+    Args:
+        simulation_id: Simulation primary key
+        cursor: Day number to continue after
+        limit: Maximum snapshots per page
+        start_date: Optional inclusive lower bound on snapshot_date
+        end_date: Optional inclusive upper bound on snapshot_date
+        include_decisions: Include snapshot decisions
+        session: Database session
+
+    Returns:
+        SnapshotPage with the snapshots and the next page's cursor
+
+    Raises:
+        HTTPException: If simulation not found
+    """
+    simulation = await _get_simulation_or_404(session, simulation_id)
+
+    stmt = _snapshot_select(simulation_id, include_decisions)
+    if cursor is not None:
+        stmt = stmt.where(ArenaSnapshot.day_number > cursor)
+    if start_date is not None:
+        stmt = stmt.where(ArenaSnapshot.snapshot_date >= start_date)
+    if end_date is not None:
+        stmt = stmt.where(ArenaSnapshot.snapshot_date <= end_date)
+    result = await session.execute(stmt.limit(limit + 1))
+    rows = result.scalars().all()
+
+    page = rows[:limit]
+    return SnapshotPage(
+        items=[
+            _snapshot_response(snap, simulation.symbols, include_decisions) for snap in page
+        ],
+        next_cursor=page[-1].day_number if len(rows) > limit else None,
+    )
+
+
+@router.get(
+    "/simulations/{simulation_id}/equity-curve",
+    response_model=SimulationEquityCurve,
+    status_code=status.HTTP_200_OK,
+    summary="Get Simulation Equity Curve",
+    description=(
+        "Daily total equity of a simulation. With format=ndjson the points are "
+        "streamed as newline-delimited JSON, one object per line, without "
+        "building the whole curve in memory."
+    ),
+    operation_id="get_arena_simulation_equity_curve",
+    responses={
+        200: {"content": {"application/x-ndjson": {}}},
+        404: {"description": "Simulation not found"},
+    },
+)
+async def get_simulation_equity_curve(
+    simulation_id: int,
+    start_date: date | None = Query(default=None, description="Earliest snapshot date"),
+    end_date: date | None = Query(default=None, description="Latest snapshot date"),
+    response_format: Literal["json", "ndjson"] = Query(
+        default="json", alias="format", description="Response format"
+    ),
+    session: AsyncSession = Depends(get_db_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> SimulationEquityCurve | StreamingResponse:
+    """Get a simulation's equity curve.
+
+    Args:
+        simulation_id: Simulation primary key
+        start_date: Optional inclusive lower bound on snapshot_date
+        end_date: Optional inclusive upper bound on snapshot_date
+        response_format: "json" for one document, "ndjson" to stream points
+        session: Database session
+        session_factory: Session factory for the streaming query
+
+    Returns:
+        SimulationEquityCurve, or a streaming NDJSON response of EquityCurvePoint
+
+    Raises:
+        HTTPException: If simulation not found
+    """
+    simulation = await _get_simulation_or_404(session, simulation_id)
+
+    stmt = (
+        select(ArenaSnapshot.snapshot_date, ArenaSnapshot.total_equity)
+        .where(ArenaSnapshot.simulation_id == simulation_id)
+        .order_by(ArenaSnapshot.day_number)
     )
+    if start_date is not None:
+        stmt = stmt.where(ArenaSnapshot.snapshot_date >= start_date)
+    if end_date is not None:
+        stmt = stmt.where(ArenaSnapshot.snapshot_date <= end_date)
+
+    if response_format == "json":
+        result = await session.execute(stmt)
+        return SimulationEquityCurve(
+            simulation_id=simulation_id,
+            portfolio_strategy=(simulation.agent_config or {}).get("portfolio_strategy"),
+            snapshots=[
+                EquityCurvePoint(snapshot_date=row.snapshot_date, total_equity=row.total_equity)
+                for row in result
+            ],
+        )
+
+    async def stream_points() -> AsyncIterator[str]:
+        # A dedicated session: the response body is sent after the request's
+        # dependencies may already have been cleaned up.
+        async with session_factory() as stream_session:
+            rows = await stream_session.stream(
+                stmt.execution_options(yield_per=_EQUITY_CURVE_STREAM_BATCH)
+            )
+            async for row in rows:
+                point = EquityCurvePoint(
+                    snapshot_date=row.snapshot_date, total_equity=row.total_equity
+                )
+                yield point.model_dump_json() + "\n"
+
+    return StreamingResponse(stream_points(), media_type="application/x-ndjson")
 
 
 @router.post(
@@ -491,7 +894,11 @@ async def cancel_simulation(
     session: AsyncSession = Depends(get_db_session),
 ) -> None:
     """Cancel an Arena simulation (pending/running/paused only)."""
-    stmt = select(ArenaSimulation).where(ArenaSimulation.id == simulation_id)
+    stmt = (
+        select(ArenaSimulation)
+        .options(noload(ArenaSimulation.positions), noload(ArenaSimulation.snapshots))
+        .where(ArenaSimulation.id == simulation_id)
+    )
     result = await session.execute(stmt)
     simulation = result.scalar_one_or_none()
 
@@ -658,6 +1065,135 @@ async def get_benchmark_data(
     ]
 
 
+@router.get(
+    "/simulations/{simulation_id}/profile",
+    response_model=SimulationProfileResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Simulation Step Profile",
+    description=(
+        "Per-phase timings (agent evaluation, ATR, portfolio selection, snapshot, "
+        "commit) and counters (symbols evaluated, cache hits/misses, DB statements) "
+        "accumulated over the simulation's days. Updated at every commit."
+    ),
+    operation_id="get_arena_simulation_profile",
+    responses={
+        404: {"description": "Simulation not found"},
+    },
+)
+async def get_simulation_profile(
+    simulation_id: int,
+    session: AsyncSession = Depends(get_db_session),
+) -> SimulationProfileResponse:
+    """Get the step profile of a simulation.
+
+    Args:
+        simulation_id: Simulation primary key
+        session: Database session
+
+    Returns:
+        SimulationProfileResponse with phase timings and counters
+
+    Raises:
+        HTTPException: If simulation not found
+    """
+    result = await session.execute(
+        select(ArenaSimulation.step_profile).where(ArenaSimulation.id == simulation_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Simulation {simulation_id} not found",
+        )
+
+    profile = row.step_profile or {}
+    counters = profile.get("counters", {})
+    return SimulationProfileResponse(
+        simulation_id=simulation_id,
+        days=counters.get("days", 0),
+        phases={
+            name: PhaseTiming(
+                total_ms=phase["total_ms"],
+                calls=phase["calls"],
+                mean_ms=round(phase["total_ms"] / phase["calls"], 3) if phase["calls"] else 0.0,
+            )
+            for name, phase in profile.get("phases", {}).items()
+        },
+        counters=counters,
+    )
+
+
+@router.get(
+    "/simulations/{simulation_id}/snapshots/{day_number}/decisions",
+    response_model=SnapshotDecisionsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Simulation Day Decisions",
+    description=(
+        "Agent decisions for one simulation day, with reasoning. Snapshots store "
+        "decisions compactly without reasoning text, so the agent is re-run for "
+        "that day to rebuild it."
+    ),
+    operation_id="get_arena_snapshot_decisions",
+    responses={
+        404: {"description": "Simulation or snapshot not found"},
+    },
+)
+async def get_snapshot_decisions(
+    simulation_id: int,
+    day_number: int,
+    session: AsyncSession = Depends(get_db_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> SnapshotDecisionsResponse:
+    """Get one day's decisions with the agent's reasoning.
+
+    Args:
+        simulation_id: Simulation primary key
+        day_number: Snapshot day number (0-indexed)
+        session: Database session
+        session_factory: Session factory for the engine's price loading
+
+    Returns:
+        SnapshotDecisionsResponse with decisions keyed by symbol
+
+    Raises:
+        HTTPException: If the simulation or snapshot is not found
+    """
+    simulation = await session.get(
+        ArenaSimulation,
+        simulation_id,
+        options=[noload(ArenaSimulation.positions), noload(ArenaSimulation.snapshots)],
+    )
+    if simulation is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Simulation {simulation_id} not found",
+        )
+
+    result = await session.execute(
+        select(ArenaSnapshot).where(
+            ArenaSnapshot.simulation_id == simulation_id,
+            ArenaSnapshot.day_number == day_number,
+        )
+    )
+    snapshot = result.scalar_one_or_none()
+    if snapshot is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Snapshot for day {day_number} not found",
+        )
+
+    engine = SimulationEngine(
+        session, session_factory=session_factory, price_cache=get_shared_price_cache()
+    )
+    decisions = await engine.explain_decisions(simulation, snapshot)
+    return SnapshotDecisionsResponse(
+        simulation_id=simulation_id,
+        day_number=day_number,
+        snapshot_date=snapshot.snapshot_date,
+        decisions=decisions,
+    )
+
+
 @router.post(
     "/comparisons",
     response_model=ComparisonResponse,
@@ -719,6 +1255,10 @@ async def create_comparison(
         "max_risk_pct": request.max_risk_pct,
         # Layer 10: Entry filters
         "ibs_max_threshold": request.ibs_max_threshold,
+        "record_decisions": request.record_decisions,
+        "accounting_mode": request.accounting_mode,
+        # Symbols failing the trend gate skip the remaining criteria
+        "short_circuit_trend": True,
     }
     if request.agent_config_id is not None:
         base_agent_config["agent_config_id"] = request.agent_config_id
@@ -799,6 +1339,7 @@ async def get_comparison(
     """
     stmt = (
         select(ArenaSimulation)
+        .options(noload(ArenaSimulation.positions), noload(ArenaSimulation.snapshots))
         .where(ArenaSimulation.group_id == group_id)
         .order_by(ArenaSimulation.id)
     )
@@ -868,3 +1409,419 @@ async def get_comparison_equity_curves(
             for sim in simulations
         ],
     )
+
+
+# Sweep ranking metrics: (attribute, higher_is_better)
+_SWEEP_SORT_METRICS: dict[str, tuple[str, bool]] = {
+    "total_return_pct": ("total_return_pct", True),
+    "sharpe_ratio": ("sharpe_ratio", True),
+    "profit_factor": ("profit_factor", True),
+    "max_drawdown_pct": ("max_drawdown_pct", False),
+}
+
+
+@router.post(
+    "/sweeps",
+    response_model=SweepResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Create Parameter Sweep",
+    description=(
+        "Runs one agent over a grid of configurations: one simulation per combination "
+        "of parameter_grid values, all sharing a group_id. Configurations run in parallel "
+        "across worker processes on one shared copy of the price data and agent signals, so "
+        "each symbol-day is scored once. Returns 202 immediately; poll GET /sweeps/{group_id} "
+        "for ranked results."
+    ),
+    operation_id="create_arena_sweep",
+    responses={
+        422: {"description": "Validation error (unknown parameter, invalid combination, too many configs)"},
+        404: {"description": "Agent config not found (when agent_config_id is provided)"},
+    },
+)
+async def create_sweep(
+    request: CreateSweepRequest,
+    session: AsyncSession = Depends(get_db_session),
+) -> SweepResponse:
+    """Create a parameter sweep.
+
+    Each grid combination becomes a PENDING simulation; the swept values are
+    stored in its agent_config under ``sweep_params``.
+
+    Args:
+        request: Base configuration plus parameter_grid
+        session: Database session
+
+    Returns:
+        SweepResponse with group_id and all created simulations
+
+    Raises:
+        HTTPException: 404 if agent_config_id is provided but not found
+    """
+    signal_config = await _resolve_signal_config(request, session)
+
+    group_id = str(uuid.uuid4())
+    simulations = []
+
+    for params, config_request in request.expand():
+        agent_config = {
+            **_build_agent_config(config_request, signal_config),
+            "sweep_params": params,
+        }
+        label = ", ".join(f"{name}={value}" for name, value in params.items())
+
+        sim = ArenaSimulation(
+            name=f"{request.name or 'Sweep'} [{label}]",
+            stock_list_id=request.stock_list_id,
+            stock_list_name=request.stock_list_name,
+            symbols=request.symbols,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            initial_capital=request.initial_capital,
+            position_size=request.position_size,
+            agent_type=request.agent_type,
+            agent_config=agent_config,
+            group_id=group_id,
+            status=SimulationStatus.PENDING.value,
+            current_day=0,
+            total_days=0,
+        )
+        session.add(sim)
+        simulations.append(sim)
+
+    await session.commit()
+    for sim in simulations:
+        await session.refresh(sim)
+
+    logger.info(
+        "Created parameter sweep %s with %d configurations over %s",
+        group_id,
+        len(simulations),
+        sorted(request.parameter_grid),
+    )
+
+    return SweepResponse(
+        group_id=group_id,
+        simulations=[_build_simulation_response(s) for s in simulations],
+    )
+
+
+@router.get(
+    "/sweeps/{group_id}",
+    response_model=SweepSummaryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Parameter Sweep Results",
+    description=(
+        "Returns one summary row per sweep configuration, ranked by sort_by "
+        "(max_drawdown_pct ranks lowest first, other metrics highest first). "
+        "With top_k > 0, also returns full positions and snapshots for the "
+        "best top_k completed configurations."
+    ),
+    operation_id="get_arena_sweep",
+    responses={
+        404: {"description": "Sweep not found"},
+    },
+)
+async def get_sweep(
+    group_id: str,
+    sort_by: Literal[
+        "total_return_pct", "sharpe_ratio", "profit_factor", "max_drawdown_pct"
+    ] = Query("total_return_pct", description="Metric to rank configurations by"),
+    top_k: int = Query(0, ge=0, le=10, description="Full results for the best K configurations"),
+    session: AsyncSession = Depends(get_db_session),
+    data_service: DataService = Depends(get_data_service),
+) -> SweepSummaryResponse:
+    """Get ranked results of a parameter sweep.
+
+    Args:
+        group_id: The UUID shared by all simulations in the sweep
+        sort_by: Metric to rank configurations by
+        top_k: Number of best completed configurations to return in full
+        session: Database session
+        data_service: Market data service for sector prefetch (top_k details)
+
+    Returns:
+        SweepSummaryResponse with ranked rows and optional top-K details
+
+    Raises:
+        HTTPException: 404 if no simulations found for the given group_id
+    """
+    # Summary rows only need simulation columns; skip positions and snapshots.
+    stmt = (
+        select(ArenaSimulation)
+        .where(ArenaSimulation.group_id == group_id)
+        .order_by(ArenaSimulation.id)
+        .options(noload(ArenaSimulation.positions), noload(ArenaSimulation.snapshots))
+    )
+    result = await session.execute(stmt)
+    simulations = result.scalars().all()
+
+    if not simulations:
+        logger.warning("Sweep not found: %s", group_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sweep not found",
+        )
+
+    attribute, higher_is_better = _SWEEP_SORT_METRICS[sort_by]
+
+    def rank_key(sim: ArenaSimulation) -> tuple[bool, Decimal]:
+        value = getattr(sim, attribute)
+        if value is None:
+            return (True, Decimal(0))  # No result yet: rank last
+        return (False, -value if higher_is_better else value)
+
+    ranked = sorted(simulations, key=rank_key)
+    completed = [s for s in ranked if s.status == SimulationStatus.COMPLETED.value]
+
+    top_results: list[SimulationDetailResponse] = []
+    if top_k and completed:
+        for sim in completed[:top_k]:
+            top_results.append(await _build_simulation_detail(sim, session, data_service))
+
+    return SweepSummaryResponse(
+        group_id=group_id,
+        total_configs=len(simulations),
+        completed_configs=len(completed),
+        sort_by=sort_by,
+        rows=[
+            SweepResultRow(
+                simulation_id=sim.id,
+                params=(sim.agent_config or {}).get("sweep_params", {}),
+                status=sim.status,
+                final_equity=sim.final_equity,
+                total_return_pct=sim.total_return_pct,
+                max_drawdown_pct=sim.max_drawdown_pct,
+                sharpe_ratio=sim.sharpe_ratio,
+                profit_factor=sim.profit_factor,
+                total_trades=sim.total_trades,
+                winning_trades=sim.winning_trades,
+            )
+            for sim in ranked
+        ],
+        top_results=top_results,
+    )
+
+
+@router.post(
+    "/walk-forward",
+    response_model=WalkForwardResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Create Walk-Forward Backtest",
+    description=(
+        "Splits start_date..end_date into rolling train/test windows and creates a "
+        "train and a test sub-simulation per window, all sharing a group_id. The whole "
+        "range is loaded once and shared by every sub-simulation across worker processes, "
+        "and windows run in parallel across worker processes. Returns 202 immediately; "
+        "poll GET /walk-forward/{group_id} for per-window results and the stitched "
+        "out-of-sample equity curve."
+    ),
+    operation_id="create_arena_walk_forward",
+    responses={
+        422: {"description": "Validation error (range too short, too many windows)"},
+        404: {"description": "Agent config not found (when agent_config_id is provided)"},
+    },
+)
+async def create_walk_forward(
+    request: CreateWalkForwardRequest,
+    session: AsyncSession = Depends(get_db_session),
+) -> WalkForwardResponse:
+    """Create a walk-forward backtest.
+
+    Each sub-simulation stores its window in agent_config under
+    ``walk_forward`` and the whole run's dates under ``price_range``.
+
+    Args:
+        request: Base configuration plus window lengths
+        session: Database session
+
+    Returns:
+        WalkForwardResponse with group_id and all created sub-simulations
+
+    Raises:
+        HTTPException: 404 if agent_config_id is provided but not found
+    """
+    signal_config = await _resolve_signal_config(request, session)
+    base_agent_config = _build_agent_config(request, signal_config)
+    price_range = {
+        "start": request.start_date.isoformat(),
+        "end": request.end_date.isoformat(),
+    }
+    windows = build_walk_forward_windows(
+        request.start_date,
+        request.end_date,
+        request.train_days,
+        request.test_days,
+        request.step_days,
+    )
+
+    group_id = str(uuid.uuid4())
+    simulations = []
+
+    for window in windows:
+        window_info = {
+            "window": window.index,
+            "train_start": window.train_start.isoformat(),
+            "train_end": window.train_end.isoformat(),
+            "test_start": window.test_start.isoformat(),
+            "test_end": window.test_end.isoformat(),
+        }
+        periods = (
+            ("train", window.train_start, window.train_end),
+            ("test", window.test_start, window.test_end),
+        )
+        for role, start_date, end_date in periods:
+            sim = ArenaSimulation(
+                name=f"{request.name or 'Walk-forward'} [w{window.index} {role}]",
+                stock_list_id=request.stock_list_id,
+                stock_list_name=request.stock_list_name,
+                symbols=request.symbols,
+                start_date=start_date,
+                end_date=end_date,
+                initial_capital=request.initial_capital,
+                position_size=request.position_size,
+                agent_type=request.agent_type,
+                agent_config={
+                    **base_agent_config,
+                    "price_range": price_range,
+                    "walk_forward": {**window_info, "role": role},
+                },
+                group_id=group_id,
+                status=SimulationStatus.PENDING.value,
+                current_day=0,
+                total_days=0,
+            )
+            session.add(sim)
+            simulations.append(sim)
+
+    await session.commit()
+    for sim in simulations:
+        await session.refresh(sim)
+
+    logger.info(
+        "Created walk-forward run %s: %d windows (train=%dd, test=%dd, step=%dd)",
+        group_id,
+        len(windows),
+        request.train_days,
+        request.test_days,
+        request.step_days or request.test_days,
+    )
+
+    return WalkForwardResponse(
+        group_id=group_id,
+        simulations=[_build_simulation_response(s) for s in simulations],
+    )
+
+
+@router.get(
+    "/walk-forward/{group_id}",
+    response_model=WalkForwardSummaryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Walk-Forward Results",
+    description=(
+        "Returns train vs test results per window and the out-of-sample equity curve "
+        "stitched from consecutive completed test windows."
+    ),
+    operation_id="get_arena_walk_forward",
+    responses={
+        404: {"description": "Walk-forward run not found"},
+    },
+)
+async def get_walk_forward(
+    group_id: str,
+    session: AsyncSession = Depends(get_db_session),
+) -> WalkForwardSummaryResponse:
+    """Get per-window results and the stitched equity curve of a walk-forward run.
+
+    Args:
+        group_id: The UUID shared by all sub-simulations of the run
+        session: Database session
+
+    Returns:
+        WalkForwardSummaryResponse
+
+    Raises:
+        HTTPException: 404 if no walk-forward sub-simulations exist for group_id
+    """
+    stmt = (
+        select(ArenaSimulation)
+        .where(ArenaSimulation.group_id == group_id)
+        .order_by(ArenaSimulation.id)
+        .options(noload(ArenaSimulation.positions), noload(ArenaSimulation.snapshots))
+    )
+    result = await session.execute(stmt)
+    by_window: dict[int, dict[str, ArenaSimulation]] = {}
+    for sim in result.scalars().all():
+        info = (sim.agent_config or {}).get("walk_forward")
+        if info:
+            by_window.setdefault(info["window"], {})[info["role"]] = sim
+
+    if not by_window:
+        logger.warning("Walk-forward run not found: %s", group_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Walk-forward run not found",
+        )
+
+    windows: list[WalkForwardWindowResult] = []
+    stitch_ids: list[int] = []
+    chain_complete = True
+    for index in sorted(by_window):
+        train, test = by_window[index]["train"], by_window[index]["test"]
+        info = test.agent_config["walk_forward"]
+        windows.append(
+            WalkForwardWindowResult(
+                window=index,
+                train_start=info["train_start"],
+                train_end=info["train_end"],
+                test_start=info["test_start"],
+                test_end=info["test_end"],
+                train_simulation_id=train.id,
+                test_simulation_id=test.id,
+                train_status=train.status,
+                test_status=test.status,
+                train_return_pct=train.total_return_pct,
+                test_return_pct=test.total_return_pct,
+                test_max_drawdown_pct=test.max_drawdown_pct,
+                test_total_trades=test.total_trades,
+            )
+        )
+        # Stitch only an unbroken prefix of completed test windows
+        chain_complete = chain_complete and test.status == SimulationStatus.COMPLETED.value
+        if chain_complete:
+            stitch_ids.append(test.id)
+
+    curves: dict[int, list[tuple[date, Decimal]]] = {sim_id: [] for sim_id in stitch_ids}
+    if stitch_ids:
+        snapshot_rows = await session.execute(
+            select(
+                ArenaSnapshot.simulation_id,
+                ArenaSnapshot.snapshot_date,
+                ArenaSnapshot.total_equity,
+            )
+            .where(ArenaSnapshot.simulation_id.in_(stitch_ids))
+            .order_by(ArenaSnapshot.simulation_id, ArenaSnapshot.snapshot_date)
+        )
+        for sim_id, snapshot_date, total_equity in snapshot_rows.all():
+            curves[sim_id].append((snapshot_date, total_equity))
+
+    initial_capital = by_window[min(by_window)]["test"].initial_capital
+    stitched = stitch_equity_curves([curves[sim_id] for sim_id in stitch_ids], initial_capital)
+    stitched_return_pct = (
+        ((stitched[-1][1] - initial_capital) / initial_capital * 100).quantize(Decimal("0.01"))
+        if stitched
+        else None
+    )
+
+    return WalkForwardSummaryResponse(
+        group_id=group_id,
+        total_windows=len(windows),
+        completed_windows=sum(
+            1 for w in windows if w.test_status == SimulationStatus.COMPLETED.value
+        ),
+        windows=windows,
+        equity_curve=[
+            EquityCurvePoint(snapshot_date=point_date, total_equity=equity)
+            for point_date, equity in stitched
+        ],
+        stitched_return_pct=stitched_return_pct,
+    )
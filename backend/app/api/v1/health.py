@@ -9,6 +9,7 @@ from fastapi import HTTPException
 from fastapi import status
 
 from app.core.config import get_settings
+from app.services.price_hot_cache import get_price_hot_cache
 
 router = APIRouter()
 
@@ -74,6 +75,12 @@ async def health_check() -> dict[str, Any]:
             "message": f"Application not ready: {str(e)}",
         }
 
+    # Price hot tier metrics (informational, never unhealthy)
+    health_data["checks"]["price_hot_cache"] = {
+        "status": "healthy",
+        **get_price_hot_cache().snapshot(),
+    }
+
     # Return appropriate HTTP status
     if health_data["status"] == "unhealthy":
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=health_data)
@@ -93,6 +93,16 @@ class Settings(BaseSettings):
         default=600,
         description="Maximum number of symbols allowed in Arena simulations"
     )
+    arena_max_sweep_configs: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of configurations (grid combinations) in an Arena parameter sweep"
+    )
+    arena_max_walk_forward_windows: int = Field(
+        default=60,
+        ge=1,
+        description="Maximum number of train/test windows in an Arena walk-forward run"
+    )
 
     # Market Data Provider Configuration
     market_data_provider: str = Field(
@@ -125,6 +135,14 @@ class Settings(BaseSettings):
         default=365,
         description="Default number of days of historical data to fetch"
     )
+    trading_calendar_years: int = Field(
+        default=20,
+        ge=1,
+        description=(
+            "Years of NYSE sessions (back from the current year) held in the "
+            "in-memory trading calendar index"
+        ),
+    )
 
     # IB Broker Timeouts
     ib_fill_poll_interval: float = Field(
@@ -149,6 +167,34 @@ class Settings(BaseSettings):
         default=60,
         description="Interval for sweeper to check for stale jobs in seconds"
     )
+    arena_worker_processes: int = Field(
+        default=4,
+        ge=0,
+        description=(
+            "Arena simulations run in parallel, each in its own process "
+            "(0 = run one at a time in the API process)"
+        ),
+    )
+    arena_step_profiling: bool = Field(
+        default=True,
+        description="Record per-phase timings and counters for each arena simulation day",
+    )
+    arena_price_cache_mb: int = Field(
+        default=512,
+        ge=0,
+        description=(
+            "Per-process memory budget in MB for arena price matrices kept after "
+            "their last simulation finishes (0 = free as soon as unused)"
+        ),
+    )
+    price_hot_cache_bars: int = Field(
+        default=250_000,
+        ge=0,
+        description=(
+            "Per-process budget in price bars for the in-memory hot tier in front of "
+            "the database price cache (0 = disabled)"
+        ),
+    )
 
     @property
     def is_development(self) -> bool:
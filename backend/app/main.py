@@ -176,7 +176,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Create and start workers
         # All workers use default poll_interval of 5.0 seconds
         live20_worker = Live20Worker(session_factory, live20_queue)
-        arena_worker = ArenaWorker(session_factory, arena_queue)
+        arena_worker = ArenaWorker(
+            session_factory, arena_queue, processes=settings.arena_worker_processes
+        )
 
         # Start worker loops as background tasks
         live20_worker_task = asyncio.create_task(live20_worker.start())
@@ -8,7 +8,7 @@ Import models from this module to ensure proper dependency resolution.
 from app.models.base import Base
 
 # Import all models
-from app.models.stock import StockPrice
+from app.models.stock import PriceCoverageSegment, StockPrice
 from app.models.ib_order import IBOrder, IBOrderStatus
 from app.models.recommendation import Recommendation, RecommendationDecision, RecommendationSource
 from app.models.live20_run import Live20Run
@@ -28,6 +28,7 @@ from app.models.arena import (
 __all__ = [
     "Base",
     "StockPrice",
+    "PriceCoverageSegment",
     "IBOrder",
     "IBOrderStatus",
     "Recommendation",
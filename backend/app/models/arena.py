@@ -16,6 +16,7 @@ from sqlalchemy import DateTime
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
 from sqlalchemy import JSON
+from sqlalchemy import LargeBinary
 from sqlalchemy import Numeric
 from sqlalchemy import String
 from sqlalchemy import Text
@@ -195,6 +196,13 @@ class ArenaSimulation(Base):
         Text, nullable=True, doc="Error message if simulation failed"
     )
 
+    # Performance profile (see app.services.arena.step_profile)
+    step_profile: Mapped[dict | None] = mapped_column(
+        JSON,
+        nullable=True,
+        doc="Accumulated per-phase timings and counters: {phases: {...}, counters: {...}}",
+    )
+
     # Relationships
     positions: Mapped[list["ArenaPosition"]] = relationship(
         "ArenaPosition",
@@ -446,7 +454,15 @@ class ArenaSnapshot(Base):
         JSON,
         nullable=False,
         default=dict,
-        doc="Agent decisions: {symbol: {action, score, reasoning}}",
+        doc=(
+            "Agent decisions: {symbol: {action, score, reasoning}} "
+            "(snapshots written before decision_log; empty otherwise)"
+        ),
+    )
+    decision_log: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        doc="Compact agent decisions (see app.services.arena.decision_log)",
     )
 
     # Relationship
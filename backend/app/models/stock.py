@@ -3,12 +3,13 @@
 Models for storing stock market data with proper financial data types
 and time-series optimization for technical analysis.
 """
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import Decimal
 
 from sqlalchemy import BigInteger
 from sqlalchemy import Boolean
 from sqlalchemy import CheckConstraint
+from sqlalchemy import Date
 from sqlalchemy import DateTime
 from sqlalchemy import Index
 from sqlalchemy import Numeric
@@ -216,3 +217,57 @@ class StockPrice(Base):
             "timestamp": self.timestamp,
             "symbol": self.symbol,
         }
+
+
+class PriceCoverageSegment(Base):
+    """A range of days whose price data has been fetched for a symbol.
+
+    Records what was asked of the provider, not what came back: a day
+    inside a segment is known to the cache even when the provider had no
+    bars for it (holidays, halts, dates before a listing). Only complete
+    days are recorded, so a day whose bars were fetched while the session
+    was still open is not covered until it is fetched again.
+
+    Segments of a (symbol, interval) are merged on write (see
+    ``StockPriceRepository.add_fetched_range``), so the cache's coverage of
+    a date range is read from a handful of rows instead of the price rows.
+    Deleting price rows without deleting their segments leaves those days
+    reported as cached.
+    """
+
+    __tablename__ = "price_coverage"
+
+    symbol: Mapped[str] = mapped_column(
+        String(10), nullable=False, doc="Stock symbol (e.g., 'AAPL')"
+    )
+
+    interval: Mapped[str] = mapped_column(
+        String(10), nullable=False, doc="Data interval (e.g., '1d', '1h', '5m')"
+    )
+
+    start_date: Mapped[date] = mapped_column(
+        Date, nullable=False, doc="First covered day (inclusive)"
+    )
+
+    end_date: Mapped[date] = mapped_column(
+        Date, nullable=False, doc="Last covered day (inclusive)"
+    )
+
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        doc="When the most recent fetch merged into this segment ran",
+    )
+
+    __table_args__ = (
+        Index("ix_price_coverage_symbol_interval_start", "symbol", "interval", "start_date"),
+        CheckConstraint("end_date >= start_date", name="ck_price_coverage_end_gte_start"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation showing the covered range."""
+        return (
+            f"<PriceCoverageSegment(symbol='{self.symbol}', interval='{self.interval}', "
+            f"start_date='{self.start_date}', end_date='{self.end_date}')>"
+        )
@@ -4,10 +4,13 @@ Generates fake but realistic-looking data without hitting external APIs.
 Useful for unit tests, integration tests, and development environments.
 """
 import logging
-from datetime import datetime, timedelta
+import zlib
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
+
 from app.providers.base import (
     MarketDataProviderInterface,
     PriceDataPoint,
@@ -17,6 +20,23 @@ from app.providers.base import (
 
 logger = logging.getLogger(__name__)
 
+# Seeded series start here, so a symbol's bar for a given day does not depend
+# on the requested range.
+_SYNTHETIC_EPOCH = date(2000, 1, 3)
+_SYNTHETIC_SECTORS = (
+    "Technology",
+    "Healthcare",
+    "Financial Services",
+    "Consumer Cyclical",
+    "Industrials",
+    "Communication Services",
+    "Consumer Defensive",
+    "Energy",
+    "Basic Materials",
+    "Real Estate",
+    "Utilities",
+)
+
 
 class MockMarketDataProvider(MarketDataProviderInterface):
     """
@@ -27,8 +47,23 @@ class MockMarketDataProvider(MarketDataProviderInterface):
     - Unit tests that need predictable data
     - Integration tests that don't want external dependencies
     - Development environments without API access
+    - Benchmarks that need large synthetic universes (pass ``seed``)
+
+    By default every symbol gets the same steady uptrend on every calendar
+    day. With a ``seed``, daily bars are a random walk on weekdays, with
+    drift, volatility and sector derived from the seed and the symbol. The
+    same seed always produces the same bars.
     """
 
+    def __init__(self, seed: int | None = None) -> None:
+        """Initialize the provider.
+
+        Args:
+            seed: Seed for synthetic random-walk daily data (None keeps the
+                fixed uptrend).
+        """
+        self._seed = seed
+
     @property
     def provider_name(self) -> str:
         return "mock"
@@ -39,18 +74,25 @@ class MockMarketDataProvider(MarketDataProviderInterface):
 
     async def get_symbol_info(self, symbol: str) -> SymbolInfo:
         """Get mock symbol information for testing."""
+        sector = "Technology"
+        if self._seed is not None:
+            sector_index = zlib.crc32(symbol.upper().encode()) % len(_SYNTHETIC_SECTORS)
+            sector = _SYNTHETIC_SECTORS[sector_index]
         return SymbolInfo(
             symbol=symbol.upper(),
             name=f"{symbol.upper()} Corporation",
             currency="USD",
             exchange="MOCK",
             market_cap=1000000000.0,
-            sector="Technology",
+            sector=sector,
             industry="Software",
         )
 
     async def fetch_price_data(self, request: PriceDataRequest) -> list[PriceDataPoint]:
         """Generate fake historical data."""
+        if self._seed is not None and request.interval == "1d":
+            return self._synthetic_daily_data(request)
+
         price_points = []
         current_date = request.start_date
         base_price = Decimal("100.00")
@@ -89,6 +131,63 @@ class MockMarketDataProvider(MarketDataProviderInterface):
         logger.info(f"Generated {len(price_points)} mock data points for {request.symbol}")
         return price_points
 
+    def _synthetic_daily_data(self, request: PriceDataRequest) -> list[PriceDataPoint]:
+        """Generate a seeded weekday random walk for one symbol.
+
+        Args:
+            request: Daily price data request.
+
+        Returns:
+            Bars for weekdays between the request's start and end dates.
+        """
+        symbol = request.symbol.upper()
+        start = request.start_date.date()
+        end = request.end_date.date()
+        if end < _SYNTHETIC_EPOCH or end < start:
+            return []
+
+        days = np.arange(
+            np.datetime64(_SYNTHETIC_EPOCH), np.datetime64(end + timedelta(days=1))
+        )
+        days = days[np.is_busday(days)]
+        rng = np.random.default_rng([self._seed, zlib.crc32(symbol.encode())])
+
+        drift = rng.normal(0.0003, 0.0005)
+        volatility = rng.uniform(0.01, 0.03)
+        closes = rng.uniform(20.0, 300.0) * np.exp(
+            np.cumsum(rng.normal(drift, volatility, len(days)))
+        )
+        prev_closes = np.concatenate(([closes[0]], closes[:-1]))
+        opens = prev_closes * (1 + rng.normal(0.0, volatility / 4, len(days)))
+        wicks = np.abs(rng.normal(0.0, volatility / 2, (2, len(days))))
+        highs = np.maximum(opens, closes) * (1 + wicks[0])
+        lows = np.minimum(opens, closes) * (1 - wicks[1])
+        volumes = rng.lognormal(14.0, 0.5, len(days)).astype(np.int64)
+
+        first = int(np.searchsorted(days, np.datetime64(start)))
+        price_points = [
+            PriceDataPoint(
+                symbol=request.symbol,
+                timestamp=datetime.combine(day.item(), time.min, tzinfo=timezone.utc),
+                open_price=Decimal(f"{open_price:.2f}"),
+                high_price=Decimal(f"{high_price:.2f}"),
+                low_price=Decimal(f"{low_price:.2f}"),
+                close_price=Decimal(f"{close_price:.2f}"),
+                volume=int(volume),
+            )
+            for day, open_price, high_price, low_price, close_price, volume in zip(
+                days[first:],
+                opens[first:],
+                highs[first:],
+                lows[first:],
+                closes[first:],
+                volumes[first:],
+                strict=True,
+            )
+        ]
+        logger.debug(f"Generated {len(price_points)} synthetic daily bars for {symbol}")
+        return price_points
+
     async def get_latest_quote(self, symbol: str) -> dict[str, Any]:
         """Return mock quote."""
         return {
@@ -5,26 +5,194 @@ including OHLCV operations, technical analysis support, and bulk data handling
 optimized for high-volume financial data operations.
 """
 import logging
-from datetime import datetime, timedelta, timezone
+import time
+from collections.abc import AsyncIterable
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any
+from zoneinfo import ZoneInfo
 
+import asyncpg
+from sqlalchemy import Row
+from sqlalchemy import String
 from sqlalchemy import and_
+from sqlalchemy import any_
 from sqlalchemy import asc
+from sqlalchemy import bindparam
+from sqlalchemy import delete
 from sqlalchemy import desc
 from sqlalchemy import func
 from sqlalchemy import select
+from sqlalchemy import text
 from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.stock import PriceCoverageSegment
 from app.models.stock import StockPrice
 from app.repositories.base import BaseRepository
 from app.repositories.base import DatabaseError
 
 logger = logging.getLogger(__name__)
 
+# Session-local staging table for bulk_ingest. Temporary tables are never
+# WAL-logged, so COPY into it is as cheap as Postgres allows.
+_INGEST_STAGING_TABLE = "stock_prices_ingest"
+
+_INGEST_COLUMNS = (
+    "symbol",
+    "timestamp",
+    "open_price",
+    "high_price",
+    "low_price",
+    "close_price",
+    "volume",
+    "adjusted_close",
+)
+
+_CREATE_INGEST_STAGING = f"""
+CREATE TEMPORARY TABLE IF NOT EXISTS {_INGEST_STAGING_TABLE} (
+    seq bigserial,
+    symbol text NOT NULL,
+    timestamp timestamptz NOT NULL,
+    open_price numeric NOT NULL,
+    high_price numeric NOT NULL,
+    low_price numeric NOT NULL,
+    close_price numeric NOT NULL,
+    volume bigint NOT NULL,
+    adjusted_close numeric
+) ON COMMIT DROP
+"""
+
+# DISTINCT ON keeps the last staged copy of a bar: ON CONFLICT cannot
+# update the same row twice in one statement.
+_MERGE_INGEST_STAGING = f"""
+INSERT INTO stock_prices (
+    symbol, timestamp, interval, open_price, high_price, low_price, close_price,
+    volume, adjusted_close, is_validated, data_source, last_fetched_at, updated_at
+)
+SELECT DISTINCT ON (symbol, timestamp)
+    symbol, timestamp, :interval, open_price, high_price, low_price, close_price,
+    volume, adjusted_close, false, :data_source, now(), now()
+FROM {_INGEST_STAGING_TABLE}
+ORDER BY symbol, timestamp, seq DESC
+ON CONFLICT (symbol, timestamp, interval) DO UPDATE SET
+    open_price = EXCLUDED.open_price,
+    high_price = EXCLUDED.high_price,
+    low_price = EXCLUDED.low_price,
+    close_price = EXCLUDED.close_price,
+    volume = EXCLUDED.volume,
+    adjusted_close = EXCLUDED.adjusted_close,
+    data_source = EXCLUDED.data_source,
+    last_fetched_at = EXCLUDED.last_fetched_at,
+    updated_at = EXCLUDED.updated_at
+"""
+
+
+@dataclass(frozen=True)
+class PriceCoverage:
+    """Aggregate summary of the cached price rows in a date range."""
+
+    first_timestamp: datetime | None
+    last_timestamp: datetime | None
+    last_fetched_at: datetime | None
+    row_count: int
+
+    @classmethod
+    def from_row(cls, row: Row) -> "PriceCoverage":
+        """Build from a coverage query row."""
+        return cls(
+            first_timestamp=row.first_timestamp,
+            last_timestamp=row.last_timestamp,
+            last_fetched_at=row.last_fetched_at,
+            row_count=row.row_count,
+        )
+
+    @classmethod
+    def empty(cls) -> "PriceCoverage":
+        """Coverage of a range with no cached rows."""
+        return cls(first_timestamp=None, last_timestamp=None, last_fetched_at=None, row_count=0)
+
+
+@dataclass(frozen=True, order=True)
+class DateRange:
+    """Inclusive range of days."""
+
+    start_date: date
+    end_date: date
+
+    def touches(self, other: "DateRange") -> bool:
+        """Whether the ranges overlap or are adjacent (no day between them)."""
+        return (
+            self.start_date <= other.end_date + timedelta(days=1)
+            and other.start_date <= self.end_date + timedelta(days=1)
+        )
+
+
+def merge_date_ranges(ranges: list[DateRange]) -> list[DateRange]:
+    """Merge overlapping and adjacent ranges.
+
+    Returns:
+        Disjoint, non-adjacent ranges sorted by start date
+    """
+    merged: list[DateRange] = []
+    for current in sorted(ranges):
+        if merged and merged[-1].touches(current):
+            last = merged[-1]
+            merged[-1] = DateRange(last.start_date, max(last.end_date, current.end_date))
+        else:
+            merged.append(current)
+    return merged
+
+
+@dataclass(frozen=True)
+class BulkIngestResult:
+    """Outcome of a ``StockPriceRepository.bulk_ingest`` run."""
+
+    rows_copied: int
+    rows_merged: int
+    chunks: int
+    merges: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Copied rows per second of wall time (0.0 for an empty run)."""
+        return self.rows_copied / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+async def _iterate_chunks(
+    chunks: Iterable[list[dict[str, Any]]] | AsyncIterable[list[dict[str, Any]]],
+):
+    """Iterate sync and async chunk sources alike."""
+    if isinstance(chunks, AsyncIterable):
+        async for chunk in chunks:
+            yield chunk
+    else:
+        for chunk in chunks:
+            yield chunk
+
+
+def _ingest_record(data: dict[str, Any]) -> tuple:
+    """Convert a price dictionary to a staging row in ``_INGEST_COLUMNS`` order."""
+    timestamp = data["timestamp"]
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (
+        data["symbol"].upper(),
+        timestamp,
+        data["open_price"],
+        data["high_price"],
+        data["low_price"],
+        data["close_price"],
+        int(data["volume"]),
+        data.get("adjusted_close"),
+    )
+
 
 class StockPriceRepository(BaseRepository[StockPrice]):
     """Repository for StockPrice model with time-series and financial data optimizations.
@@ -95,6 +263,412 @@ class StockPriceRepository(BaseRepository[StockPrice]):
             self.logger.error(f"Failed to get price data for {symbol}: {e}")
             raise DatabaseError(f"Database error retrieving price data: {str(e)}")
 
+    async def get_price_coverage(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> PriceCoverage:
+        """Summarize the cached rows for a symbol within a date range.
+
+        One aggregate query (first/last timestamp, latest ``last_fetched_at``
+        and row count) instead of loading the rows, for cache freshness
+        checks.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            start_date: Start date of the range
+            end_date: End date of the range
+            interval: Data interval ('1d', '1h', '5m', etc.)
+
+        Returns:
+            PriceCoverage (row_count 0 and None timestamps when empty)
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            query = select(*self._coverage_columns()).where(
+                and_(
+                    self.model.symbol == symbol.upper(),
+                    self.model.interval == interval,
+                    self.model.timestamp >= start_date,
+                    self.model.timestamp <= end_date,
+                )
+            )
+
+            result = await self.session.execute(query)
+            return PriceCoverage.from_row(result.one())
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to get price coverage for {symbol}: {e}")
+            raise DatabaseError(f"Database error retrieving price coverage: {str(e)}")
+
+    async def get_price_coverage_for_symbols(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> dict[str, PriceCoverage]:
+        """Summarize the cached rows for many symbols in one grouped query.
+
+        Args:
+            symbols: Stock symbols
+            start_date: Start date of the range
+            end_date: End date of the range
+            interval: Data interval ('1d', '1h', '5m', etc.)
+
+        Returns:
+            Dictionary mapping symbol to its PriceCoverage.
+            Symbols without data are absent.
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not symbols:
+            return {}
+
+        try:
+            query = (
+                select(self.model.symbol, *self._coverage_columns())
+                .where(
+                    and_(
+                        self.model.symbol == any_(self._symbol_array(symbols)),
+                        self.model.interval == interval,
+                        self.model.timestamp >= start_date,
+                        self.model.timestamp <= end_date,
+                    )
+                )
+                .group_by(self.model.symbol)
+            )
+
+            result = await self.session.execute(query)
+            return {row.symbol: PriceCoverage.from_row(row) for row in result}
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to get price coverage for {len(symbols)} symbols: {e}")
+            raise DatabaseError(f"Database error retrieving price coverage: {str(e)}")
+
+    async def get_price_rows_by_date_range(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> list[Row]:
+        """Get OHLCV column tuples for a symbol within a date range.
+
+        Like get_price_data_by_date_range, but selects plain columns, so no
+        ORM instances are built or tracked in the session identity map.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            interval: Data interval ('1d', '1h', '5m', etc.)
+
+        Returns:
+            Rows with symbol, timestamp, open_price, high_price, low_price,
+            close_price and volume, ordered by timestamp
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            query = (
+                select(*self._ohlcv_columns())
+                .where(
+                    and_(
+                        self.model.symbol == symbol.upper(),
+                        self.model.interval == interval,
+                        self.model.timestamp >= start_date,
+                        self.model.timestamp <= end_date,
+                    )
+                )
+                .order_by(asc(self.model.timestamp))
+            )
+
+            result = await self.session.execute(query)
+            return list(result.all())
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to get price rows for {symbol}: {e}")
+            raise DatabaseError(f"Database error retrieving price data: {str(e)}")
+
+    async def get_price_rows_for_symbols(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> dict[str, list[Row]]:
+        """Get OHLCV column tuples for many symbols within a date range in one query.
+
+        The symbols are bound as a single array parameter
+        (``symbol = ANY(:symbols)``), so the statement is the same for any
+        number of symbols.
+
+        Args:
+            symbols: Stock symbols
+            start_date: Start date for data retrieval
+            end_date: End date for data retrieval
+            interval: Data interval ('1d', '1h', '5m', etc.)
+
+        Returns:
+            Dictionary mapping symbol to its rows ordered by timestamp
+            (columns as in get_price_rows_by_date_range).
+            Symbols without data are absent.
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not symbols:
+            return {}
+
+        try:
+            query = (
+                select(*self._ohlcv_columns())
+                .where(
+                    and_(
+                        self.model.symbol == any_(self._symbol_array(symbols)),
+                        self.model.interval == interval,
+                        self.model.timestamp >= start_date,
+                        self.model.timestamp <= end_date,
+                    )
+                )
+                .order_by(asc(self.model.symbol), asc(self.model.timestamp))
+            )
+
+            result = await self.session.execute(query)
+
+            rows_by_symbol: dict[str, list[Row]] = {}
+            for row in result:
+                rows_by_symbol.setdefault(row.symbol, []).append(row)
+
+            self.logger.debug(
+                f"Retrieved price rows for {len(rows_by_symbol)}/{len(symbols)} symbols "
+                f"from {start_date} to {end_date} with interval {interval}"
+            )
+            return rows_by_symbol
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to get price rows for {len(symbols)} symbols: {e}")
+            raise DatabaseError(f"Database error retrieving price data: {str(e)}")
+
+    # ===== FETCH COVERAGE =====
+
+    async def get_fetched_ranges(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        interval: str = "1d",
+    ) -> list[DateRange]:
+        """Get the day ranges already fetched for a symbol within a date range.
+
+        Reads the ``price_coverage`` segments, not the price rows.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            start_date: First day of the range
+            end_date: Last day of the range
+            interval: Data interval ('1d', '1h', '5m', etc.)
+
+        Returns:
+            Merged fetched ranges overlapping the range, sorted by start date
+            (not clipped to it)
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ranges = await self.get_fetched_ranges_for_symbols(
+            [symbol], start_date, end_date, interval
+        )
+        return ranges.get(symbol.upper(), [])
+
+    async def get_fetched_ranges_for_symbols(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+        interval: str = "1d",
+    ) -> dict[str, list[DateRange]]:
+        """Get the day ranges already fetched for many symbols in one query.
+
+        Args:
+            symbols: Stock symbols
+            start_date: First day of the range
+            end_date: Last day of the range
+            interval: Data interval ('1d', '1h', '5m', etc.)
+
+        Returns:
+            Dictionary mapping symbol to its merged fetched ranges
+            (as in get_fetched_ranges). Symbols without coverage are absent.
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not symbols:
+            return {}
+
+        try:
+            query = select(
+                PriceCoverageSegment.symbol,
+                PriceCoverageSegment.start_date,
+                PriceCoverageSegment.end_date,
+            ).where(
+                and_(
+                    PriceCoverageSegment.symbol == any_(self._symbol_array(symbols)),
+                    PriceCoverageSegment.interval == interval,
+                    PriceCoverageSegment.start_date <= end_date,
+                    PriceCoverageSegment.end_date >= start_date,
+                )
+            )
+
+            result = await self.session.execute(query)
+
+            segments: dict[str, list[DateRange]] = {}
+            for row in result:
+                segments.setdefault(row.symbol, []).append(
+                    DateRange(row.start_date, row.end_date)
+                )
+            return {symbol: merge_date_ranges(ranges) for symbol, ranges in segments.items()}
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to get fetched ranges for {len(symbols)} symbols: {e}")
+            raise DatabaseError(f"Database error retrieving price coverage: {str(e)}")
+
+    async def add_fetched_range(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        interval: str = "1d",
+    ) -> DateRange:
+        """Record that a day range has been fetched for a symbol.
+
+        Segments overlapping or adjacent to the range are deleted and
+        replaced by one merged segment, so coverage stays a few rows per
+        symbol. Concurrent writers can still leave overlapping segments
+        behind; readers merge them, and the next write folds them together.
+
+        Args:
+            symbol: Stock symbol (e.g., 'AAPL')
+            start_date: First fetched day
+            end_date: Last fetched day (inclusive)
+            interval: Data interval ('1d', '1h', '5m', etc.)
+
+        Returns:
+            The merged segment now containing the range
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        symbol = symbol.upper()
+        merged = DateRange(start_date, end_date)
+
+        try:
+            stmt = (
+                delete(PriceCoverageSegment)
+                .where(
+                    and_(
+                        PriceCoverageSegment.symbol == symbol,
+                        PriceCoverageSegment.interval == interval,
+                        PriceCoverageSegment.start_date <= end_date + timedelta(days=1),
+                        PriceCoverageSegment.end_date >= start_date - timedelta(days=1),
+                    )
+                )
+                .returning(PriceCoverageSegment.start_date, PriceCoverageSegment.end_date)
+            )
+            result = await self.session.execute(stmt)
+            for row in result:
+                merged = DateRange(
+                    min(merged.start_date, row.start_date), max(merged.end_date, row.end_date)
+                )
+
+            self.session.add(
+                PriceCoverageSegment(
+                    symbol=symbol,
+                    interval=interval,
+                    start_date=merged.start_date,
+                    end_date=merged.end_date,
+                    fetched_at=datetime.now(timezone.utc),
+                )
+            )
+            await self.session.flush()
+
+            self.logger.debug(
+                f"Recorded {symbol} {interval} coverage {start_date} to {end_date} "
+                f"(segment now {merged.start_date} to {merged.end_date})"
+            )
+            return merged
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to record fetched range for {symbol}: {e}")
+            raise DatabaseError(f"Database error recording price coverage: {str(e)}")
+
+    async def forget_fetched_ranges_through(self, last_day: date, intervals: list[str]) -> int:
+        """Drop coverage of every day up to ``last_day`` after deleting its bars.
+
+        Segments ending by ``last_day`` are deleted and segments spanning it
+        are trimmed to start the day after.
+
+        Args:
+            last_day: Last day (inclusive) whose price rows were deleted
+            intervals: Intervals whose price rows were deleted
+
+        Returns:
+            Number of segments deleted or trimmed
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            in_intervals = PriceCoverageSegment.interval.in_(intervals)
+            deleted = await self.session.execute(
+                delete(PriceCoverageSegment).where(
+                    and_(in_intervals, PriceCoverageSegment.end_date <= last_day)
+                )
+            )
+            trimmed = await self.session.execute(
+                update(PriceCoverageSegment)
+                .where(and_(in_intervals, PriceCoverageSegment.start_date <= last_day))
+                .values(start_date=last_day + timedelta(days=1))
+            )
+            return deleted.rowcount + trimmed.rowcount
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to forget fetched ranges through {last_day}: {e}")
+            raise DatabaseError(f"Database error updating price coverage: {str(e)}")
+
+    def _coverage_columns(self) -> tuple:
+        """Aggregate columns read by the coverage queries."""
+        return (
+            func.min(self.model.timestamp).label("first_timestamp"),
+            func.max(self.model.timestamp).label("last_timestamp"),
+            func.max(self.model.last_fetched_at).label("last_fetched_at"),
+            func.count().label("row_count"),
+        )
+
+    def _ohlcv_columns(self) -> tuple:
+        """Columns read by the plain-row price queries."""
+        return (
+            self.model.symbol,
+            self.model.timestamp,
+            self.model.open_price,
+            self.model.high_price,
+            self.model.low_price,
+            self.model.close_price,
+            self.model.volume,
+        )
+
+    @staticmethod
+    def _symbol_array(symbols: list[str]):
+        """Bind symbols as one uppercase text[] parameter."""
+        return bindparam("symbols", [s.upper() for s in symbols], type_=ARRAY(String))
+
     async def get_latest_prices(
         self, symbols: list[str], interval: str = "1d", limit_per_symbol: int = 1
     ) -> dict[str, list[StockPrice]]:
@@ -716,6 +1290,102 @@ class StockPriceRepository(BaseRepository[StockPrice]):
             self.logger.error(f"Failed to sync price data for {symbol}: {e}")
             raise DatabaseError(f"Database error syncing price data: {str(e)}")
 
+    async def bulk_ingest(
+        self,
+        chunks: Iterable[list[dict[str, Any]]] | AsyncIterable[list[dict[str, Any]]],
+        interval: str = "1d",
+        data_source: str = "yahoo_finance",
+        merge_every: int = 250_000,
+    ) -> BulkIngestResult:
+        """Load large volumes of price data with COPY and a set-based merge.
+
+        Each chunk is streamed into a temporary staging table with binary
+        COPY. Once ``merge_every`` rows are staged (and after the last chunk)
+        they are merged into stock_prices with one INSERT ... ON CONFLICT DO
+        UPDATE, and the staging table is emptied. Only one chunk is held in
+        memory at a time, so a generator can feed a multi-year backfill.
+
+        Everything runs in the session's current transaction and is only
+        visible once the caller commits; the staging table is dropped on
+        commit. Like ``sync_price_data``, this writes bars only: callers
+        backfilling from a provider record what they requested with
+        ``add_fetched_range``.
+
+        Args:
+            chunks: Lists of price dictionaries with symbol, timestamp,
+                open_price, high_price, low_price, close_price, volume and
+                optionally adjusted_close (sync or async iterable)
+            interval: Data interval of every row
+            data_source: Source recorded on every row
+            merge_every: Staged row count that triggers a merge
+
+        Returns:
+            Row counts, timing and throughput of the run
+
+        Raises:
+            ValueError: If merge_every is not positive
+            DatabaseError: If database operation fails (nothing from this
+                run should then be committed)
+        """
+        if merge_every <= 0:
+            raise ValueError(f"merge_every must be positive, got {merge_every}")
+
+        started = time.perf_counter()
+        rows_copied = rows_merged = chunk_count = merge_count = staged = 0
+        merge_params = {"interval": interval, "data_source": data_source}
+
+        try:
+            # Executing through the session first also opens the transaction
+            # that the raw COPY below then runs in.
+            await self.session.execute(text(_CREATE_INGEST_STAGING))
+            await self.session.execute(text(f"TRUNCATE {_INGEST_STAGING_TABLE}"))
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver = raw_connection.driver_connection
+
+            async def merge_staged() -> None:
+                nonlocal rows_merged, merge_count, staged
+                result = await self.session.execute(text(_MERGE_INGEST_STAGING), merge_params)
+                await self.session.execute(text(f"TRUNCATE {_INGEST_STAGING_TABLE}"))
+                rows_merged += result.rowcount
+                merge_count += 1
+                staged = 0
+
+            async for chunk in _iterate_chunks(chunks):
+                if not chunk:
+                    continue
+                await driver.copy_records_to_table(
+                    _INGEST_STAGING_TABLE,
+                    records=[_ingest_record(data) for data in chunk],
+                    columns=_INGEST_COLUMNS,
+                )
+                chunk_count += 1
+                rows_copied += len(chunk)
+                staged += len(chunk)
+                if staged >= merge_every:
+                    await merge_staged()
+
+            if staged:
+                await merge_staged()
+
+        except (SQLAlchemyError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            self.logger.error(f"Failed bulk ingest after {rows_copied} rows: {e}")
+            raise DatabaseError(f"Database error in bulk ingest: {str(e)}")
+
+        ingest = BulkIngestResult(
+            rows_copied=rows_copied,
+            rows_merged=rows_merged,
+            chunks=chunk_count,
+            merges=merge_count,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        self.logger.info(
+            f"Bulk ingested {ingest.rows_copied} {interval} price rows "
+            f"({ingest.rows_merged} merged) in {ingest.chunks} chunks, "
+            f"{ingest.elapsed_seconds:.2f}s ({ingest.rows_per_second:,.0f} rows/sec)"
+        )
+        return ingest
+
     # ===== UTILITY AND OPTIMIZATION METHODS =====
 
     async def cleanup_old_intraday_data(
@@ -746,6 +1416,10 @@ class StockPriceRepository(BaseRepository[StockPrice]):
                 },
                 soft_delete=False,  # Hard delete for cleanup
             )
+            # The day containing the cutoff lost some of its bars as well
+            await self.forget_fetched_ranges_through(
+                cutoff_date.astimezone(ZoneInfo("US/Eastern")).date(), intraday_intervals
+            )
 
             self.logger.info(f"Cleaned up {deleted_count} old intraday records")
             return deleted_count
@@ -3,6 +3,7 @@
 This module defines Pydantic schemas for the Trading Agent Arena API,
 which manages simulation creation, status tracking, and result retrieval.
 """
+import itertools
 from datetime import date
 from datetime import datetime
 from decimal import Decimal
@@ -10,6 +11,7 @@ from typing import Any
 from typing import Literal
 
 from pydantic import Field
+from pydantic import ValidationError
 from pydantic import field_validator
 from pydantic import model_validator
 
@@ -319,6 +321,26 @@ class CreateSimulationRequest(StrictBaseModel):
         ),
     )
 
+    # --- Decision log ---
+    record_decisions: Literal["all", "buy"] = Field(
+        default="all",
+        description=(
+            "Which daily agent decisions snapshots record: 'all' records every symbol, "
+            "'buy' records only BUY signals and their portfolio selection outcome."
+        ),
+    )
+
+    # --- Accounting ---
+    accounting_mode: Literal["decimal", "integer"] = Field(
+        default="decimal",
+        description=(
+            "Arithmetic for daily trailing-stop updates and position valuation: "
+            "'decimal' uses Decimal prices, 'integer' uses integer 1/10000 price "
+            "units and is faster with identical results. Entries, exits and "
+            "stored values are Decimal in both modes."
+        ),
+    )
+
     # Shared validators — plain functions applied via field_validator(...)
     _normalize_symbols = field_validator("symbols", mode="before")(_normalize_symbols_value)
     _validate_symbols_count = field_validator("symbols")(_validate_symbols_count_value)
@@ -362,6 +384,166 @@ class CreateSimulationRequest(StrictBaseModel):
         return self
 
 
+# Config fields a parameter sweep may vary. Universe, dates, capital and the
+# scoring setup are fixed per sweep so all configs share one price matrix.
+SWEEPABLE_PARAMETERS: frozenset[str] = frozenset(
+    {
+        "trailing_stop_pct",
+        "min_buy_score",
+        "portfolio_strategy",
+        "max_per_sector",
+        "max_open_positions",
+        "stop_type",
+        "atr_stop_multiplier",
+        "atr_stop_min_pct",
+        "atr_stop_max_pct",
+        "take_profit_pct",
+        "take_profit_atr_mult",
+        "max_hold_days",
+        "max_hold_days_profit",
+        "position_size_pct",
+        "sizing_mode",
+        "risk_per_trade_pct",
+        "win_streak_bonus_pct",
+        "max_risk_pct",
+        "breakeven_trigger_pct",
+        "ratchet_trigger_pct",
+        "ratchet_trail_pct",
+        "ma_sweet_spot_center",
+        "ibs_max_threshold",
+        "regime_filter",
+        "regime_sma_period",
+        "regime_bull_max_positions",
+        "regime_bear_max_positions",
+    }
+)
+
+
+class CreateSweepRequest(CreateSimulationRequest):
+    """Request to run one agent over a grid of configurations.
+
+    The base fields are those of CreateSimulationRequest. ``parameter_grid``
+    maps config fields to candidate values; one simulation is created per
+    combination (cartesian product), each validated as a full
+    CreateSimulationRequest.
+    """
+
+    parameter_grid: dict[str, list[Any]] = Field(
+        ...,
+        min_length=1,
+        description=(
+            "Config field -> candidate values, e.g. "
+            '{"trailing_stop_pct": [3, 5, 8], "max_open_positions": [3, 5]}. '
+            "One simulation runs per combination."
+        ),
+    )
+
+    @field_validator("parameter_grid")
+    @classmethod
+    def validate_parameter_grid(cls, v: dict[str, list[Any]]) -> dict[str, list[Any]]:
+        """Validate grid keys are sweepable, values non-empty, and the size is capped."""
+        unknown = sorted(set(v) - SWEEPABLE_PARAMETERS)
+        if unknown:
+            available = ", ".join(sorted(SWEEPABLE_PARAMETERS))
+            msg = f"Parameters cannot be swept: {', '.join(unknown)}. Available: {available}"
+            raise ValueError(msg)
+
+        total = 1
+        for name, values in v.items():
+            if not values:
+                msg = f"parameter_grid['{name}'] must list at least one value"
+                raise ValueError(msg)
+            if len(values) != len({repr(value) for value in values}):
+                msg = f"parameter_grid['{name}'] contains duplicate values"
+                raise ValueError(msg)
+            total *= len(values)
+
+        max_configs = get_settings().arena_max_sweep_configs
+        if total > max_configs:
+            msg = f"Maximum {max_configs} sweep configurations allowed, got {total}"
+            raise ValueError(msg)
+        return v
+
+    @model_validator(mode="after")
+    def validate_grid_configs(self) -> "CreateSweepRequest":
+        """Ensure every combination is a valid simulation request."""
+        self.expand()
+        return self
+
+    def expand(self) -> list[tuple[dict[str, Any], CreateSimulationRequest]]:
+        """Build one CreateSimulationRequest per grid combination.
+
+        Returns:
+            (swept parameter values, full request) per combination, in grid order.
+
+        Raises:
+            ValueError: If a combination fails CreateSimulationRequest validation.
+        """
+        base = self.model_dump(exclude={"parameter_grid"})
+        names = list(self.parameter_grid)
+        configs = []
+        for values in itertools.product(*(self.parameter_grid[name] for name in names)):
+            params = dict(zip(names, values, strict=True))
+            try:
+                request = CreateSimulationRequest.model_validate({**base, **params})
+            except ValidationError as e:
+                errors = "; ".join(err["msg"] for err in e.errors())
+                msg = f"Invalid sweep configuration {params}: {errors}"
+                raise ValueError(msg) from None
+            configs.append((params, request))
+        return configs
+
+
+class CreateWalkForwardRequest(CreateSimulationRequest):
+    """Request to run a walk-forward (rolling-window) backtest.
+
+    The base fields are those of CreateSimulationRequest, with start_date
+    and end_date spanning the whole run. The range is split into train/test
+    windows; each period runs as a sub-simulation with the base config.
+    """
+
+    train_days: int = Field(
+        ...,
+        ge=30,
+        description="Calendar days in each in-sample (train) period",
+    )
+    test_days: int = Field(
+        ...,
+        ge=5,
+        description="Calendar days in each out-of-sample (test) period",
+    )
+    step_days: int | None = Field(
+        default=None,
+        ge=5,
+        description="Calendar days between window starts, at least test_days (default: test_days)",
+    )
+
+    @model_validator(mode="after")
+    def validate_window_count(self) -> "CreateWalkForwardRequest":
+        """Ensure windows do not overlap and number between one and the configured maximum."""
+        from app.services.arena.walk_forward import build_walk_forward_windows
+
+        if self.step_days is not None and self.step_days < self.test_days:
+            msg = (
+                f"step_days ({self.step_days}) must be >= test_days ({self.test_days}) "
+                "so test periods do not overlap"
+            )
+            raise ValueError(msg)
+        count = len(
+            build_walk_forward_windows(
+                self.start_date, self.end_date, self.train_days, self.test_days, self.step_days
+            )
+        )
+        if count == 0:
+            msg = "Date range is too short for one train period plus a test period"
+            raise ValueError(msg)
+        max_windows = get_settings().arena_max_walk_forward_windows
+        if count > max_windows:
+            msg = f"Maximum {max_windows} walk-forward windows allowed, got {count}"
+            raise ValueError(msg)
+        return self
+
+
 class CreateComparisonRequest(StrictBaseModel):
     """Request to create a multi-strategy comparison run.
 
@@ -518,6 +700,26 @@ class CreateComparisonRequest(StrictBaseModel):
         ),
     )
 
+    # --- Decision log ---
+    record_decisions: Literal["all", "buy"] = Field(
+        default="all",
+        description=(
+            "Which daily agent decisions snapshots record: 'all' records every symbol, "
+            "'buy' records only BUY signals and their portfolio selection outcome."
+        ),
+    )
+
+    # --- Accounting ---
+    accounting_mode: Literal["decimal", "integer"] = Field(
+        default="decimal",
+        description=(
+            "Arithmetic for daily trailing-stop updates and position valuation: "
+            "'decimal' uses Decimal prices, 'integer' uses integer 1/10000 price "
+            "units and is faster with identical results. Entries, exits and "
+            "stored values are Decimal in both modes."
+        ),
+    )
+
     # Shared validators — same standalone functions as CreateSimulationRequest
     _normalize_symbols = field_validator("symbols", mode="before")(_normalize_symbols_value)
     _validate_symbols_count = field_validator("symbols")(_validate_symbols_count_value)
@@ -624,7 +826,10 @@ class SnapshotResponse(StrictBaseModel):
     daily_return_pct: Decimal
     cumulative_return_pct: Decimal
     open_position_count: int
-    decisions: dict
+    decisions: dict | None = Field(
+        default=None,
+        description="Agent decisions keyed by symbol (only when include_decisions=true)",
+    )
 
     model_config = {
         "from_attributes": True,
@@ -753,15 +958,49 @@ class SimulationListResponse(StrictBaseModel):
     has_more: bool = Field(..., description="Whether more simulations exist beyond current page")
 
 
+class PositionPage(StrictBaseModel):
+    """One page of a simulation's positions, oldest first."""
+
+    items: list[PositionResponse]
+    next_cursor: int | None = Field(
+        default=None, description="Cursor for the next page (None on the last page)"
+    )
+
+
+class SnapshotPage(StrictBaseModel):
+    """One page of a simulation's daily snapshots, in day order."""
+
+    items: list[SnapshotResponse]
+    next_cursor: int | None = Field(
+        default=None, description="Cursor for the next page (None on the last page)"
+    )
+
+
+class RegimePoint(StrictBaseModel):
+    """Market regime of the regime filter on one simulation day."""
+
+    date: date
+    regime: Literal["bull", "bear", "neutral"]
+
+
 class SimulationDetailResponse(StrictBaseModel):
     """Response schema for detailed simulation view.
 
-    Includes simulation summary plus all positions and snapshots.
+    Includes simulation summary plus all positions and snapshots (unless
+    excluded with include_positions / include_snapshots), and the market
+    regime series when requested with include_regime.
     """
 
     simulation: SimulationResponse
     positions: list[PositionResponse]
     snapshots: list[SnapshotResponse]
+    regime: list[RegimePoint] | None = Field(
+        default=None,
+        description=(
+            "Regime filter's market regime per trading day (empty when the "
+            "regime filter is disabled). Only included with include_regime=true."
+        ),
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -884,6 +1123,37 @@ class BenchmarkDataPoint(StrictBaseModel):
     cumulative_return_pct: Decimal
 
 
+class PhaseTiming(StrictBaseModel):
+    """Accumulated time spent in one simulation-day phase."""
+
+    total_ms: float
+    calls: int
+    mean_ms: float
+
+
+class SimulationProfileResponse(StrictBaseModel):
+    """Per-phase timings and counters accumulated over a simulation's days.
+
+    Phases may nest: ``symbols`` includes ``agent`` and ``atr`` time, and
+    ``selection`` includes ``atr`` time for ranked signals. Empty when the
+    simulation has not run a day yet or profiling is disabled.
+    """
+
+    simulation_id: int
+    days: int
+    phases: dict[str, PhaseTiming]
+    counters: dict[str, int]
+
+
+class SnapshotDecisionsResponse(StrictBaseModel):
+    """One simulation day's agent decisions with reasoning."""
+
+    simulation_id: int
+    day_number: int
+    snapshot_date: date
+    decisions: dict
+
+
 class EquityCurvePoint(StrictBaseModel):
     """A single point in an equity curve time series."""
 
@@ -904,3 +1174,90 @@ class ComparisonEquityCurvesResponse(StrictBaseModel):
 
     group_id: str
     simulations: list[SimulationEquityCurve]
+
+
+class SweepResponse(StrictBaseModel):
+    """Response for a newly created parameter sweep.
+
+    A sweep is a group of simulations sharing one group_id, one per
+    combination of the parameter grid.
+    """
+
+    group_id: str
+    simulations: list[SimulationResponse]
+
+
+class SweepResultRow(StrictBaseModel):
+    """Summary of one sweep configuration."""
+
+    simulation_id: int
+    params: dict[str, Any]
+    status: str
+    final_equity: Decimal | None = None
+    total_return_pct: Decimal | None = None
+    max_drawdown_pct: Decimal | None = None
+    sharpe_ratio: Decimal | None = None
+    profit_factor: Decimal | None = None
+    total_trades: int
+    winning_trades: int
+
+
+class SweepSummaryResponse(StrictBaseModel):
+    """Ranked results of a parameter sweep.
+
+    ``rows`` holds one summary per configuration, best first by ``sort_by``
+    (configurations without results yet come last). ``top_results`` holds
+    full positions and snapshots for the best ``top_k`` completed ones.
+    """
+
+    group_id: str
+    total_configs: int
+    completed_configs: int
+    sort_by: str
+    rows: list[SweepResultRow]
+    top_results: list[SimulationDetailResponse] = Field(default_factory=list)
+
+
+class WalkForwardWindowResult(StrictBaseModel):
+    """Train and test results for one walk-forward window."""
+
+    window: int
+    train_start: date
+    train_end: date
+    test_start: date
+    test_end: date
+    train_simulation_id: int
+    test_simulation_id: int
+    train_status: str
+    test_status: str
+    train_return_pct: Decimal | None = None
+    test_return_pct: Decimal | None = None
+    test_max_drawdown_pct: Decimal | None = None
+    test_total_trades: int
+
+
+class WalkForwardResponse(StrictBaseModel):
+    """Response for a newly created walk-forward run.
+
+    A walk-forward run is a group of simulations sharing one group_id: a
+    train and a test sub-simulation per window.
+    """
+
+    group_id: str
+    simulations: list[SimulationResponse]
+
+
+class WalkForwardSummaryResponse(StrictBaseModel):
+    """Per-window results and the stitched out-of-sample equity curve.
+
+    ``equity_curve`` chains the test periods of consecutive completed
+    windows, starting from the first, carrying each window's ending equity
+    into the next. ``stitched_return_pct`` is its total return.
+    """
+
+    group_id: str
+    total_windows: int
+    completed_windows: int
+    windows: list[WalkForwardWindowResult]
+    equity_curve: list[EquityCurvePoint]
+    stitched_return_pct: Decimal | None = None
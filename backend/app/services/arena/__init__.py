@@ -3,9 +3,17 @@
 This package contains services for running trading agent arena simulations.
 """
 
-from app.services.arena.agent_protocol import AgentDecision, BaseAgent, PriceBar
+from app.services.arena.agent_protocol import (
+    AgentDecision,
+    BaseAgent,
+    PrecomputedSignals,
+    PriceBar,
+    PriceWindow,
+)
 from app.services.arena.agent_registry import get_agent, list_agents
 from app.services.arena.arena_worker import ArenaWorker
+from app.services.arena.price_matrix import PriceMatrix
+from app.services.arena.shared_price_cache import SharedPriceCache
 from app.services.arena.simulation_engine import SimulationEngine
 from app.services.arena.trailing_stop import FixedPercentTrailingStop, TrailingStopUpdate
 
@@ -14,7 +22,11 @@ __all__ = [
     "ArenaWorker",
     "BaseAgent",
     "FixedPercentTrailingStop",
+    "PrecomputedSignals",
     "PriceBar",
+    "PriceMatrix",
+    "PriceWindow",
+    "SharedPriceCache",
     "SimulationEngine",
     "TrailingStopUpdate",
     "get_agent",
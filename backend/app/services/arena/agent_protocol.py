@@ -5,10 +5,15 @@ along with core data types for agent communication.
 """
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Hashable
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 
+import numpy as np
+from numpy.typing import NDArray
+
 
 @dataclass
 class AgentDecision:
@@ -69,6 +74,174 @@ class PriceBar:
         if self.volume < 0:
             raise ValueError(f"Volume ({self.volume}) cannot be negative")
 
+    @classmethod
+    def from_floats(
+        cls,
+        bar_date: date,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> "PriceBar":
+        """Build a PriceBar from float OHLCV values.
+
+        Uses the shortest repr of each float, so prices that originated as
+        ``Numeric(12, 4)`` database values round-trip to the same Decimal.
+
+        Args:
+            bar_date: Trading date.
+            open_: Open price.
+            high: High price.
+            low: Low price.
+            close: Close price.
+            volume: Share volume.
+
+        Returns:
+            PriceBar with Decimal prices.
+        """
+        return cls(
+            date=bar_date,
+            open=Decimal(repr(float(open_))),
+            high=Decimal(repr(float(high))),
+            low=Decimal(repr(float(low))),
+            close=Decimal(repr(float(close))),
+            volume=int(volume),
+        )
+
+
+@dataclass(frozen=True)
+class PriceWindow:
+    """Columnar OHLCV history for one symbol (oldest to newest).
+
+    Arrays are usually read-only views into the simulation's PriceMatrix,
+    so agents can feed them straight into indicator functions without
+    converting per-bar Decimals to floats.
+
+    Attributes:
+        dates: Bar dates as ``datetime64[D]``.
+        opens: Open prices.
+        highs: High prices.
+        lows: Low prices.
+        closes: Close prices.
+        volumes: Share volumes (float64).
+    """
+
+    dates: NDArray[np.datetime64]
+    opens: NDArray[np.float64]
+    highs: NDArray[np.float64]
+    lows: NDArray[np.float64]
+    closes: NDArray[np.float64]
+    volumes: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        """Number of bars in the window."""
+        return len(self.dates)
+
+    @property
+    def last_date(self) -> date | None:
+        """Date of the newest bar, or None for an empty window."""
+        if len(self.dates) == 0:
+            return None
+        return self.dates[-1].astype(object)
+
+    def bar(self, index: int) -> PriceBar:
+        """Materialize one bar as a Decimal PriceBar.
+
+        Args:
+            index: Position in the window (negative indexes allowed).
+
+        Returns:
+            PriceBar for that row.
+        """
+        return PriceBar.from_floats(
+            bar_date=self.dates[index].astype(object),
+            open_=self.opens[index],
+            high=self.highs[index],
+            low=self.lows[index],
+            close=self.closes[index],
+            volume=self.volumes[index],
+        )
+
+    @classmethod
+    def empty(cls) -> "PriceWindow":
+        """Create a window with no bars."""
+        empty = np.array([], dtype=np.float64)
+        return cls(
+            dates=np.array([], dtype="datetime64[D]"),
+            opens=empty,
+            highs=empty,
+            lows=empty,
+            closes=empty,
+            volumes=empty,
+        )
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[PriceBar]) -> "PriceWindow":
+        """Build a window from PriceBars.
+
+        Args:
+            bars: Price bars, oldest to newest.
+
+        Returns:
+            PriceWindow holding float64 copies of the bar values.
+        """
+        return cls(
+            dates=np.array([b.date for b in bars], dtype="datetime64[D]"),
+            opens=np.array([b.open for b in bars], dtype=np.float64),
+            highs=np.array([b.high for b in bars], dtype=np.float64),
+            lows=np.array([b.low for b in bars], dtype=np.float64),
+            closes=np.array([b.close for b in bars], dtype=np.float64),
+            volumes=np.array([b.volume for b in bars], dtype=np.float64),
+        )
+
+
+class PrecomputedSignals(ABC):
+    """Decisions for one symbol precomputed over its whole price history.
+
+    Agents whose decision for a day depends only on price data can compute
+    every day's decision once at simulation start (see
+    ``BaseAgent.precompute_signals``). The engine then looks decisions up
+    per day instead of re-running the agent's indicators.
+    """
+
+    @abstractmethod
+    def decide(
+        self,
+        symbol: str,
+        current_date: date,
+        has_open_position: bool,
+        bars_available: int,
+    ) -> AgentDecision | None:
+        """Return the decision ``evaluate`` would make for this day.
+
+        Args:
+            symbol: Stock symbol being evaluated
+            current_date: Current simulation date
+            has_open_position: Whether we already hold this symbol
+            bars_available: Number of bars in the history ``evaluate`` would see
+
+        Returns:
+            AgentDecision, or None if the date is not covered (callers should
+            fall back to ``BaseAgent.evaluate``).
+        """
+        pass
+
+    def bind(self, agent: "BaseAgent") -> "PrecomputedSignals":
+        """Reuse these signals for another agent with the same ``signal_key``.
+
+        Agents may apply config-dependent thresholds (e.g. a minimum BUY
+        score) in ``decide`` rather than at precompute time; the returned
+        object must apply ``agent``'s. The default returns self.
+
+        Args:
+            agent: Agent whose ``signal_key`` equals the producing agent's
+
+        Returns:
+            PrecomputedSignals deciding with ``agent``'s configuration.
+        """
+        return self
+
 
 class BaseAgent(ABC):
     """Base class for arena trading agents.
@@ -105,7 +278,7 @@ class BaseAgent(ABC):
     async def evaluate(
         self,
         symbol: str,
-        price_history: list[PriceBar],
+        price_history: PriceWindow,
         current_date: date,
         has_open_position: bool,
     ) -> AgentDecision:
@@ -113,7 +286,8 @@ class BaseAgent(ABC):
 
         Args:
             symbol: Stock symbol to evaluate
-            price_history: Historical price data (oldest to newest)
+            price_history: Historical price data (oldest to newest), as
+                columnar float arrays
             current_date: Current simulation date
             has_open_position: Whether we already hold this symbol
 
@@ -121,3 +295,28 @@ class BaseAgent(ABC):
             AgentDecision with action, score, and reasoning
         """
         pass
+
+    @property
+    def signal_key(self) -> Hashable | None:
+        """Config values ``precompute_signals`` depends on.
+
+        Agents with equal keys produce identical precomputed signals for the
+        same price history, so the engine computes them once and shares them
+        (via ``PrecomputedSignals.bind``) across simulations, e.g. the
+        configs of a parameter sweep. None (the default) disables sharing.
+        """
+        return None
+
+    def precompute_signals(self, price_history: PriceWindow) -> PrecomputedSignals | None:
+        """Precompute decisions for every bar of a symbol's price history.
+
+        Optional batch hook for backtests. The default returns None, meaning
+        the engine calls ``evaluate`` every day.
+
+        Args:
+            price_history: The symbol's full cached price history (oldest to newest)
+
+        Returns:
+            PrecomputedSignals for the symbol, or None if not supported.
+        """
+        return None
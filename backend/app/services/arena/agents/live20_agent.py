@@ -4,7 +4,9 @@ This agent uses Live20Evaluator for scoring and filters to LONG-only setups.
 It evaluates historical price data and returns trading decisions for arena simulations.
 """
 
+import copy
 import logging
+from collections.abc import Hashable, Sequence
 from datetime import date
 from typing import ClassVar
 
@@ -12,8 +14,14 @@ from app.indicators.cci_analysis import CCIAnalysis
 from app.indicators.multi_day_patterns import analyze_multi_day_patterns
 from app.indicators.trend import detect_trend
 from app.models.recommendation import ScoringAlgorithm
-from app.services.arena.agent_protocol import AgentDecision, BaseAgent, PriceBar
-from app.services.live20_evaluator import Live20Evaluator
+from app.services.arena.agent_protocol import (
+    AgentDecision,
+    BaseAgent,
+    PrecomputedSignals,
+    PriceBar,
+    PriceWindow,
+)
+from app.services.live20_evaluator import Live20CriteriaSeries, Live20Evaluator
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +37,11 @@ class Live20ArenaAgent(BaseAgent):
     5. CCI/RSI-2 Momentum - weighted score
 
     Returns BUY signal when score >= min_buy_score (configurable, default 60).
+
+    With ``short_circuit_trend`` the trend gate is checked first, and symbols
+    that fail it get NO_SIGNAL without evaluating (or scoring) the other
+    criteria. Arena simulations enable it; the full evaluation is still used
+    to explain decisions.
     """
 
     DEFAULT_MIN_BUY_SCORE: ClassVar[int] = 60
@@ -40,10 +53,13 @@ class Live20ArenaAgent(BaseAgent):
             config: Optional configuration dict. Supported keys:
                 - min_buy_score: Minimum score threshold for BUY signal (default: 60)
                 - scoring_algorithm: Scoring algorithm ('cci' or 'rsi2', default: 'cci')
+                - short_circuit_trend: Skip the non-trend criteria when the
+                  trend gate fails (default: False)
         """
         super().__init__(config)
         self._evaluator = Live20Evaluator()
         self._min_buy_score = self._config.get("min_buy_score", self.DEFAULT_MIN_BUY_SCORE)
+        self._short_circuit_trend = bool(self._config.get("short_circuit_trend", False))
 
         # Validate and convert scoring_algorithm with error handling
         scoring_algorithm_str = self._config.get("scoring_algorithm", "cci")
@@ -120,7 +136,7 @@ class Live20ArenaAgent(BaseAgent):
     async def evaluate(
         self,
         symbol: str,
-        price_history: list[PriceBar],
+        price_history: PriceWindow | Sequence[PriceBar],
         current_date: date,
         has_open_position: bool,
     ) -> AgentDecision:
@@ -128,7 +144,8 @@ class Live20ArenaAgent(BaseAgent):
 
         Args:
             symbol: Stock symbol to evaluate
-            price_history: Historical price data (oldest to newest)
+            price_history: Historical price data (oldest to newest). A list of
+                PriceBars is accepted for callers outside the engine.
             current_date: Current simulation date
             has_open_position: Whether we already hold this symbol
 
@@ -145,7 +162,7 @@ class Live20ArenaAgent(BaseAgent):
             )
 
         # Need minimum data
-        if len(price_history) < 25:
+        if len(price_history) < Live20Evaluator.REQUIRED_BARS:
             return AgentDecision(
                 symbol=symbol,
                 action="NO_SIGNAL",
@@ -153,12 +170,25 @@ class Live20ArenaAgent(BaseAgent):
                 reasoning=f"Insufficient data ({len(price_history)} bars)",
             )
 
-        # Extract price arrays
-        opens = [float(bar.open) for bar in price_history]
-        highs = [float(bar.high) for bar in price_history]
-        lows = [float(bar.low) for bar in price_history]
-        closes = [float(bar.close) for bar in price_history]
-        volumes = [float(bar.volume) for bar in price_history]
+        if not isinstance(price_history, PriceWindow):
+            price_history = PriceWindow.from_bars(price_history)
+
+        # Every criterion for the newest bar depends only on the trailing
+        # REQUIRED_BARS bars, so evaluate that fixed-size tail. Per-day cost
+        # stays constant no matter how much lookback the engine hands us.
+        # (Only CCIAnalysis.signal_type is path-dependent, and it is not used
+        # for arena decisions.)
+        tail = slice(-Live20Evaluator.REQUIRED_BARS, None)
+        opens = price_history.opens[tail]
+        highs = price_history.highs[tail]
+        lows = price_history.lows[tail]
+        closes = price_history.closes[tail]
+        volumes = price_history.volumes[tail]
+
+        # Cheap trend gate first: a non-bearish trend can never be a BUY
+        if self._short_circuit_trend:
+            if not self._evaluator.evaluate_trend(closes).aligned_for_long:
+                return self._trend_gated_decision(symbol)
 
         # Evaluate criteria using shared evaluator — capture all 4 return values
         # for enriched metadata on BUY signals.
@@ -177,26 +207,12 @@ class Live20ArenaAgent(BaseAgent):
         signal_criteria = [
             c for c in criteria if c.name != Live20Evaluator.TREND_CRITERION_NAME
         ]
-        aligned_count = sum(1 for c in signal_criteria if c.aligned_for_long)
         score = sum(c.score_for_long for c in signal_criteria if c.aligned_for_long)
-
-        # Build reasoning
-        aligned_criteria = [c.name for c in signal_criteria if c.aligned_for_long]
-        not_aligned = [c.name for c in signal_criteria if not c.aligned_for_long]
         trend_ok = trend_criterion.aligned_for_long
-
-        reasoning_parts = [
-            f"Trend eligible: {'yes' if trend_ok else 'no'}",
-            f"Score: {score}/100 ({aligned_count}/4 signal criteria aligned)",
-            f"Aligned: {', '.join(aligned_criteria) if aligned_criteria else 'none'}",
-            f"Not aligned: {', '.join(not_aligned) if not_aligned else 'none'}",
-        ]
-
-        # Determine action (LONG-only): trend must be eligible and score must pass threshold
-        if trend_ok and score >= self._min_buy_score:
-            action = "BUY"
-        else:
-            action = "NO_SIGNAL"
+        reasoning = self._build_reasoning(
+            trend_ok, [(c.name, c.aligned_for_long) for c in signal_criteria], score
+        )
+        action = self._action_for(trend_ok, score)
 
         # Build enriched metadata for BUY signals only.
         # Metadata powers the EnrichedScoreSelector tiebreaker cascade.
@@ -227,6 +243,195 @@ class Live20ArenaAgent(BaseAgent):
             symbol=symbol,
             action=action,
             score=score,
-            reasoning="; ".join(reasoning_parts),
+            reasoning=reasoning,
+            metadata=metadata,
+        )
+
+    @property
+    def signal_key(self) -> Hashable:
+        """Scoring algorithm, criterion weights and trend short-circuit.
+
+        min_buy_score applies at decide time.
+        """
+        return (
+            self._scoring_algorithm.value,
+            tuple(sorted(self._signal_scores.items())),
+            self._short_circuit_trend,
+        )
+
+    def precompute_signals(self, price_history: PriceWindow) -> "Live20PrecomputedSignals":
+        """Evaluate Live20 criteria for every bar of a symbol's history at once.
+
+        Args:
+            price_history: The symbol's full price history (oldest to newest)
+
+        Returns:
+            Live20PrecomputedSignals that reproduce ``evaluate`` for each date.
+        """
+        series = self._evaluator.evaluate_criteria_series(
+            price_history.opens,
+            price_history.highs,
+            price_history.lows,
+            price_history.closes,
+            price_history.volumes,
+            scoring_algorithm=self._scoring_algorithm,
+            signal_scores=self._signal_scores,
+            short_circuit=self._short_circuit_trend,
+        )
+        return Live20PrecomputedSignals(self, price_history.dates.tolist(), series)
+
+    @staticmethod
+    def _trend_gated_decision(symbol: str) -> AgentDecision:
+        """NO_SIGNAL for a symbol that failed the trend gate, left unscored."""
+        return AgentDecision(
+            symbol=symbol,
+            action="NO_SIGNAL",
+            score=None,
+            reasoning="Trend eligible: no; other criteria not evaluated",
+        )
+
+    def _action_for(self, trend_ok: bool, score: int) -> str:
+        """Determine action (LONG-only): trend must be eligible and score must pass threshold."""
+        if trend_ok and score >= self._min_buy_score:
+            return "BUY"
+        return "NO_SIGNAL"
+
+    @staticmethod
+    def _build_reasoning(
+        trend_ok: bool, signal_alignment: list[tuple[str, bool]], score: int
+    ) -> str:
+        """Build the decision reasoning string.
+
+        Args:
+            trend_ok: Whether the trend eligibility filter passed
+            signal_alignment: (criterion name, aligned) for each non-trend criterion
+            score: Total non-trend score
+
+        Returns:
+            Semicolon-separated reasoning text
+        """
+        aligned_criteria = [name for name, aligned in signal_alignment if aligned]
+        not_aligned = [name for name, aligned in signal_alignment if not aligned]
+        reasoning_parts = [
+            f"Trend eligible: {'yes' if trend_ok else 'no'}",
+            f"Score: {score}/100 ({len(aligned_criteria)}/4 signal criteria aligned)",
+            f"Aligned: {', '.join(aligned_criteria) if aligned_criteria else 'none'}",
+            f"Not aligned: {', '.join(not_aligned) if not_aligned else 'none'}",
+        ]
+        return "; ".join(reasoning_parts)
+
+
+class Live20PrecomputedSignals(PrecomputedSignals):
+    """Live20 decisions for one symbol, backed by a Live20CriteriaSeries.
+
+    Produces the same AgentDecision as ``Live20ArenaAgent.evaluate`` for any
+    date in the symbol's history, by indexing precomputed criteria arrays.
+    """
+
+    def __init__(
+        self,
+        agent: Live20ArenaAgent,
+        dates: list[date],
+        series: Live20CriteriaSeries,
+    ) -> None:
+        """Initialize with the owning agent and the symbol's criteria series.
+
+        Args:
+            agent: Agent whose thresholds and scoring produced the series
+            dates: Bar dates (oldest to newest), aligned with the series
+            series: Criteria for every bar
+        """
+        self._agent = agent
+        self._index = {bar_date: i for i, bar_date in enumerate(dates)}
+        self._series = series
+
+    def bind(self, agent: BaseAgent) -> "Live20PrecomputedSignals":
+        """Share the criteria series, applying ``agent``'s min_buy_score.
+
+        Args:
+            agent: Live20 agent with the same ``signal_key``
+
+        Returns:
+            Live20PrecomputedSignals deciding with ``agent``'s threshold.
+        """
+        if not isinstance(agent, Live20ArenaAgent) or agent.signal_key != self._agent.signal_key:
+            msg = "Live20 signals can only be bound to a Live20 agent with the same signal_key"
+            raise ValueError(msg)
+        bound = copy.copy(self)
+        bound._agent = agent
+        return bound
+
+    def decide(
+        self,
+        symbol: str,
+        current_date: date,
+        has_open_position: bool,
+        bars_available: int,
+    ) -> AgentDecision | None:
+        """Look up the decision for ``current_date``.
+
+        Args:
+            symbol: Stock symbol being evaluated
+            current_date: Current simulation date
+            has_open_position: Whether we already hold this symbol
+            bars_available: Number of bars in the history ``evaluate`` would see
+
+        Returns:
+            AgentDecision, or None if the date is not in the precomputed history.
+        """
+        if has_open_position:
+            return AgentDecision(
+                symbol=symbol,
+                action="HOLD",
+                score=None,
+                reasoning="Already holding position",
+            )
+
+        if bars_available < Live20Evaluator.REQUIRED_BARS:
+            return AgentDecision(
+                symbol=symbol,
+                action="NO_SIGNAL",
+                score=None,
+                reasoning=f"Insufficient data ({bars_available} bars)",
+            )
+
+        i = self._index.get(current_date)
+        if i is None or not self._series.evaluated[i]:
+            return None
+
+        s = self._series
+        trend_ok = bool(s.trend_aligned[i])
+        if not trend_ok and self._agent._short_circuit_trend:
+            return self._agent._trend_gated_decision(symbol)
+        score = int(s.score[i])
+        reasoning = self._agent._build_reasoning(
+            trend_ok,
+            [
+                ("ma20_distance", bool(s.ma20_aligned[i])),
+                ("candle", bool(s.candle_aligned[i])),
+                ("volume", bool(s.volume_aligned[i])),
+                ("momentum", bool(s.momentum_aligned[i])),
+            ],
+            score,
+        )
+        action = self._agent._action_for(trend_ok, score)
+
+        metadata: dict | None = None
+        if action == "BUY":
+            is_cci = s.cci_direction[i] is not None
+            metadata = {
+                "cci_value": float(s.momentum_value[i]) if is_cci else None,
+                "cci_direction": s.cci_direction[i],
+                "ma_distance_pct": float(s.ma20_distance[i]),
+                "rvol": float(s.rvol[i]),
+                "candle_duration": s.candle_duration[i],
+                "candle_pattern": s.candle_pattern[i],
+            }
+
+        return AgentDecision(
+            symbol=symbol,
+            action=action,
+            score=score,
+            reasoning=reasoning,
             metadata=metadata,
         )
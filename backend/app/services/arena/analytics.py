@@ -6,6 +6,7 @@ at simulation finalization to populate performance metrics.
 from decimal import Decimal
 
 from app.models.arena import ArenaPosition, ArenaSimulation, ArenaSnapshot
+from app.services.trading_calendar_service import SessionIndex
 
 
 def compute_simulation_analytics(
@@ -32,9 +33,9 @@ def compute_simulation_analytics(
     # Average hold time in actual trading days.
     # Each snapshot represents one trading day, so we count snapshots whose date
     # falls within [entry_date, exit_date] — no external calendar library needed.
-    trading_day_set = {s.snapshot_date for s in snapshots}
+    trading_days = SessionIndex(s.snapshot_date for s in snapshots)
     hold_days = [
-        sum(1 for d in trading_day_set if p.entry_date <= d <= p.exit_date)
+        trading_days.count_between(p.entry_date, p.exit_date)
         for p in closed
         if p.entry_date and p.exit_date
     ]
@@ -2,30 +2,348 @@
 
 This worker picks up pending ArenaSimulation entries from the database
 and processes them with resume capability and cancellation support.
+
+Simulation stepping is CPU-bound, so with ``processes > 0`` each claimed
+simulation runs in one of that many single-process ``ProcessPoolExecutor``
+lanes and several simulations (e.g. the strategies of a comparison group or
+the configurations of a parameter sweep) run in parallel. The main process
+loads each simulation's price matrix and publishes it in shared memory (see
+``shared_price_memory``), so simulations on the same prices share one copy
+whichever lane they run in. The agent signals of a group (see
+``shared_price_cache``) are computed once in a lane and handed to each of its
+simulations. Claiming, heartbeats and completion bookkeeping stay in the
+main process.
+
+Heartbeats stop with the main process, so a simulation must not outlive it:
+on shutdown, running simulations stop at their next checkpoint (pool
+processes through a shared event) and are released to the queue for
+resume, and pool processes still running after the shutdown wait are
+terminated (see ``ArenaWorker.stop``).
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
 import time
+from collections.abc import Callable
+from collections.abc import Hashable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from dataclasses import replace
+from multiprocessing.queues import SimpleQueue
+from multiprocessing.synchronize import Event
+from typing import cast
 
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import get_settings
 from app.models.arena import ArenaSimulation
+from app.models.arena import SimulationStatus
+from app.services.arena.agent_protocol import PrecomputedSignals
+from app.services.arena.agent_registry import get_agent
+from app.services.arena.price_matrix import PriceMatrix
+from app.services.arena.shared_price_cache import PriceCacheKey
+from app.services.arena.shared_price_cache import SharedPriceCache
+from app.services.arena.shared_price_cache import get_shared_price_cache
+from app.services.arena.shared_price_memory import SharedPriceMatrix
+from app.services.arena.shared_price_memory import SharedPriceMatrixRef
 from app.services.arena.simulation_engine import SimulationEngine
+from app.services.arena.simulation_engine import load_price_matrix
+from app.services.arena.simulation_engine import precompute_signals
+from app.services.arena.simulation_engine import simulation_price_key
+from app.services.data_service import DataService
+from app.services.job_queue_service import JobQueueService
+from app.services.job_worker import JobInterrupted
 from app.services.job_worker import JobWorker
 
 logger = logging.getLogger(__name__)
 
+# Set by _init_pool_process in pool processes; the parent sets the event on shutdown
+_pool_stop_event: Event | None = None
+
+
+@dataclass(frozen=True)
+class SharedPrices:
+    """A price matrix the worker published for a pool process to attach.
+
+    Attributes:
+        key: Price cache key the simulation's engine will ask for.
+        matrix: Published matrix.
+        signal_key: ``BaseAgent.signal_key`` of the simulation's agent.
+        signals: Signals per symbol precomputed for the simulation's group.
+    """
+
+    key: PriceCacheKey
+    matrix: SharedPriceMatrixRef
+    signal_key: Hashable | None = None
+    signals: dict[str, PrecomputedSignals] | None = None
+
+
+async def run_simulation(
+    session_factory: async_sessionmaker[AsyncSession],
+    queue_service: JobQueueService[ArenaSimulation],
+    simulation_id: int,
+    should_stop: Callable[[], bool] | None = None,
+) -> bool:
+    """Initialize (if needed) and run a simulation to completion.
+
+    Shared by in-process execution and pool worker processes. Progress is
+    committed at engine checkpoints, and cancellation is checked at each
+    checkpoint, so a resumed run continues from the last checkpoint.
+
+    Args:
+        session_factory: Factory for creating async database sessions
+        queue_service: Queue service used for cancellation checks
+        simulation_id: ID of the simulation to run
+        should_stop: Optional check for worker shutdown, made before
+            initializing and at the same checkpoints as cancellation
+
+    Returns:
+        True if the run stopped for worker shutdown before finishing; the
+        simulation is left running, to be released for resume.
+    """
+    # Create simulation engine with a new session
+    # We need a fresh session because the simulation object came from
+    # a different session (the queue service session)
+    async with session_factory() as session:
+        engine = SimulationEngine(session, session_factory, price_cache=get_shared_price_cache())
+        try:
+            return await _run_engine(engine, session, queue_service, simulation_id, should_stop)
+        finally:
+            # Return the shared price matrix even if the run was cancelled or failed
+            engine.clear_simulation_cache(simulation_id)
+
+
+async def _run_engine(
+    engine: SimulationEngine,
+    session: AsyncSession,
+    queue_service: JobQueueService[ArenaSimulation],
+    simulation_id: int,
+    should_stop: Callable[[], bool] | None = None,
+) -> bool:
+    """Drive one simulation through initialization and its remaining days.
+
+    Returns:
+        True if stopped for worker shutdown (see ``run_simulation``).
+    """
+    worker_id = queue_service.worker_id
+
+    def stopping() -> bool:
+        return should_stop is not None and should_stop()
+
+    # Load simulation in this session
+    sim = await session.get(ArenaSimulation, simulation_id)
+    if not sim:
+        logger.error(f"[{worker_id}] Simulation {simulation_id} not found")
+        return False
+
+    if stopping():
+        logger.info(f"[{worker_id}] Simulation {simulation_id} not started: worker stopping")
+        return True
+
+    # Initialize simulation if not yet started
+    if not sim.is_initialized:
+        logger.info(f"[{worker_id}] Simulation {simulation_id}: initializing")
+        await engine.initialize_simulation(simulation_id)
+
+        # Refresh to get updated state (only refresh scalar attributes needed by the worker)
+        await session.refresh(sim, attribute_names=["current_day", "total_days", "status"])
+        logger.info(
+            f"[{worker_id}] Simulation {simulation_id}: initialized "
+            f"with {sim.total_days} trading days"
+        )
+
+    if sim.current_day >= sim.total_days:
+        return False
+
+    async def should_cancel() -> bool:
+        return stopping() or await queue_service.is_cancelled(simulation_id)
+
+    start_time = time.monotonic()
+    start_day = sim.current_day
+    sim = await engine.run_to_completion(simulation_id, should_cancel=should_cancel)
+    elapsed = time.monotonic() - start_time
+
+    if sim.status != SimulationStatus.COMPLETED.value and stopping():
+        logger.info(
+            f"[{worker_id}] Simulation {simulation_id} stopped for shutdown "
+            f"at day {sim.current_day}"
+        )
+        return True
+
+    if sim.status != SimulationStatus.COMPLETED.value:
+        logger.info(
+            f"[{worker_id}] Simulation {simulation_id} cancelled, "
+            f"stopping at day {sim.current_day}"
+        )
+        return False
+
+    logger.info(
+        f"[{worker_id}] Simulation {simulation_id}: processed days "
+        f"{start_day}-{sim.current_day} in {elapsed:.2f}s"
+    )
+    return False
+
+
+def run_simulation_in_process(
+    simulation_id: int, worker_id: str, prices: SharedPrices | None = None
+) -> bool:
+    """Pool worker entry point: run one simulation in this process.
+
+    Database connections cannot be shared across processes, so the pool
+    process builds its own engine (without pooling, since it lives for one
+    simulation) and session factory.
+
+    Args:
+        simulation_id: ID of the simulation to run
+        worker_id: Parent worker ID, used as log prefix
+        prices: Matrix published by the parent, attached into this process's
+            price cache for the run instead of being loaded again, and the
+            group's signals, if computed
+
+    Returns:
+        True if the run stopped for worker shutdown (see ``run_simulation``).
+    """
+    settings = get_settings()
+    db_engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    session_factory = async_sessionmaker(
+        db_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+    queue_service = JobQueueService(session_factory, ArenaSimulation, worker_id=worker_id)
+
+    should_stop = _pool_stop_event.is_set if _pool_stop_event is not None else None
+
+    async def _run() -> bool:
+        price_cache = get_shared_price_cache()
+        try:
+            # Held for the run, so the engine's acquire finds the attached matrix
+            if prices is not None:
+                await price_cache.acquire(prices.key, lambda: _attach_prices(prices.matrix))
+                if (
+                    prices.signals is not None
+                    and price_cache.get_signals(prices.key, prices.signal_key) is None
+                ):
+                    price_cache.store_signals(prices.key, prices.signal_key, prices.signals)
+            try:
+                return await run_simulation(
+                    session_factory, queue_service, simulation_id, should_stop
+                )
+            finally:
+                if prices is not None:
+                    price_cache.release(prices.key)
+        finally:
+            await db_engine.dispose()
+
+    return asyncio.run(_run())
+
+
+def precompute_signals_in_process(
+    prices: SharedPrices, agent_type: str, agent_config: dict
+) -> dict[str, PrecomputedSignals]:
+    """Pool worker entry point: compute an agent's signals on a published matrix.
+
+    Args:
+        prices: Published matrix of the simulations that will use the signals
+        agent_type: Agent type of those simulations
+        agent_config: Agent config of one of them (they share the signal_key)
+
+    Returns:
+        Signals per traded symbol.
+    """
+    agent = get_agent(agent_type, agent_config)
+    matrix = SharedPriceMatrix.attach(prices.matrix)
+    return precompute_signals(agent, matrix, prices.key.symbols)
+
+
+async def _attach_prices(ref: SharedPriceMatrixRef) -> PriceMatrix:
+    """Price cache loader for a matrix published by the parent process."""
+    return SharedPriceMatrix.attach(ref)
+
+
+def _init_pool_process(stop_event: Event | None = None, started: SimpleQueue | None = None) -> None:
+    """Configure logging and the shutdown event in a freshly spawned pool process.
+
+    Args:
+        stop_event: Event the parent sets when the worker shuts down
+        started: Queue this process reports its PID on, so the parent can
+            terminate it on shutdown
+    """
+    from app.utils.structured_logging import configure_structured_logging
+
+    global _pool_stop_event
+    _pool_stop_event = stop_event
+    if started is not None:
+        started.put(os.getpid())
+    configure_structured_logging(log_level=get_settings().log_level)
+
 
 class ArenaWorker(JobWorker[ArenaSimulation]):
     """Worker that processes arena simulation jobs from the queue.
 
     Implements resume capability by tracking current_day progress,
-    and supports graceful cancellation between simulation days.
+    and supports graceful cancellation between simulation checkpoints.
+
+    With ``processes > 0`` up to that many simulations run concurrently in
+    as many single-process lanes, each taking the least busy lane; with 0
+    (the default) simulations run one at a time on the event loop. Price
+    matrices for the lanes are loaded here once and shared through shared
+    memory, and signals once per group.
     """
 
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        queue_service: JobQueueService[ArenaSimulation],
+        poll_interval: float = 5.0,
+        processes: int = 0,
+    ) -> None:
+        """Initialize the arena worker.
+
+        Args:
+            session_factory: Factory for creating async database sessions
+            queue_service: JobQueueService for queue operations
+            poll_interval: Seconds to wait between polls when idle (default: 5.0)
+            processes: Pool processes for parallel simulations (0 = run in-process)
+
+        Raises:
+            ValueError: If processes is negative
+        """
+        if processes < 0:
+            raise ValueError(f"processes must be >= 0, got {processes}")
+        super().__init__(
+            session_factory,
+            queue_service,
+            poll_interval=poll_interval,
+            max_concurrent_jobs=max(processes, 1),
+        )
+        self.processes = processes
+        self._lanes: list[ProcessPoolExecutor] = []
+        # Simulations submitted to each lane and not finished yet
+        self._lane_loads: list[int] = [0] * processes
+        self._stop_event: Event | None = None
+        # PIDs reported by pool processes as they start (see _init_pool_process)
+        self._started: SimpleQueue | None = None
+        # Matrices published for the lanes (SharedPriceMatrix), kept like the
+        # pool processes' own caches while unused
+        self._shared_prices = SharedPriceCache(
+            max_bytes=get_settings().arena_price_cache_mb * 1024 * 1024
+        )
+        # Signal computations in progress, by signal scope and signal_key
+        self._signal_loads: dict[
+            tuple[PriceCacheKey, Hashable], asyncio.Future[dict[str, PrecomputedSignals]]
+        ] = {}
+        self._stopping = False
+
     async def process_job(self, simulation: ArenaSimulation) -> None:
         """Process an arena simulation job with resume capability.
 
         Resumes from partial completion by checking simulation.current_day.
-        Checks for cancellation before each day's processing.
+        Checks for cancellation at each engine checkpoint.
 
         Args:
             simulation: The ArenaSimulation to process
@@ -39,71 +357,252 @@ class ArenaWorker(JobWorker[ArenaSimulation]):
             f"status={simulation.status})"
         )
 
-        # Create simulation engine with a new session
-        # We need a fresh session because the simulation object came from
-        # a different session (the queue service session)
-        async with self.session_factory() as session:
-            engine = SimulationEngine(session, self.session_factory)
+        if self.processes:
+            loop = asyncio.get_running_loop()
+            prices = await self._share_prices(simulation)
+            lane = self._pick_lane()
+            self._lane_loads[lane] += 1
+            try:
+                stopped = await loop.run_in_executor(
+                    self._get_lane(lane),
+                    run_simulation_in_process,
+                    simulation_id,
+                    worker_id,
+                    prices,
+                )
+            except BrokenProcessPool as e:
+                if self._stopping:
+                    msg = f"Simulation {simulation_id}: pool process terminated on shutdown"
+                    raise JobInterrupted(msg) from e
+                raise
+            finally:
+                self._lane_loads[lane] -= 1
+                if prices is not None:
+                    self._shared_prices.release(prices.key)
+        else:
+            stopped = await run_simulation(
+                self.session_factory,
+                self.queue_service,
+                simulation_id,
+                should_stop=lambda: self._stopping,
+            )
+        if stopped:
+            raise JobInterrupted(f"Simulation {simulation_id}: stopped for worker shutdown")
 
-            # Load simulation in this session
+        # Log completion summary (fresh read: the run may have used another process)
+        async with self.session_factory() as session:
             sim = await session.get(ArenaSimulation, simulation_id)
-            if not sim:
-                logger.error(f"[{worker_id}] Simulation {simulation_id} not found")
+            if sim is None or sim.status != SimulationStatus.COMPLETED.value:
                 return
+            logger.info(
+                f"[{worker_id}] Simulation {simulation_id} completed: "
+                f"{sim.total_trades} trades, "
+                f"return {sim.total_return_pct}%"
+            )
 
-            # Initialize simulation if not yet started
-            if not sim.is_initialized:
-                logger.info(f"[{worker_id}] Simulation {simulation_id}: initializing")
-                await engine.initialize_simulation(simulation_id)
+    async def stop(self) -> None:
+        """Stop the worker, its running simulations and the pool lanes.
 
-                # Refresh to get updated state (only refresh scalar attributes needed by the worker)
-                await session.refresh(sim, attribute_names=["current_day", "total_days", "status"])
-                logger.info(
-                    f"[{worker_id}] Simulation {simulation_id}: initialized "
-                    f"with {sim.total_days} trading days"
-                )
+        Running simulations are told to stop at their next checkpoint (pool
+        processes through the shared stop event); each commits the days it
+        processed and its job is released for resume. Pool processes still
+        running once the base class's shutdown wait is over are terminated,
+        which also releases their jobs, so no simulation keeps writing
+        without heartbeats while another worker re-claims it. Published price
+        matrices no simulation holds anymore are then unlinked.
+        """
+        self._stopping = True
+        if self._stop_event is not None:
+            self._stop_event.set()
+        await super().stop()
+        if self._lanes:
+            await self._shutdown_lanes()
+        self._shared_prices.clear()
 
-            # Process days until completion
-            while sim.current_day < sim.total_days:
-                # Check for cancellation before each day
-                if await self.queue_service.is_cancelled(simulation_id):
-                    logger.info(
-                        f"[{worker_id}] Simulation {simulation_id} cancelled, "
-                        f"stopping at day {sim.current_day}"
-                    )
-                    return
-
-                # Process one day
-                start_time = time.monotonic()
-                snapshot = await engine.step_day(simulation_id)
-                elapsed = time.monotonic() - start_time
-
-                if snapshot is None:
-                    # Simulation completed (step_day returns None when done)
+    async def _shutdown_lanes(self) -> None:
+        """Terminate pool processes still running after the shutdown wait, then the lanes."""
+        if self._has_active_jobs():
+            logger.warning(
+                f"[{self.queue_service.worker_id}] Terminating pool processes "
+                f"still running after the shutdown wait"
+            )
+            self._terminate_pool_processes()
+            # Released by process_job once the pool reports the broken futures
+            settings = get_settings()
+            for _ in range(settings.worker_shutdown_iterations):
+                if not self._has_active_jobs():
                     break
+                await asyncio.sleep(settings.worker_shutdown_sleep)
 
-                # Refresh simulation to get updated current_day
-                await session.refresh(sim, attribute_names=["current_day", "total_days", "status"])
+        for executor in self._lanes:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._lanes = []
+        if self._started is not None:
+            self._started.close()
+            self._started = None
 
-                logger.info(
-                    f"[{worker_id}] Simulation {simulation_id}: "
-                    f"day {sim.current_day}/{sim.total_days} complete, "
-                    f"equity=${snapshot.total_equity}, took {elapsed:.2f}s"
-                )
+    def _has_active_jobs(self) -> bool:
+        """Whether any claimed job is still being processed."""
+        return self._current_job_id is not None or bool(self._active_jobs)
+
+    def _terminate_pool_processes(self) -> None:
+        """Kill the lanes' processes; their pending futures fail with BrokenProcessPool.
+
+        Only live children of this process that reported as pool processes
+        are terminated, so a PID reused after a pool process exited is safe.
+        """
+        pool_pids = set()
+        if self._started is not None:
+            while not self._started.empty():
+                pool_pids.add(self._started.get())
+        for process in multiprocessing.active_children():
+            if process.pid in pool_pids:
+                process.terminate()
+
+    async def _share_prices(self, simulation: ArenaSimulation) -> SharedPrices | None:
+        """Load and publish a simulation's price matrix for its pool process.
+
+        Simulations on the same prices (the strategies of a comparison
+        group, sweep configurations, walk-forward windows) then all attach
+        one copy, whichever lanes they run in. Grouped simulations also get
+        their group's signals (see ``_share_signals``). The caller releases
+        ``key`` once the simulation is done.
 
-            # Log completion summary (refresh state after session work)
-            await session.refresh(
-                sim,
-                attribute_names=[
-                    "current_day",
-                    "total_days",
-                    "status",
-                    "total_trades",
-                    "total_return_pct",
-                ],
+        Args:
+            simulation: The simulation about to run
+
+        Returns:
+            The published matrix, or None if loading failed; the pool process
+            then loads it itself and fails the simulation as usual.
+        """
+        try:
+            agent = get_agent(simulation.agent_type, simulation.agent_config)
+            key = simulation_price_key(simulation, agent.required_lookback_days)
+            matrix = await self._shared_prices.acquire(key, lambda: self._publish_prices(key))
+        except Exception as e:
+            logger.warning(
+                f"[{self.queue_service.worker_id}] Simulation {simulation.id}: "
+                f"could not share price data, the pool process loads it: {e}"
             )
-            logger.info(
-                f"[{worker_id}] Simulation {simulation_id} completed: "
-                f"{sim.total_trades} trades, "
-                f"return {sim.total_return_pct}%"
+            return None
+        prices = SharedPrices(key, cast(SharedPriceMatrix, matrix).ref)
+        if simulation.group_id is None or agent.signal_key is None:
+            return prices
+
+        try:
+            signals = await self._share_signals(simulation, prices, agent.signal_key)
+        except BaseException:
+            self._shared_prices.release(key)
+            raise
+        return replace(prices, signal_key=agent.signal_key, signals=signals)
+
+    async def _publish_prices(self, key: PriceCacheKey) -> PriceMatrix:
+        """Load a matrix and copy it into shared memory (unlinked once evicted)."""
+        data_service = DataService(session_factory=self.session_factory)
+        return SharedPriceMatrix.publish(await load_price_matrix(data_service, key))
+
+    async def _share_signals(
+        self, simulation: ArenaSimulation, prices: SharedPrices, signal_key: Hashable
+    ) -> dict[str, PrecomputedSignals] | None:
+        """Get a group's signals, computing them in a lane for its first simulation.
+
+        The configurations of a sweep (and the strategies of a comparison)
+        mostly score symbols the same way, so each symbol-day is scored once
+        on the published matrix and every simulation of the group, in any
+        lane, reuses the result.
+
+        Args:
+            simulation: The simulation about to run
+            prices: Its published matrix (held by the caller)
+            signal_key: ``BaseAgent.signal_key`` of its agent
+
+        Returns:
+            Signals per symbol, or None if computing them failed; the pool
+            process then computes its own.
+        """
+        signals = self._shared_prices.get_signals(prices.key, signal_key)
+        if signals is not None:
+            return signals
+
+        scope = (prices.key.signal_scope(), signal_key)
+        pending = self._signal_loads.get(scope)
+        if pending is None:
+            pending = asyncio.ensure_future(self._compute_signals(simulation, prices))
+            self._signal_loads[scope] = pending
+            pending.add_done_callback(lambda done: self._signal_load_done(scope, done))
+        try:
+            signals = await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise  # This caller was cancelled, not the computation
+            return None
+        except Exception as e:
+            logger.warning(
+                f"[{self.queue_service.worker_id}] Simulation {simulation.id}: "
+                f"could not precompute group signals, the pool process computes them: {e}"
+            )
+            return None
+        self._shared_prices.store_signals(prices.key, signal_key, signals)
+        return signals
+
+    async def _compute_signals(
+        self, simulation: ArenaSimulation, prices: SharedPrices
+    ) -> dict[str, PrecomputedSignals]:
+        """Run ``precompute_signals_in_process`` in the least busy lane."""
+        lane = self._pick_lane()
+        self._lane_loads[lane] += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_lane(lane),
+                precompute_signals_in_process,
+                prices,
+                simulation.agent_type,
+                simulation.agent_config,
             )
+        finally:
+            self._lane_loads[lane] -= 1
+
+    def _signal_load_done(
+        self,
+        scope: tuple[PriceCacheKey, Hashable],
+        done: asyncio.Future[dict[str, PrecomputedSignals]],
+    ) -> None:
+        """Forget a finished signal computation; its waiters have the result."""
+        del self._signal_loads[scope]
+        if not done.cancelled():
+            # Mark retrieved, so a failure whose waiters were cancelled isn't logged.
+            done.exception()
+
+    def _pick_lane(self) -> int:
+        """Choose the lane with the fewest simulations (and signal computations).
+
+        Returns:
+            Index into the worker's lanes.
+        """
+        return min(range(self.processes), key=self._lane_loads.__getitem__)
+
+    def _get_lane(self, lane: int) -> ProcessPoolExecutor:
+        """Create the lanes on first use and return one.
+
+        Each lane is a one-process pool, so a simulation's lane decides the
+        process (and price cache) it runs with. Uses the ``spawn`` start
+        method: forked children would inherit the parent's event loop and
+        open database connections.
+
+        Args:
+            lane: Index returned by ``_pick_lane``
+        """
+        if not self._lanes:
+            context = multiprocessing.get_context("spawn")
+            self._stop_event = context.Event()
+            self._started = context.SimpleQueue()
+            self._lanes = [
+                ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=context,
+                    initializer=_init_pool_process,
+                    initargs=(self._stop_event, self._started),
+                )
+                for _ in range(self.processes)
+            ]
+        return self._lanes[lane]
@@ -0,0 +1,262 @@
+"""Compact per-day decision log for arena snapshots.
+
+Snapshots used to store every symbol's decision as a JSON dict with its
+reasoning string, which for large universes made snapshots the bulk of a
+simulation's storage and of ``GET /arena/simulations/{id}``. DecisionLog
+instead keeps one row per recorded symbol in fixed-width columns (symbol
+index into ``ArenaSimulation.symbols``, action code, integer score, flags)
+and serializes them as a zlib-compressed binary blob.
+
+Reasoning text is not stored. ``NO_DATA`` reasons are implied by a flag;
+agent reasoning is rebuilt on request by re-running the agent for that day
+(``SimulationEngine.explain_decisions``).
+
+Blob layout (little-endian), compressed with zlib::
+
+    version: uint8, count: uint32
+    symbol_index: uint32[count]
+    action: uint8[count]
+    score: int16[count]     (-32768 = no score)
+    flags: uint8[count]
+    ibs: uint16[count]      (IBS in 1e-4 units, when IBS-filtered)
+"""
+
+import struct
+import zlib
+from collections.abc import Iterator, Mapping, Sequence
+
+import numpy as np
+
+from app.services.arena.agent_protocol import AgentDecision
+
+_VERSION = 1
+_HEADER = struct.Struct("<BI")
+
+# Action codes; AgentDecision actions plus the engine's NO_DATA.
+_ACTIONS: tuple[str, ...] = ("NO_DATA", "NO_SIGNAL", "HOLD", "BUY")
+_ACTION_CODES: dict[str, int] = {action: code for code, action in enumerate(_ACTIONS)}
+_BUY = _ACTION_CODES["BUY"]
+_NOT_RECORDED = 255
+
+_NO_SCORE = -32768
+
+# Flag bits
+_HELD = 1  # Agent evaluated the symbol with an open position
+_NO_BAR_TODAY = 2  # NO_DATA: history exists but no bar on the snapshot date
+_SELECTION_DECIDED = 4  # Portfolio selection (or the IBS filter) ruled on the signal
+_SELECTED = 8
+_IBS_FILTERED = 16
+
+_IBS_SCALE = 10_000
+
+_NO_DATA_REASONS = {False: "No price data", True: "No data for today"}
+
+
+class DecisionLog:
+    """One simulation day's decisions, indexed by the simulation's symbols.
+
+    With ``buy_only`` only BUY signals are recorded (together with their
+    portfolio selection and IBS annotations); other decisions are dropped.
+
+    Example:
+        >>> log = DecisionLog(["AAPL", "MSFT"])
+        >>> log.record("AAPL", decision, has_position=False)
+        >>> log.record_no_data("MSFT", has_history=False)
+        >>> snapshot.decision_log = log.to_bytes()
+    """
+
+    def __init__(self, symbols: Sequence[str], buy_only: bool = False) -> None:
+        """Initialize an empty log.
+
+        Args:
+            symbols: The simulation's symbols; positions are stored instead of names.
+            buy_only: Record only BUY decisions.
+        """
+        self._symbols = list(symbols)
+        self._index = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._buy_only = buy_only
+        n = len(self._symbols)
+        self._action = np.full(n, _NOT_RECORDED, dtype=np.uint8)
+        self._score = np.full(n, _NO_SCORE, dtype=np.int16)
+        self._flags = np.zeros(n, dtype=np.uint8)
+        self._ibs = np.zeros(n, dtype=np.uint16)
+
+    def record(self, symbol: str, decision: AgentDecision, has_position: bool) -> None:
+        """Record the agent's decision for a symbol.
+
+        Args:
+            symbol: Stock symbol.
+            decision: The agent's decision.
+            has_position: Whether the symbol was held when the agent evaluated it.
+        """
+        code = _ACTION_CODES[decision.action]
+        if self._buy_only and code != _BUY:
+            return
+        i = self._index[symbol]
+        self._action[i] = code
+        if decision.score is not None:
+            self._score[i] = decision.score
+        if has_position:
+            self._flags[i] |= _HELD
+
+    def record_no_data(self, symbol: str, has_history: bool) -> None:
+        """Record that a symbol could not be evaluated.
+
+        Args:
+            symbol: Stock symbol.
+            has_history: True if the symbol has history but no bar today.
+        """
+        if self._buy_only:
+            return
+        i = self._index[symbol]
+        self._action[i] = _ACTION_CODES["NO_DATA"]
+        if has_history:
+            self._flags[i] |= _NO_BAR_TODAY
+
+    def mark_ibs_filtered(self, symbol: str, ibs: float) -> None:
+        """Record that a BUY signal was dropped by the IBS entry filter.
+
+        Args:
+            symbol: Stock symbol.
+            ibs: The day's Internal Bar Strength.
+        """
+        i = self._index[symbol]
+        self._flags[i] |= _SELECTION_DECIDED | _IBS_FILTERED
+        self._ibs[i] = round(ibs * _IBS_SCALE)
+
+    def mark_selected(self, symbol: str, selected: bool) -> None:
+        """Record the portfolio selector's verdict on a BUY signal.
+
+        Args:
+            symbol: Stock symbol.
+            selected: Whether a position was opened for the signal.
+        """
+        i = self._index[symbol]
+        self._flags[i] |= _SELECTION_DECIDED
+        if selected:
+            self._flags[i] |= _SELECTED
+        else:
+            self._flags[i] &= ~np.uint8(_SELECTED)
+
+    def evaluated(self) -> Iterator[tuple[str, bool]]:
+        """Yield ``(symbol, has_position)`` for every recorded agent decision."""
+        no_data = _ACTION_CODES["NO_DATA"]
+        for i in np.flatnonzero((self._action != _NOT_RECORDED) & (self._action != no_data)):
+            yield self._symbols[i], bool(self._flags[i] & _HELD)
+
+    def to_dict(self, reasoning: Mapping[str, str] | None = None) -> dict[str, dict]:
+        """Expand to the ``{symbol: {action, score, reasoning, ...}}`` form.
+
+        Args:
+            reasoning: Agent reasoning per symbol (e.g. from
+                ``SimulationEngine.explain_decisions``). Symbols without an
+                entry get ``None``.
+
+        Returns:
+            Decisions keyed by symbol, in the simulation's symbol order.
+        """
+        reasoning = reasoning or {}
+        decisions: dict[str, dict] = {}
+        for i in np.flatnonzero(self._action != _NOT_RECORDED):
+            symbol = self._symbols[i]
+            action = _ACTIONS[self._action[i]]
+            flags = int(self._flags[i])
+            score = int(self._score[i])
+            entry: dict
+            if action == "NO_DATA":
+                entry = {
+                    "action": action,
+                    "reasoning": _NO_DATA_REASONS[bool(flags & _NO_BAR_TODAY)],
+                }
+            else:
+                entry = {
+                    "action": action,
+                    "score": None if score == _NO_SCORE else score,
+                    "reasoning": reasoning.get(symbol),
+                }
+            if flags & _IBS_FILTERED:
+                entry["ibs_filtered"] = True
+                entry["ibs_value"] = int(self._ibs[i]) / _IBS_SCALE
+            if flags & _SELECTION_DECIDED:
+                entry["portfolio_selected"] = bool(flags & _SELECTED)
+            decisions[symbol] = entry
+        return decisions
+
+    def to_bytes(self) -> bytes:
+        """Serialize the recorded rows to a compressed blob."""
+        rows = np.flatnonzero(self._action != _NOT_RECORDED)
+        payload = b"".join(
+            (
+                _HEADER.pack(_VERSION, len(rows)),
+                rows.astype("<u4").tobytes(),
+                self._action[rows].tobytes(),
+                self._score[rows].astype("<i2").tobytes(),
+                self._flags[rows].tobytes(),
+                self._ibs[rows].astype("<u2").tobytes(),
+            )
+        )
+        return zlib.compress(payload)
+
+    @classmethod
+    def from_bytes(cls, symbols: Sequence[str], blob: bytes) -> "DecisionLog":
+        """Load a log written by ``to_bytes``.
+
+        Args:
+            symbols: The simulation's symbols (the same list the log was written with).
+            blob: Serialized log.
+
+        Returns:
+            DecisionLog holding the recorded rows.
+
+        Raises:
+            ValueError: If the blob has an unknown version or refers to
+                symbols outside ``symbols``.
+        """
+        payload = zlib.decompress(blob)
+        version, count = _HEADER.unpack_from(payload)
+        if version != _VERSION:
+            msg = f"Unsupported decision log version: {version}"
+            raise ValueError(msg)
+
+        log = cls(symbols)
+        if count == 0:
+            return log
+
+        offset = _HEADER.size
+        columns = []
+        for dtype in ("<u4", "u1", "<i2", "u1", "<u2"):
+            column = np.frombuffer(payload, dtype=dtype, count=count, offset=offset)
+            offset += column.nbytes
+            columns.append(column)
+        rows, action, score, flags, ibs = columns
+
+        if int(rows.max()) >= len(log._symbols):
+            msg = "Decision log refers to more symbols than the simulation has"
+            raise ValueError(msg)
+        log._action[rows] = action
+        log._score[rows] = score
+        log._flags[rows] = flags
+        log._ibs[rows] = ibs
+        return log
+
+
+def snapshot_decisions(
+    symbols: Sequence[str],
+    decision_log: bytes | None,
+    legacy_decisions: dict | None,
+) -> dict[str, dict]:
+    """Get a snapshot's decisions, whichever way they were stored.
+
+    Args:
+        symbols: The simulation's symbols.
+        decision_log: ``ArenaSnapshot.decision_log``.
+        legacy_decisions: ``ArenaSnapshot.decisions`` (snapshots written
+            before the decision log).
+
+    Returns:
+        Decisions keyed by symbol. Reasoning is None for agent decisions
+        read from a decision log.
+    """
+    if decision_log is not None:
+        return DecisionLog.from_bytes(symbols, decision_log).to_dict()
+    return legacy_decisions or {}
@@ -0,0 +1,218 @@
+"""Vectorized daily exit rules for open arena positions.
+
+The engine's Decimal path applies the exit rules position by position:
+trailing stop, breakeven floor, profit ratchet, take profit and max hold.
+``evaluate_exits`` applies the same rules to every open position at once,
+as NumPy operations on integer price units (see ``trailing_stop``), so one
+day's exit stage costs a handful of array operations however many
+positions are open.
+
+Results are identical to the Decimal path:
+
+- Trailing stops round half-even to 4 decimal places, like ``quantize``.
+- Ratchet stops round half-up, like the Numeric column they are stored in.
+- Threshold checks compare exact integer products.
+- Stop exits fill at ``min(stop, open)`` (gap down).
+- Take-profit exits fill at ``max(target, open)`` (gap up). The target
+  price itself is a Decimal (``ExitBatch.take_profit_price``), because the
+  engine books it unrounded.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.models.arena import ExitReason
+from app.services.arena.trailing_stop import MULTIPLIER_SCALE, PRICE_SCALE
+
+# Exit codes in ExitBatch.reason; index into EXIT_REASONS.
+NO_EXIT = 0
+EXIT_REASONS: tuple[ExitReason | None, ...] = (
+    None,
+    ExitReason.STOP_HIT,
+    ExitReason.TAKE_PROFIT,
+    ExitReason.MAX_HOLD,
+)
+_STOP_HIT, _TAKE_PROFIT, _MAX_HOLD = 1, 2, 3
+
+
+@dataclass(frozen=True)
+class ExitRules:
+    """A simulation's exit rule configuration, in integer units.
+
+    Multipliers are in ``MULTIPLIER_SCALE`` units; 0 disables the rule.
+
+    Attributes:
+        breakeven_multiplier: ``1 + breakeven_trigger_pct / 100``.
+        ratchet_multiplier: ``1 + ratchet_trigger_pct / 100``.
+        ratchet_stop_multiplier: ``1 - ratchet_trail_pct / 100``.
+        take_profit_pct: Fixed take-profit target, in percent.
+        take_profit_atr_mult: Take-profit target as a multiple of ATR%.
+        max_hold_days: Maximum holding period in trading days.
+        max_hold_days_profit: Holding period for positions closing above entry.
+    """
+
+    breakeven_multiplier: int = 0
+    ratchet_multiplier: int = 0
+    ratchet_stop_multiplier: int = 0
+    take_profit_pct: float | None = None
+    take_profit_atr_mult: float | None = None
+    max_hold_days: int | None = None
+    max_hold_days_profit: int | None = None
+
+
+@dataclass
+class ExitBatch:
+    """Outcome of one day's exit rules, aligned with the input positions.
+
+    Attributes:
+        highest: New highest price since entry (unchanged on a stop exit).
+        stop: New stop price (unchanged on a stop exit).
+        reason: Exit code per position; ``EXIT_REASONS[code]`` is the
+            ExitReason, ``NO_EXIT`` keeps the position open.
+        exit_price: Fill price for stop and max-hold exits, and the gap-up
+            floor (today's open) for take-profit exits.
+        take_profit_pct: Take-profit target that fired, NaN elsewhere.
+    """
+
+    highest: NDArray[np.int64]
+    stop: NDArray[np.int64]
+    reason: NDArray[np.int8]
+    exit_price: NDArray[np.int64]
+    take_profit_pct: NDArray[np.float64]
+
+    def take_profit_price(self, i: int, entry_price: Decimal) -> Decimal:
+        """Decimal take-profit target of position ``i``.
+
+        Args:
+            i: Position index in the batch.
+            entry_price: The position's entry price.
+
+        Returns:
+            ``entry_price * (1 + target_pct / 100)``, unrounded.
+        """
+        return entry_price * (1 + Decimal(str(float(self.take_profit_pct[i]))) / 100)
+
+
+def price_units(prices: NDArray[np.float64]) -> NDArray[np.int64]:
+    """Convert float prices (4 decimal places) to integer price units."""
+    return np.rint(prices * PRICE_SCALE).astype(np.int64)
+
+
+def _scale(
+    prices: NDArray[np.int64], multipliers: NDArray[np.int64] | int, half_even: bool
+) -> NDArray[np.int64]:
+    """Vectorized ``trailing_stop.scale_price_units``."""
+    quotient, remainder = np.divmod(prices * multipliers, MULTIPLIER_SCALE)
+    twice = 2 * remainder
+    round_up = twice > MULTIPLIER_SCALE
+    if half_even:
+        round_up |= (twice == MULTIPLIER_SCALE) & (quotient % 2 == 1)
+    else:
+        round_up |= twice == MULTIPLIER_SCALE
+    return quotient + round_up
+
+
+def evaluate_exits(
+    rules: ExitRules,
+    *,
+    open_: NDArray[np.int64],
+    high: NDArray[np.int64],
+    low: NDArray[np.int64],
+    close: NDArray[np.int64],
+    entry: NDArray[np.int64],
+    highest: NDArray[np.int64],
+    stop: NDArray[np.int64],
+    trail_multiplier: NDArray[np.int64],
+    hold_days: NDArray[np.int64],
+    atr_pct: NDArray[np.float64] | None = None,
+) -> ExitBatch:
+    """Apply one day's exit rules to a batch of open positions.
+
+    Rules are checked in the engine's order: the trailing stop (against the
+    previous stop) first; then, for positions still open, the breakeven and
+    ratchet floors, take profit, and max hold.
+
+    Args:
+        rules: Exit rule configuration.
+        open_: Today's open per position, in price units.
+        high: Today's high.
+        low: Today's low.
+        close: Today's close.
+        entry: Entry price.
+        highest: Highest price since entry, before today.
+        stop: Stop price, before today.
+        trail_multiplier: ``1 - trail_pct / 100`` per position, in
+            multiplier units.
+        hold_days: Trading days since entry (0 when unknown).
+        atr_pct: Today's ATR% per position (NaN when unavailable); required
+            when ``rules.take_profit_atr_mult`` is set.
+
+    Returns:
+        ExitBatch aligned with the inputs.
+    """
+    triggered = low <= stop
+    alive = ~triggered
+    new_highest = np.where(triggered, highest, np.maximum(high, highest))
+    new_stop = np.where(
+        triggered, stop, np.maximum(_scale(new_highest, trail_multiplier, half_even=True), stop)
+    )
+    has_entry = entry != 0
+
+    # Breakeven floor: pin the stop at entry once the high clears the trigger
+    if rules.breakeven_multiplier:
+        threshold = entry * rules.breakeven_multiplier
+        hit = alive & has_entry & (new_highest * MULTIPLIER_SCALE >= threshold)
+        new_stop = np.where(hit, np.maximum(new_stop, entry), new_stop)
+
+    # Profit ratchet: tighter trail once the high clears the trigger
+    if rules.ratchet_multiplier:
+        threshold = entry * rules.ratchet_multiplier
+        hit = alive & has_entry & (new_highest * MULTIPLIER_SCALE >= threshold)
+        ratchet_stop = _scale(new_highest, rules.ratchet_stop_multiplier, half_even=False)
+        new_stop = np.where(hit, np.maximum(new_stop, ratchet_stop), new_stop)
+
+    reason = np.where(triggered, _STOP_HIT, NO_EXIT).astype(np.int8)
+    # Gap down: a stop exit fills at the open when the stock opens below the stop
+    exit_price = np.where(triggered, np.minimum(stop, open_), 0)
+
+    # Take profit on the intraday high; fills at max(target, open) for gap-ups
+    take_profit_pct = np.full(len(entry), np.nan)
+    if rules.take_profit_pct is not None or rules.take_profit_atr_mult is not None:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return_pct_at_high = (high - entry) * 100 / entry
+        if rules.take_profit_pct is not None:
+            hit = alive & (return_pct_at_high >= rules.take_profit_pct)
+            take_profit_pct[hit] = rules.take_profit_pct
+        if rules.take_profit_atr_mult is not None and atr_pct is not None:
+            atr_target = rules.take_profit_atr_mult * atr_pct
+            # NaN ATR compares False, like the Decimal path's missing-ATR skip
+            hit = (
+                alive
+                & np.isnan(take_profit_pct)
+                & (atr_pct > 0)
+                & (return_pct_at_high >= atr_target)
+            )
+            take_profit_pct[hit] = atr_target[hit]
+        take_profit = ~np.isnan(take_profit_pct)
+        reason[take_profit] = _TAKE_PROFIT
+        exit_price = np.where(take_profit, open_, exit_price)
+
+    # Max hold, with the extended limit for positions closing above entry
+    if rules.max_hold_days is not None:
+        limit = np.full(len(entry), rules.max_hold_days)
+        if rules.max_hold_days_profit is not None:
+            limit = np.where(has_entry & (close > entry), rules.max_hold_days_profit, limit)
+        expired = (reason == NO_EXIT) & (hold_days >= limit)
+        reason[expired] = _MAX_HOLD
+        exit_price = np.where(expired, close, exit_price)
+
+    return ExitBatch(
+        highest=new_highest,
+        stop=new_stop,
+        reason=reason,
+        exit_price=exit_price.astype(np.int64),
+        take_profit_pct=take_profit_pct,
+    )
@@ -0,0 +1,77 @@
+"""Market regime series for the arena regime filter (Layer 7).
+
+A day is ``bull`` when the regime symbol (e.g. SPY) closes above its simple
+moving average, ``bear`` otherwise, and ``neutral`` when there are fewer
+than ``sma_period`` bars in the lookback window ending that day.
+
+``regime_series`` classifies a whole range of dates from one pass over the
+regime symbol's history, so the engine looks each simulation day up instead
+of rebuilding the SMA window daily.
+"""
+
+from datetime import date
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.services.arena.agent_protocol import PriceWindow
+
+Regime = Literal["bull", "bear", "neutral"]
+
+
+def regime_lookback_days(sma_period: int) -> int:
+    """Calendar days of regime symbol history needed before a regime date."""
+    return sma_period * 2 + 30
+
+
+def regime_series(
+    history: PriceWindow, dates: NDArray[np.datetime64], sma_period: int
+) -> list[Regime]:
+    """Classify the market regime on each date.
+
+    No look-ahead: each date only uses bars up to and including that date.
+    Dates need not be regime symbol trading days; the latest bar on or
+    before the date is used.
+
+    Args:
+        history: Regime symbol bars (oldest to newest).
+        dates: Dates to classify (``datetime64[D]``).
+        sma_period: Number of bars in the simple moving average.
+
+    Returns:
+        Regime per date, aligned with ``dates``.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    regimes: list[Regime] = ["neutral"] * len(dates)
+    n = len(history)
+    if sma_period < 1 or n < sma_period:
+        return regimes
+
+    closes = history.closes
+    # Window sums added left to right, like the per-day sum() this replaces,
+    # so SMAs (and close == SMA ties) are bit-identical.
+    sums = np.zeros(n - sma_period + 1)
+    for k in range(sma_period):
+        sums += closes[k : n - sma_period + 1 + k]
+    sma = np.full(n, np.nan)
+    sma[sma_period - 1 :] = sums / sma_period
+
+    # Latest bar on or before each date, and the oldest bar in its SMA
+    last = np.searchsorted(history.dates, dates, side="right") - 1
+    oldest = last - sma_period + 1
+    window_start = dates - np.timedelta64(regime_lookback_days(sma_period), "D")
+    # Neutral unless all sma_period bars fall inside the lookback window
+    valid = oldest >= 0
+    valid[valid] &= history.dates[oldest[valid]] >= window_start[valid]
+
+    bull = np.zeros(len(dates), dtype=bool)
+    bull[valid] = closes[last[valid]] > sma[last[valid]]
+    for i in np.flatnonzero(valid):
+        regimes[i] = "bull" if bull[i] else "bear"
+    return regimes
+
+
+def regime_on(history: PriceWindow, current_date: date, sma_period: int) -> Regime:
+    """Classify the market regime on a single date (see ``regime_series``)."""
+    return regime_series(history, np.array([current_date], dtype="datetime64[D]"), sma_period)[0]
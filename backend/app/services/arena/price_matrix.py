@@ -0,0 +1,461 @@
+"""Columnar price storage for arena simulations.
+
+The simulation engine steps through hundreds of symbols per day, and every
+indicator it runs works on float arrays. Holding the cached history as
+``list[PriceBar]`` (Decimal fields) meant converting the same bars back to
+floats every simulated day. ``PriceMatrix`` stores the whole cache once as
+float64 OHLCV arrays shaped ``(dates, symbols)`` with a shared date index, and
+hands out per-symbol ``PriceWindow`` views without copying.
+
+Decimal ``PriceBar`` objects are only materialized on demand, for the few
+symbols whose bars feed cash accounting (entries, exits, position values).
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import date, timedelta
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.providers.base import PriceDataPoint
+from app.services.arena.agent_protocol import PriceBar, PriceWindow
+
+_FIELDS = ("open", "high", "low", "close", "volume")
+_ONE_DAY = timedelta(days=1)
+
+
+class PriceMatrix(Mapping[str, list[PriceBar]]):
+    """Immutable dates × symbols OHLCV store.
+
+    Columns are stored in Fortran order so each symbol's history is contiguous
+    in memory and per-symbol windows are plain slices. Dates where a symbol
+    has no bar hold NaN.
+
+    The Mapping interface (``symbol in matrix``, ``matrix[symbol]``) exists for
+    inspection and debugging; it materializes ``PriceBar`` objects and should
+    not be used on hot paths. Use ``window()`` and ``bar()`` instead.
+
+    Attributes:
+        symbols: Symbols in column order.
+        dates: Sorted unique dates (``datetime64[D]``) across all symbols.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        dates: NDArray[np.datetime64],
+        columns: dict[str, NDArray[np.float64]],
+    ) -> None:
+        """Wrap pre-built arrays. Prefer ``from_records`` / ``from_bars``.
+
+        Args:
+            symbols: Symbols in column order.
+            dates: Sorted unique ``datetime64[D]`` row index.
+            columns: Arrays keyed by field name (open, high, low, close,
+                volume), each shaped ``(len(dates), len(symbols))``.
+        """
+        self.symbols: tuple[str, ...] = tuple(symbols)
+        self.dates = dates
+        self._symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._open = columns["open"]
+        self._high = columns["high"]
+        self._low = columns["low"]
+        self._close = columns["close"]
+        self._volume = columns["volume"]
+
+        for array in (self.dates, self._open, self._high, self._low, self._close, self._volume):
+            array.setflags(write=False)
+
+        # Per-symbol valid row bounds. Symbols that list late or delist early
+        # only carry NaN outside [first, last]; windows are clamped to it so
+        # the common case stays a zero-copy slice.
+        present = ~np.isnan(self._close)
+        n_dates = len(self.dates)
+        has_any = present.any(axis=0)
+        if n_dates:
+            first = np.where(has_any, present.argmax(axis=0), n_dates)
+            last = np.where(has_any, n_dates - 1 - present[::-1].argmax(axis=0), -1)
+        else:
+            first = np.zeros(len(self.symbols), dtype=np.intp)
+            last = np.full(len(self.symbols), -1, dtype=np.intp)
+        self._first_row = first
+        self._last_row = last
+        counts = present.sum(axis=0)
+        # Interior holes (halts, vendor gaps) force a masked copy for that symbol.
+        self._has_gaps = has_any & (counts != (last - first + 1))
+        self._present = present
+
+        # O(1) date -> row lookup. ``_day_rows[d - first_ordinal]`` is the
+        # first row whose date is >= d (bisect-left), for every calendar day
+        # from the first date through the day after the last, so both exact
+        # lookups and range bounds are a subtraction plus a list index.
+        if n_dates:
+            first_day = self.dates[0]
+            calendar = np.arange(first_day, self.dates[-1] + 2, dtype="datetime64[D]")
+            self._first_ordinal = first_day.astype(object).toordinal()
+            self._day_rows: list[int] = np.searchsorted(self.dates, calendar).tolist()
+        else:
+            self._first_ordinal = 0
+            self._day_rows = [0]
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def empty(cls) -> "PriceMatrix":
+        """Create a matrix with no symbols and no dates."""
+        return cls._build({})
+
+    @classmethod
+    def from_records(
+        cls, records_by_symbol: Mapping[str, Sequence[PriceDataPoint]]
+    ) -> "PriceMatrix":
+        """Build a matrix from DataService price records.
+
+        This is the only place cached prices are converted to float.
+
+        Args:
+            records_by_symbol: Price records per symbol, oldest to newest.
+
+        Returns:
+            New PriceMatrix.
+
+        Raises:
+            ValueError: If any bar violates OHLC/volume invariants.
+        """
+        columns_by_symbol: dict[str, tuple[NDArray, ...]] = {}
+        for symbol, records in records_by_symbol.items():
+            columns_by_symbol[symbol] = (
+                np.array([r.timestamp.date() for r in records], dtype="datetime64[D]"),
+                np.array([r.open_price for r in records], dtype=np.float64),
+                np.array([r.high_price for r in records], dtype=np.float64),
+                np.array([r.low_price for r in records], dtype=np.float64),
+                np.array([r.close_price for r in records], dtype=np.float64),
+                np.array([r.volume for r in records], dtype=np.float64),
+            )
+        return cls._build(columns_by_symbol)
+
+    @classmethod
+    def from_bars(cls, bars_by_symbol: Mapping[str, Sequence[PriceBar]]) -> "PriceMatrix":
+        """Build a matrix from already-materialized PriceBar lists.
+
+        Args:
+            bars_by_symbol: PriceBars per symbol, oldest to newest.
+
+        Returns:
+            New PriceMatrix.
+        """
+        columns_by_symbol: dict[str, tuple[NDArray, ...]] = {}
+        for symbol, bars in bars_by_symbol.items():
+            columns_by_symbol[symbol] = (
+                np.array([b.date for b in bars], dtype="datetime64[D]"),
+                np.array([b.open for b in bars], dtype=np.float64),
+                np.array([b.high for b in bars], dtype=np.float64),
+                np.array([b.low for b in bars], dtype=np.float64),
+                np.array([b.close for b in bars], dtype=np.float64),
+                np.array([b.volume for b in bars], dtype=np.float64),
+            )
+        return cls._build(columns_by_symbol)
+
+    def with_records(
+        self, symbol: str, records: Sequence[PriceDataPoint]
+    ) -> "PriceMatrix":
+        """Return a new matrix with one symbol's records added or replaced.
+
+        Used to merge auxiliary symbols (e.g. the regime filter's SPY) that
+        are loaded with a different lookback than the traded universe.
+
+        Args:
+            symbol: Symbol to add.
+            records: Price records for the symbol, oldest to newest.
+
+        Returns:
+            New PriceMatrix containing all existing symbols plus ``symbol``.
+        """
+        columns_by_symbol = {s: self._symbol_columns(s) for s in self.symbols if s != symbol}
+        added = PriceMatrix.from_records({symbol: records})
+        columns_by_symbol[symbol] = added._symbol_columns(symbol)
+        return PriceMatrix._build(columns_by_symbol)
+
+    @classmethod
+    def _build(cls, columns_by_symbol: Mapping[str, tuple[NDArray, ...]]) -> "PriceMatrix":
+        """Align per-symbol columns onto the union date index."""
+        symbols = list(columns_by_symbol)
+        if symbols:
+            dates = np.unique(
+                np.concatenate([cols[0] for cols in columns_by_symbol.values()])
+            )
+        else:
+            dates = np.array([], dtype="datetime64[D]")
+
+        shape = (len(dates), len(symbols))
+        columns = {name: np.full(shape, np.nan, dtype=np.float64, order="F") for name in _FIELDS}
+        for j, symbol in enumerate(symbols):
+            sym_dates, *values = columns_by_symbol[symbol]
+            if len(sym_dates) == 0:
+                continue
+            _validate_bars(symbol, sym_dates, *values)
+            rows = np.searchsorted(dates, sym_dates)
+            for name, column in zip(_FIELDS, values, strict=True):
+                columns[name][rows, j] = column
+
+        return cls(symbols, dates, columns)
+
+    def _symbol_columns(self, symbol: str) -> tuple[NDArray, ...]:
+        """Extract one symbol's present rows as (dates, open, high, low, close, volume)."""
+        j = self._symbol_index[symbol]
+        mask = self._present[:, j]
+        return (
+            self.dates[mask],
+            self._open[mask, j],
+            self._high[mask, j],
+            self._low[mask, j],
+            self._close[mask, j],
+            self._volume[mask, j],
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the matrix's arrays, in bytes."""
+        return (
+            self.dates.nbytes
+            + self._open.nbytes
+            + self._high.nbytes
+            + self._low.nbytes
+            + self._close.nbytes
+            + self._volume.nbytes
+            + self._present.nbytes
+        )
+
+    # ------------------------------------------------------------------
+    # Hot-path access
+    # ------------------------------------------------------------------
+
+    def window(self, symbol: str, start: date, end: date) -> PriceWindow:
+        """Get a symbol's bars with ``start <= date <= end``.
+
+        Returns zero-copy views unless the symbol has interior gaps inside
+        the requested range, in which case the present rows are copied out.
+
+        Args:
+            symbol: Stock symbol.
+            start: Inclusive start date.
+            end: Inclusive end date.
+
+        Returns:
+            PriceWindow (empty if the symbol is unknown or has no bars in range).
+        """
+        j = self._symbol_index.get(symbol)
+        if j is None:
+            return PriceWindow.empty()
+
+        lo = self._row_at_or_after(start)
+        hi = self._row_at_or_after(end + _ONE_DAY)
+        lo = max(lo, int(self._first_row[j]))
+        hi = min(hi, int(self._last_row[j]) + 1)
+        if lo >= hi:
+            return PriceWindow.empty()
+
+        rows: slice | NDArray[np.bool_] = slice(lo, hi)
+        dates = self.dates[lo:hi]
+        if self._has_gaps[j]:
+            mask = self._present[lo:hi, j]
+            if not mask.all():
+                rows = np.flatnonzero(mask) + lo
+                dates = self.dates[rows]
+
+        return PriceWindow(
+            dates=dates,
+            opens=self._open[rows, j],
+            highs=self._high[rows, j],
+            lows=self._low[rows, j],
+            closes=self._close[rows, j],
+            volumes=self._volume[rows, j],
+        )
+
+    def history(self, symbol: str) -> PriceWindow:
+        """Get every bar cached for a symbol (oldest to newest).
+
+        Args:
+            symbol: Stock symbol.
+
+        Returns:
+            PriceWindow (empty if the symbol is unknown).
+        """
+        j = self._symbol_index.get(symbol)
+        if j is None or self._last_row[j] < 0:
+            return PriceWindow.empty()
+        first = self.dates[self._first_row[j]].item()
+        last = self.dates[self._last_row[j]].item()
+        return self.window(symbol, first, last)
+
+    def bar(self, symbol: str, target_date: date) -> PriceBar | None:
+        """Materialize a single Decimal PriceBar for cash accounting.
+
+        Args:
+            symbol: Stock symbol.
+            target_date: Bar date.
+
+        Returns:
+            PriceBar, or None if the symbol has no bar on that date.
+        """
+        j = self._symbol_index.get(symbol)
+        if j is None:
+            return None
+        row = self.row_for_date(target_date)
+        if row is None or not self._present[row, j]:
+            return None
+        return self._bar_at(row, j)
+
+    def close(self, symbol: str, target_date: date) -> float | None:
+        """Closing price of a single bar as a float, without building a PriceBar.
+
+        Args:
+            symbol: Stock symbol.
+            target_date: Bar date.
+
+        Returns:
+            Close price, or None if the symbol has no bar on that date.
+        """
+        j = self._symbol_index.get(symbol)
+        if j is None:
+            return None
+        row = self.row_for_date(target_date)
+        if row is None or not self._present[row, j]:
+            return None
+        return float(self._close[row, j])
+
+    def day_prices(
+        self, symbols: Sequence[str], target_date: date
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """Open, high, low and close of several symbols on one date.
+
+        Args:
+            symbols: Stock symbols.
+            target_date: Bar date.
+
+        Returns:
+            ``(open, high, low, close)`` arrays aligned with ``symbols``; NaN
+            where a symbol has no bar on that date.
+        """
+        n = len(symbols)
+        prices = tuple(np.full(n, np.nan) for _ in range(4))
+        row = self.row_for_date(target_date)
+        if row is None or n == 0:
+            return prices
+        columns = np.fromiter(
+            (self._symbol_index.get(symbol, -1) for symbol in symbols), dtype=np.intp, count=n
+        )
+        known = columns >= 0
+        for out, array in zip(
+            prices, (self._open, self._high, self._low, self._close), strict=True
+        ):
+            out[known] = array[row, columns[known]]
+        return prices
+
+    def row_for_date(self, target_date: date) -> int | None:
+        """Row index of an exact date in the matrix, in O(1).
+
+        Args:
+            target_date: Date to look up.
+
+        Returns:
+            Row index, or None if no symbol has a bar on that date.
+        """
+        row = self._row_at_or_after(target_date)
+        if row < self._row_at_or_after(target_date + _ONE_DAY):
+            return row
+        return None
+
+    def trading_days(self, start: date, end: date) -> list[date]:
+        """Dates in ``[start, end]`` where at least one symbol has a bar.
+
+        Args:
+            start: Inclusive start date.
+            end: Inclusive end date.
+
+        Returns:
+            Sorted list of dates.
+        """
+        lo = self._row_at_or_after(start)
+        hi = self._row_at_or_after(end + _ONE_DAY)
+        return self.dates[lo:hi].astype(object).tolist()
+
+    def _row_at_or_after(self, target_date: date) -> int:
+        """First row whose date is >= target_date (bisect-left), in O(1)."""
+        offset = target_date.toordinal() - self._first_ordinal
+        if offset <= 0:
+            return 0
+        if offset >= len(self._day_rows):
+            return len(self.dates)
+        return self._day_rows[offset]
+
+    def _bar_at(self, row: int, j: int) -> PriceBar:
+        """Build a Decimal PriceBar from one cell of the matrix."""
+        return PriceBar.from_floats(
+            bar_date=self.dates[row].astype(object),
+            open_=self._open[row, j],
+            high=self._high[row, j],
+            low=self._low[row, j],
+            close=self._close[row, j],
+            volume=self._volume[row, j],
+        )
+
+    # ------------------------------------------------------------------
+    # Mapping interface (inspection only)
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, symbol: str) -> list[PriceBar]:
+        """Materialize all of a symbol's bars as PriceBars."""
+        j = self._symbol_index[symbol]
+        return [self._bar_at(int(row), j) for row in np.flatnonzero(self._present[:, j])]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over symbols."""
+        return iter(self.symbols)
+
+    def __len__(self) -> int:
+        """Number of symbols."""
+        return len(self.symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Whether the symbol has a column (O(1))."""
+        return symbol in self._symbol_index
+
+
+def _validate_bars(
+    symbol: str,
+    dates: NDArray[np.datetime64],
+    opens: NDArray[np.float64],
+    highs: NDArray[np.float64],
+    lows: NDArray[np.float64],
+    closes: NDArray[np.float64],
+    volumes: NDArray[np.float64],
+) -> None:
+    """Apply PriceBar's OHLCV invariants to a whole column at once.
+
+    Raises:
+        ValueError: On the first offending bar, mirroring PriceBar's messages.
+    """
+    bad = (
+        (highs < lows)
+        | (highs < opens)
+        | (highs < closes)
+        | (lows > opens)
+        | (lows > closes)
+        | (volumes < 0)
+    )
+    if bad.any():
+        i = int(np.argmax(bad))
+        # Reuse PriceBar's own validation so error messages stay identical.
+        PriceBar.from_floats(
+            bar_date=dates[i].astype(object),
+            open_=opens[i],
+            high=highs[i],
+            low=lows[i],
+            close=closes[i],
+            volume=volumes[i],
+        )
+        msg = f"Invalid price bar for {symbol} on {dates[i]}"
+        raise ValueError(msg)
@@ -0,0 +1,272 @@
+"""Process-wide shared price cache for arena simulations.
+
+A comparison group runs several strategies over the same symbols and dates.
+Without sharing, every ``SimulationEngine`` fetched and converted the same
+bars into its own ``PriceMatrix``. ``SharedPriceCache`` hands out one
+immutable matrix per load key to every simulation that asks for it:
+
+- Each ``acquire`` takes a reference; ``release`` drops it.
+- Concurrent acquires of a key that is still loading wait for that load
+  instead of starting another one.
+- Once no simulation references a matrix it stays cached only while the
+  total size of unreferenced matrices fits in ``max_bytes``, evicting the
+  least recently used first. Referenced matrices are never evicted.
+- Agent signals precomputed from a matrix can be stored with it, so
+  simulations that differ only in exit, sizing or regime parameters (a
+  parameter sweep) score each symbol-day once.
+
+The cache lives per process. ``ArenaWorker`` loads the matrices its pool
+processes need once and publishes them in shared memory (see
+``shared_price_memory``); each pool process attaches them into its own
+cache, so all processes read one copy. It also computes the signals of a
+group (e.g. a parameter sweep) once and stores them in each process's cache
+next to the attached matrix.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, replace
+from datetime import date
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.services.arena.agent_protocol import PrecomputedSignals
+from app.services.arena.price_matrix import PriceMatrix
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PriceCacheKey:
+    """Identifies one loaded price matrix.
+
+    Two simulations share a matrix only when every field matches. A matrix
+    for a larger universe is not reused, because trading days are derived
+    from every cached symbol. Simulations that should share across date
+    ranges (walk-forward windows) request the same range explicitly.
+
+    Attributes:
+        symbols: Traded symbols, sorted.
+        data_start: First date fetched (simulation start minus lookback).
+        end_date: Last date fetched.
+        regime_symbol: Regime filter symbol merged into the matrix, if any.
+        regime_start: First date fetched for the regime symbol.
+    """
+
+    symbols: tuple[str, ...]
+    data_start: date
+    end_date: date
+    regime_symbol: str | None = None
+    regime_start: date | None = None
+
+    def signal_scope(self) -> "PriceCacheKey":
+        """Key of the traded symbols' histories, which signals are computed from.
+
+        The regime symbol only adds its own column to the matrix, so matrices
+        that differ only in regime fields share precomputed signals.
+        """
+        return replace(self, regime_symbol=None, regime_start=None)
+
+
+@dataclass
+class _Entry:
+    """A cached matrix and the number of users."""
+
+    matrix: PriceMatrix
+    refs: int = 0
+
+
+class SharedPriceCache:
+    """Reference-counted PriceMatrix cache with an LRU budget for idle entries.
+
+    Not thread-safe: all calls must come from one event loop at a time,
+    which holds for the API process and for each pool worker process.
+
+    Example:
+        >>> cache = SharedPriceCache(max_bytes=512 * 1024 * 1024)
+        >>> matrix = await cache.acquire(key, load_matrix)
+        >>> ...
+        >>> cache.release(key)
+    """
+
+    def __init__(self, max_bytes: int = 0) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for matrices no simulation references.
+                0 drops a matrix as soon as its last user releases it.
+
+        Raises:
+            ValueError: If max_bytes is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self._entries: dict[PriceCacheKey, _Entry] = {}
+        # Unreferenced entries, least recently released first.
+        self._idle: OrderedDict[PriceCacheKey, None] = OrderedDict()
+        self._idle_bytes = 0
+        self._loading: dict[PriceCacheKey, asyncio.Future[PriceMatrix]] = {}
+        # Precomputed agent signals per symbol, by signal scope and then by
+        # BaseAgent.signal_key. Kept while any matrix of the scope is cached.
+        self._signals: dict[PriceCacheKey, dict[Hashable, dict[str, PrecomputedSignals]]] = {}
+
+    async def acquire(
+        self,
+        key: PriceCacheKey,
+        loader: Callable[[], Awaitable[PriceMatrix]],
+    ) -> PriceMatrix:
+        """Get the matrix for a key, loading it if needed, and take a reference.
+
+        Args:
+            key: Load parameters identifying the matrix.
+            loader: Builds the matrix on a cache miss.
+
+        Returns:
+            The shared, read-only PriceMatrix.
+
+        Raises:
+            Exception: Whatever the loader raises. Failed loads are not cached.
+        """
+        while (entry := self._entries.get(key)) is None:
+            pending = self._loading.get(key)
+            if pending is None:
+                await self._load(key, loader)
+                continue
+            try:
+                await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # This caller was cancelled, not the load
+                # The loading caller was cancelled; retry the load here.
+
+        if entry.refs == 0 and key in self._idle:
+            del self._idle[key]
+            self._idle_bytes -= entry.matrix.nbytes
+        entry.refs += 1
+        return entry.matrix
+
+    def release(self, key: PriceCacheKey) -> None:
+        """Drop a reference taken by ``acquire``.
+
+        When the last reference goes, the matrix becomes idle and is kept
+        only while it fits in the budget.
+
+        Args:
+            key: Key passed to ``acquire``.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.refs == 0:
+            logger.warning(f"Releasing price cache entry that is not held: {key}")
+            return
+
+        entry.refs -= 1
+        if entry.refs == 0:
+            self._idle[key] = None
+            self._idle_bytes += entry.matrix.nbytes
+            self._evict()
+
+    def get_signals(
+        self, key: PriceCacheKey, signal_key: Hashable
+    ) -> dict[str, PrecomputedSignals] | None:
+        """Get signals previously stored for a cached matrix.
+
+        Args:
+            key: Key of a matrix the caller holds.
+            signal_key: ``BaseAgent.signal_key`` of the agent.
+
+        Returns:
+            Signals per symbol, or None if none were stored.
+        """
+        if key not in self._entries:
+            return None
+        return self._signals.get(key.signal_scope(), {}).get(signal_key)
+
+    def store_signals(
+        self,
+        key: PriceCacheKey,
+        signal_key: Hashable,
+        signals: dict[str, PrecomputedSignals],
+    ) -> None:
+        """Keep precomputed signals alongside their matrix for other simulations.
+
+        Signals are shared by every matrix with the same signal scope, are
+        dropped with the last of those matrices and are not counted against
+        the byte budget.
+
+        Args:
+            key: Key of a matrix the caller holds.
+            signal_key: ``BaseAgent.signal_key`` of the agent that computed them.
+            signals: Signals per symbol.
+        """
+        if key in self._entries:
+            self._signals.setdefault(key.signal_scope(), {})[signal_key] = signals
+
+    def clear(self) -> None:
+        """Drop all idle entries. Referenced entries are kept."""
+        for key in list(self._idle):
+            del self._entries[key]
+        self._idle.clear()
+        self._idle_bytes = 0
+        self._drop_orphaned_signals()
+
+    def __len__(self) -> int:
+        """Number of cached matrices (referenced and idle)."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a matrix is cached for the key."""
+        return key in self._entries
+
+    async def _load(
+        self,
+        key: PriceCacheKey,
+        loader: Callable[[], Awaitable[PriceMatrix]],
+    ) -> None:
+        """Run the loader once, publishing the result to concurrent waiters."""
+        future: asyncio.Future[PriceMatrix] = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            matrix = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure doesn't log a warning.
+            future.exception()
+            raise
+        else:
+            self._entries[key] = _Entry(matrix)
+            future.set_result(matrix)
+            logger.debug(
+                f"Price cache: loaded {len(matrix)} symbols x {len(matrix.dates)} dates "
+                f"({matrix.nbytes / 1e6:.1f} MB)"
+            )
+        finally:
+            del self._loading[key]
+
+    def _evict(self) -> None:
+        """Evict least recently released idle entries until within budget."""
+        evicted = False
+        while self._idle and self._idle_bytes > self.max_bytes:
+            key, _ = self._idle.popitem(last=False)
+            entry = self._entries.pop(key)
+            self._idle_bytes -= entry.matrix.nbytes
+            evicted = True
+        if evicted:
+            self._drop_orphaned_signals()
+
+    def _drop_orphaned_signals(self) -> None:
+        """Drop signals whose scope no cached matrix has anymore."""
+        scopes = {key.signal_scope() for key in self._entries}
+        for scope in [scope for scope in self._signals if scope not in scopes]:
+            del self._signals[scope]
+
+
+@lru_cache(maxsize=1)
+def get_shared_price_cache() -> SharedPriceCache:
+    """Get this process's shared price cache, sized from settings."""
+    return SharedPriceCache(max_bytes=get_settings().arena_price_cache_mb * 1024 * 1024)
@@ -0,0 +1,136 @@
+"""Price matrices shared between processes through shared memory.
+
+``SharedPriceCache`` shares a matrix between the simulations of one process,
+but ``ArenaWorker`` runs simulations in several pool processes, so the
+strategies of a comparison group would each load the same matrix again.
+Instead the worker loads a matrix once, publishes its OHLCV arrays into one
+``multiprocessing.shared_memory`` block with ``SharedPriceMatrix.publish``,
+and pool processes ``attach`` to that block read-only, so every process reads
+the same pages.
+
+The publishing process owns the block and unlinks it once its matrix is
+garbage collected (e.g. evicted from its cache). Attached processes keep the
+block mapped until their own matrix and every view of it are gone.
+"""
+
+import weakref
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.services.arena.price_matrix import PriceMatrix
+
+_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(frozen=True, eq=False)
+class SharedPriceMatrixRef:
+    """Picklable reference to a published matrix, passed to other processes.
+
+    Attributes:
+        name: Shared memory block holding the OHLCV arrays.
+        symbols: Symbols in column order.
+        dates: Row index (``datetime64[D]``).
+    """
+
+    name: str
+    symbols: tuple[str, ...]
+    dates: NDArray[np.datetime64]
+
+
+class SharedPriceMatrix(PriceMatrix):
+    """PriceMatrix whose OHLCV arrays live in a shared memory block.
+
+    Create one with ``publish`` (owner) or ``attach`` (other processes), not
+    with the PriceMatrix constructors.
+
+    Attributes:
+        ref: Reference other processes attach with.
+    """
+
+    def __init__(self, ref: SharedPriceMatrixRef, owner: bool) -> None:
+        """Map the block and wrap its arrays.
+
+        Args:
+            ref: Block to map.
+            owner: Whether this process unlinks the block when done with it.
+        """
+        block = _Block(shared_memory.SharedMemory(name=ref.name), ref, owner)
+        ohlcv = np.asarray(block)
+        super().__init__(
+            ref.symbols,
+            ref.dates,
+            {name: ohlcv[:, :, i] for i, name in enumerate(_FIELDS)},
+        )
+        self.ref = ref
+
+    @classmethod
+    def publish(cls, matrix: PriceMatrix) -> "SharedPriceMatrix":
+        """Copy a matrix into a new shared memory block owned by this process.
+
+        Args:
+            matrix: Matrix to share.
+
+        Returns:
+            SharedPriceMatrix over the new block. The block is unlinked when
+            it is garbage collected, so keep it while other processes may
+            still attach.
+        """
+        shape = (len(matrix.dates), len(matrix.symbols), len(_FIELDS))
+        block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+        try:
+            ohlcv = np.ndarray(shape, dtype=np.float64, buffer=block.buf, order="F")
+            columns = (matrix._open, matrix._high, matrix._low, matrix._close, matrix._volume)
+            for i, column in enumerate(columns):
+                ohlcv[:, :, i] = column
+            del ohlcv
+            ref = SharedPriceMatrixRef(block.name, matrix.symbols, matrix.dates)
+            return cls(ref, owner=True)
+        except BaseException:
+            block.unlink()
+            raise
+        finally:
+            block.close()
+
+    @classmethod
+    def attach(cls, ref: SharedPriceMatrixRef) -> "SharedPriceMatrix":
+        """Map a matrix published by another process.
+
+        Args:
+            ref: ``ref`` of the published matrix.
+
+        Returns:
+            Read-only SharedPriceMatrix over the published block.
+
+        Raises:
+            FileNotFoundError: If the owner already unlinked the block.
+        """
+        return cls(ref, owner=False)
+
+
+class _Block:
+    """Array source that keeps a shared memory block mapped.
+
+    Arrays built from ``__array_interface__`` hold this object as their base,
+    so the block is closed (and unlinked, for the owner) only after the last
+    view of it is gone. Closing it earlier would leave those arrays pointing
+    at unmapped memory.
+    """
+
+    def __init__(
+        self, block: shared_memory.SharedMemory, ref: SharedPriceMatrixRef, owner: bool
+    ) -> None:
+        shape = (len(ref.dates), len(ref.symbols), len(_FIELDS))
+        layout = np.ndarray(shape, dtype=np.float64, buffer=block.buf, order="F")
+        self.__array_interface__ = layout.__array_interface__
+        del layout
+        weakref.finalize(self, _release_block, block, owner)
+
+
+def _release_block(block: shared_memory.SharedMemory, owner: bool) -> None:
+    """Unmap a block, unlinking it if this process published it."""
+    block.close()
+    if owner:
+        block.unlink()
@@ -9,16 +9,21 @@ trading simulations. It manages:
 - Performance metrics calculation
 """
 
-import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from typing import Sequence
 
-from sqlalchemy import select
+import numpy as np
+from numpy.typing import NDArray
+from sqlalchemy import Numeric, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import noload
 
+from app.core.config import get_settings
 from app.models.arena import (
     ArenaPosition,
     ArenaSimulation,
@@ -28,16 +33,277 @@ from app.models.arena import (
     SimulationStatus,
 )
 from app.models.stock_sector import StockSector
-from app.services.arena.agent_protocol import AgentDecision, PriceBar
-from app.services.arena.analytics import compute_simulation_analytics
+from app.services.arena.agent_protocol import (
+    AgentDecision,
+    BaseAgent,
+    PrecomputedSignals,
+    PriceBar,
+    PriceWindow,
+)
 from app.services.arena.agent_registry import get_agent
-from app.services.arena.trailing_stop import AtrTrailingStop, FixedPercentTrailingStop
+from app.services.arena.analytics import compute_simulation_analytics
+from app.services.arena.decision_log import DecisionLog
+from app.services.arena.exit_rules import (
+    EXIT_REASONS,
+    ExitBatch,
+    ExitRules,
+    evaluate_exits,
+    price_units,
+)
+from app.services.arena.market_regime import (
+    Regime,
+    regime_lookback_days,
+    regime_on,
+    regime_series,
+)
+from app.services.arena.price_matrix import PriceMatrix
+from app.services.arena.shared_price_cache import PriceCacheKey, SharedPriceCache
+from app.services.arena.step_profile import StepProfile, counting_statements
+from app.services.arena.trailing_stop import (
+    PRICE_SCALE,
+    AtrTrailingStop,
+    FixedPercentTrailingStop,
+    from_price_units,
+    to_multiplier_units,
+    to_price_units,
+    trail_multiplier_units,
+)
 from app.services.data_service import DataService
 from app.services.portfolio_selector import EnrichedScoreSelector, QualifyingSignal, get_selector
-from app.utils.technical_indicators import calculate_atr_percentage
+from app.services.trading_calendar_service import SessionIndex
+from app.utils.technical_indicators import (
+    calculate_atr_percentage,
+    calculate_rolling_atr_percentage,
+)
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_PRICE_MATRIX = PriceMatrix.empty()
+
+# Numeric column scales for values carried from one day to the next. Postgres
+# rounds (half away from zero) on write, so a day that starts from a database
+# reload sees these values rounded; the engine rounds its in-memory state the
+# same way so in-memory and resumed runs produce identical results.
+_POSITION_SCALES: dict[str, int] = {
+    column.name: column.type.scale
+    for column in ArenaPosition.__table__.columns
+    if isinstance(column.type, Numeric)
+}
+_SNAPSHOT_QUANTUM = Decimal(1).scaleb(-ArenaSnapshot.__table__.c.cash.type.scale)
+
+
+def simulation_price_key(simulation: ArenaSimulation, lookback_days: int) -> PriceCacheKey:
+    """Key of the price matrix ``SimulationEngine`` loads for a simulation.
+
+    Lets another process (``ArenaWorker``) load and share the matrix before
+    the engine asks for it.
+
+    Args:
+        simulation: Simulation to load prices for.
+        lookback_days: Agent's required lookback period.
+
+    Returns:
+        Key for ``SharedPriceCache`` and ``load_price_matrix``.
+    """
+    start_date, end_date, regime_symbol, regime_sma_period = _simulation_price_range(simulation)
+    return _price_cache_key(
+        simulation.symbols, start_date, end_date, lookback_days, regime_symbol, regime_sma_period
+    )
+
+
+def _simulation_price_range(simulation: ArenaSimulation) -> tuple[date, date, str | None, int]:
+    """Dates to load for a simulation, and its regime symbol and SMA period if enabled.
+
+    An optional ``price_range`` in agent_config (``{"start": ISO date,
+    "end": ISO date}``) widens the loaded range beyond the simulation's own
+    dates. Walk-forward sub-simulations set it to the whole run so every
+    window shares one cached matrix; lookups stay windowed by date, so
+    results are unchanged.
+    """
+    start_date = simulation.start_date
+    end_date = simulation.end_date
+    price_range = simulation.agent_config.get("price_range")
+    if price_range:
+        start_date = min(start_date, date.fromisoformat(price_range["start"]))
+        end_date = max(end_date, date.fromisoformat(price_range["end"]))
+
+    regime_symbol: str | None = None
+    regime_sma_period = 0
+    # Regime filter: pre-load regime symbol (e.g. SPY) into price cache
+    if simulation.agent_config.get("regime_filter", False):
+        regime_symbol = simulation.agent_config.get("regime_symbol", "SPY")
+        regime_sma_period = simulation.agent_config.get("regime_sma_period", 20)
+    return start_date, end_date, regime_symbol, regime_sma_period
+
+
+def _price_cache_key(
+    symbols: Sequence[str],
+    start_date: date,
+    end_date: date,
+    lookback_days: int,
+    regime_symbol: str | None,
+    regime_sma_period: int,
+) -> PriceCacheKey:
+    """Build a price cache key (see ``SimulationEngine._load_price_cache`` for the args)."""
+    return PriceCacheKey(
+        symbols=tuple(sorted(symbols)),
+        data_start=start_date - timedelta(days=lookback_days + 30),
+        end_date=end_date,
+        regime_symbol=regime_symbol,
+        regime_start=(
+            start_date - timedelta(days=regime_lookback_days(regime_sma_period))
+            if regime_symbol is not None
+            else None
+        ),
+    )
+
+
+async def load_price_matrix(data_service: DataService, key: PriceCacheKey) -> PriceMatrix:
+    """Fetch price records through DataService and build a PriceMatrix.
+
+    Args:
+        data_service: Service to fetch price records with.
+        key: Symbols and date ranges to load.
+
+    Returns:
+        PriceMatrix with all symbols, plus the regime symbol if requested.
+
+    Raises:
+        ValueError: If any symbol fails to load (fail-fast approach).
+    """
+    end = datetime.combine(key.end_date, datetime.max.time(), tzinfo=timezone.utc)
+
+    def start_of(day: date) -> datetime:
+        return datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
+
+    # One cache query for the whole universe; only stale symbols hit the
+    # provider (fail-fast on any error)
+    results = await data_service.get_price_data_batch(
+        list(key.symbols),
+        start_date=start_of(key.data_start),
+        end_date=end,
+        interval="1d",
+    )
+
+    # Build the columnar cache once; Decimal -> float happens only here
+    matrix = PriceMatrix.from_records(results)
+
+    # The regime symbol is merged without overwriting simulation symbol data,
+    # and is deliberately not added to simulation.symbols so it never
+    # participates in position or trading-day logic.
+    if (
+        key.regime_symbol is not None
+        and key.regime_start is not None
+        and key.regime_symbol not in matrix
+    ):
+        records = await data_service.get_price_data(
+            symbol=key.regime_symbol,
+            start_date=start_of(key.regime_start),
+            end_date=end,
+            interval="1d",
+        )
+        matrix = matrix.with_records(key.regime_symbol, records)
+        logger.debug(f"Loaded {len(records)} {key.regime_symbol} bars for regime filter")
+
+    return matrix
+
+
+def precompute_signals(
+    agent: BaseAgent, matrix: PriceMatrix, symbols: Iterable[str]
+) -> dict[str, PrecomputedSignals]:
+    """Precompute an agent's decisions over each symbol's full history in a matrix.
+
+    Args:
+        agent: Agent to precompute for.
+        matrix: Price matrix holding the symbols.
+        symbols: Symbols to precompute.
+
+    Returns:
+        Signals per symbol; symbols the agent cannot batch-evaluate are left out.
+    """
+    signals: dict[str, PrecomputedSignals] = {}
+    for symbol in symbols:
+        symbol_signals = agent.precompute_signals(matrix.history(symbol))
+        if isinstance(symbol_signals, PrecomputedSignals):
+            signals[symbol] = symbol_signals
+    return signals
+
+
+@dataclass
+class _PriceMarks:
+    """Integer copies of an open position's stop inputs (integer accounting mode).
+
+    Prices are in ``PRICE_SCALE`` units. Daily trailing-stop updates work on
+    these; ``store`` writes them back to the position when the day's work is
+    persisted.
+
+    Attributes:
+        entry: Entry price.
+        highest: Highest price since entry.
+        stop: Current stop price.
+        trail_pct: The position's trailing stop percentage.
+        trail_multiplier: ``1 - trail_pct / 100`` in multiplier units.
+        entry_day: Index of the entry date in the simulation's trading days
+            (-1 if unknown).
+    """
+
+    entry: int
+    highest: int
+    stop: int
+    trail_pct: Decimal
+    trail_multiplier: int
+    entry_day: int = -1
+    _stored: tuple[int, int] = (0, 0)
+
+    @classmethod
+    def from_position(
+        cls, position: ArenaPosition, trading_day_index: SessionIndex
+    ) -> "_PriceMarks":
+        """Read the marks of an OPEN position."""
+        entry_day = None
+        if position.entry_date is not None:
+            entry_day = trading_day_index.position(position.entry_date)
+        highest = to_price_units(position.highest_price)
+        stop = to_price_units(position.current_stop)
+        return cls(
+            entry=to_price_units(position.entry_price),
+            highest=highest,
+            stop=stop,
+            trail_pct=position.trailing_stop_pct,
+            trail_multiplier=trail_multiplier_units(position.trailing_stop_pct),
+            entry_day=-1 if entry_day is None else entry_day,
+            _stored=(highest, stop),
+        )
+
+    def store(self, position: ArenaPosition) -> None:
+        """Write changed marks back to the position."""
+        if (self.highest, self.stop) != self._stored:
+            position.highest_price = from_price_units(self.highest)
+            position.current_stop = from_price_units(self.stop)
+            self._stored = (self.highest, self.stop)
+
+
+@dataclass
+class _PortfolioState:
+    """Portfolio state carried from one simulation day to the next.
+
+    Attributes:
+        cash: Cash balance at the end of the previous day.
+        prev_equity: Total equity at the end of the previous day.
+        positions_by_symbol: OPEN positions keyed by symbol.
+        pending_by_symbol: PENDING positions keyed by symbol.
+        day: The simulation's ``current_day`` this state is the start of.
+        price_marks: Integer stop marks of OPEN positions, keyed by symbol
+            (integer accounting mode only; filled on first use).
+    """
+
+    cash: Decimal
+    prev_equity: Decimal
+    positions_by_symbol: dict[str, ArenaPosition]
+    pending_by_symbol: dict[str, ArenaPosition]
+    day: int = 0
+    price_marks: dict[str, _PriceMarks] = field(default_factory=dict)
+
 
 class SimulationEngine:
     """Orchestrates arena simulation execution.
@@ -59,27 +325,60 @@ class SimulationEngine:
     # Below 1bp indicates missing or corrupt ATR data, not genuine low volatility.
     _MIN_ATR_PCT = 0.01
 
+    # Calendar days of history behind each ATR% value (enough for 14-period
+    # Wilder's ATR).
+    _ATR_WINDOW_DAYS = 90
+
+    # Trading days run_to_completion processes in memory between commits.
+    DEFAULT_CHECKPOINT_DAYS = 20
+
     def __init__(
         self,
         session: AsyncSession,
         session_factory: async_sessionmaker[AsyncSession],
+        price_cache: SharedPriceCache | None = None,
     ) -> None:
         """Initialize the simulation engine.
 
         Args:
             session: Database session for persistence operations.
             session_factory: Factory for creating async database sessions for DataService.
+            price_cache: Cache to share price matrices through (e.g. the
+                process-wide ``get_shared_price_cache()``). Defaults to a
+                private cache, so matrices are not shared with other engines.
         """
         self.session = session
         self.data_service = DataService(session_factory=session_factory)
         # In-memory caches (populated during init or first step_day for resume)
         self._trading_days_cache: dict[int, list[date]] = {}
+        # Session index over each simulation's trading days (holding periods)
+        self._trading_day_indexes: dict[int, SessionIndex] = {}
         self._peak_equity: dict[int, Decimal] = {}
         self._max_drawdown: dict[int, Decimal] = {}
-        # Price data cache: {simulation_id: {symbol: [PriceBar, ...]}}
-        self._price_cache: dict[int, dict[str, list[PriceBar]]] = {}
+        # Price data cache: {simulation_id: PriceMatrix (dates x symbols float64 OHLCV)}
+        self._price_cache: dict[int, PriceMatrix] = {}
+        # Shared-cache keys held by each simulation, released on clear
+        self._price_cache_keys: dict[int, PriceCacheKey] = {}
+        self._shared_prices = price_cache if price_cache is not None else SharedPriceCache()
         # Sector cache: {simulation_id: {symbol: sector_name | None}}
         self._sector_cache: dict[int, dict[str, str | None]] = {}
+        # Precomputed agent decisions: {simulation_id: {symbol: PrecomputedSignals}}
+        self._signal_cache: dict[int, dict[str, PrecomputedSignals]] = {}
+        # ATR% over each symbol's full cached history, aligned with its bar
+        # dates: {simulation_id: {symbol: (dates, atr_pct)}}
+        self._atr_cache: dict[
+            int, dict[str, tuple[NDArray[np.datetime64], NDArray[np.float64]]]
+        ] = {}
+        # Market regime per matrix date: {simulation_id: {date: regime}}
+        self._regime_cache: dict[int, dict[date, Regime]] = {}
+        # Per-day phase timings: {simulation_id: StepProfile}
+        self._profiles: dict[int, StepProfile] = {}
+        # Portfolio state carried between days: {simulation_id: _PortfolioState}.
+        # Authoritative while this engine runs the simulation; the database is
+        # only read back on resume (or after a failed day). The positions stay
+        # usable across commits because sessions use expire_on_commit=False.
+        self._portfolio_states: dict[int, _PortfolioState] = {}
+        self._profiling_enabled = get_settings().arena_step_profiling
 
     async def initialize_simulation(
         self,
@@ -129,20 +428,12 @@ class SimulationEngine:
 
         # Pre-load all price data into memory cache (replaces the old loop that
         # loaded data through DataService and discarded the results)
-        await self._load_price_cache(
-            simulation.id,
-            simulation.symbols,
-            simulation.start_date,
-            simulation.end_date,
-            lookback_days,
-        )
-        # Regime filter: pre-load regime symbol (e.g. SPY) into price cache
+        await self._load_simulation_prices(simulation, lookback_days)
+        self._load_signal_cache(simulation.id, agent, simulation.symbols)
         if simulation.agent_config.get("regime_filter", False):
-            await self._load_regime_symbol_cache(
+            self._get_regime_series(
                 simulation.id,
                 simulation.agent_config.get("regime_symbol", "SPY"),
-                simulation.start_date,
-                simulation.end_date,
                 simulation.agent_config.get("regime_sma_period", 20),
             )
         # Prefetch any missing sector data from Yahoo Finance (non-blocking on failure)
@@ -212,6 +503,11 @@ class SimulationEngine:
             the entire day re-processes from the last committed snapshot.
             Do not add intermediate commits within this method.
 
+        Portfolio state (cash, open and pending positions) is kept in memory
+        between calls on the same engine, so only the first day after
+        starting or resuming reads it from the database. A day that raises
+        discards the in-memory state; the next call reloads it.
+
         Args:
             simulation_id: ID of simulation to advance.
 
@@ -221,6 +517,39 @@ class SimulationEngine:
         Raises:
             ValueError: If simulation not found or not in RUNNING status.
         """
+        simulation = await self._get_simulation_for_run(simulation_id)
+        if simulation.status == SimulationStatus.COMPLETED.value:
+            return None
+
+        profile = self._get_profile(simulation)
+        with counting_statements(profile):
+            try:
+                snapshot = await self._advance_day(simulation)
+                if snapshot is None:
+                    return None
+
+                self._before_commit(simulation, profile)
+                started = time.perf_counter()
+                await self.session.commit()
+                await self.session.refresh(snapshot)
+                profile.add_time("commit", time.perf_counter() - started)
+            except Exception:
+                self._portfolio_states.pop(simulation_id, None)
+                raise
+        return snapshot
+
+    async def _get_simulation_for_run(self, simulation_id: int) -> ArenaSimulation:
+        """Load a simulation that is RUNNING or already COMPLETED.
+
+        Args:
+            simulation_id: ID of simulation to load.
+
+        Returns:
+            The simulation.
+
+        Raises:
+            ValueError: If simulation not found or in any other status.
+        """
         simulation = await self.session.get(
             ArenaSimulation,
             simulation_id,
@@ -230,12 +559,31 @@ class SimulationEngine:
             msg = f"Simulation {simulation_id} not found"
             raise ValueError(msg)
 
-        if simulation.status == SimulationStatus.COMPLETED.value:
-            return None
-
-        if simulation.status != SimulationStatus.RUNNING.value:
+        if simulation.status not in (
+            SimulationStatus.RUNNING.value,
+            SimulationStatus.COMPLETED.value,
+        ):
             msg = f"Simulation not running: {simulation.status}"
             raise ValueError(msg)
+        return simulation
+
+    async def _advance_day(self, simulation: ArenaSimulation) -> ArenaSnapshot | None:
+        """Process the simulation's next trading day without committing.
+
+        Shared by ``step_day`` (one commit per day) and ``run_to_completion``
+        (committed every few days). Adds the day's positions and snapshot to
+        the session and updates the in-memory portfolio state for the next
+        day.
+
+        Args:
+            simulation: RUNNING simulation to advance.
+
+        Returns:
+            Snapshot for the day, or None if the simulation was completed
+            (the final close-out and analytics are committed).
+        """
+        simulation_id = simulation.id
+        profile = self._get_profile(simulation)
 
         # Get agent and trailing stop config
         agent = get_agent(simulation.agent_type, simulation.agent_config)
@@ -271,6 +619,40 @@ class SimulationEngine:
         breakeven_trigger_pct: float | None = simulation.agent_config.get("breakeven_trigger_pct")
         ratchet_trigger_pct: float | None = simulation.agent_config.get("ratchet_trigger_pct")
         ratchet_trail_pct: float | None = simulation.agent_config.get("ratchet_trail_pct")
+        # Threshold and trail multipliers, built once per day rather than per position
+        breakeven_multiplier: Decimal | None = None
+        if breakeven_trigger_pct is not None:
+            breakeven_multiplier = (
+                Decimal("1") + Decimal(str(breakeven_trigger_pct)) / Decimal("100")
+            )
+        ratchet_multiplier: Decimal | None = None
+        ratchet_stop_multiplier = Decimal("1")
+        if ratchet_trigger_pct is not None and ratchet_trail_pct is not None:
+            ratchet_multiplier = (
+                Decimal("1") + Decimal(str(ratchet_trigger_pct)) / Decimal("100")
+            )
+            ratchet_stop_multiplier = (
+                Decimal("1") - Decimal(str(ratchet_trail_pct)) / Decimal("100")
+            )
+
+        # Integer accounting runs the daily open-position updates and valuation
+        # on integer price units; entries, exits and stored values stay Decimal.
+        integer_accounting = simulation.agent_config.get("accounting_mode") == "integer"
+        exit_rules = ExitRules(
+            breakeven_multiplier=(
+                to_multiplier_units(breakeven_multiplier) if breakeven_multiplier else 0
+            ),
+            ratchet_multiplier=to_multiplier_units(ratchet_multiplier) if ratchet_multiplier else 0,
+            ratchet_stop_multiplier=to_multiplier_units(ratchet_stop_multiplier),
+            take_profit_pct=take_profit_pct,
+            take_profit_atr_mult=take_profit_atr_mult,
+            max_hold_days=max_hold_days,
+            max_hold_days_profit=max_hold_days_profit,
+        )
+        # Fixed stops trail every position by the same multiplier
+        fixed_trail_multiplier: int | None = None
+        if atr_trailing_stop is None:
+            fixed_trail_multiplier = trail_multiplier_units(fixed_trailing_stop.trail_pct)
 
         # Position sizing config — read all sizing-related fields once
         position_size_pct: float | None = simulation.agent_config.get("position_size_pct")
@@ -292,23 +674,10 @@ class SimulationEngine:
 
         # Ensure price cache is loaded (handles resume case)
         if simulation_id not in self._price_cache:
-            await self._load_price_cache(
-                simulation_id,
-                simulation.symbols,
-                simulation.start_date,
-                simulation.end_date,
-                agent.required_lookback_days,
-            )
-            # Regime filter: load regime symbol if enabled
-            if simulation.agent_config.get("regime_filter", False):
-                await self._load_regime_symbol_cache(
-                    simulation_id,
-                    simulation.agent_config.get("regime_symbol", "SPY"),
-                    simulation.start_date,
-                    simulation.end_date,
-                    simulation.agent_config.get("regime_sma_period", 20),
-                )
+            await self._load_simulation_prices(simulation, agent.required_lookback_days)
             await self._load_sector_cache(simulation_id, simulation.symbols)
+        if simulation_id not in self._signal_cache:
+            self._load_signal_cache(simulation_id, agent, simulation.symbols)
 
         # Use cached trading days (lazy-load for resume case)
         if simulation_id not in self._trading_days_cache:
@@ -319,54 +688,56 @@ class SimulationEngine:
 
         # Check if simulation is complete
         if simulation.current_day >= len(trading_days):
+            started = time.perf_counter()
+            # Flush days processed in memory (run_to_completion) so the
+            # close-out and analytics queries below see them.
+            self._store_price_marks(simulation_id)
+            await self.session.flush()
             # Close all positions and finalize
             closed_positions = await self._close_all_positions(
                 simulation, trading_days[-1], ExitReason.SIMULATION_END
             )
+            profile.add_time("close_out", time.perf_counter() - started)
+            self._before_commit(simulation, profile)
+            self._portfolio_states.pop(simulation_id, None)
             await self._finalize_simulation(simulation, closed_positions)
             return None
 
         current_date = trading_days[simulation.current_day]
-
-        # Get previous snapshot for cash balance
-        prev_snapshot = await self._get_latest_snapshot(simulation.id)
-        cash = prev_snapshot.cash if prev_snapshot else simulation.initial_capital
-
-        # Load open positions
-        open_positions = await self._get_open_positions(simulation.id)
-        positions_by_symbol: dict[str, ArenaPosition] = {p.symbol: p for p in open_positions}
-
-        # Batch-load pending positions (1 query instead of N)
-        pending_result = await self.session.execute(
-            select(ArenaPosition)
-            .where(ArenaPosition.simulation_id == simulation.id)
-            .where(ArenaPosition.status == PositionStatus.PENDING.value)
-        )
-        pending_by_symbol: dict[str, ArenaPosition] = {
-            p.symbol: p for p in pending_result.scalars().all()
-        }
+        profile.count("days")
+
+        state = self._portfolio_states.get(simulation_id)
+        if state is None or state.day != simulation.current_day:
+            started = time.perf_counter()
+            state = await self._load_portfolio_state(simulation)
+            profile.add_time("load_state", time.perf_counter() - started)
+            self._portfolio_states[simulation_id] = state
+        cash = state.cash
+        positions_by_symbol = state.positions_by_symbol
+        pending_by_symbol = state.pending_by_symbol
+        price_marks = state.price_marks
 
         # Per-day ATR memoization: avoid recalculating ATR multiple times per symbol per day.
         _day_atr_cache: dict[str, float | None] = {}
 
         def _get_atr_for_day(symbol: str) -> float | None:
             if symbol not in _day_atr_cache:
+                profile.count("atr_cache_misses")
+                started = time.perf_counter()
                 _day_atr_cache[symbol] = self._calculate_symbol_atr_pct(
                     simulation_id, symbol, current_date
                 )
+                profile.add_time("atr", time.perf_counter() - started)
+            else:
+                profile.count("atr_cache_hits")
             return _day_atr_cache[symbol]
 
         # Compute current equity once before processing symbols (for equity-based sizing).
         # Doing this outside the loop avoids O(n²) and ensures the same equity
         # baseline is used for all pending positions opened on the same day.
-        pos_value = Decimal("0")
-        for pos in positions_by_symbol.values():
-            if pos.status == PositionStatus.OPEN.value:
-                pos_bar = self._get_cached_bar_for_date(
-                    simulation_id, pos.symbol, current_date
-                )
-                if pos_bar:
-                    pos_value += pos.shares * pos_bar.close
+        pos_value = self._positions_value(
+            simulation_id, positions_by_symbol.values(), current_date, integer_accounting
+        )
         current_equity = cash + pos_value
 
         # Determine effective_position_size for fixed/fixed_pct modes.
@@ -393,13 +764,48 @@ class SimulationEngine:
         # into the same-day sizing of symbol #2.
         streak_at_day_start = simulation.consecutive_wins
 
-        # Build O(1) trading-day index lookup (used for max-hold-days checks).
-        trading_days_idx: dict[date, int] = {d: i for i, d in enumerate(trading_days)}
+        # O(1) trading-day position lookup (used for max-hold-days checks),
+        # built once per simulation.
+        trading_day_index = self._trading_day_indexes.get(simulation_id)
+        if trading_day_index is None:
+            trading_day_index = SessionIndex(trading_days)
+            self._trading_day_indexes[simulation_id] = trading_day_index
+
+        # Integer accounting runs the exit rules for every position held at
+        # the start of the day as one array pass. The symbol loop below then
+        # applies each outcome in symbol order, so cash moves exactly as in
+        # the per-position Decimal path.
+        exit_batch: ExitBatch | None = None
+        exit_rows: dict[str, int] = {}
+        if integer_accounting and positions_by_symbol:
+            started = time.perf_counter()
+            exit_batch, exit_rows = self._evaluate_exits(
+                simulation_id,
+                [
+                    symbol
+                    for symbol, position in positions_by_symbol.items()
+                    if position.status == PositionStatus.OPEN.value
+                ],
+                state,
+                exit_rules,
+                fixed_trail_multiplier,
+                current_date,
+                trading_day_index,
+                _get_atr_for_day,
+            )
+            profile.add_time("exit_rules", time.perf_counter() - started)
 
         # Process each symbol
-        decisions: dict[str, dict] = {}
+        decisions = DecisionLog(
+            simulation.symbols,
+            buy_only=simulation.agent_config.get("record_decisions", "all") == "buy",
+        )
         # Collect BUY signals for portfolio selection (processed after symbol loop)
         buy_signals: list[tuple[str, AgentDecision, PriceBar]] = []
+        signals_by_symbol = self._signal_cache.get(simulation_id, {})
+        signal_hits = signal_misses = 0
+        agent_seconds = 0.0
+        symbols_started = time.perf_counter()
 
         for symbol in simulation.symbols:
             # Get price history up to current date
@@ -410,19 +816,24 @@ class SimulationEngine:
                 current_date,
             )
 
-            if not price_history:
-                decisions[symbol] = {"action": "NO_DATA", "reasoning": "No price data"}
+            if not len(price_history):
+                decisions.record_no_data(symbol, has_history=False)
                 continue
 
-            # Get today's bar for position updates
-            today_bar = self._find_bar_for_date(price_history, current_date)
-            if not today_bar:
-                decisions[symbol] = {
-                    "action": "NO_DATA",
-                    "reasoning": "No data for today",
-                }
+            # The window ends at current_date, so today's bar (if any) is its last row.
+            if price_history.last_date != current_date:
+                decisions.record_no_data(symbol, has_history=True)
                 continue
 
+            # Materialize a Decimal bar only for symbols that touch cash
+            # accounting; signal-only symbols stay on the float arrays (and so
+            # do held symbols under integer accounting).
+            today_bar: PriceBar | None = None
+            if symbol in pending_by_symbol or (
+                symbol in positions_by_symbol and not integer_accounting
+            ):
+                today_bar = price_history.bar(-1)
+
             # Check for pending position to open
             pending = pending_by_symbol.get(symbol)
             if pending:
@@ -445,7 +856,7 @@ class SimulationEngine:
                     if symbol_atr_pct is None or symbol_atr_pct < self._MIN_ATR_PCT:
                         # ATR data is missing/corrupt — we cannot compute the
                         # promised risk %, so refuse the trade rather than open
-                        # a misleadingly-sized position. Logged in decisions[].
+                        # a misleadingly-sized position. Logged on the position.
                         risk_skip_reason = (
                             f"Risk-based sizing requires ATR data; got "
                             f"{symbol_atr_pct} (min {self._MIN_ATR_PCT}%)"
@@ -559,7 +970,46 @@ class SimulationEngine:
 
             # Update existing position
             position = positions_by_symbol.get(symbol)
-            if position and position.status == PositionStatus.OPEN.value:
+            if position and position.status == PositionStatus.OPEN.value and integer_accounting:
+                # Apply the batched exit rules (positions opened today get a
+                # batch of their own). Decimals are only built for an exit
+                # and when the marks are written back before a commit.
+                batch, row = exit_batch, exit_rows.get(symbol)
+                if batch is None or row is None:
+                    batch, _ = self._evaluate_exits(
+                        simulation_id,
+                        [symbol],
+                        state,
+                        exit_rules,
+                        fixed_trail_multiplier,
+                        current_date,
+                        trading_day_index,
+                        _get_atr_for_day,
+                    )
+                    row = 0
+                marks = price_marks[symbol]
+                marks.highest = int(batch.highest[row])
+                marks.stop = int(batch.stop[row])
+                exit_reason = EXIT_REASONS[batch.reason[row]]
+                if exit_reason is not None:
+                    exit_price = from_price_units(int(batch.exit_price[row]))
+                    if exit_reason is ExitReason.TAKE_PROFIT:
+                        # Gap-up handling: fill at the open if above the target
+                        exit_price = max(
+                            batch.take_profit_price(row, position.entry_price), exit_price
+                        )
+                    marks.store(position)
+                    del price_marks[symbol]
+                    cash = self._close_position(
+                        position=position,
+                        simulation=simulation,
+                        exit_reason=exit_reason,
+                        exit_price=exit_price,
+                        exit_date=current_date,
+                        cash=cash,
+                    )
+                    del positions_by_symbol[symbol]
+            elif position and position.status == PositionStatus.OPEN.value:
                 # Update trailing stop — ATR stops use the per-position trail_pct
                 # stored at entry time; fixed stops use the class-level value.
                 if atr_trailing_stop is not None:
@@ -599,28 +1049,18 @@ class SimulationEngine:
                     # --- Layer 8: Breakeven stop floor ---
                     # Once the position has gained enough, pin the stop at entry
                     # so a winner can never turn into a loser.
-                    if breakeven_trigger_pct is not None and position.entry_price:
-                        breakeven_threshold = position.entry_price * (
-                            Decimal("1") + Decimal(str(breakeven_trigger_pct)) / Decimal("100")
-                        )
+                    if breakeven_multiplier is not None and position.entry_price:
+                        breakeven_threshold = position.entry_price * breakeven_multiplier
                         if position.highest_price >= breakeven_threshold:
                             position.current_stop = max(
                                 position.current_stop, position.entry_price
                             )
 
                     # --- Layer 8: Profit ratcheting — tighter trail at high gains ---
-                    if (
-                        ratchet_trigger_pct is not None
-                        and ratchet_trail_pct is not None
-                        and position.entry_price
-                    ):
-                        ratchet_threshold = position.entry_price * (
-                            Decimal("1") + Decimal(str(ratchet_trigger_pct)) / Decimal("100")
-                        )
+                    if ratchet_multiplier is not None and position.entry_price:
+                        ratchet_threshold = position.entry_price * ratchet_multiplier
                         if position.highest_price >= ratchet_threshold:
-                            ratchet_stop = position.highest_price * (
-                                Decimal("1") - Decimal(str(ratchet_trail_pct)) / Decimal("100")
-                            )
+                            ratchet_stop = position.highest_price * ratchet_stop_multiplier
                             position.current_stop = max(
                                 position.current_stop, ratchet_stop
                             )
@@ -676,8 +1116,8 @@ class SimulationEngine:
                         and symbol in positions_by_symbol
                         and position.entry_date is not None
                     ):
-                        entry_idx = trading_days_idx.get(position.entry_date)
-                        current_idx = trading_days_idx.get(current_date)
+                        entry_idx = trading_day_index.position(position.entry_date)
+                        current_idx = trading_day_index.position(current_date)
                         if entry_idx is None or current_idx is None:
                             hold_days = 0
                         else:
@@ -705,18 +1145,33 @@ class SimulationEngine:
 
             # Get agent decision (only if not already holding)
             has_position = symbol in positions_by_symbol
-            decision = await agent.evaluate(symbol, price_history, current_date, has_position)
+            agent_started = time.perf_counter()
+            decision = None
+            if symbol in signals_by_symbol:
+                decision = signals_by_symbol[symbol].decide(
+                    symbol, current_date, has_position, len(price_history)
+                )
+            if decision is None:
+                signal_misses += 1
+                decision = await agent.evaluate(symbol, price_history, current_date, has_position)
+            else:
+                signal_hits += 1
+            agent_seconds += time.perf_counter() - agent_started
 
-            decisions[symbol] = {
-                "action": decision.action,
-                "score": decision.score,
-                "reasoning": decision.reasoning,
-            }
+            decisions.record(symbol, decision, has_position)
 
             # Collect BUY signals for portfolio selection (don't create PENDING yet).
             # today_bar rides along so Layer 10 filters don't re-scan the price cache.
             if decision.action == "BUY" and not has_position:
-                buy_signals.append((symbol, decision, today_bar))
+                buy_signals.append((symbol, decision, today_bar or price_history.bar(-1)))
+
+        profile.add_time("symbols", time.perf_counter() - symbols_started)
+        profile.add_time("agent", agent_seconds)
+        profile.count("symbols_evaluated", signal_hits + signal_misses)
+        profile.count("signal_cache_hits", signal_hits)
+        profile.count("signal_cache_misses", signal_misses)
+        profile.count("buy_signals", len(buy_signals))
+        selection_started = time.perf_counter()
 
         # --- Layer 10: Entry Filters ---
         # Prune BUY signals by Internal Bar Strength before portfolio selection.
@@ -736,9 +1191,7 @@ class SimulationEngine:
                 if ibs < ibs_max:
                     filtered_buy_signals.append((symbol, decision, today_bar))
                 else:
-                    decisions[symbol]["ibs_filtered"] = True
-                    decisions[symbol]["ibs_value"] = round(ibs, 4)
-                    decisions[symbol]["portfolio_selected"] = False
+                    decisions.mark_ibs_filtered(symbol, ibs)
             buy_signals = filtered_buy_signals
 
         # --- Portfolio Selection ---
@@ -806,10 +1259,11 @@ class SimulationEngine:
         selected_symbols = {s.symbol for s in selected}
 
         # Create PENDING positions for selected signals only
+        new_pending: dict[str, ArenaPosition] = {}
         for symbol, decision, _today_bar in buy_signals:
             is_selected = symbol in selected_symbols
             # Annotate decision for transparency in snapshots
-            decisions[symbol]["portfolio_selected"] = is_selected
+            decisions.mark_selected(symbol, is_selected)
             if is_selected:
                 # For ATR stops the actual trail_pct is computed at position
                 # open time (next day) when we have the entry price.  Store
@@ -825,20 +1279,20 @@ class SimulationEngine:
                     agent_score=decision.score,
                 )
                 self.session.add(new_position)
+                new_pending[symbol] = new_position
+
+        profile.add_time("selection", time.perf_counter() - selection_started)
+        snapshot_started = time.perf_counter()
 
         # Calculate portfolio value
-        positions_value = Decimal("0")
-        for position in positions_by_symbol.values():
-            if position.status == PositionStatus.OPEN.value:
-                # Get current price
-                today_bar = self._get_cached_bar_for_date(simulation_id, position.symbol, current_date)
-                if today_bar:
-                    positions_value += position.shares * today_bar.close
+        positions_value = self._positions_value(
+            simulation_id, positions_by_symbol.values(), current_date, integer_accounting
+        )
 
         total_equity = cash + positions_value
 
         # Calculate daily P&L
-        prev_equity = prev_snapshot.total_equity if prev_snapshot else simulation.initial_capital
+        prev_equity = state.prev_equity
         daily_pnl = total_equity - prev_equity
         daily_return_pct = (daily_pnl / prev_equity * 100) if prev_equity else Decimal("0")
         cumulative_return_pct = (
@@ -857,7 +1311,7 @@ class SimulationEngine:
             daily_return_pct=daily_return_pct,
             cumulative_return_pct=cumulative_return_pct,
             open_position_count=len(positions_by_symbol),
-            decisions=decisions,
+            decision_log=decisions.to_bytes(),
         )
         self.session.add(snapshot)
 
@@ -913,8 +1367,19 @@ class SimulationEngine:
             )
             raise ValueError(f"Accounting error: positions_value is negative ({positions_value})")
 
-        await self.session.commit()
-        await self.session.refresh(snapshot)
+        # Carry state to the next day. Pending positions whose symbol had no
+        # bar today were not processed and stay pending.
+        state.cash = cash
+        state.prev_equity = total_equity
+        state.pending_by_symbol = {
+            symbol: pending
+            for symbol, pending in pending_by_symbol.items()
+            if pending.status == PositionStatus.PENDING.value
+        }
+        state.pending_by_symbol.update(new_pending)
+        state.day = simulation.current_day
+        self._round_carried_state(state)
+        profile.add_time("snapshot", time.perf_counter() - snapshot_started)
 
         logger.debug(
             f"Simulation {simulation_id} day {simulation.current_day}: "
@@ -926,33 +1391,193 @@ class SimulationEngine:
     async def run_to_completion(
         self,
         simulation_id: int,
+        checkpoint_days: int = DEFAULT_CHECKPOINT_DAYS,
+        should_cancel: Callable[[], Awaitable[bool]] | None = None,
     ) -> ArenaSimulation:
         """Run simulation to completion.
 
-        Continuously steps through days until the simulation is complete.
+        Fast path for whole runs: like ``step_day`` the portfolio state stays
+        in memory across days, and in addition positions and snapshots are
+        flushed in bulk with one commit every ``checkpoint_days`` trading
+        days (and at the end).
+
+        Each commit is a checkpoint with the same guarantees as ``step_day``:
+        snapshots, positions and ``current_day`` always commit together, so
+        after a crash the simulation resumes from the last checkpoint and
+        re-processes the uncommitted days. Carried values are rounded to
+        their column scales each day, so the result is identical to stepping
+        day by day.
 
         Args:
             simulation_id: ID of simulation to run.
+            checkpoint_days: Trading days to process between commits.
+            should_cancel: Optional async callback checked before the first
+                day and after each checkpoint; when it returns True the run
+                stops with all processed days committed.
 
         Returns:
-            Completed simulation object.
+            Simulation object (COMPLETED unless cancelled).
+
+        Raises:
+            ValueError: If simulation not found, not running, or
+                checkpoint_days < 1.
         """
-        while True:
-            snapshot = await self.step_day(simulation_id)
-            if snapshot is None:
-                break
+        if checkpoint_days < 1:
+            msg = f"checkpoint_days must be at least 1, got {checkpoint_days}"
+            raise ValueError(msg)
+
+        simulation = await self._get_simulation_for_run(simulation_id)
+        if simulation.status == SimulationStatus.COMPLETED.value:
+            return simulation
+
+        profile = self._get_profile(simulation)
+        with counting_statements(profile):
+            uncommitted_days = 0
+            try:
+                while True:
+                    if (
+                        uncommitted_days == 0
+                        and should_cancel is not None
+                        and await should_cancel()
+                    ):
+                        logger.info(
+                            f"Simulation {simulation_id} cancelled at day {simulation.current_day}"
+                        )
+                        break
+
+                    snapshot = await self._advance_day(simulation)
+                    if snapshot is None:
+                        break  # Finalized and committed
+
+                    uncommitted_days += 1
+                    if uncommitted_days >= checkpoint_days:
+                        self._before_commit(simulation, profile)
+                        started = time.perf_counter()
+                        await self.session.commit()
+                        profile.add_time("commit", time.perf_counter() - started)
+                        uncommitted_days = 0
+                        logger.info(
+                            f"Simulation {simulation_id}: checkpoint at day "
+                            f"{simulation.current_day}/{simulation.total_days}, "
+                            f"equity=${snapshot.total_equity}"
+                        )
+            except Exception:
+                self._portfolio_states.pop(simulation_id, None)
+                raise
 
-        simulation = await self.session.get(
-            ArenaSimulation,
-            simulation_id,
-            options=[noload(ArenaSimulation.positions), noload(ArenaSimulation.snapshots)],
-        )
         return simulation
 
     # =========================================================================
     # Helper Methods
     # =========================================================================
 
+    def _get_profile(self, simulation: ArenaSimulation) -> StepProfile:
+        """Get the simulation's step profile, continuing from the stored one on resume."""
+        profile = self._profiles.get(simulation.id)
+        if profile is None:
+            profile = StepProfile(simulation.step_profile, enabled=self._profiling_enabled)
+            self._profiles[simulation.id] = profile
+        return profile
+
+    @staticmethod
+    def _store_profile(simulation: ArenaSimulation, profile: StepProfile) -> None:
+        """Write the profile to the simulation, to be saved with the next commit."""
+        if profile.enabled:
+            simulation.step_profile = profile.to_dict()
+
+    def _evaluate_exits(
+        self,
+        simulation_id: int,
+        symbols: list[str],
+        state: _PortfolioState,
+        rules: ExitRules,
+        fixed_trail_multiplier: int | None,
+        current_date: date,
+        trading_day_index: SessionIndex,
+        atr_for_day: Callable[[str], float | None],
+    ) -> tuple[ExitBatch, dict[str, int]]:
+        """Run the exit rules for open positions that trade today (integer accounting).
+
+        Args:
+            simulation_id: Simulation ID.
+            symbols: Symbols of OPEN positions in ``state``.
+            state: Portfolio state; missing price marks are created.
+            rules: The simulation's exit rules.
+            fixed_trail_multiplier: Trail multiplier for fixed stops; None
+                to use each position's own (ATR stops).
+            current_date: Today.
+            trading_day_index: The simulation's trading days, for holding periods.
+            atr_for_day: Today's ATR% per symbol.
+
+        Returns:
+            Tuple of (batch, row of each evaluated symbol in the batch).
+            Symbols without a bar today are left out.
+        """
+        open_, high, low, close = self._get_price_matrix(simulation_id).day_prices(
+            symbols, current_date
+        )
+        traded = ~np.isnan(close)
+        if not traded.all():
+            symbols = [symbol for symbol, ok in zip(symbols, traded, strict=True) if ok]
+            open_, high, low, close = open_[traded], high[traded], low[traded], close[traded]
+
+        marks = []
+        for symbol in symbols:
+            symbol_marks = state.price_marks.get(symbol)
+            if symbol_marks is None:
+                symbol_marks = state.price_marks[symbol] = _PriceMarks.from_position(
+                    state.positions_by_symbol[symbol], trading_day_index
+                )
+            marks.append(symbol_marks)
+        n = len(marks)
+
+        def column(name: str) -> np.ndarray:
+            return np.fromiter((getattr(m, name) for m in marks), dtype=np.int64, count=n)
+
+        if fixed_trail_multiplier is None:
+            trail_multiplier = column("trail_multiplier")
+        else:
+            trail_multiplier = np.full(n, fixed_trail_multiplier, dtype=np.int64)
+        entry_day = column("entry_day")
+        current_day = trading_day_index.position(current_date)
+        if current_day is None:
+            hold_days = np.zeros(n, dtype=np.int64)
+        else:
+            hold_days = np.where(entry_day >= 0, current_day - entry_day, 0)
+        atr_pct = None
+        if rules.take_profit_atr_mult is not None:
+            atr_pct = np.array(
+                [atr if (atr := atr_for_day(symbol)) is not None else np.nan for symbol in symbols],
+                dtype=np.float64,
+            )
+
+        batch = evaluate_exits(
+            rules,
+            open_=price_units(open_),
+            high=price_units(high),
+            low=price_units(low),
+            close=price_units(close),
+            entry=column("entry"),
+            highest=column("highest"),
+            stop=column("stop"),
+            trail_multiplier=trail_multiplier,
+            hold_days=hold_days,
+            atr_pct=atr_pct,
+        )
+        return batch, {symbol: i for i, symbol in enumerate(symbols)}
+
+    def _before_commit(self, simulation: ArenaSimulation, profile: StepProfile) -> None:
+        """Write values kept only in memory between commits to their models."""
+        self._store_price_marks(simulation.id)
+        self._store_profile(simulation, profile)
+
+    def _store_price_marks(self, simulation_id: int) -> None:
+        """Write integer accounting stop marks back to the open positions."""
+        state = self._portfolio_states.get(simulation_id)
+        if state is not None:
+            for symbol, marks in state.price_marks.items():
+                marks.store(state.positions_by_symbol[symbol])
+
     async def _init_drawdown_state(self, simulation: ArenaSimulation) -> None:
         """Initialize peak equity and max drawdown from existing snapshots.
 
@@ -985,6 +1610,31 @@ class SimulationEngine:
         self._peak_equity[sim_id] = peak
         self._max_drawdown[sim_id] = max_dd
 
+    async def _load_simulation_prices(
+        self, simulation: ArenaSimulation, lookback_days: int
+    ) -> None:
+        """Load the simulation's universe, plus the regime symbol if enabled.
+
+        The range can be wider than the simulation's own dates (see
+        ``_simulation_price_range``).
+
+        Args:
+            simulation: Simulation to load prices for.
+            lookback_days: Agent's required lookback period.
+        """
+        start_date, end_date, regime_symbol, regime_sma_period = _simulation_price_range(
+            simulation
+        )
+        await self._load_price_cache(
+            simulation.id,
+            simulation.symbols,
+            start_date,
+            end_date,
+            lookback_days,
+            regime_symbol=regime_symbol,
+            regime_sma_period=regime_sma_period,
+        )
+
     async def _load_price_cache(
         self,
         simulation_id: int,
@@ -992,18 +1642,28 @@ class SimulationEngine:
         start_date: date,
         end_date: date,
         lookback_days: int,
+        regime_symbol: str | None = None,
+        regime_sma_period: int = 0,
     ) -> None:
         """Load all price data into memory for a simulation.
 
         Called during initialization and lazy-loaded on resume.
         All subsequent price lookups use this cache instead of DB queries.
 
+        The matrix comes from the engine's ``SharedPriceCache``, so
+        simulations with the same universe, dates and lookback (e.g. the
+        strategies of a comparison group) share one copy. The reference is
+        released by ``clear_simulation_cache``.
+
         Args:
             simulation_id: Simulation ID for cache key.
             symbols: List of symbols to load.
             start_date: Simulation start date.
             end_date: Simulation end date.
             lookback_days: Agent's required lookback period.
+            regime_symbol: Regime filter ticker (e.g. 'SPY') to merge in, if any.
+            regime_sma_period: Regime SMA period; extra lookback for the regime
+                symbol = regime_sma_period * 2 + 30 days.
 
         Raises:
             ValueError: If any symbol fails to load (fail-fast approach).
@@ -1011,99 +1671,23 @@ class SimulationEngine:
         if simulation_id in self._price_cache:
             return  # Already loaded
 
-        data_start = start_date - timedelta(days=lookback_days + 30)
-
-        # Create inner function for parallel fetching
-        async def fetch_symbol_data(symbol: str) -> tuple[str, list[PriceBar]]:
-            """Fetch and transform data for a single symbol.
-
-            Returns:
-                Tuple of (symbol, price_bars)
-
-            Raises:
-                Exception: Any error during fetch/transform propagates
-            """
-            records = await self.data_service.get_price_data(
-                symbol=symbol,
-                start_date=datetime.combine(
-                    data_start, datetime.min.time(), tzinfo=timezone.utc
-                ),
-                end_date=datetime.combine(
-                    end_date, datetime.max.time(), tzinfo=timezone.utc
-                ),
-                interval="1d",
-            )
-            price_bars = [
-                PriceBar(
-                    date=r.timestamp.date(),
-                    open=Decimal(str(r.open_price)),
-                    high=Decimal(str(r.high_price)),
-                    low=Decimal(str(r.low_price)),
-                    close=Decimal(str(r.close_price)),
-                    volume=int(r.volume),
-                )
-                for r in records
-            ]
-            return (symbol, price_bars)
-
-        # Execute all fetches concurrently (fail-fast on any error)
-        tasks = [fetch_symbol_data(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks)
-
-        # Build cache from results
-        cache: dict[str, list[PriceBar]] = {symbol: bars for symbol, bars in results}
-        self._price_cache[simulation_id] = cache
-
-
-    async def _load_regime_symbol_cache(
-        self,
-        simulation_id: int,
-        regime_symbol: str,
-        start_date: date,
-        end_date: date,
-        sma_period: int,
-    ) -> None:
-        """Fetch regime symbol (e.g. SPY) into the price cache with SMA lookback.
+        key = _price_cache_key(
+            symbols, start_date, end_date, lookback_days, regime_symbol, regime_sma_period
+        )
+        matrix = await self._shared_prices.acquire(key, lambda: self._fetch_price_matrix(key))
+        self._price_cache[simulation_id] = matrix
+        self._price_cache_keys[simulation_id] = key
 
-        Merges into the existing cache without overwriting simulation symbol data.
-        The regime symbol is deliberately not added to simulation.symbols so it
-        never participates in position or trading-day logic.
+    async def _fetch_price_matrix(self, key: PriceCacheKey) -> PriceMatrix:
+        """Fetch price records through DataService and build a PriceMatrix.
 
         Args:
-            simulation_id: Simulation ID for cache key.
-            regime_symbol: Ticker to use as regime indicator (e.g. 'SPY').
-            start_date: Simulation start date.
-            end_date: Simulation end date.
-            sma_period: SMA period; extra lookback = sma_period * 2 + 30 days.
-        """
-        cache = self._price_cache.setdefault(simulation_id, {})
-        if regime_symbol in cache:
-            return  # Already loaded
+            key: Symbols and date ranges to load.
 
-        extra_lookback = sma_period * 2 + 30
-        data_start = start_date - timedelta(days=extra_lookback)
-
-        records = await self.data_service.get_price_data(
-            symbol=regime_symbol,
-            start_date=datetime.combine(data_start, datetime.min.time(), tzinfo=timezone.utc),
-            end_date=datetime.combine(end_date, datetime.max.time(), tzinfo=timezone.utc),
-            interval="1d",
-        )
-        bars = [
-            PriceBar(
-                date=r.timestamp.date(),
-                open=Decimal(str(r.open_price)),
-                high=Decimal(str(r.high_price)),
-                low=Decimal(str(r.low_price)),
-                close=Decimal(str(r.close_price)),
-                volume=int(r.volume),
-            )
-            for r in records
-        ]
-        cache[regime_symbol] = bars
-        logger.debug(
-            f"Simulation {simulation_id}: loaded {len(bars)} {regime_symbol} bars for regime filter"
-        )
+        Returns:
+            PriceMatrix with all symbols, plus the regime symbol if requested.
+        """
+        return await load_price_matrix(self.data_service, key)
 
     def _detect_market_regime(
         self,
@@ -1111,10 +1695,11 @@ class SimulationEngine:
         current_date: date,
         regime_symbol: str,
         sma_period: int,
-    ) -> str:
+    ) -> Regime:
         """Detect market regime using regime symbol close vs its SMA.
 
         No look-ahead: only uses bars up to and including current_date.
+        Looks the date up in the precomputed regime series.
 
         Args:
             simulation_id: Simulation ID for cache lookup.
@@ -1126,29 +1711,40 @@ class SimulationEngine:
             'bull' if close > SMA(period), 'bear' otherwise.
             'neutral' if insufficient data.
         """
-        bars = self._get_cached_price_history(
-            simulation_id,
-            regime_symbol,
-            current_date - timedelta(days=sma_period * 2 + 30),
-            current_date,
+        regime = self._get_regime_series(simulation_id, regime_symbol, sma_period).get(
+            current_date
         )
-        if len(bars) < sma_period:
-            logger.debug(
-                f"Simulation {simulation_id}: insufficient {regime_symbol} bars "
-                f"({len(bars)} < {sma_period}) for regime on {current_date}, defaulting to neutral"
-            )
-            return "neutral"
-
-        recent_closes = [float(b.close) for b in bars[-sma_period:]]
-        sma = sum(recent_closes) / len(recent_closes)
-        regime_close = float(bars[-1].close)
-        regime = "bull" if regime_close > sma else "bear"
+        if regime is None:
+            # Not a date of the price matrix (no symbol traded)
+            history = self._get_price_matrix(simulation_id).history(regime_symbol)
+            regime = regime_on(history, current_date, sma_period)
         logger.debug(
             f"Simulation {simulation_id}: {regime_symbol} regime={regime} "
-            f"close={regime_close:.2f} sma{sma_period}={sma:.2f} on {current_date}"
+            f"sma{sma_period} on {current_date}"
         )
         return regime
 
+    def _get_regime_series(
+        self, simulation_id: int, regime_symbol: str, sma_period: int
+    ) -> dict[date, Regime]:
+        """Get the market regime for every date of the price matrix, computed once.
+
+        Args:
+            simulation_id: Simulation ID for cache lookup.
+            regime_symbol: Ticker to look up in price cache (e.g. 'SPY').
+            sma_period: Number of periods for the simple moving average.
+
+        Returns:
+            Regime keyed by date.
+        """
+        series = self._regime_cache.get(simulation_id)
+        if series is None:
+            matrix = self._get_price_matrix(simulation_id)
+            regimes = regime_series(matrix.history(regime_symbol), matrix.dates, sma_period)
+            series = dict(zip(matrix.dates.astype(object).tolist(), regimes, strict=True))
+            self._regime_cache[simulation_id] = series
+        return series
+
     async def _load_sector_cache(self, simulation_id: int, symbols: list[str]) -> None:
         """Batch-load sector data for all symbols. One query, no Yahoo API calls.
 
@@ -1179,6 +1775,10 @@ class SimulationEngine:
         Uses a 90-day window (enough for 14-period Wilder's ATR).
         Returns None if insufficient price data is available.
 
+        ATR% for every bar of the symbol's cached history is computed on the
+        first lookup, so a day with a bar is an array read. Days without one
+        fall back to calculating over the window.
+
         Args:
             simulation_id: Simulation ID for cache lookup.
             symbol: Stock symbol.
@@ -1187,35 +1787,106 @@ class SimulationEngine:
         Returns:
             ATR as a percentage of price (e.g., 4.25 for 4.25%), or None.
         """
+        dates, atr_pct = self._get_atr_series(simulation_id, symbol)
+        day = np.datetime64(current_date, "D")
+        row = int(np.searchsorted(dates, day))
+        if row < len(dates) and dates[row] == day:
+            value = float(atr_pct[row])
+            return None if np.isnan(value) else value
+
         price_history = self._get_cached_price_history(
             simulation_id,
             symbol,
-            current_date - timedelta(days=90),
+            current_date - timedelta(days=self._ATR_WINDOW_DAYS),
             current_date,
         )
-        if not price_history or len(price_history) < 15:
+        if len(price_history) < 15:
             return None
-        highs = [float(bar.high) for bar in price_history]
-        lows = [float(bar.low) for bar in price_history]
-        closes = [float(bar.close) for bar in price_history]
-        return calculate_atr_percentage(highs, lows, closes)
+        return calculate_atr_percentage(
+            price_history.highs, price_history.lows, price_history.closes
+        )
+
+    def _get_atr_series(
+        self, simulation_id: int, symbol: str
+    ) -> tuple[NDArray[np.datetime64], NDArray[np.float64]]:
+        """Get a symbol's ATR% series, computing it over the full history once.
+
+        Args:
+            simulation_id: Simulation ID for cache lookup.
+            symbol: Stock symbol.
+
+        Returns:
+            Tuple of (bar dates, ATR% per bar with NaN where unavailable).
+        """
+        symbol_series = self._atr_cache.setdefault(simulation_id, {})
+        series = symbol_series.get(symbol)
+        if series is None:
+            history = self._get_price_matrix(simulation_id).history(symbol)
+            series = (
+                history.dates,
+                calculate_rolling_atr_percentage(
+                    history.dates,
+                    history.highs,
+                    history.lows,
+                    history.closes,
+                    window_days=self._ATR_WINDOW_DAYS,
+                ),
+            )
+            symbol_series[symbol] = series
+        return series
+
+    def _load_signal_cache(
+        self, simulation_id: int, agent: BaseAgent, symbols: list[str]
+    ) -> None:
+        """Precompute agent decisions over each symbol's full cached history.
+
+        Agents that support batch evaluation (``BaseAgent.precompute_signals``)
+        compute every day's decision once here, and ``step_day`` looks them up
+        instead of calling ``evaluate``. Agents without support are evaluated
+        per day as before.
+
+        Signals are stored with the shared price matrix under the agent's
+        ``signal_key``, so other simulations on the same matrix whose agents
+        score identically (e.g. parameter sweep configs) reuse them.
+
+        Args:
+            simulation_id: Simulation ID for cache key.
+            agent: Agent instance for the simulation.
+            symbols: Symbols to precompute.
+        """
+        price_key = self._price_cache_keys.get(simulation_id)
+        signal_key = agent.signal_key
+        shareable = price_key is not None and signal_key is not None
+        if shareable:
+            shared = self._shared_prices.get_signals(price_key, signal_key)
+            if shared is not None:
+                self._signal_cache[simulation_id] = {
+                    symbol: symbol_signals.bind(agent)
+                    for symbol, symbol_signals in shared.items()
+                }
+                return
+
+        signals = precompute_signals(agent, self._get_price_matrix(simulation_id), symbols)
+        self._signal_cache[simulation_id] = signals
+        if shareable:
+            self._shared_prices.store_signals(price_key, signal_key, signals)
+
+    def _get_price_matrix(self, simulation_id: int) -> PriceMatrix:
+        """Get the simulation's price matrix (empty if not loaded)."""
+        matrix = self._price_cache.get(simulation_id)
+        return matrix if matrix is not None else _EMPTY_PRICE_MATRIX
 
     def _get_cached_price_history(
         self, simulation_id: int, symbol: str, start: date, end: date
-    ) -> list[PriceBar]:
+    ) -> PriceWindow:
         """Get price history from in-memory cache with date filtering."""
-        all_bars = self._price_cache.get(simulation_id, {}).get(symbol, [])
-        return [b for b in all_bars if start <= b.date <= end]
+        return self._get_price_matrix(simulation_id).window(symbol, start, end)
 
     def _get_cached_bar_for_date(
         self, simulation_id: int, symbol: str, target_date: date
     ) -> PriceBar | None:
         """Get single bar from in-memory cache."""
-        all_bars = self._price_cache.get(simulation_id, {}).get(symbol, [])
-        for bar in reversed(all_bars):
-            if bar.date == target_date:
-                return bar
-        return None
+        return self._get_price_matrix(simulation_id).bar(symbol, target_date)
 
     def _get_trading_days_from_cache(
         self, simulation_id: int, start: date, end: date
@@ -1230,30 +1901,109 @@ class SimulationEngine:
         Returns:
             Sorted list of trading dates where we have data for at least one symbol.
         """
-        all_dates: set[date] = set()
-        symbol_cache = self._price_cache.get(simulation_id, {})
-        for bars in symbol_cache.values():
-            for bar in bars:
-                if start <= bar.date <= end:
-                    all_dates.add(bar.date)
-        return sorted(all_dates)
-
-    def _find_bar_for_date(
-        self, price_history: list[PriceBar], target_date: date
-    ) -> PriceBar | None:
-        """Find a price bar for a specific date in the history.
+        return self._get_price_matrix(simulation_id).trading_days(start, end)
+
+    async def _load_portfolio_state(self, simulation: ArenaSimulation) -> _PortfolioState:
+        """Load the portfolio state at the start of the next day from the database.
 
         Args:
-            price_history: List of price bars.
-            target_date: Date to find.
+            simulation: Simulation being run.
 
         Returns:
-            PriceBar for the date or None if not found.
+            Cash and equity from the latest snapshot (initial capital if none),
+            plus OPEN and PENDING positions keyed by symbol, as the start of
+            the simulation's current day.
         """
-        for bar in reversed(price_history):
-            if bar.date == target_date:
-                return bar
-        return None
+        # Get previous snapshot for cash balance
+        prev_snapshot = await self._get_latest_snapshot(simulation.id)
+        if prev_snapshot:
+            cash, prev_equity = prev_snapshot.cash, prev_snapshot.total_equity
+        else:
+            cash = prev_equity = simulation.initial_capital
+
+        # Load open positions
+        open_positions = await self._get_open_positions(simulation.id)
+
+        # Batch-load pending positions (1 query instead of N)
+        pending_result = await self.session.execute(
+            select(ArenaPosition)
+            .where(ArenaPosition.simulation_id == simulation.id)
+            .where(ArenaPosition.status == PositionStatus.PENDING.value)
+        )
+
+        return _PortfolioState(
+            cash=cash,
+            prev_equity=prev_equity,
+            positions_by_symbol={p.symbol: p for p in open_positions},
+            pending_by_symbol={p.symbol: p for p in pending_result.scalars().all()},
+            day=simulation.current_day,
+        )
+
+    @staticmethod
+    def _round_carried_state(state: _PortfolioState) -> None:
+        """Round carried values the way a database round trip would.
+
+        Args:
+            state: State to round in place.
+        """
+        state.cash = state.cash.quantize(_SNAPSHOT_QUANTUM, rounding=ROUND_HALF_UP)
+        state.prev_equity = state.prev_equity.quantize(_SNAPSHOT_QUANTUM, rounding=ROUND_HALF_UP)
+        for position in (*state.positions_by_symbol.values(), *state.pending_by_symbol.values()):
+            for name, scale in _POSITION_SCALES.items():
+                value = getattr(position, name)
+                if value is None:
+                    continue
+                rounded = value.quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP)
+                # Only assign real changes so untouched positions stay clean
+                if rounded != value:
+                    setattr(position, name, rounded)
+        # Integer marks are exact; only an ATR trail percentage rounded on
+        # the entry day changes the multiplier.
+        for symbol, marks in state.price_marks.items():
+            trail_pct = state.positions_by_symbol[symbol].trailing_stop_pct
+            if trail_pct != marks.trail_pct:
+                marks.trail_pct = trail_pct
+                marks.trail_multiplier = trail_multiplier_units(trail_pct)
+
+    def _positions_value(
+        self,
+        simulation_id: int,
+        positions: Iterable[ArenaPosition],
+        current_date: date,
+        integer_accounting: bool,
+    ) -> Decimal:
+        """Value OPEN positions at the day's close.
+
+        Under integer accounting the closes are summed in price units and the
+        total is converted once; the result equals the Decimal sum.
+
+        Args:
+            simulation_id: Simulation ID.
+            positions: Positions to value; positions without a bar that day
+                count as zero.
+            current_date: Valuation date.
+            integer_accounting: Sum integer price units instead of Decimal bars.
+
+        Returns:
+            Total market value.
+        """
+        if integer_accounting:
+            matrix = self._get_price_matrix(simulation_id)
+            total = 0
+            for position in positions:
+                if position.status == PositionStatus.OPEN.value:
+                    close = matrix.close(position.symbol, current_date)
+                    if close is not None:
+                        total += position.shares * round(close * PRICE_SCALE)
+            return from_price_units(total)
+
+        value = Decimal("0")
+        for position in positions:
+            if position.status == PositionStatus.OPEN.value:
+                today_bar = self._get_cached_bar_for_date(simulation_id, position.symbol, current_date)
+                if today_bar:
+                    value += position.shares * today_bar.close
+        return value
 
     async def _get_latest_snapshot(self, simulation_id: int) -> ArenaSnapshot | None:
         """Get most recent snapshot for a simulation.
@@ -1400,13 +2150,103 @@ class SimulationEngine:
 
         Caches are per-engine-instance and not thread-safe by design.
         Each ArenaWorker creates one engine per simulation and runs
-        sequentially, so no concurrency issues exist.
+        sequentially, so no concurrency issues exist. The price matrix
+        reference is returned to the shared price cache. Safe to call
+        more than once.
         """
         self._price_cache.pop(simulation_id, None)
+        key = self._price_cache_keys.pop(simulation_id, None)
+        if key is not None:
+            self._shared_prices.release(key)
         self._trading_days_cache.pop(simulation_id, None)
+        self._trading_day_indexes.pop(simulation_id, None)
         self._peak_equity.pop(simulation_id, None)
         self._max_drawdown.pop(simulation_id, None)
         self._sector_cache.pop(simulation_id, None)
+        self._signal_cache.pop(simulation_id, None)
+        self._atr_cache.pop(simulation_id, None)
+        self._regime_cache.pop(simulation_id, None)
+        self._profiles.pop(simulation_id, None)
+        self._portfolio_states.pop(simulation_id, None)
+
+    async def explain_decisions(
+        self, simulation: ArenaSimulation, snapshot: ArenaSnapshot
+    ) -> dict[str, dict]:
+        """Get a snapshot's decisions with the agent's reasoning filled in.
+
+        Decision logs store no reasoning text, so the agent is re-run for the
+        snapshot date on the price window the day was simulated with. Agents
+        decide from prices alone, so the reasoning matches the original run.
+
+        Args:
+            simulation: The snapshot's simulation.
+            snapshot: Snapshot to explain.
+
+        Returns:
+            Decisions keyed by symbol (see ``DecisionLog.to_dict``).
+        """
+        if snapshot.decision_log is None:
+            return snapshot.decisions
+
+        log = DecisionLog.from_bytes(simulation.symbols, snapshot.decision_log)
+        evaluated = list(log.evaluated())
+        if not evaluated:
+            return log.to_dict()
+
+        # Explanations evaluate every criterion, including for symbols the
+        # run's trend gate short-circuited.
+        agent = get_agent(
+            simulation.agent_type, {**simulation.agent_config, "short_circuit_trend": False}
+        )
+        current_date = snapshot.snapshot_date
+        await self._load_simulation_prices(simulation, agent.required_lookback_days)
+        try:
+            reasoning: dict[str, str] = {}
+            for symbol, has_position in evaluated:
+                price_history = self._get_cached_price_history(
+                    simulation.id,
+                    symbol,
+                    current_date - timedelta(days=agent.required_lookback_days + 30),
+                    current_date,
+                )
+                decision = await agent.evaluate(
+                    symbol, price_history, current_date, has_position
+                )
+                reasoning[symbol] = decision.reasoning
+        finally:
+            self.clear_simulation_cache(simulation.id)
+        return log.to_dict(reasoning)
+
+    async def market_regimes(self, simulation: ArenaSimulation) -> list[tuple[date, Regime]]:
+        """Get the regime filter's market regime for each simulation day.
+
+        Uses the same precomputed series ``step_day`` looks up, over the
+        simulation's trading days.
+
+        Args:
+            simulation: Simulation to describe.
+
+        Returns:
+            (date, regime) pairs in date order; empty when the regime filter
+            is disabled.
+        """
+        if not simulation.agent_config.get("regime_filter", False):
+            return []
+
+        agent = get_agent(simulation.agent_type, simulation.agent_config)
+        await self._load_simulation_prices(simulation, agent.required_lookback_days)
+        try:
+            series = self._get_regime_series(
+                simulation.id,
+                simulation.agent_config.get("regime_symbol", "SPY"),
+                simulation.agent_config.get("regime_sma_period", 20),
+            )
+            trading_days = self._get_trading_days_from_cache(
+                simulation.id, simulation.start_date, simulation.end_date
+            )
+            return [(day, series[day]) for day in trading_days]
+        finally:
+            self.clear_simulation_cache(simulation.id)
 
     async def _get_all_snapshots(self, simulation_id: int) -> list[ArenaSnapshot]:
         """Get all snapshots for a simulation ordered by day number.
@@ -0,0 +1,123 @@
+"""Per-simulation timing profile for arena simulation days.
+
+SimulationEngine records how long each phase of a day takes (agent
+evaluation, ATR calculation, portfolio selection, snapshot building,
+commits) and counts symbols evaluated, cache hits and misses, and database
+statements. Totals accumulate over the whole simulation, so a slow run can
+be broken down after the fact without a profiler attached.
+
+Recording is a ``perf_counter`` call and a dict update, cheap enough to
+leave on in production (``arena_step_profiling``). The profile is stored on
+the simulation as JSON at every commit, so it survives worker restarts.
+
+Database statements are counted by one ``before_cursor_execute`` listener
+on all engines. It only counts inside ``counting_statements()``, and the
+active profile is a context variable, so statements from other requests or
+tasks are not counted.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class StepProfile:
+    """Accumulated phase timings and counters for one simulation.
+
+    Phases may nest: ``symbols`` includes the ``agent`` and ``atr`` time
+    spent inside the symbol loop, so subtract those to get position
+    management time.
+
+    Example:
+        >>> profile = StepProfile()
+        >>> started = time.perf_counter()
+        >>> ...  # do work
+        >>> profile.add_time("agent", time.perf_counter() - started)
+        >>> profile.count("symbols_evaluated")
+    """
+
+    def __init__(self, data: dict[str, Any] | None = None, enabled: bool = True) -> None:
+        """Initialize the profile, continuing from stored data if given.
+
+        Args:
+            data: A previous ``to_dict()`` result (e.g. from a resumed
+                simulation) to keep accumulating into.
+            enabled: When False, nothing is recorded.
+        """
+        self.enabled = enabled
+        self._seconds: dict[str, float] = {}
+        self._calls: dict[str, int] = {}
+        self._counters: dict[str, int] = {}
+        if data:
+            for name, phase in data.get("phases", {}).items():
+                self._seconds[name] = phase["total_ms"] / 1000
+                self._calls[name] = phase["calls"]
+            self._counters.update(data.get("counters", {}))
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Add one timed call of ``phase``.
+
+        Args:
+            phase: Phase name.
+            seconds: Elapsed time in seconds.
+        """
+        if not self.enabled:
+            return
+        self._seconds[phase] = self._seconds.get(phase, 0.0) + seconds
+        self._calls[phase] = self._calls.get(phase, 0) + 1
+
+    def count(self, counter: str, n: int = 1) -> None:
+        """Increment ``counter`` by ``n``.
+
+        Args:
+            counter: Counter name.
+            n: Amount to add.
+        """
+        if not self.enabled:
+            return
+        self._counters[counter] = self._counters.get(counter, 0) + n
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict.
+
+        Returns:
+            ``{"phases": {name: {"total_ms", "calls"}}, "counters": {name: n}}``
+        """
+        return {
+            "phases": {
+                name: {"total_ms": round(seconds * 1000, 3), "calls": self._calls[name]}
+                for name, seconds in self._seconds.items()
+            },
+            "counters": dict(self._counters),
+        }
+
+
+_active_profile: ContextVar[StepProfile | None] = ContextVar(
+    "arena_step_profile", default=None
+)
+
+
+@contextmanager
+def counting_statements(profile: StepProfile) -> Iterator[None]:
+    """Count database statements issued by the current task against ``profile``.
+
+    Args:
+        profile: Profile whose ``db_statements`` counter is incremented.
+    """
+    token = _active_profile.set(profile)
+    try:
+        yield
+    finally:
+        _active_profile.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(*_args: object) -> None:
+    """Count one statement against the active profile, if any."""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.count("db_statements")
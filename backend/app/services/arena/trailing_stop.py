@@ -7,12 +7,58 @@ Available implementations:
 - FixedPercentTrailingStop: Fixed percentage below the running high.
 - AtrTrailingStop: ATR-adaptive percentage, computed once at entry and then
   behaves identically to FixedPercentTrailingStop for subsequent updates.
+
+Both also provide ``update_units``, the same daily update on integer price
+units (``PRICE_SCALE`` units per dollar), for the simulation engine's integer
+accounting mode. Prices have 4 decimal places, so the integer update gives
+exactly the Decimal result.
 """
 
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import ClassVar
 
+# Fixed-point scales for integer accounting: prices in 1/10000 dollar units
+# (the scale of stored prices), trail multipliers in 1e-8 units.
+PRICE_SCALE = 10_000
+MULTIPLIER_SCALE = 100_000_000
+
+
+def to_price_units(price: Decimal) -> int:
+    """Convert a price with at most 4 decimal places to integer price units."""
+    return int(price.scaleb(4).to_integral_value())
+
+
+def from_price_units(units: int) -> Decimal:
+    """Convert integer price units back to a Decimal price."""
+    return Decimal(units).scaleb(-4)
+
+
+def to_multiplier_units(multiplier: Decimal) -> int:
+    """Convert a price multiplier (e.g. 0.95) to integer multiplier units."""
+    return int((multiplier * MULTIPLIER_SCALE).to_integral_value())
+
+
+def scale_price_units(price: int, multiplier: int, half_even: bool = True) -> int:
+    """Multiply price units by multiplier units, rounding back to price units.
+
+    Args:
+        price: Price in price units.
+        multiplier: Multiplier in multiplier units.
+        half_even: Round ties to even (like ``Decimal.quantize``); otherwise
+            away from zero (like a Numeric column write).
+
+    Returns:
+        Rounded product in price units.
+    """
+    quotient, remainder = divmod(price * multiplier, MULTIPLIER_SCALE)
+    twice = 2 * remainder
+    if twice > MULTIPLIER_SCALE or (
+        twice == MULTIPLIER_SCALE and (not half_even or quotient % 2)
+    ):
+        quotient += 1
+    return quotient
+
 
 @dataclass
 class TrailingStopUpdate:
@@ -59,6 +105,7 @@ class FixedPercentTrailingStop:
             raise ValueError(msg)
         self.trail_pct = trail_pct
         self._trail_multiplier = Decimal("1") - (trail_pct / Decimal("100"))
+        self._multiplier_units = to_multiplier_units(self._trail_multiplier)
 
     def calculate_initial_stop(
         self, entry_price: Decimal
@@ -119,6 +166,56 @@ class FixedPercentTrailingStop:
             stop_triggered=False,
         )
 
+    def update_units(
+        self,
+        current_high: int,
+        current_low: int,
+        previous_highest: int,
+        previous_stop: int,
+    ) -> tuple[int, int, bool]:
+        """Integer price unit version of update().
+
+        Args:
+            current_high: Today's high price
+            current_low: Today's low price
+            previous_highest: Previous highest price since entry
+            previous_stop: Previous stop price
+
+        Returns:
+            Tuple of (highest_price, stop_price, stop_triggered). When
+            triggered, the stop price is the exit trigger price.
+        """
+        return _update_units(
+            current_high, current_low, previous_highest, previous_stop, self._multiplier_units
+        )
+
+
+def _update_units(
+    current_high: int,
+    current_low: int,
+    previous_highest: int,
+    previous_stop: int,
+    multiplier: int,
+) -> tuple[int, int, bool]:
+    """Shared integer trailing stop update; see FixedPercentTrailingStop.update()."""
+    if current_low <= previous_stop:
+        return previous_highest, previous_stop, True
+    new_highest = max(current_high, previous_highest)
+    new_stop = scale_price_units(new_highest, multiplier)
+    return new_highest, max(new_stop, previous_stop), False
+
+
+def trail_multiplier_units(trail_pct: Decimal) -> int:
+    """Multiplier units for a trail percentage (e.g. 7.0 -> 0.93).
+
+    Args:
+        trail_pct: Trailing percentage (e.g., Decimal("7.0") for 7%).
+
+    Returns:
+        ``1 - trail_pct / 100`` in multiplier units.
+    """
+    return to_multiplier_units(_make_trail_multiplier(trail_pct))
+
 
 def _make_trail_multiplier(trail_pct: Decimal) -> Decimal:
     """Compute the price multiplier for a given trail percentage.
@@ -280,3 +377,29 @@ class AtrTrailingStop:
             stop_price=new_stop,
             stop_triggered=False,
         )
+
+    def update_units(
+        self,
+        current_high: int,
+        current_low: int,
+        previous_highest: int,
+        previous_stop: int,
+        trail_multiplier: int,
+    ) -> tuple[int, int, bool]:
+        """Integer price unit version of update().
+
+        Args:
+            current_high: Today's high price.
+            current_low: Today's low price.
+            previous_highest: Previous highest price since entry.
+            previous_stop: Previous stop price.
+            trail_multiplier: ``trail_multiplier_units(position.trailing_stop_pct)``,
+                computed once per position.
+
+        Returns:
+            Tuple of (highest_price, stop_price, stop_triggered). When
+            triggered, the stop price is the exit trigger price.
+        """
+        return _update_units(
+            current_high, current_low, previous_highest, previous_stop, trail_multiplier
+        )
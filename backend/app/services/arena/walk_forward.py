@@ -0,0 +1,128 @@
+"""Walk-forward (rolling-window) backtest helpers for arena simulations.
+
+A walk-forward run splits a long date range into consecutive windows. Each
+window has an in-sample train period followed by an out-of-sample test
+period, and both run as ordinary sub-simulations of one group. Comparing
+train and test returns window by window shows how stable a strategy is, and
+chaining the test periods gives one out-of-sample equity curve.
+
+Every sub-simulation loads the group's whole date range (``price_range`` in
+its agent_config), so all windows share one price matrix and one set of
+precomputed signals per worker process (see ``SharedPriceCache``). Engine
+lookups are windowed by date, so the wider matrix does not change results.
+Windows run in parallel through the regular ArenaWorker process pool.
+
+These are pure functions (no database access), like ``analytics``.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+
+_CENT = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    """One train/test split of a walk-forward run.
+
+    Attributes:
+        index: Zero-based window number.
+        train_start: First day of the in-sample period.
+        train_end: Last day of the in-sample period.
+        test_start: First day of the out-of-sample period.
+        test_end: Last day of the out-of-sample period.
+    """
+
+    index: int
+    train_start: date
+    train_end: date
+    test_start: date
+    test_end: date
+
+
+def build_walk_forward_windows(
+    start_date: date,
+    end_date: date,
+    train_days: int,
+    test_days: int,
+    step_days: int | None = None,
+) -> list[WalkForwardWindow]:
+    """Split a date range into rolling train/test windows.
+
+    The first test period starts ``train_days`` calendar days after
+    ``start_date``. Each following window moves forward by ``step_days``
+    (default ``test_days``, giving back-to-back test periods). The last test
+    period is clipped to ``end_date``.
+
+    Args:
+        start_date: First day of the whole range.
+        end_date: Last day of the whole range.
+        train_days: Calendar days in each train period.
+        test_days: Calendar days in each test period.
+        step_days: Calendar days between window starts (default: test_days).
+
+    Returns:
+        Windows in chronological order (empty if the range is too short).
+
+    Raises:
+        ValueError: If any period length is less than 1 day.
+    """
+    step = test_days if step_days is None else step_days
+    if train_days < 1 or test_days < 1 or step < 1:
+        msg = (
+            f"train_days, test_days and step_days must be >= 1, "
+            f"got {train_days}, {test_days}, {step}"
+        )
+        raise ValueError(msg)
+
+    windows: list[WalkForwardWindow] = []
+    test_start = start_date + timedelta(days=train_days)
+    while test_start <= end_date:
+        windows.append(
+            WalkForwardWindow(
+                index=len(windows),
+                train_start=test_start - timedelta(days=train_days),
+                train_end=test_start - timedelta(days=1),
+                test_start=test_start,
+                test_end=min(test_start + timedelta(days=test_days - 1), end_date),
+            )
+        )
+        test_start += timedelta(days=step)
+    return windows
+
+
+def stitch_equity_curves(
+    curves: Sequence[Sequence[tuple[date, Decimal]]],
+    initial_capital: Decimal,
+) -> list[tuple[date, Decimal]]:
+    """Chain per-window equity curves into one compounded curve.
+
+    Every sub-simulation starts from the same ``initial_capital``. Window k
+    is rescaled so it starts from where window k-1 ended, as if the capital
+    had been carried over. Points are expected in chronological order.
+    Points on dates an earlier window already covered are skipped, and the
+    window is rebased on its equity at the last skipped date, so only its
+    returns after that date are compounded.
+
+    Args:
+        curves: (date, total_equity) points per window, in window order.
+        initial_capital: Starting capital of every sub-simulation.
+
+    Returns:
+        Stitched (date, equity) points, rounded to cents.
+    """
+    stitched: list[tuple[date, Decimal]] = []
+    carried = initial_capital
+    for curve in curves:
+        if not curve:
+            continue
+        base = initial_capital
+        for point_date, equity in curve:
+            if stitched and point_date <= stitched[-1][0]:
+                base = equity
+                continue
+            stitched.append((point_date, (equity * carried / base).quantize(_CENT)))
+        carried = carried * curve[-1][1] / base
+    return stitched
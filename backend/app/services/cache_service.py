@@ -1,20 +1,19 @@
 """Cache service for market data freshness checking.
 
 Provides smart caching logic that understands market hours and trading days.
+Coverage of completed trading days is read from the fetched-range index
+(``price_coverage``), so gaps anywhere in a requested range are found
+without reading price rows.
 """
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
-from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 from app.services import trading_calendar_service
-from app.repositories.stock_price import StockPriceRepository
-
-if TYPE_CHECKING:
-    from app.models.stock import StockPrice
+from app.repositories.stock_price import DateRange, PriceCoverage, StockPriceRepository
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +24,28 @@ class CacheTTLConfig:
     market_hours_ttl: int = 300  # 5 minutes during market hours
 
 
+def hot_tier_expiry(ttl_config: CacheTTLConfig, now: datetime | None = None) -> datetime:
+    """When price data confirmed fresh at ``now`` should be rechecked.
+
+    Freshness only changes at the next session open or close, or after the
+    market-hours TTL while the market is open. Used to expire in-process
+    copies of data the database cache just served.
+
+    Args:
+        ttl_config: TTL configuration
+        now: Reference time (defaults to current time)
+
+    Returns:
+        Expiry time (UTC)
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    transition = trading_calendar_service.get_next_market_transition(now)
+    if trading_calendar_service.get_market_status(now) == "market_open":
+        return min(now + timedelta(seconds=ttl_config.market_hours_ttl), transition)
+    return transition
+
+
 @dataclass
 class FreshnessResult:
     """Result of freshness check with market-aware logic."""
@@ -36,7 +57,79 @@ class FreshnessResult:
     last_complete_trading_day: date  # Last day with complete data available
     needs_fetch: bool  # Whether to fetch new data
     fetch_start_date: date | None  # Start date for incremental fetch (if needed)
-    cached_records: list[StockPrice] | None = None  # Records from freshness check DB query
+    # Completed trading days never fetched, as runs of consecutive sessions
+    missing_ranges: list[DateRange] = field(default_factory=list)
+
+
+@dataclass
+class _FreshnessReference:
+    """Market-time reference shared by every symbol of one freshness check."""
+    now: datetime
+    today: date
+    market_status: str
+    last_complete_day: date
+    is_historical_request: bool
+
+    @property
+    def needs_intraday(self) -> bool:
+        """Whether today's partial session must be checked against the TTL."""
+        return not self.is_historical_request and self.market_status == "market_open"
+
+    def today_start(self) -> datetime:
+        """Start of today (US/Eastern) in UTC."""
+        eastern_now = self.now.astimezone(ZoneInfo("US/Eastern"))
+        midnight = eastern_now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return midnight.astimezone(timezone.utc)
+
+
+def coverage_span(sessions: DateRange) -> DateRange:
+    """Widen a run of fetched sessions over the non-trading days around it.
+
+    Recording the span instead of the bare sessions lets it merge with the
+    fetched ranges before and after it (e.g. across a weekend).
+
+    Args:
+        sessions: First and last fetched session
+
+    Returns:
+        Range from the day after the previous session to the day before the
+        next session
+    """
+    previous = trading_calendar_service.get_last_trading_day_on_or_before(
+        sessions.start_date - timedelta(days=1)
+    )
+    following = trading_calendar_service.get_next_trading_day(sessions.end_date)
+    return DateRange(
+        min(sessions.start_date, previous + timedelta(days=1)),
+        max(sessions.end_date, following - timedelta(days=1)),
+    )
+
+
+def find_missing_ranges(fetched: list[DateRange], sessions: list[date]) -> list[DateRange]:
+    """Find the sessions outside every fetched range.
+
+    Args:
+        fetched: Merged fetched ranges sorted by start date
+        sessions: Sorted trading sessions that must be covered
+
+    Returns:
+        Runs of consecutive uncovered sessions (first and last session of each)
+    """
+    missing: list[DateRange] = []
+    run: list[date] = []
+    i = 0
+    for session in sessions:
+        while i < len(fetched) and fetched[i].end_date < session:
+            i += 1
+        if i < len(fetched) and fetched[i].start_date <= session:
+            if run:
+                missing.append(DateRange(run[0], run[-1]))
+                run = []
+        else:
+            run.append(session)
+    if run:
+        missing.append(DateRange(run[0], run[-1]))
+    return missing
 
 
 class MarketDataCache:
@@ -82,6 +175,83 @@ class MarketDataCache:
         Returns:
             FreshnessResult with freshness status and fetch recommendations
         """
+        reference = self._freshness_reference(end_date)
+
+        # Fetched day ranges from the coverage index (no price rows read)
+        fetched = await self.repository.get_fetched_ranges(
+            symbol=symbol,
+            start_date=start_date.date(),
+            end_date=reference.last_complete_day,
+            interval=interval,
+        )
+        # Today's partial session is not in the index; summarize its rows
+        today = None
+        if reference.needs_intraday:
+            today = await self.repository.get_price_coverage(
+                symbol=symbol,
+                start_date=reference.today_start(),
+                end_date=end_date,
+                interval=interval,
+            )
+        return self._assess_freshness(fetched, today, start_date, reference)
+
+    async def check_freshness_batch(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str,
+    ) -> dict[str, FreshnessResult]:
+        """
+        Check cache freshness for many symbols with one database query.
+
+        Applies the same market-hours-aware logic as check_freshness_smart to
+        each symbol, reading every symbol's fetched ranges in a single query
+        (plus one grouped aggregate over today's rows during market hours).
+
+        Args:
+            symbols: Stock symbols (uppercase)
+            start_date: Start date for requested data range
+            end_date: End date for requested data range
+            interval: Data interval (e.g., "1d", "1h")
+
+        Returns:
+            FreshnessResult per symbol
+        """
+        reference = self._freshness_reference(end_date)
+        fetched_by_symbol = await self.repository.get_fetched_ranges_for_symbols(
+            symbols=symbols,
+            start_date=start_date.date(),
+            end_date=reference.last_complete_day,
+            interval=interval,
+        )
+        today_by_symbol: dict[str, PriceCoverage] = {}
+        if reference.needs_intraday:
+            today_by_symbol = await self.repository.get_price_coverage_for_symbols(
+                symbols=symbols,
+                start_date=reference.today_start(),
+                end_date=end_date,
+                interval=interval,
+            )
+        return {
+            symbol: self._assess_freshness(
+                fetched_by_symbol.get(symbol, []),
+                today_by_symbol.get(symbol, PriceCoverage.empty()) if reference.needs_intraday else None,
+                start_date,
+                reference,
+            )
+            for symbol in symbols
+        }
+
+    def _freshness_reference(self, end_date: datetime) -> _FreshnessReference:
+        """Work out the market status and last complete trading day for a request.
+
+        Args:
+            end_date: End date of the requested range
+
+        Returns:
+            _FreshnessReference for assessing the cached records
+        """
         now = datetime.now(timezone.utc)
         eastern = ZoneInfo("US/Eastern")
         today = now.astimezone(eastern).date()
@@ -103,157 +273,128 @@ class MarketDataCache:
         if is_historical_request:
             # Historical request: use requested end_date as reference
             # The "last complete trading day" is the last trading day <= requested end_date
-            last_complete_day = requested_end
-            for _ in range(10):  # Max 10 days back (covers any holiday streak)
-                if trading_calendar_service.is_trading_day(last_complete_day):
-                    break
-                last_complete_day = last_complete_day - timedelta(days=1)
+            last_complete_day = trading_calendar_service.get_last_trading_day_on_or_before(
+                requested_end
+            )
             market_status = "closed"  # Historical data is always "closed"
         else:
             # Live request: use current time as reference (existing behavior)
             last_complete_day = last_complete_day_now
 
-        # Get cached data to check coverage
-        price_records = await self.repository.get_price_data_by_date_range(
-            symbol=symbol,
-            start_date=start_date,
-            end_date=end_date,
-            interval=interval,
+        return _FreshnessReference(
+            now=now,
+            today=today,
+            market_status=market_status,
+            last_complete_day=last_complete_day,
+            is_historical_request=is_historical_request,
         )
 
-        if not price_records:
-            return FreshnessResult(
-                is_fresh=False,
-                reason="No cached data",
-                market_status=market_status,
-                recommended_ttl=0,
-                last_data_date=None,
-                last_complete_trading_day=last_complete_day,
-                needs_fetch=True,
-                fetch_start_date=start_date.date(),
-            )
+    def _assess_freshness(
+        self,
+        fetched: list[DateRange],
+        today: PriceCoverage | None,
+        start_date: datetime,
+        reference: _FreshnessReference,
+    ) -> FreshnessResult:
+        """Decide whether cached data covers a request.
+
+        Every trading session from the requested start through the last
+        complete trading day must lie in a fetched range. During market
+        hours, live requests also need today's rows fetched within the TTL.
 
-        # Find the first and last dates in cached data
-        last_data_date = max(record.timestamp.date() for record in price_records)
-        first_data_date = min(record.timestamp.date() for record in price_records)
+        Args:
+            fetched: Merged fetched ranges overlapping the request
+            today: Summary of today's cached rows (only for live requests
+                during market hours, otherwise None)
+            start_date: Start date of the requested range
+            reference: Market-time reference for the request
+
+        Returns:
+            FreshnessResult with freshness status and fetch recommendations
+        """
+        now = reference.now
+        market_status = reference.market_status
+        last_complete_day = reference.last_complete_day
+        has_today = today is not None and today.row_count > 0
 
-        # Check if cache covers the START of the requested range
         # Normalize to first trading day for requests starting on holidays/weekends
         requested_start = start_date.date()
         normalized_start = trading_calendar_service.get_first_trading_day_on_or_after(
             requested_start
         )
+        sessions = (
+            trading_calendar_service.get_trading_days_in_range(normalized_start, last_complete_day)
+            if normalized_start <= last_complete_day
+            else []
+        )
+        missing = find_missing_ranges(fetched, sessions)
+
+        # Last cached day the request can use
+        last_data_date = None
+        if has_today:
+            last_data_date = reference.today
+        elif fetched and fetched[-1].start_date <= last_complete_day:
+            last_data_date = min(fetched[-1].end_date, last_complete_day)
 
-        if first_data_date > normalized_start:
+        def result(
+            is_fresh: bool,
+            reason: str,
+            recommended_ttl: int,
+            fetch_start_date: date | None = None,
+        ) -> FreshnessResult:
             return FreshnessResult(
-                is_fresh=False,
-                reason=f"Cache missing data before {first_data_date} (requested: {requested_start}, first trading day: {normalized_start})",
+                is_fresh=is_fresh,
+                reason=reason,
                 market_status=market_status,
-                recommended_ttl=0,
+                recommended_ttl=recommended_ttl,
                 last_data_date=last_data_date,
                 last_complete_trading_day=last_complete_day,
-                needs_fetch=True,
-                fetch_start_date=requested_start,
+                needs_fetch=not is_fresh,
+                fetch_start_date=fetch_start_date,
+                missing_ranges=missing,
             )
 
-        # For historical requests, check if cache covers the requested range
-        if is_historical_request:
-            if last_data_date >= last_complete_day:
-                return FreshnessResult(
-                    is_fresh=True,
-                    reason=f"Historical data covers requested range (up to {last_data_date})",
-                    market_status=market_status,
-                    recommended_ttl=86400,  # 24 hours
-                    last_data_date=last_data_date,
-                    last_complete_trading_day=last_complete_day,
-                    needs_fetch=False,
-                    fetch_start_date=None,
-                    cached_records=price_records,
-                )
-            else:
-                # Missing data within the historical range
-                next_needed_day = trading_calendar_service.get_next_trading_day(last_data_date)
-                return FreshnessResult(
-                    is_fresh=False,
-                    reason=f"Historical data missing from {next_needed_day} to {last_complete_day}",
-                    market_status=market_status,
-                    recommended_ttl=0,
-                    last_data_date=last_data_date,
-                    last_complete_trading_day=last_complete_day,
-                    needs_fetch=True,
-                    fetch_start_date=last_data_date,
-                )
-
-        # Live request logic: Determine freshness based on market status
-        if market_status == "market_open":
-            # During market hours: use short TTL for live data
-            # Check if we have data for today
-            if last_data_date < today:
-                # Missing today's data entirely
-                return FreshnessResult(
-                    is_fresh=False,
-                    reason="Missing today's intraday data",
-                    market_status=market_status,
-                    recommended_ttl=self.ttl_config.market_hours_ttl,
-                    last_data_date=last_data_date,
-                    last_complete_trading_day=last_complete_day,
-                    needs_fetch=True,
-                    fetch_start_date=last_data_date,
-                )
-
-            # Have today's data, but check TTL for live updates
-            latest_fetch = max(record.last_fetched_at for record in price_records)
-            ttl_threshold = now - timedelta(seconds=self.ttl_config.market_hours_ttl)
-
-            if latest_fetch >= ttl_threshold:
-                return FreshnessResult(
-                    is_fresh=True,
-                    reason="Data fresh within 5-minute TTL",
-                    market_status=market_status,
-                    recommended_ttl=self.ttl_config.market_hours_ttl,
-                    last_data_date=last_data_date,
-                    last_complete_trading_day=last_complete_day,
-                    needs_fetch=False,
-                    fetch_start_date=None,
-                    cached_records=price_records,
-                )
-            else:
-                return FreshnessResult(
-                    is_fresh=False,
-                    reason="TTL expired during market hours",
-                    market_status=market_status,
-                    recommended_ttl=self.ttl_config.market_hours_ttl,
-                    last_data_date=last_data_date,
-                    last_complete_trading_day=last_complete_day,
-                    needs_fetch=True,
-                    fetch_start_date=last_data_date,
-                )
+        intraday_ttl = self.ttl_config.market_hours_ttl if reference.needs_intraday else 0
 
-        else:
+        if not fetched and not has_today and (missing or reference.needs_intraday):
+            return result(False, "No cached data", 0, fetch_start_date=requested_start)
+
+        if missing:
+            first, last = missing[0], missing[-1]
+            gaps = f" in {len(missing)} gaps" if len(missing) > 1 else ""
+            prefix = "Historical data missing" if reference.is_historical_request else "Missing data"
+            return result(
+                False,
+                f"{prefix} from {first.start_date} to {last.end_date}{gaps}",
+                intraday_ttl,
+                fetch_start_date=first.start_date,
+            )
+
+        # Every completed session is covered
+        if reference.is_historical_request:
+            return result(
+                True,
+                f"Historical data covers requested range (up to {last_complete_day})",
+                86400,  # 24 hours
+            )
+
+        if not reference.needs_intraday:
             # Pre-market, after-hours, or closed
-            # Check if data covers up to last complete trading day
-            if last_data_date >= last_complete_day:
-                return FreshnessResult(
-                    is_fresh=True,
-                    reason=f"Data covers up to last complete trading day ({last_complete_day})",
-                    market_status=market_status,
-                    recommended_ttl=86400,  # 24 hours
-                    last_data_date=last_data_date,
-                    last_complete_trading_day=last_complete_day,
-                    needs_fetch=False,
-                    fetch_start_date=None,
-                    cached_records=price_records,
-                )
-            else:
-                # Missing data for completed trading days
-                next_needed_day = trading_calendar_service.get_next_trading_day(last_data_date)
-                return FreshnessResult(
-                    is_fresh=False,
-                    reason=f"Missing data from {next_needed_day} to {last_complete_day}",
-                    market_status=market_status,
-                    recommended_ttl=0,
-                    last_data_date=last_data_date,
-                    last_complete_trading_day=last_complete_day,
-                    needs_fetch=True,
-                    fetch_start_date=last_data_date,  # Small overlap is OK
-                )
+            return result(
+                True,
+                f"Data covers up to last complete trading day ({last_complete_day})",
+                86400,  # 24 hours
+            )
+
+        # During market hours: use short TTL for today's live data
+        if not has_today:
+            return result(
+                False, "Missing today's intraday data", intraday_ttl, fetch_start_date=reference.today
+            )
+
+        ttl_threshold = now - timedelta(seconds=self.ttl_config.market_hours_ttl)
+        if today.last_fetched_at >= ttl_threshold:
+            return result(True, "Data fresh within 5-minute TTL", intraday_ttl)
+        return result(
+            False, "TTL expired during market hours", intraday_ttl, fetch_start_date=reference.today
+        )
@@ -14,7 +14,7 @@ import asyncio
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, time, timedelta, timezone
 from typing import Any, AsyncContextManager
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,8 +27,21 @@ from app.core.exceptions import (
 )
 from app.providers.base import MarketDataProviderInterface, PriceDataPoint, PriceDataRequest
 from app.providers.yahoo import YahooFinanceProvider
-from app.repositories.stock_price import StockPriceRepository
-from app.services.cache_service import MarketDataCache, CacheTTLConfig
+from app.repositories.stock_price import DateRange, StockPriceRepository
+from app.services import trading_calendar_service
+from app.services.cache_service import (
+    CacheTTLConfig,
+    FreshnessResult,
+    MarketDataCache,
+    coverage_span,
+    hot_tier_expiry,
+)
+from app.services.price_hot_cache import (
+    HotCacheKey,
+    PriceHotCache,
+    get_price_hot_cache,
+    points_in_range,
+)
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
@@ -51,6 +64,14 @@ class DataServiceConfig:
     max_history_years: int = 10
 
 
+@dataclass
+class _PlannedFetch:
+    """One provider request and the completed sessions it fetches."""
+
+    request: PriceDataRequest
+    sessions: DateRange | None  # None when it only fetches today's partial session
+
+
 class DataService:
     """
     Market data service with cache-first architecture.
@@ -95,6 +116,7 @@ class DataService:
         session_factory: Callable[[], AsyncContextManager[AsyncSession]] | None = None,
         provider: MarketDataProviderInterface | None = None,
         config: DataServiceConfig | None = None,
+        hot_cache: PriceHotCache | None = None,
     ):
         """
         Initialize DataService with dependencies.
@@ -105,12 +127,15 @@ class DataService:
                 None for API-only mode (no caching/persistence).
             provider: Market data provider (defaults to Yahoo if None)
             config: Service configuration (uses defaults if None)
+            hot_cache: In-memory tier in front of the database cache
+                (defaults to the process-wide ``get_price_hot_cache()``)
         """
         self._session_factory = session_factory
         self.provider = provider or YahooFinanceProvider()
         self.config = config or DataServiceConfig()
         self.logger = logger
         self._ttl_config = CacheTTLConfig()
+        self._hot_cache = hot_cache if hot_cache is not None else get_price_hot_cache()
 
     @staticmethod
     async def _get_fetch_lock(cache_key: str) -> asyncio.Lock:
@@ -319,10 +344,16 @@ class DataService:
         Sessions are opened only for DB operations and closed before external API calls.
 
         Flow:
+        0. Check the in-memory hot tier — returns without touching the DB on a hit
         1. Check freshness (market-aware) — returns cached data if fresh
-        2. If stale: acquire lock, double-check, fetch from provider, store in DB
+        2. If stale: acquire lock, double-check, fetch only the missing session
+           ranges (plus today's partial session during market hours) from the
+           provider, store them in the DB and record them as fetched
         3. Read full merged range from DB after store
 
+        Data served from the DB is kept in the hot tier until the freshness
+        decision could change; storing new bars invalidates the symbol.
+
         Race condition protection:
         - Per-cache-key locks prevent duplicate provider fetches
         - Double-check after lock acquisition catches concurrent populates
@@ -355,9 +386,20 @@ class DataService:
 
         cache_key = f"{symbol}:{interval}:{start_date.date()}:{end_date.date()}"
 
+        # --- Phase 0: In-memory hot tier (no DB access on a hit) ---
+        hot_key = HotCacheKey.for_request(symbol, interval, start_date, end_date)
+        if not force_refresh:
+            points = self._hot_cache.get(hot_key, start_date, end_date)
+            if points is not None:
+                self.logger.debug(f"Hot cache hit for {symbol}")
+                return points
+        # Whole days covered by hot_key, so the cached entry serves any request with it
+        load_start, load_end = hot_key.load_range()
+
         # --- Phase 1: Cache check (short-lived session) ---
-        fetch_start = start_date
+        freshness: FreshnessResult | None = None
         if not force_refresh:
+            generation = self._hot_cache.generation(symbol)
             async with self._session_factory() as session:
                 repo = StockPriceRepository(session)
                 cache = MarketDataCache(repo, self._ttl_config)
@@ -367,31 +409,29 @@ class DataService:
                     end_date=end_date,
                     interval=interval,
                 )
-            # Session closed here — objects detached but scalar attrs accessible
+                # Rows are only read once the aggregate check confirms a hit
+                if freshness.is_fresh:
+                    price_rows = await repo.get_price_rows_by_date_range(
+                        symbol=symbol,
+                        start_date=load_start,
+                        end_date=load_end,
+                        interval=interval,
+                    )
+            # Session closed here — plain rows, nothing attached to it
 
-            if freshness.is_fresh and freshness.cached_records is not None:
+            if freshness.is_fresh:
                 self.logger.debug(
                     f"Cache hit for {symbol}: {freshness.reason} "
                     f"(market: {freshness.market_status})"
                 )
-                return [self._record_to_point(r) for r in freshness.cached_records]
-
-            # Use incremental start date if available
-            if freshness.fetch_start_date and freshness.fetch_start_date > start_date.date():
-                fetch_start = datetime.combine(
-                    freshness.fetch_start_date,
-                    datetime.min.time(),
-                    tzinfo=timezone.utc,
-                )
-                self.logger.debug(
-                    f"Incremental fetch for {symbol}: {freshness.fetch_start_date} to {end_date.date()}"
-                )
+                return self._serve_rows(hot_key, price_rows, generation, start_date, end_date)
 
         # --- Phase 2: Lock + double-check + fetch + store ---
         fetch_lock = await self._get_fetch_lock(cache_key)
         async with fetch_lock:
             # Double-check after lock (short-lived session)
             if not force_refresh:
+                generation = self._hot_cache.generation(symbol)
                 async with self._session_factory() as session:
                     repo = StockPriceRepository(session)
                     cache = MarketDataCache(repo, self._ttl_config)
@@ -401,31 +441,29 @@ class DataService:
                         end_date=end_date,
                         interval=interval,
                     )
+                    if freshness.is_fresh:
+                        price_rows = await repo.get_price_rows_by_date_range(
+                            symbol=symbol,
+                            start_date=load_start,
+                            end_date=load_end,
+                            interval=interval,
+                        )
                 # Session closed here
 
-                if freshness.is_fresh and freshness.cached_records is not None:
+                if freshness.is_fresh:
                     self.logger.debug(
                         f"Cache hit after lock for {symbol}: {freshness.reason} "
                         f"(market: {freshness.market_status})"
                     )
-                    return [self._record_to_point(r) for r in freshness.cached_records]
-
-                # Update fetch_start in case it changed
-                if freshness.fetch_start_date and freshness.fetch_start_date > start_date.date():
-                    fetch_start = datetime.combine(
-                        freshness.fetch_start_date,
-                        datetime.min.time(),
-                        tzinfo=timezone.utc,
+                    return self._serve_rows(
+                        hot_key, price_rows, generation, start_date, end_date
                     )
 
-            # --- Yahoo fetch (NO session open!) ---
-            request = PriceDataRequest(
-                symbol=symbol,
-                start_date=fetch_start,
-                end_date=end_date,
-                interval=interval,
-            )
-            price_points = await self.provider.fetch_price_data(request)
+                self.logger.debug(f"Cache miss for {symbol}: {freshness.reason}")
+
+            # --- Provider fetch (NO session open!) ---
+            plans = self._plan_fetches(symbol, start_date, end_date, interval, hot_key, freshness)
+            price_points, fetched_sessions = await self._fetch_planned(plans, end_date)
 
             # --- Phase 3: Store + read (short-lived session) ---
             price_dicts = [self._point_to_dict(point, interval) for point in price_points]
@@ -436,25 +474,274 @@ class DataService:
                     new_data=price_dicts,
                     interval=interval,
                 )
+                for sessions in fetched_sessions:
+                    span = coverage_span(sessions)
+                    await repo.add_fetched_range(
+                        symbol=symbol,
+                        start_date=span.start_date,
+                        end_date=span.end_date,
+                        interval=interval,
+                    )
                 await session.commit()
+                # Entries loaded before this write must not be served or stored
+                self._hot_cache.invalidate(symbol)
+                generation = self._hot_cache.generation(symbol)
 
                 self.logger.info(f"Fetched and stored {len(price_points)} points for {symbol}")
 
                 # Read full merged range from DB (includes both old + new data)
-                price_records = await repo.get_price_data_by_date_range(
+                price_rows = await repo.get_price_rows_by_date_range(
                     symbol=symbol,
-                    start_date=start_date,
-                    end_date=end_date,
+                    start_date=load_start,
+                    end_date=load_end,
                     interval=interval,
                 )
-                result = [self._record_to_point(r) for r in price_records]
             # Session closed here
 
-        return result
+        return self._serve_rows(hot_key, price_rows, generation, start_date, end_date)
+
+    async def get_price_data_batch(
+        self,
+        symbols: list[str],
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        interval: str = "1d",
+        max_concurrency: int = 8,
+    ) -> dict[str, list[PriceDataPoint]]:
+        """
+        Get price data for many symbols with batched cache queries.
+
+        Flow:
+        1. One grouped aggregate query checks every symbol's freshness with
+           the same market-aware logic as get_price_data
+        2. One range query (``symbol = ANY(:symbols)``) reads the fresh
+           symbols' rows, which are served directly
+        3. Stale symbols go through get_price_data (lock, double-check,
+           provider fetch of the missing ranges, store), at most max_concurrency at a time
+
+        Args:
+            symbols: Stock symbols (duplicates are ignored)
+            start_date: Start date (defaults to 1 year ago)
+            end_date: End date (defaults to now)
+            interval: Data interval (default "1d")
+            max_concurrency: Max concurrent provider fetches for stale symbols
+
+        Returns:
+            Dict mapping symbol (uppercase) to its PriceDataPoints sorted by
+            timestamp, in the order of ``symbols``
+
+        Raises:
+            RuntimeError: If session_factory not provided during initialization
+            SymbolNotFoundError: If a stale symbol is not found
+            DataValidationError: If data validation fails
+        """
+        self._require_session_factory()
+        assert self._session_factory is not None
+
+        symbols = list(dict.fromkeys(s.upper().strip() for s in symbols))
+        if not symbols:
+            return {}
+        if end_date is None:
+            end_date = datetime.now(timezone.utc)
+        if start_date is None:
+            start_date = end_date - timedelta(days=get_settings().default_history_days)
+
+        # --- Phase 1: Batched cache check and read (short-lived session) ---
+        async with self._session_factory() as session:
+            repo = StockPriceRepository(session)
+            cache = MarketDataCache(repo, self._ttl_config)
+            freshness_by_symbol = await cache.check_freshness_batch(
+                symbols=symbols,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+            )
+            fresh = [s for s in symbols if freshness_by_symbol[s].is_fresh]
+            rows_by_symbol = await repo.get_price_rows_for_symbols(
+                symbols=fresh,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+            )
+        # Session closed here — plain rows, nothing attached to it
+
+        results: dict[str, list[PriceDataPoint]] = {
+            symbol: [self._record_to_point(r) for r in rows_by_symbol.get(symbol, [])]
+            for symbol in fresh
+        }
+        stale = [s for s in symbols if s not in results]
+
+        self.logger.debug(
+            f"Batch price data: {len(results)} cache hits, {len(stale)} stale "
+            f"of {len(symbols)} symbols"
+        )
+
+        # --- Phase 2: Fetch stale symbols with bounded concurrency ---
+        if stale:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch_one(symbol: str) -> tuple[str, list[PriceDataPoint]]:
+                """Refresh one stale symbol through the single-symbol path."""
+                async with semaphore:
+                    records = await self.get_price_data(
+                        symbol=symbol,
+                        start_date=start_date,
+                        end_date=end_date,
+                        interval=interval,
+                    )
+                return symbol, records
+
+            results.update(await asyncio.gather(*[fetch_one(s) for s in stale]))
+
+        return {symbol: results[symbol] for symbol in symbols}
+
+    def _plan_fetches(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str,
+        hot_key: HotCacheKey,
+        freshness: FreshnessResult | None,
+    ) -> list[_PlannedFetch]:
+        """Work out the provider requests for a stale (or force-refreshed) range.
+
+        Args:
+            symbol: Stock symbol (uppercase)
+            start_date: Requested start
+            end_date: Requested end
+            interval: Data interval
+            hot_key: Hot-tier key of the request (for its US/Eastern end day)
+            freshness: Freshness of the cached data, or None to refetch the
+                whole range
+
+        Returns:
+            Requests in date order, each with the completed sessions it fetches
+        """
+        if freshness is None:
+            first = trading_calendar_service.get_first_trading_day_on_or_after(start_date.date())
+            last = min(
+                trading_calendar_service.get_last_complete_trading_day(),
+                trading_calendar_service.get_last_trading_day_on_or_before(hot_key.end_day),
+            )
+            request = PriceDataRequest(
+                symbol=symbol, start_date=start_date, end_date=end_date, interval=interval
+            )
+            return [_PlannedFetch(request, DateRange(first, last) if first <= last else None)]
+
+        plans = [
+            _PlannedFetch(
+                PriceDataRequest(
+                    symbol=symbol,
+                    start_date=datetime.combine(gap.start_date, time.min, tzinfo=timezone.utc),
+                    end_date=datetime.combine(gap.end_date, time.max, tzinfo=timezone.utc),
+                    interval=interval,
+                ),
+                gap,
+            )
+            for gap in freshness.missing_ranges
+        ]
+
+        # Live request during market hours: today's partial session as well
+        if freshness.market_status == "market_open":
+            last_complete = freshness.last_complete_trading_day
+            if plans and plans[-1].sessions.end_date == last_complete:
+                plans[-1].request.end_date = end_date
+            else:
+                today_start = datetime.combine(
+                    last_complete + timedelta(days=1), time.min, tzinfo=timezone.utc
+                )
+                plans.append(
+                    _PlannedFetch(
+                        PriceDataRequest(
+                            symbol=symbol,
+                            start_date=today_start,
+                            end_date=end_date,
+                            interval=interval,
+                        ),
+                        None,
+                    )
+                )
+
+        if len(plans) > 1:
+            self.logger.debug(f"Fetching {symbol} in {len(plans)} ranges")
+        return plans
+
+    async def _fetch_planned(
+        self, plans: list[_PlannedFetch], end_date: datetime
+    ) -> tuple[list[PriceDataPoint], list[DateRange]]:
+        """Fetch the planned ranges from the provider.
+
+        A range the provider has no bars for (before a listing, during a
+        halt) fails on its own. If any range fails, one request from the
+        first range through ``end_date`` is made instead; when it returns
+        data, every planned range is recorded as fetched, so the empty
+        range is not requested again.
+
+        Args:
+            plans: Planned requests in date order
+            end_date: Requested end
+
+        Returns:
+            (price points, completed session ranges that were fetched)
+
+        Raises:
+            APIError: If the provider fails
+            DataValidationError: If the provider returns invalid or no data
+        """
+        fetched = [plan.sessions for plan in plans if plan.sessions is not None]
+        try:
+            price_points: list[PriceDataPoint] = []
+            for plan in plans:
+                price_points.extend(await self.provider.fetch_price_data(plan.request))
+            return price_points, fetched
+        except (APIError, DataValidationError) as e:
+            first = plans[0].request
+            if len(plans) == 1 and first.end_date == end_date:
+                raise
+            self.logger.warning(
+                f"Range fetch failed for {first.symbol} ({e}); "
+                f"fetching {first.start_date.date()} to {end_date.date()} in one request"
+            )
+            span = PriceDataRequest(
+                symbol=first.symbol,
+                start_date=first.start_date,
+                end_date=end_date,
+                interval=first.interval,
+            )
+            return await self.provider.fetch_price_data(span), fetched
+
+    def _serve_rows(
+        self,
+        hot_key: HotCacheKey,
+        price_rows: list,
+        generation: int,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[PriceDataPoint]:
+        """Cache rows read for ``hot_key.load_range()`` and return the requested range.
+
+        The rows are converted and kept in the hot tier before slicing.
+
+        Args:
+            hot_key: Hot-tier key of the request
+            price_rows: Fresh rows covering ``hot_key.load_range()``
+            generation: Hot-tier generation of the symbol read before the rows
+            start_date: Requested start
+            end_date: Requested end
+
+        Returns:
+            PriceDataPoints in ``[start_date, end_date]`` sorted by timestamp
+        """
+        points = [self._record_to_point(r) for r in price_rows]
+        self._hot_cache.put(
+            hot_key, points, expires_at=hot_tier_expiry(self._ttl_config), generation=generation
+        )
+        return points_in_range(points, start_date, end_date)
 
     @staticmethod
     def _record_to_point(record) -> PriceDataPoint:
-        """Convert StockPrice DB record to PriceDataPoint."""
+        """Convert a StockPrice record or price row to PriceDataPoint."""
         return PriceDataPoint(
             symbol=record.symbol,
             timestamp=record.timestamp,
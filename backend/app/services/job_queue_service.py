@@ -113,6 +113,38 @@ class JobQueueService(Generic[T]):
             await session.commit()
             return reset_count
 
+    async def release_job(self, job_id: int) -> bool:
+        """Return a job this worker claimed to the queue without counting a retry.
+
+        Used when the worker stops before the job finished: the job is
+        resumed by the next worker to claim it. A job that meanwhile left
+        'running' or was re-claimed by another worker is left alone.
+
+        Args:
+            job_id: The database ID of the job to release
+
+        Returns:
+            True if the job was reset to 'pending'.
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(self.model_class)
+                .where(self.model_class.id == job_id)
+                .where(self.model_class.status == "running")
+                .where(self.model_class.worker_id == self.worker_id)
+                .values(
+                    status="pending",
+                    worker_id=None,
+                    claimed_at=None,
+                    last_error="Worker stopped - job will be resumed",
+                )
+            )
+            await session.commit()
+            released = result.rowcount > 0
+            if released:
+                logger.info(f"Released job {job_id} for resume (worker={self.worker_id})")
+            return released
+
     async def claim_next_job(self) -> T | None:
         """Atomically claim the next pending job.
 
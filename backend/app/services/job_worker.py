@@ -19,6 +19,14 @@ settings = get_settings()
 T = TypeVar("T")
 
 
+class JobInterrupted(Exception):
+    """Raised by process_job when the worker stopped before the job finished.
+
+    The job is released back to the queue (see JobQueueService.release_job)
+    instead of being marked completed or failed, so it resumes elsewhere.
+    """
+
+
 class JobWorker(ABC, Generic[T]):
     """Base class for job workers.
 
@@ -36,6 +44,7 @@ class JobWorker(ABC, Generic[T]):
         session_factory: Factory for creating database sessions
         queue_service: JobQueueService instance for queue operations
         poll_interval: Seconds to wait between polling when no jobs found
+        max_concurrent_jobs: Maximum number of jobs processed at once
     """
 
     def __init__(
@@ -43,6 +52,7 @@ class JobWorker(ABC, Generic[T]):
         session_factory: async_sessionmaker[AsyncSession],
         queue_service: JobQueueService[T],
         poll_interval: float = 5.0,
+        max_concurrent_jobs: int = 1,
     ) -> None:
         """Initialize the job worker.
 
@@ -50,12 +60,22 @@ class JobWorker(ABC, Generic[T]):
             session_factory: Factory for creating async database sessions
             queue_service: JobQueueService for queue operations
             poll_interval: Seconds to wait between polls when idle (default: 5.0)
+            max_concurrent_jobs: Jobs processed at once (default: 1). With 1,
+                jobs run inline in the worker loop; above 1, each claimed job
+                runs as its own task with its own heartbeat.
+
+        Raises:
+            ValueError: If max_concurrent_jobs < 1
         """
+        if max_concurrent_jobs < 1:
+            raise ValueError(f"max_concurrent_jobs must be at least 1, got {max_concurrent_jobs}")
         self.session_factory = session_factory
         self.queue_service = queue_service
         self.poll_interval = poll_interval
+        self.max_concurrent_jobs = max_concurrent_jobs
         self._running = False
         self._current_job_id: int | None = None
+        self._active_jobs: dict[int, asyncio.Task] = {}
         self._sweeper_task: asyncio.Task | None = None
 
     @abstractmethod
@@ -72,7 +92,8 @@ class JobWorker(ABC, Generic[T]):
             job: The job instance to process
 
         Raises:
-            Any exception will cause the job to be marked as failed with retry
+            JobInterrupted: If the worker is stopping; the job is released
+            Any other exception will cause the job to be marked as failed with retry
         """
         pass
 
@@ -90,36 +111,20 @@ class JobWorker(ABC, Generic[T]):
 
         while self._running:
             try:
+                if len(self._active_jobs) >= self.max_concurrent_jobs:
+                    # At capacity: wait for a running job to finish before claiming
+                    await asyncio.wait(
+                        set(self._active_jobs.values()), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    continue
+
                 job = await self.queue_service.claim_next_job()
 
                 if job:
-                    self._current_job_id = job.id
-                    logger.info(
-                        f"[{self.queue_service.worker_id}] Processing job {job.id}"
-                    )
-
-                    # Start heartbeat task
-                    heartbeat_task = asyncio.create_task(self._heartbeat_loop(job.id))
-
-                    try:
-                        await self.process_job(job)
-                        await self.queue_service.mark_completed(job.id)
-                        logger.info(
-                            f"[{self.queue_service.worker_id}] Job {job.id} completed"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"[{self.queue_service.worker_id}] Job {job.id} failed: {e}",
-                            exc_info=True,
-                        )
-                        await self.queue_service.mark_failed(job.id, str(e))
-                    finally:
-                        heartbeat_task.cancel()
-                        try:
-                            await heartbeat_task
-                        except asyncio.CancelledError:
-                            pass
-                        self._current_job_id = None
+                    if self.max_concurrent_jobs == 1:
+                        await self._run_job(job)
+                    else:
+                        self._active_jobs[job.id] = asyncio.create_task(self._run_job(job))
                 else:
                     # No pending jobs, wait before polling again
                     await asyncio.sleep(self.poll_interval)
@@ -137,6 +142,47 @@ class JobWorker(ABC, Generic[T]):
                 )
                 await asyncio.sleep(self.poll_interval)
 
+    async def _run_job(self, job: T) -> None:
+        """Process one claimed job with heartbeats and record the outcome.
+
+        Args:
+            job: The claimed job instance
+        """
+        self._current_job_id = job.id
+        logger.info(
+            f"[{self.queue_service.worker_id}] Processing job {job.id}"
+        )
+
+        # Start heartbeat task
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop(job.id))
+
+        try:
+            await self.process_job(job)
+            await self.queue_service.mark_completed(job.id)
+            logger.info(
+                f"[{self.queue_service.worker_id}] Job {job.id} completed"
+            )
+        except JobInterrupted:
+            logger.info(
+                f"[{self.queue_service.worker_id}] Job {job.id} interrupted by shutdown"
+            )
+            await self.queue_service.release_job(job.id)
+        except Exception as e:
+            logger.error(
+                f"[{self.queue_service.worker_id}] Job {job.id} failed: {e}",
+                exc_info=True,
+            )
+            await self.queue_service.mark_failed(job.id, str(e))
+        finally:
+            heartbeat_task.cancel()
+            try:
+                await heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._active_jobs.pop(job.id, None)
+            if self._current_job_id == job.id:
+                self._current_job_id = None
+
     async def stop(self) -> None:
         """Stop the worker loop gracefully.
 
@@ -154,15 +200,16 @@ class JobWorker(ABC, Generic[T]):
             except asyncio.CancelledError:
                 pass
 
-        # Wait for current job to finish (graceful shutdown)
-        if self._current_job_id:
+        # Wait for current jobs to finish (graceful shutdown)
+        if self._current_job_id or self._active_jobs:
+            waiting_ids = sorted(set(self._active_jobs) | ({self._current_job_id} - {None}))
             logger.info(
-                f"[{self.queue_service.worker_id}] Waiting for job "
-                f"{self._current_job_id} to complete..."
+                f"[{self.queue_service.worker_id}] Waiting for job(s) "
+                f"{', '.join(str(job_id) for job_id in waiting_ids)} to complete..."
             )
             # Give it up to configured seconds to finish current iteration
             for _ in range(settings.worker_shutdown_iterations):
-                if self._current_job_id is None:
+                if self._current_job_id is None and not self._active_jobs:
                     break
                 await asyncio.sleep(settings.worker_shutdown_sleep)
 
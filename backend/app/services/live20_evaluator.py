@@ -10,11 +10,18 @@ Usage:
         opens, highs, lows, closes, volumes
     )
     direction, score = evaluator.determine_direction_and_score(criteria)
+
+Callers that only act on LONG setups (the arena agent) can check the trend
+gate first with ``evaluate_trend`` and skip the other criteria when it fails.
 """
 
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import NDArray
+
 from app.indicators.cci_analysis import CCIAnalysis, CCIDirection, CCIZone, analyze_cci
 from app.indicators.ma_analysis import analyze_ma_distance
 from app.indicators.multi_day_patterns import analyze_multi_day_patterns
@@ -53,6 +60,50 @@ class CriterionResult:
     score_for_long: int
 
 
+@dataclass(frozen=True)
+class Live20CriteriaSeries:
+    """Live20 criteria for every bar of one symbol's history (oldest to newest).
+
+    Produced by ``Live20Evaluator.evaluate_criteria_series``. Entry ``i`` holds
+    what ``evaluate_criteria`` returns for the history ending at bar ``i``.
+    Bars before ``REQUIRED_BARS - 1`` are not evaluated (``evaluated`` is
+    False and the other fields hold neutral placeholders).
+
+    Attributes:
+        evaluated: Whether bar i had enough history to be evaluated.
+        trend_aligned: Trend eligibility (10-day trend is bearish).
+        ma20_distance: Rounded MA20 distance percentage.
+        ma20_aligned: MA20 distance criterion alignment.
+        candle_pattern: Multi-day candle pattern name.
+        candle_duration: Candle pattern duration ("1-day", "2-day", "3-day").
+        candle_aligned: Candle criterion alignment.
+        rvol: Today/yesterday volume ratio.
+        volume_aligned: Volume criterion alignment.
+        momentum_value: Rounded CCI or RSI-2 value.
+        cci_direction: CCI direction value, or None for RSI-2 scoring.
+        momentum_aligned: Momentum criterion alignment.
+        momentum_score: Points the momentum criterion awards when aligned.
+        score: Total non-trend score (sum of aligned criterion weights).
+        aligned_count: Number of aligned non-trend criteria.
+    """
+
+    evaluated: NDArray[np.bool_]
+    trend_aligned: NDArray[np.bool_]
+    ma20_distance: NDArray[np.float64]
+    ma20_aligned: NDArray[np.bool_]
+    candle_pattern: list[str]
+    candle_duration: list[str]
+    candle_aligned: NDArray[np.bool_]
+    rvol: NDArray[np.float64]
+    volume_aligned: NDArray[np.bool_]
+    momentum_value: NDArray[np.float64]
+    cci_direction: list[str | None]
+    momentum_aligned: NDArray[np.bool_]
+    momentum_score: NDArray[np.int64]
+    score: NDArray[np.int64]
+    aligned_count: NDArray[np.int64]
+
+
 class Live20Evaluator:
     """Core evaluation logic for Live20 mean reversion strategy.
 
@@ -69,9 +120,9 @@ class Live20Evaluator:
     - NO_SETUP: Trend ineligible or fewer than 2 non-trend criteria aligned
 
     Note:
-        Requires minimum 25 price bars for accurate evaluation. The calling
-        service/agent is responsible for validating data sufficiency before
-        calling evaluate_criteria().
+        Requires minimum 25 price bars (``REQUIRED_BARS``) for accurate
+        evaluation. The calling service/agent is responsible for validating
+        data sufficiency before calling evaluate_criteria().
     """
 
     TREND_CRITERION_NAME = "trend"
@@ -85,6 +136,11 @@ class Live20Evaluator:
     MA20_DISTANCE_THRESHOLD = 5.0  # 5% threshold for "far" from MA20
     MIN_CRITERIA_FOR_SETUP = 3  # Legacy threshold including trend
     MIN_NON_TREND_CRITERIA_FOR_SETUP = 2
+    # Longest trailing window any criterion reads for the newest bar: MA20
+    # plus its 5-bar slope lookback. Trend (10), CCI (14 + previous value),
+    # RSI-2 (3), volume (2) and candle patterns (3) all fit inside it, so the
+    # criteria are identical whether callers pass full history or this tail.
+    REQUIRED_BARS = 25
 
     @classmethod
     def normalize_signal_scores(cls, signal_scores: dict[str, int] | None) -> dict[str, int]:
@@ -127,13 +183,33 @@ class Live20Evaluator:
 
         return normalized
 
+    def evaluate_trend(self, closes: list[float] | NDArray[np.float64]) -> CriterionResult:
+        """Evaluate the 10-day trend eligibility gate on its own.
+
+        Cheap compared to the full criteria; a non-bearish trend rules out a
+        LONG setup whatever the other criteria say.
+
+        Args:
+            closes: Closing prices (oldest to newest)
+
+        Returns:
+            The trend CriterionResult, as included in ``evaluate_criteria``.
+        """
+        trend = detect_trend(closes, period=10)
+        return CriterionResult(
+            name=self.TREND_CRITERION_NAME,
+            value=trend.value,
+            aligned_for_long=trend == TrendDirection.BEARISH,
+            score_for_long=0,
+        )
+
     def evaluate_criteria(
         self,
-        opens: list[float],
-        highs: list[float],
-        lows: list[float],
-        closes: list[float],
-        volumes: list[float],
+        opens: list[float] | NDArray[np.float64],
+        highs: list[float] | NDArray[np.float64],
+        lows: list[float] | NDArray[np.float64],
+        closes: list[float] | NDArray[np.float64],
+        volumes: list[float] | NDArray[np.float64],
         scoring_algorithm: ScoringAlgorithm = ScoringAlgorithm.CCI,
         signal_scores: dict[str, int] | None = None,
     ) -> tuple[list[CriterionResult], VolumeSignalAnalysis, MomentumAnalysis, str]:
@@ -159,15 +235,9 @@ class Live20Evaluator:
         weights = self.normalize_signal_scores(signal_scores)
 
         # 1. Recent Trend (10-day) - eligibility filter only (non-scoring)
-        trend = detect_trend(closes, period=10)
-        criteria.append(
-            CriterionResult(
-                name=self.TREND_CRITERION_NAME,
-                value=trend.value,
-                aligned_for_long=trend == TrendDirection.BEARISH,
-                score_for_long=0,
-            )
-        )
+        trend_criterion = self.evaluate_trend(closes)
+        trend = TrendDirection(trend_criterion.value)
+        criteria.append(trend_criterion)
 
         # 2. MA20 Distance - Price stretched from MA
         ma_analysis = analyze_ma_distance(closes, period=20)
@@ -248,6 +318,222 @@ class Live20Evaluator:
 
         return criteria, volume_signal, momentum_analysis, candle_explanation
 
+    def evaluate_criteria_series(
+        self,
+        opens: list[float] | NDArray[np.float64],
+        highs: list[float] | NDArray[np.float64],
+        lows: list[float] | NDArray[np.float64],
+        closes: list[float] | NDArray[np.float64],
+        volumes: list[float] | NDArray[np.float64],
+        scoring_algorithm: ScoringAlgorithm = ScoringAlgorithm.CCI,
+        signal_scores: dict[str, int] | None = None,
+        short_circuit: bool = False,
+    ) -> Live20CriteriaSeries:
+        """Evaluate all criteria for every bar of a price history at once.
+
+        Batch counterpart of ``evaluate_criteria`` for backtests: bar ``i`` of
+        the result matches calling ``evaluate_criteria`` on the history ending
+        at bar ``i`` (with at least ``REQUIRED_BARS`` bars). Trend, MA20, CCI,
+        RSI-2 and volume are computed as whole-array NumPy operations using
+        the same formulas as the indicator functions, so values are
+        bit-identical. Candle patterns are rule-based and run bar-by-bar
+        through the same pattern functions on a 3-bar window.
+
+        Args:
+            opens: Opening prices (oldest to newest)
+            highs: High prices
+            lows: Low prices
+            closes: Closing prices
+            volumes: Volume data
+            scoring_algorithm: Scoring algorithm for momentum criterion (default CCI)
+            signal_scores: Weight configuration for non-trend criteria
+            short_circuit: Skip the per-bar candle and CCI direction work for
+                bars that fail the trend gate. Their non-trend criteria are
+                then placeholders (not aligned, score 0).
+
+        Returns:
+            Live20CriteriaSeries with one entry per input bar.
+        """
+        weights = self.normalize_signal_scores(signal_scores)
+        o = np.array(opens, dtype=float)
+        h = np.array(highs, dtype=float)
+        lo = np.array(lows, dtype=float)
+        c = np.array(closes, dtype=float)
+        v = np.array(volumes, dtype=float)
+        n = len(c)
+        first = self.REQUIRED_BARS - 1
+        evaluated = np.arange(n) >= first
+
+        # 1. Trend (10-day): percent change from close[i-9] to close[i]
+        trend_period = 10
+        trend_pct = np.zeros(n)
+        if n >= trend_period:
+            start = c[: n - trend_period + 1]
+            end = c[trend_period - 1 :]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pct = ((end - start) / start) * 100
+            trend_pct[trend_period - 1 :] = np.where(start == 0, 0.0, pct)
+        trend_codes = np.where(trend_pct > 1.0, 1, np.where(trend_pct < -1.0, -1, 0))
+        trend_aligned = evaluated & (trend_codes == -1)
+        # Bars that get the per-bar (Python loop) criteria
+        detailed = trend_aligned if short_circuit else evaluated
+
+        # 2. MA20 distance (same SMA convolution as simple_moving_average)
+        ma_period = 20
+        ma = np.full(n, np.nan)
+        if n >= ma_period:
+            ma[ma_period - 1 :] = np.convolve(c, np.ones(ma_period) / ma_period, mode="valid")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distance = np.where(ma == 0, 0.0, ((c - ma) / ma) * 100)
+        ma20_distance = np.where(evaluated, np.round(distance, 2), 0.0)
+        ma20_aligned = evaluated & (ma20_distance < -self.MA20_DISTANCE_THRESHOLD)
+
+        # 3. Volume: today vs yesterday with candle color
+        rvol = np.ones(n)
+        volume_aligned = np.zeros(n, dtype=bool)
+        if n >= 2:
+            today, yesterday = v[1:], v[:-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.round(today / yesterday, 2)
+            rvol[1:] = np.where(yesterday == 0, 1.0, ratio)
+            volume_aligned[1:] = (today > yesterday) & (c[1:] > o[1:])
+        volume_aligned &= evaluated
+
+        # 4. Momentum: CCI or RSI-2
+        cci_direction: list[str | None] = [None] * n
+        if scoring_algorithm == ScoringAlgorithm.RSI2:
+            rsi = self._rsi2_series(c)
+            valid = ~np.isnan(rsi)
+            long_score = np.select(
+                [rsi < 5, rsi < 15, rsi < 30, rsi < 50], [20, 15, 10, 5], default=0
+            )
+            long_score = np.where(valid, long_score, 0)
+            momentum_score = np.array(
+                [int(round(weights["momentum"] * (int(s) / 20))) for s in long_score],
+                dtype=np.int64,
+            )
+            momentum_value = np.array(
+                [round(float(x), 1) if ok else 50.0 for x, ok in zip(rsi, valid, strict=True)]
+            )
+            momentum_aligned = evaluated & (momentum_score > 0)
+        else:
+            cci = self._cci_series(h, lo, c, period=14)
+            prev = np.concatenate([[np.nan], cci[:-1]])
+            change = cci - prev
+            oversold = cci < -100
+            neutral = (cci >= -100) & (cci <= 100)
+            rising = change > 5
+            falling = change < -5
+            momentum_aligned = evaluated & (
+                (oversold & ~falling) | (neutral & rising)
+            )
+            momentum_score = np.full(n, weights["momentum"], dtype=np.int64)
+            momentum_value = np.zeros(n)
+            for i in np.flatnonzero(detailed):
+                momentum_value[i] = round(float(cci[i]), 1)
+                if rising[i]:
+                    cci_direction[i] = CCIDirection.RISING.value
+                elif falling[i]:
+                    cci_direction[i] = CCIDirection.FALLING.value
+                else:
+                    cci_direction[i] = CCIDirection.FLAT.value
+
+        # 5. Candle patterns: rule-based, evaluated bar by bar on a 3-bar window
+        candle_pattern = ["none"] * n
+        candle_duration = ["1-day"] * n
+        candle_aligned = np.zeros(n, dtype=bool)
+        trend_by_code = {
+            1: TrendDirection.BULLISH,
+            -1: TrendDirection.BEARISH,
+            0: TrendDirection.NEUTRAL,
+        }
+        for i in np.flatnonzero(detailed):
+            window = slice(i - 2, i + 1)
+            result = analyze_multi_day_patterns(
+                o[window], h[window], lo[window], c[window], trend_by_code[int(trend_codes[i])]
+            )
+            candle_pattern[i] = result.pattern_name
+            candle_duration[i] = result.duration.value
+            candle_aligned[i] = result.aligned_for_long
+
+        if short_circuit:
+            ma20_aligned &= trend_aligned
+            volume_aligned &= trend_aligned
+            momentum_aligned &= trend_aligned
+
+        score = (
+            ma20_aligned * weights["ma20_distance"]
+            + candle_aligned * weights["candle"]
+            + volume_aligned * weights["volume"]
+            + momentum_aligned * momentum_score
+        ).astype(np.int64)
+        aligned_count = (
+            ma20_aligned.astype(np.int64)
+            + candle_aligned
+            + volume_aligned
+            + momentum_aligned
+        )
+
+        return Live20CriteriaSeries(
+            evaluated=evaluated,
+            trend_aligned=trend_aligned,
+            ma20_distance=ma20_distance,
+            ma20_aligned=ma20_aligned,
+            candle_pattern=candle_pattern,
+            candle_duration=candle_duration,
+            candle_aligned=candle_aligned,
+            rvol=rvol,
+            volume_aligned=volume_aligned,
+            momentum_value=momentum_value,
+            cci_direction=cci_direction,
+            momentum_aligned=momentum_aligned,
+            momentum_score=momentum_score,
+            score=score,
+            aligned_count=aligned_count,
+        )
+
+    @staticmethod
+    def _cci_series(
+        highs: NDArray[np.float64],
+        lows: NDArray[np.float64],
+        closes: NDArray[np.float64],
+        period: int,
+    ) -> NDArray[np.float64]:
+        """Whole-history CCI matching ``commodity_channel_index`` element for element."""
+        n = len(closes)
+        cci = np.full(n, np.nan)
+        if n < period:
+            return cci
+        tp = (highs + lows + closes) / 3.0
+        tp_sma = np.convolve(tp, np.ones(period) / period, mode="valid")
+        mean_dev = np.abs(sliding_window_view(tp, period) - tp_sma[:, None]).mean(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = np.where(
+                mean_dev != 0, (tp[period - 1 :] - tp_sma) / (0.015 * mean_dev), 0
+            )
+        cci[period - 1 :] = values
+        return cci
+
+    @staticmethod
+    def _rsi2_series(closes: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Whole-history RSI-2 matching ``relative_strength_index(period=2)``."""
+        period = 2
+        n = len(closes)
+        rsi = np.full(n, np.nan)
+        if n < period + 1:
+            return rsi
+        delta = np.diff(closes)
+        gains = np.where(delta > 0, delta, 0)
+        losses = np.where(delta < 0, -delta, 0)
+        kernel = np.ones(period) / period
+        avg_gains = np.convolve(gains, kernel, mode="valid")
+        avg_losses = np.convolve(losses, kernel, mode="valid")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rs = np.where(avg_losses != 0, avg_gains / avg_losses, 0)
+            values = 100 - (100 / (1 + rs))
+        rsi[period:] = np.where(avg_losses == 0, 100, values)
+        return rsi
+
     def determine_direction_and_score(self, criteria: list[CriterionResult]) -> tuple[str, int]:
         """Determine direction and calculate score based on LONG criteria alignment.
 
@@ -281,7 +567,7 @@ class Live20Evaluator:
 
         return direction, score
 
-    def get_ma20_distance(self, closes: list[float]) -> float:
+    def get_ma20_distance(self, closes: list[float] | NDArray[np.float64]) -> float:
         """Get MA20 distance percentage.
 
         Args:
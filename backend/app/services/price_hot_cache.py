@@ -0,0 +1,287 @@
+"""Process-local hot tier in front of the database price cache.
+
+The same short windows (SPY and sector ETFs over 60 days, Live20 symbols)
+are requested many times a day, and each request used to run a freshness
+query plus a row read against Postgres. ``PriceHotCache`` keeps the decoded
+``PriceDataPoint`` lists that the database cache just served, so a repeat
+request is answered from memory:
+
+- Entries are keyed by symbol, interval, start date (UTC) and end date
+  (US/Eastern), the inputs the database freshness check depends on. Each
+  entry holds the whole days its key covers, so any request with that key
+  is answered by slicing it to the exact requested range.
+- Entries expire when the database freshness decision could change (see
+  ``cache_service.hot_tier_expiry``).
+- ``DataService`` invalidates a symbol after writing new bars for it.
+  Writes made by other processes are only seen once the entry expires.
+- The total number of cached bars is bounded; the least recently used
+  entries are evicted first.
+
+Not thread-safe: all calls must come from one event loop at a time.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from app.core.config import get_settings
+from app.providers.base import PriceDataPoint
+
+logger = logging.getLogger(__name__)
+
+_EASTERN = ZoneInfo("US/Eastern")
+
+
+@dataclass(frozen=True)
+class HotCacheKey:
+    """Identifies one hot-tier entry.
+
+    Attributes:
+        symbol: Stock symbol (uppercase).
+        interval: Data interval.
+        start_day: Requested start date (UTC).
+        end_day: Requested end date (US/Eastern).
+    """
+
+    symbol: str
+    interval: str
+    start_day: date
+    end_day: date
+
+    @classmethod
+    def for_request(
+        cls, symbol: str, interval: str, start_date: datetime, end_date: datetime
+    ) -> "HotCacheKey":
+        """Build the key for a get_price_data request."""
+        return cls(
+            symbol=symbol,
+            interval=interval,
+            start_day=_as_utc(start_date).date(),
+            end_day=_as_utc(end_date).astimezone(_EASTERN).date(),
+        )
+
+    def load_range(self) -> tuple[datetime, datetime]:
+        """Date range to load so every request with this key is a slice of it.
+
+        Returns:
+            (start of the UTC start day, end of the Eastern end day) in UTC
+        """
+        start = datetime.combine(self.start_day, time.min, tzinfo=timezone.utc)
+        end = datetime.combine(self.end_day + timedelta(days=1), time.min, tzinfo=_EASTERN)
+        return start, (end - timedelta(microseconds=1)).astimezone(timezone.utc)
+
+
+@dataclass
+class _Entry:
+    """Cached points and when they expire."""
+
+    points: list[PriceDataPoint]
+    expires_at: datetime
+
+
+@dataclass
+class HotCacheStats:
+    """Hot-tier counters since process start (or the last ``clear``)."""
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from memory (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PriceHotCache:
+    """Size-bounded LRU cache of price data already confirmed fresh.
+
+    Example:
+        >>> cache = PriceHotCache(max_bars=100_000)
+        >>> key = HotCacheKey.for_request("SPY", "1d", start, end)
+        >>> points = cache.get(key, start, end)
+        >>> if points is None:
+        ...     generation = cache.generation("SPY")
+        ...     points = await load(*key.load_range())
+        ...     cache.put(key, points, expires_at, generation)
+    """
+
+    def __init__(self, max_bars: int = 0) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bars: Total number of price bars to keep. 0 disables the cache.
+
+        Raises:
+            ValueError: If max_bars is negative.
+        """
+        if max_bars < 0:
+            raise ValueError(f"max_bars must be >= 0, got {max_bars}")
+        self.max_bars = max_bars
+        # Least recently used first
+        self._entries: OrderedDict[HotCacheKey, _Entry] = OrderedDict()
+        self._bars = 0
+        self._keys_by_symbol: dict[str, set[HotCacheKey]] = {}
+        self._generations: dict[str, int] = {}
+        self.stats = HotCacheStats()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(
+        self,
+        key: HotCacheKey,
+        start_date: datetime,
+        end_date: datetime,
+        now: datetime | None = None,
+    ) -> list[PriceDataPoint] | None:
+        """Get the cached points in ``[start_date, end_date]``.
+
+        Args:
+            key: Key for the request (see ``HotCacheKey.for_request``).
+            start_date: Exact requested start.
+            end_date: Exact requested end.
+            now: Current time (defaults to now), for expiry.
+
+        Returns:
+            A new list of points sorted by timestamp, or None on a miss.
+        """
+        if self.max_bars == 0:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= (now or datetime.now(timezone.utc)):
+            self._remove(key)
+            self.stats.expirations += 1
+            entry = None
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return points_in_range(entry.points, start_date, end_date)
+
+    def generation(self, symbol: str) -> int:
+        """Invalidation counter for a symbol; pass it to ``put``."""
+        return self._generations.get(symbol, 0)
+
+    def put(
+        self,
+        key: HotCacheKey,
+        points: list[PriceDataPoint],
+        expires_at: datetime,
+        generation: int,
+    ) -> None:
+        """Cache the points loaded for ``key.load_range()``.
+
+        Args:
+            key: Entry key.
+            points: Points sorted by timestamp covering ``key.load_range()``.
+            expires_at: When the entry stops being served.
+            generation: ``generation(key.symbol)`` read before the points were
+                loaded. If the symbol was invalidated since, the points may
+                predate the write and are not cached.
+        """
+        if (
+            self.max_bars == 0
+            or len(points) > self.max_bars
+            or generation != self.generation(key.symbol)
+        ):
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(points=points, expires_at=expires_at)
+        self._bars += len(points)
+        self._keys_by_symbol.setdefault(key.symbol, set()).add(key)
+
+        while self._bars > self.max_bars:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def invalidate(self, symbol: str) -> int:
+        """Drop every entry for a symbol after its stored bars changed.
+
+        Args:
+            symbol: Stock symbol (uppercase).
+
+        Returns:
+            Number of entries dropped.
+        """
+        self._generations[symbol] = self.generation(symbol) + 1
+        keys = list(self._keys_by_symbol.get(symbol, ()))
+        for key in keys:
+            self._remove(key)
+        self.stats.invalidations += len(keys)
+        if keys:
+            logger.debug(f"Invalidated {len(keys)} hot cache entries for {symbol}")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self._keys_by_symbol.clear()
+        self._bars = 0
+        self.stats = HotCacheStats()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Size and hit-rate metrics for monitoring."""
+        return {
+            "entries": len(self._entries),
+            "bars": self._bars,
+            "max_bars": self.max_bars,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_rate": round(self.stats.hit_rate, 4),
+            "expirations": self.stats.expirations,
+            "evictions": self.stats.evictions,
+            "invalidations": self.stats.invalidations,
+        }
+
+    def _remove(self, key: HotCacheKey) -> None:
+        """Drop one entry and its bookkeeping."""
+        entry = self._entries.pop(key)
+        self._bars -= len(entry.points)
+        keys = self._keys_by_symbol[key.symbol]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_symbol[key.symbol]
+
+
+def points_in_range(
+    points: list[PriceDataPoint], start_date: datetime, end_date: datetime
+) -> list[PriceDataPoint]:
+    """Slice points sorted by timestamp to ``[start_date, end_date]``.
+
+    Returns:
+        A new list (the input is never returned itself).
+    """
+    lo = bisect_left(points, _as_utc(start_date), key=_point_time)
+    hi = bisect_right(points, _as_utc(end_date), key=_point_time)
+    return points[lo:hi]
+
+
+def _point_time(point: PriceDataPoint) -> datetime:
+    return _as_utc(point.timestamp)
+
+
+def _as_utc(timestamp: datetime) -> datetime:
+    """Treat naive timestamps as UTC so they compare with aware ones."""
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+
+@lru_cache
+def get_price_hot_cache() -> PriceHotCache:
+    """Get this process's price hot tier, sized from settings."""
+    return PriceHotCache(max_bars=get_settings().price_hot_cache_bars)
@@ -15,29 +15,156 @@ Key functions:
 - get_last_complete_trading_day: Get most recent trading day with complete data
 - get_next_trading_day: Get next trading day after given date
 - get_first_trading_day_on_or_after: Get first trading day on or after given date
+- get_last_trading_day_on_or_before: Get last trading day on or before given date
 
 The NYSE calendar is cached using lru_cache to minimize overhead when accessed
-repeatedly during simulation operations.
+repeatedly during simulation operations. Date queries are answered from a
+``SessionIndex`` of the calendar's sessions (see ``get_nyse_session_index``),
+falling back to the calendar for dates outside its span.
 """
 
 import logging
+from collections.abc import Iterable
 from datetime import date, datetime, timedelta, timezone
 from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import exchange_calendars as xcals
+import numpy as np
+from numpy.typing import NDArray
+
+from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+_ONE_DAY = timedelta(days=1)
+
+
+class SessionIndex:
+    """Sorted trading sessions with O(1) date queries.
+
+    Sessions are kept as a ``datetime64[D]`` array plus a lookup table with
+    one entry per calendar day from the first to the last session, holding
+    the number of sessions before that day. Membership, next/previous
+    session and session counts are then a table read instead of a search
+    or a calendar call.
+
+    Built for the NYSE calendar (``get_nyse_session_index``) and for any
+    other set of trading days, e.g. the dates an arena simulation has data
+    for.
+    """
+
+    def __init__(self, sessions: Iterable[date] | NDArray[np.datetime64]) -> None:
+        """Index a set of sessions.
+
+        Args:
+            sessions: Session dates in any order; duplicates are ignored.
+        """
+        if not isinstance(sessions, np.ndarray):
+            sessions = list(sessions)
+        self.sessions: NDArray[np.datetime64] = np.unique(
+            np.asarray(sessions, dtype="datetime64[D]")
+        )
+        self.sessions.setflags(write=False)
+        self._first_ordinal = 0
+        # _rows[k]: sessions before calendar day first + k; one extra entry
+        # so _rows[span] is the session count
+        self._rows = np.zeros(1, dtype=np.int64)
+        self._is_session = np.zeros(0, dtype=bool)
+        if len(self.sessions):
+            self._first_ordinal = self.sessions[0].item().toordinal()
+            offsets = (self.sessions - self.sessions[0]).astype(np.int64)
+            span = int(offsets[-1]) + 1
+            starts = np.zeros(span + 1, dtype=np.int64)
+            starts[offsets + 1] = 1
+            self._rows = np.cumsum(starts)
+            self._is_session = np.zeros(span, dtype=bool)
+            self._is_session[offsets] = True
+
+    def __len__(self) -> int:
+        """Number of sessions."""
+        return len(self.sessions)
+
+    def _rank(self, day: date) -> int:
+        """Number of sessions before ``day`` (bisect-left position)."""
+        offset = day.toordinal() - self._first_ordinal
+        if offset <= 0:
+            return 0
+        if offset >= len(self._is_session):
+            return len(self.sessions)
+        return int(self._rows[offset])
+
+    def _session(self, i: int) -> date | None:
+        """Session ``i`` as a date, or None out of range."""
+        if 0 <= i < len(self.sessions):
+            return self.sessions[i].item()
+        return None
+
+    def covers(self, day: date) -> bool:
+        """Whether ``day`` lies within the first to last session."""
+        offset = day.toordinal() - self._first_ordinal
+        return 0 <= offset < len(self._is_session)
+
+    def is_session(self, day: date) -> bool:
+        """Whether ``day`` is a session."""
+        offset = day.toordinal() - self._first_ordinal
+        return 0 <= offset < len(self._is_session) and bool(self._is_session[offset])
+
+    def position(self, day: date) -> int | None:
+        """Index of ``day`` among the sessions, or None if it is not one."""
+        return self._rank(day) if self.is_session(day) else None
+
+    def session_on_or_after(self, day: date) -> date | None:
+        """First session on or after ``day``; None past the last session."""
+        return self._session(self._rank(day))
+
+    def session_on_or_before(self, day: date) -> date | None:
+        """Last session on or before ``day``; None before the first session."""
+        return self._session(self._rank(day + _ONE_DAY) - 1)
+
+    def next_session(self, day: date) -> date | None:
+        """First session after ``day``; None past the last session."""
+        return self.session_on_or_after(day + _ONE_DAY)
+
+    def previous_session(self, day: date) -> date | None:
+        """Last session before ``day``; None before the first session."""
+        return self._session(self._rank(day) - 1)
+
+    def count_between(self, start: date, end: date) -> int:
+        """Number of sessions in ``[start, end]``."""
+        return max(0, self._rank(end + _ONE_DAY) - self._rank(start))
+
+    def sessions_in_range(self, start: date, end: date) -> list[date]:
+        """Sessions in ``[start, end]`` as dates."""
+        lo = self._rank(start)
+        hi = max(lo, self._rank(end + _ONE_DAY))
+        return self.sessions[lo:hi].astype(object).tolist()
+
 
 @lru_cache(maxsize=1)
 def get_nyse_calendar() -> xcals.ExchangeCalendar:
     """Get NYSE calendar (cached).
 
+    The calendar starts ``trading_calendar_years`` years back (setting) and
+    runs about a year ahead.
+
     Returns:
         ExchangeCalendar: NYSE exchange calendar instance
     """
-    return xcals.get_calendar("XNYS")
+    today = date.today()
+    start = date(today.year - get_settings().trading_calendar_years, 1, 1)
+    return xcals.get_calendar("XNYS", start=start.isoformat())
+
+
+@lru_cache(maxsize=1)
+def get_nyse_session_index() -> SessionIndex:
+    """Get an index of every NYSE session in the calendar's span (cached).
+
+    Returns:
+        SessionIndex over the NYSE calendar's sessions
+    """
+    sessions = get_nyse_calendar().sessions
+    return SessionIndex(sessions.values.astype("datetime64[D]"))
 
 
 def get_trading_days_in_range(start_date: date, end_date: date) -> list[date]:
@@ -50,6 +177,9 @@ def get_trading_days_in_range(start_date: date, end_date: date) -> list[date]:
     Returns:
         List of trading days as date objects
     """
+    index = get_nyse_session_index()
+    if index.covers(start_date) and index.covers(end_date):
+        return index.sessions_in_range(start_date, end_date)
     calendar = get_nyse_calendar()
     # exchange_calendars uses pandas Timestamps
     sessions = calendar.sessions_in_range(start_date.isoformat(), end_date.isoformat())
@@ -65,6 +195,9 @@ def is_trading_day(check_date: date) -> bool:
     Returns:
         True if trading day, False otherwise
     """
+    index = get_nyse_session_index()
+    if index.covers(check_date):
+        return index.is_session(check_date)
     calendar = get_nyse_calendar()
     return calendar.is_session(check_date.isoformat())
 
@@ -79,6 +212,9 @@ def count_trading_days_in_range(start_date: date, end_date: date) -> int:
     Returns:
         Number of trading days
     """
+    index = get_nyse_session_index()
+    if index.covers(start_date) and index.covers(end_date):
+        return index.count_between(start_date, end_date)
     return len(get_trading_days_in_range(start_date, end_date))
 
 
@@ -163,11 +299,7 @@ def get_last_complete_trading_day(timestamp: datetime | None = None) -> date:
         return current_date
 
     # For pre_market, market_open, or closed: find previous trading day
-    check_date = current_date - timedelta(days=1)
-    while not is_trading_day(check_date):
-        check_date -= timedelta(days=1)
-
-    return check_date
+    return get_last_trading_day_on_or_before(current_date - _ONE_DAY)
 
 
 def get_next_trading_day(from_date: date) -> date:
@@ -179,9 +311,14 @@ def get_next_trading_day(from_date: date) -> date:
     Returns:
         The next trading day after from_date.
     """
-    check_date = from_date + timedelta(days=1)
+    index = get_nyse_session_index()
+    if index.covers(from_date):
+        next_day = index.next_session(from_date)
+        if next_day is not None:
+            return next_day
+    check_date = from_date + _ONE_DAY
     while not is_trading_day(check_date):
-        check_date += timedelta(days=1)
+        check_date += _ONE_DAY
     return check_date
 
 
@@ -200,3 +337,49 @@ def get_first_trading_day_on_or_after(from_date: date) -> date:
     if is_trading_day(from_date):
         return from_date
     return get_next_trading_day(from_date)
+
+
+def get_last_trading_day_on_or_before(from_date: date) -> date:
+    """Get the last trading day on or before the given date.
+
+    Returns from_date if it is a trading day, otherwise the previous trading
+    day. Useful for normalizing request end dates on holidays/weekends.
+
+    Args:
+        from_date: The starting date.
+
+    Returns:
+        The last trading day on or before from_date.
+    """
+    index = get_nyse_session_index()
+    if index.covers(from_date):
+        return index.session_on_or_before(from_date)
+    check_date = from_date
+    while not is_trading_day(check_date):
+        check_date -= _ONE_DAY
+    return check_date
+
+
+def get_next_market_transition(timestamp: datetime | None = None) -> datetime:
+    """Get the next session open or close strictly after a timestamp.
+
+    Market status (and with it the last complete trading day) only changes
+    at these instants, so they bound how long a freshness decision holds.
+
+    Args:
+        timestamp: The timestamp to start from. If None, uses current time.
+
+    Returns:
+        The next session open or close (UTC), honoring early closes.
+    """
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc)
+
+    calendar = get_nyse_calendar()
+    session = get_first_trading_day_on_or_after(_to_eastern(timestamp).date())
+    while True:
+        for edge in (calendar.session_open(session), calendar.session_close(session)):
+            edge_time = edge.to_pydatetime()
+            if edge_time > timestamp:
+                return edge_time
+        session = get_next_trading_day(session)
@@ -8,6 +8,7 @@ as the original AnalyticsService implementation.
 """
 import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
 
 
 def calculate_sma(data: pd.DataFrame, column: str = "Close", window: int = 50) -> pd.Series:
@@ -48,9 +49,9 @@ def calculate_atr(data: pd.DataFrame, period: int = 14) -> pd.Series:
 
 
 def calculate_atr_percentage(
-    highs: list[float],
-    lows: list[float],
-    closes: list[float],
+    highs: list[float] | NDArray[np.float64],
+    lows: list[float] | NDArray[np.float64],
+    closes: list[float] | NDArray[np.float64],
     period: int = 14,
     price_override: float | None = None,
 ) -> float | None:
@@ -83,4 +84,71 @@ def calculate_atr_percentage(
     if pd.isna(latest_atr_dollars):
         return None
 
-    return (float(latest_atr_dollars) / denominator) * 100
+    return (float(latest_atr_dollars) / float(denominator)) * 100
+
+
+def calculate_rolling_atr_percentage(
+    dates: NDArray[np.datetime64],
+    highs: NDArray[np.float64],
+    lows: NDArray[np.float64],
+    closes: NDArray[np.float64],
+    window_days: int = 90,
+    period: int = 14,
+) -> NDArray[np.float64]:
+    """Calculate ATR percentage for every bar over a trailing calendar window.
+
+    Element ``i`` equals ``calculate_atr_percentage`` on the bars dated from
+    ``dates[i] - window_days`` to ``dates[i]`` inclusive, or NaN where that
+    returns None (fewer than ``period + 1`` bars or a non-positive close).
+
+    Wilder's smoothing starts at the first bar of each window, so the values
+    depend on where the window starts and cannot be read off one ATR pass over
+    the whole history. Instead each window's true ranges become one column of a
+    matrix that is smoothed with a single ``ewm`` call, which applies the same
+    kernel to every column as ``calculate_atr`` does to one series, so the
+    results are bit-for-bit identical.
+
+    Args:
+        dates: Sorted bar dates (``datetime64[D]``)
+        highs: High prices (oldest to newest)
+        lows: Low prices (oldest to newest)
+        closes: Closing prices (oldest to newest)
+        window_days: Calendar days before each bar included in its window
+        period: ATR period (default 14)
+
+    Returns:
+        Array of ATR percentages aligned with ``dates``
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
+    closes = np.asarray(closes, dtype=np.float64)
+    n = len(closes)
+    result = np.full(n, np.nan)
+    if n == 0:
+        return result
+
+    # True range against the previous bar; fmax skips NaN like DataFrame.max
+    high_low = highs - lows
+    prev_close = np.concatenate(([np.nan], closes[:-1]))
+    true_range = np.fmax(
+        high_low, np.fmax(np.abs(highs - prev_close), np.abs(lows - prev_close))
+    )
+
+    rows = np.arange(n)
+    starts = np.searchsorted(dates, dates - np.timedelta64(window_days, "D"), side="left")
+    lengths = rows - starts + 1
+
+    # Column i holds window i's true ranges, NaN-padded at the end. The first
+    # bar of a window has no previous close inside it, so its range is high-low.
+    offsets = np.arange(int(lengths.max()))[:, np.newaxis]
+    source = np.minimum(starts + offsets, n - 1)
+    columns = np.where(offsets < lengths, true_range[source], np.nan)
+    columns[0] = high_low[starts]
+
+    atr = pd.DataFrame(columns).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+    latest_atr = atr[lengths - 1, rows]
+
+    valid = (lengths >= period + 1) & (closes > 0)
+    result[valid] = latest_atr[valid] / closes[valid] * 100
+    return result
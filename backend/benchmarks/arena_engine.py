@@ -0,0 +1,406 @@
+"""Benchmark the arena SimulationEngine on synthetic universes.
+
+Generates seeded OHLCV universes (e.g. 50/600/3000 symbols x 1/5/10 years)
+through MockMarketDataProvider, stores them in the database through
+DataService, then times for each engine configuration:
+
+- ``initialize_simulation`` (price matrix load from the DB cache, signal
+  precompute, sector load)
+- ``step_day`` per day, for the first ``--step-days`` trading days
+- ``run_to_completion`` for the whole range
+
+Results are written as JSON so runs can be compared between releases.
+Synthetic symbols (``SYN0000``...) and the benchmark simulations are deleted
+afterwards unless ``--keep-data`` is given.
+
+Run inside the backend container (uses DATABASE_URL)::
+
+    python -m benchmarks.arena_engine --symbols 50 600 --years 1 5 \\
+        --configs fixed_stop atr_stop --output arena_benchmark.json
+
+The full default matrix (3 universes x 3 spans x all configs) takes hours.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, TypeVar
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import get_settings
+from app.models.arena import ArenaSimulation, SimulationStatus
+from app.models.stock import PriceCoverageSegment, StockPrice
+from app.models.stock_sector import StockSector
+from app.providers.mock import MockMarketDataProvider
+from app.services.arena.shared_price_cache import SharedPriceCache
+from app.services.arena.simulation_engine import SimulationEngine
+from app.services.data_service import DataService
+
+T = TypeVar("T")
+
+# Engine configurations covering the stop, sizing and selector code paths
+CONFIGS: dict[str, dict[str, Any]] = {
+    "fixed_stop": {
+        "stop_type": "fixed",
+        "trailing_stop_pct": 5.0,
+    },
+    "atr_stop": {
+        "stop_type": "atr",
+        "atr_stop_multiplier": 2.0,
+    },
+    "risk_sizing": {
+        "stop_type": "atr",
+        "atr_stop_multiplier": 2.0,
+        "sizing_mode": "risk_based",
+        "risk_per_trade_pct": 2.5,
+    },
+    "score_sector_selector": {
+        "stop_type": "fixed",
+        "trailing_stop_pct": 5.0,
+        "portfolio_strategy": "score_sector_low_atr",
+        "max_per_sector": 2,
+        "max_open_positions": 10,
+    },
+    "enriched_selector_regime": {
+        "stop_type": "atr",
+        "atr_stop_multiplier": 2.0,
+        "portfolio_strategy": "enriched_score",
+        "max_open_positions": 10,
+        "regime_filter": True,
+        "regime_symbol": "SYNIDX",
+        "regime_sma_period": 20,
+    },
+}
+
+SYMBOL_PREFIX = "SYN"
+# Synthetic stand-in for SPY, so real index data in the DB is never touched
+REGIME_SYMBOL = "SYNIDX"
+# Concurrent DataService fetches while seeding the DB cache
+SEED_CONCURRENCY = 20
+# Calendar days loaded before the start date (covers the agent lookback)
+SEED_LOOKBACK_DAYS = 120
+
+logger = logging.getLogger(__name__)
+
+
+def synthetic_symbols(count: int) -> list[str]:
+    """Return the synthetic symbols of a universe of ``count`` symbols."""
+    return [f"{SYMBOL_PREFIX}{i:04d}" for i in range(count)]
+
+
+async def timed(operation: Awaitable[T]) -> tuple[T, float]:
+    """Await ``operation`` and return its result and duration in seconds."""
+    started = time.perf_counter()
+    result = await operation
+    return result, time.perf_counter() - started
+
+
+def summarize_ms(durations: list[float]) -> dict[str, float | int]:
+    """Summarize per-call durations (seconds) as milliseconds."""
+    if not durations:
+        return {"count": 0}
+    ms = sorted(d * 1000 for d in durations)
+    return {
+        "count": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p50_ms": round(statistics.median(ms), 3),
+        "p95_ms": round(ms[min(len(ms) - 1, int(len(ms) * 0.95))], 3),
+        "max_ms": round(ms[-1], 3),
+    }
+
+
+async def seed_universe(
+    data_service: DataService,
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+) -> None:
+    """Store synthetic bars for ``symbols`` (and the regime symbol) in the DB cache."""
+    semaphore = asyncio.Semaphore(SEED_CONCURRENCY)
+    start = datetime.combine(start_date, datetime.min.time(), tzinfo=timezone.utc)
+    end = datetime.combine(end_date, datetime.max.time(), tzinfo=timezone.utc)
+
+    async def fetch(symbol: str) -> None:
+        async with semaphore:
+            await data_service.get_price_data(
+                symbol=symbol, start_date=start, end_date=end, interval="1d"
+            )
+
+    await asyncio.gather(*(fetch(symbol) for symbol in [*symbols, REGIME_SYMBOL]))
+
+
+class ArenaEngineBenchmark:
+    """Runs benchmark cases against one database and collects results."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        provider: MockMarketDataProvider,
+        step_days: int,
+    ) -> None:
+        """Initialize the benchmark.
+
+        Args:
+            session_factory: Factory for database sessions.
+            provider: Seeded provider the synthetic universe comes from.
+            step_days: Trading days to time individually with step_day.
+        """
+        self._session_factory = session_factory
+        self._provider = provider
+        self._step_days = step_days
+        self.simulation_ids: list[int] = []
+
+    def _new_engine(self, session: AsyncSession) -> SimulationEngine:
+        """Create an engine with a private price cache, so each run loads from the DB."""
+        engine = SimulationEngine(session, self._session_factory, price_cache=SharedPriceCache())
+        engine.data_service = DataService(
+            session_factory=self._session_factory, provider=self._provider
+        )
+        return engine
+
+    async def _create_simulation(
+        self,
+        name: str,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+        agent_config: dict[str, Any],
+    ) -> int:
+        """Insert a pending benchmark simulation and return its ID."""
+        async with self._session_factory() as session:
+            simulation = ArenaSimulation(
+                name=name,
+                symbols=symbols,
+                start_date=start_date,
+                end_date=end_date,
+                initial_capital=Decimal("100000"),
+                position_size=Decimal("5000"),
+                agent_type="live20",
+                agent_config=agent_config,
+                status=SimulationStatus.PENDING.value,
+                current_day=0,
+                total_days=0,
+            )
+            session.add(simulation)
+            await session.commit()
+            self.simulation_ids.append(simulation.id)
+            return simulation.id
+
+    async def _run_engine(
+        self,
+        simulation_id: int,
+        body: Callable[[SimulationEngine], Awaitable[T]],
+    ) -> tuple[float, T]:
+        """Initialize a simulation, run ``body`` on the engine and clean up.
+
+        Returns:
+            initialize_simulation duration in seconds and the body's result.
+        """
+        async with self._session_factory() as session:
+            engine = self._new_engine(session)
+            try:
+                _, init_seconds = await timed(engine.initialize_simulation(simulation_id))
+                return init_seconds, await body(engine)
+            finally:
+                engine.clear_simulation_cache(simulation_id)
+
+    async def run_case(
+        self,
+        symbols: list[str],
+        start_date: date,
+        end_date: date,
+        config_name: str,
+    ) -> dict[str, Any]:
+        """Time one universe/span/config combination.
+
+        Returns:
+            JSON-serializable result row.
+        """
+        agent_config = CONFIGS[config_name]
+        label = f"Benchmark {config_name} {len(symbols)}x{start_date}..{end_date}"
+        step_id = await self._create_simulation(
+            f"{label} [step]", symbols, start_date, end_date, agent_config
+        )
+        run_id = await self._create_simulation(
+            f"{label} [run]", symbols, start_date, end_date, agent_config
+        )
+
+        async def step(engine: SimulationEngine) -> list[float]:
+            durations: list[float] = []
+            for _ in range(self._step_days):
+                snapshot, seconds = await timed(engine.step_day(step_id))
+                if snapshot is None:
+                    break
+                durations.append(seconds)
+            return durations
+
+        async def run(engine: SimulationEngine) -> tuple[ArenaSimulation, float]:
+            return await timed(engine.run_to_completion(run_id))
+
+        step_init_seconds, step_durations = await self._run_engine(step_id, step)
+        init_seconds, (simulation, run_seconds) = await self._run_engine(run_id, run)
+        trading_days = simulation.total_days
+
+        return {
+            "config": config_name,
+            "symbols": len(symbols),
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "trading_days": trading_days,
+            # Both simulations initialize identically; keep the less noisy one
+            "initialize_s": round(min(init_seconds, step_init_seconds), 4),
+            "step_day": summarize_ms(step_durations),
+            "run_to_completion_s": round(run_seconds, 4),
+            "run_to_completion_per_day_ms": (
+                round(run_seconds * 1000 / trading_days, 3) if trading_days else None
+            ),
+            "total_trades": simulation.total_trades,
+        }
+
+
+async def cleanup(
+    session_factory: async_sessionmaker[AsyncSession],
+    simulation_ids: list[int],
+    symbols: list[str],
+) -> None:
+    """Delete benchmark simulations and synthetic price, coverage and sector rows."""
+    async with session_factory() as session:
+        if simulation_ids:
+            await session.execute(
+                delete(ArenaSimulation).where(ArenaSimulation.id.in_(simulation_ids))
+            )
+        if symbols:
+            await session.execute(delete(StockPrice).where(StockPrice.symbol.in_(symbols)))
+            # Coverage left behind would make the next run see these symbols as
+            # fresh and load no prices
+            await session.execute(
+                delete(PriceCoverageSegment).where(PriceCoverageSegment.symbol.in_(symbols))
+            )
+            await session.execute(delete(StockSector).where(StockSector.symbol.in_(symbols)))
+        await session.commit()
+
+
+async def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every requested case and return the JSON report."""
+    settings = get_settings()
+    db_engine = create_async_engine(
+        settings.database_url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        # Large universes queue thousands of fetches on the pool
+        pool_timeout=600,
+    )
+    session_factory = async_sessionmaker(
+        db_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+    provider = MockMarketDataProvider(seed=args.seed)
+    data_service = DataService(session_factory=session_factory, provider=provider)
+    benchmark = ArenaEngineBenchmark(session_factory, provider, args.step_days)
+
+    end_date: date = args.end_date
+    all_symbols = synthetic_symbols(max(args.symbols))
+    universes: list[dict[str, Any]] = []
+    results: list[dict[str, Any]] = []
+    try:
+        for years in sorted(args.years):
+            start_date = end_date - timedelta(days=round(365.25 * years))
+            for count in sorted(args.symbols):
+                symbols = all_symbols[:count]
+                print(f"Seeding {count} symbols x {years}y...", file=sys.stderr)
+                _, seed_seconds = await timed(
+                    seed_universe(
+                        data_service,
+                        symbols,
+                        start_date - timedelta(days=SEED_LOOKBACK_DAYS),
+                        end_date,
+                    )
+                )
+                universes.append(
+                    {"symbols": count, "years": years, "seed_s": round(seed_seconds, 4)}
+                )
+                for config_name in args.configs:
+                    print(f"  {config_name}...", file=sys.stderr)
+                    row = await benchmark.run_case(symbols, start_date, end_date, config_name)
+                    results.append({"years": years, **row})
+    finally:
+        if not args.keep_data:
+            await cleanup(
+                session_factory, benchmark.simulation_ids, [*all_symbols, REGIME_SYMBOL]
+            )
+        await db_engine.dispose()
+
+    return {
+        "benchmark": "arena_engine",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "step_days": args.step_days,
+        "universes": universes,
+        "results": results,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--symbols", type=int, nargs="+", default=[50, 600, 3000], help="Universe sizes"
+    )
+    parser.add_argument(
+        "--years", type=int, nargs="+", default=[1, 5, 10], help="History spans in years"
+    )
+    parser.add_argument(
+        "--configs",
+        nargs="+",
+        choices=sorted(CONFIGS),
+        default=list(CONFIGS),
+        help="Engine configurations to time",
+    )
+    parser.add_argument(
+        "--step-days", type=int, default=20, help="Trading days timed with step_day"
+    )
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        default=date(2024, 12, 31),
+        help="Last simulated day (ISO date)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic data seed")
+    parser.add_argument(
+        "--output", type=Path, default=None, help="JSON output file (default: stdout)"
+    )
+    parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="Keep synthetic prices and benchmark simulations in the database",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(run_benchmarks(args))
+    output = json.dumps(report, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + "\n")
+        print(f"Wrote {len(report['results'])} results to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -40,6 +40,7 @@ from app.core.config import get_settings
 from app.core.database import Base
 from app.core.database import get_db_session
 from app.core.database import get_session_factory
+from app.services.price_hot_cache import get_price_hot_cache
 from app.utils.structured_logging import configure_structured_logging
 
 
@@ -88,6 +89,17 @@ def configure_logging(test_settings: Settings):
     configure_structured_logging(log_level=test_settings.log_level)
 
 
+@pytest.fixture(autouse=True)
+def clear_price_hot_cache():
+    """Start every test with an empty in-process price hot tier.
+
+    The hot tier is process-wide, so without this a test could be served
+    prices that an earlier test loaded from a database it has since truncated.
+    """
+    get_price_hot_cache().clear()
+    yield
+
+
 @pytest.fixture(scope="session")
 async def test_engine(test_settings: Settings):
     """Create test database engine.
@@ -120,7 +132,7 @@ async def test_engine(test_settings: Settings):
     async with engine.begin() as conn:
         await conn.execute(text(
             "TRUNCATE TABLE arena_positions, arena_snapshots, arena_simulations, "
-            "live20_runs, stock_prices, ib_orders, recommendations, stock_lists "
+            "live20_runs, stock_prices, price_coverage, ib_orders, recommendations, stock_lists "
             "RESTART IDENTITY CASCADE"
         ))
 
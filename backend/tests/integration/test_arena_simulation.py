@@ -22,6 +22,7 @@ from app.models.arena import (
 )
 from app.providers.base import PriceDataPoint
 from app.services.arena.agent_protocol import AgentDecision, PriceBar
+from app.services.arena.decision_log import DecisionLog
 from app.services.arena.simulation_engine import SimulationEngine
 
 
@@ -391,8 +392,11 @@ class TestArenaSimulationIntegration:
         snapshots = result.scalars().all()
 
         for snapshot in snapshots:
-            assert "AAPL" in snapshot.decisions
-            assert "MSFT" in snapshot.decisions
+            decisions = DecisionLog.from_bytes(
+                completed_sim.symbols, snapshot.decision_log
+            ).to_dict()
+            assert "AAPL" in decisions
+            assert "MSFT" in decisions
 
     @pytest.mark.integration
     async def test_simulation_step_by_step(
@@ -28,11 +28,12 @@ import pytest_asyncio
 from sqlalchemy import select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.stock import StockPrice
+from app.models.stock import PriceCoverageSegment, StockPrice
 from app.providers.mock import MockMarketDataProvider
 from app.repositories.stock_price import StockPriceRepository
 from app.services.cache_service import CacheTTLConfig, MarketDataCache
 from app.services.data_service import DataService
+from app.services.price_hot_cache import get_price_hot_cache
 
 
 @pytest_asyncio.fixture
@@ -86,10 +87,39 @@ async def clean_stock_prices(test_session_factory):
     """Clean stock_prices before each test to prevent data leakage."""
     async with test_session_factory() as session:
         await session.execute(text("DELETE FROM stock_prices"))
+        await session.execute(text("DELETE FROM price_coverage"))
         await session.commit()
     yield
 
 
+async def _forget_cached_from(session: AsyncSession, symbol: str, cutoff: datetime) -> None:
+    """Delete a symbol's cached bars and fetched ranges from ``cutoff`` onward.
+
+    Also drops the symbol from the in-process hot tier, which only sees
+    writes made through DataService.
+    """
+    from sqlalchemy import delete
+
+    await session.execute(
+        delete(StockPrice)
+        .where(StockPrice.symbol == symbol.upper())
+        .where(StockPrice.timestamp >= cutoff)
+    )
+    await session.execute(
+        delete(PriceCoverageSegment)
+        .where(PriceCoverageSegment.symbol == symbol.upper())
+        .where(PriceCoverageSegment.start_date >= cutoff.date())
+    )
+    await session.execute(
+        update(PriceCoverageSegment)
+        .where(PriceCoverageSegment.symbol == symbol.upper())
+        .where(PriceCoverageSegment.end_date >= cutoff.date())
+        .values(end_date=cutoff.date() - timedelta(days=1))
+    )
+    await session.commit()
+    get_price_hot_cache().invalidate(symbol.upper())
+
+
 # ============================================================================
 # Test 1: Cache miss fetches and stores
 # ============================================================================
@@ -306,15 +336,7 @@ async def test_cache_miss_after_ttl_expires(
 
     # Delete data from Dec 2 onwards to simulate incomplete cache
     # This makes the cached data NOT cover the last complete trading day (Dec 2)
-    from sqlalchemy import delete
-
-    delete_stmt = (
-        delete(StockPrice)
-        .where(StockPrice.symbol == symbol.upper())
-        .where(StockPrice.timestamp >= datetime(2024, 12, 2, tzinfo=timezone.utc))
-    )
-    await db_session.execute(delete_stmt)
-    await db_session.commit()
+    await _forget_cached_from(db_session, symbol, datetime(2024, 12, 2, tzinfo=timezone.utc))
 
     # Reset mock for tracking
     mock_provider.fetch_price_data.reset_mock()
@@ -860,14 +882,7 @@ async def test_incremental_fetch_uses_correct_start_date(
     assert mock_provider.fetch_price_data.call_count == 1
 
     # Step 2: Delete data from Nov 10 onward to simulate incomplete cache
-    from sqlalchemy import delete
-    delete_stmt = (
-        delete(StockPrice)
-        .where(StockPrice.symbol == symbol.upper())
-        .where(StockPrice.timestamp >= datetime(2024, 11, 10, tzinfo=timezone.utc))
-    )
-    await db_session.execute(delete_stmt)
-    await db_session.commit()
+    await _forget_cached_from(db_session, symbol, datetime(2024, 11, 10, tzinfo=timezone.utc))
 
     # Step 3: Reset provider mock and wrap to capture call args
     original_fetch = mock_provider.fetch_price_data
@@ -897,7 +912,7 @@ async def test_incremental_fetch_uses_correct_start_date(
     # Verify the fetch request used an incremental start date (not Nov 1)
     call_args = mock_provider.fetch_price_data.call_args
     fetch_request = call_args[0][0]  # First positional arg is PriceDataRequest
-    # The fetch_start should be around Nov 9 (last_data_date from cache)
+    # The fetch_start should be the first missing session (Nov 11),
     # not Nov 1 (the original start_date)
     assert fetch_request.start_date.date() >= date(2024, 11, 5), (
         f"Incremental fetch should start near the gap, not from {start_date.date()}. "
@@ -995,6 +1010,7 @@ async def test_market_hours_ttl_freshness(
         )
         await db_session.execute(update_stmt)
         await db_session.commit()
+        get_price_hot_cache().invalidate(symbol.upper())
 
         # Clear lock again
         DataService._fetch_locks.pop(cache_key, None)
@@ -4,7 +4,7 @@ Tests verify the smart caching behavior:
 - Market status detection (pre_market, market_open, after_hours, closed)
 - Last complete trading day calculation
 - Smart freshness checking based on market status and trading calendar
-- Incremental fetching when data is incomplete
+- Incremental fetching of only the missing sessions
 - Historical vs live data request handling
 """
 from datetime import date, datetime, timedelta, timezone
@@ -12,11 +12,36 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.repositories.stock_price import StockPriceRepository
+from app.repositories.stock_price import DateRange, PriceCoverage, StockPriceRepository
 from app.services import trading_calendar_service
 from app.services.cache_service import CacheTTLConfig, MarketDataCache
 
 
+def _coverage(records) -> PriceCoverage:
+    """Summarize mock price records the way the coverage query does."""
+    if not records:
+        return PriceCoverage.empty()
+    return PriceCoverage(
+        first_timestamp=min(r.timestamp for r in records),
+        last_timestamp=max(r.timestamp for r in records),
+        last_fetched_at=max(r.last_fetched_at for r in records),
+        row_count=len(records),
+    )
+
+
+def _mock_cache(repository, records) -> None:
+    """Serve mock records as one fetched range plus today's-rows summaries."""
+    days = [r.timestamp.date() for r in records]
+    repository.get_fetched_ranges.return_value = (
+        [DateRange(min(days), max(days))] if days else []
+    )
+    repository.get_price_coverage.side_effect = (
+        lambda symbol, start_date, end_date, interval: _coverage(
+            [r for r in records if start_date <= r.timestamp <= end_date]
+        )
+    )
+
+
 # ============================================================================
 # Test 1: Trading Calendar Service
 # ============================================================================
@@ -118,7 +143,8 @@ class TestSmartFreshnessChecker:
     def mock_repository(self):
         """Create a mock repository."""
         repo = AsyncMock(spec=StockPriceRepository)
-        repo.get_price_data_by_date_range = AsyncMock(return_value=[])
+        repo.get_fetched_ranges = AsyncMock(return_value=[])
+        repo.get_price_coverage = AsyncMock(return_value=PriceCoverage.empty())
         return repo
 
     @pytest.fixture
@@ -131,7 +157,7 @@ class TestSmartFreshnessChecker:
     async def test_no_cached_data_returns_stale(self, cache_with_mock_repo, mock_repository):
         """When there's no cached data, should return stale result."""
         # Empty cache
-        mock_repository.get_price_data_by_date_range.return_value = []
+        _mock_cache(mock_repository, [])
 
         freshness = await cache_with_mock_repo.check_freshness_smart(
             symbol="AAPL",
@@ -155,7 +181,7 @@ class TestSmartFreshnessChecker:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2024, 12, 2, 21, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = datetime(2024, 12, 2, 22, 0, tzinfo=timezone.utc)
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         # Check freshness on Dec 3 pre-market (8 AM ET = 13:00 UTC)
         with patch('app.services.cache_service.datetime') as mock_datetime:
@@ -190,7 +216,7 @@ class TestSmartFreshnessChecker:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2024, 12, 1, 21, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = datetime(2024, 12, 1, 22, 0, tzinfo=timezone.utc)
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         # Check on Dec 3 pre-market - should need Dec 2
         # Mock datetime.now() to make Dec 3 appear as "today"
@@ -215,7 +241,8 @@ class TestSmartFreshnessChecker:
                         assert freshness.market_status == "pre_market"
                         assert freshness.last_data_date == date(2024, 12, 1)
                         assert freshness.last_complete_trading_day == date(2024, 12, 2)
-                        assert freshness.fetch_start_date == date(2024, 12, 1)
+                        assert freshness.fetch_start_date == date(2024, 12, 2)
+                        assert freshness.missing_ranges == [DateRange(date(2024, 12, 2), date(2024, 12, 2))]
                         assert "Missing data from" in freshness.reason
 
     @pytest.mark.asyncio
@@ -229,7 +256,7 @@ class TestSmartFreshnessChecker:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2024, 12, 3, 15, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = now - timedelta(minutes=10)  # 10 minutes old
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         with patch("app.services.cache_service.trading_calendar_service.get_market_status", return_value='market_open'):
             with patch("app.services.cache_service.trading_calendar_service.get_last_complete_trading_day", return_value=date(2024, 12, 2)):
@@ -263,7 +290,7 @@ class TestSmartFreshnessChecker:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2024, 12, 3, 15, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = now - timedelta(minutes=2)  # 2 minutes old
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         with patch("app.services.cache_service.trading_calendar_service.get_market_status", return_value='market_open'):
             with patch("app.services.cache_service.trading_calendar_service.get_last_complete_trading_day", return_value=date(2024, 12, 2)):
@@ -296,7 +323,7 @@ class TestSmartFreshnessChecker:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2024, 12, 2, 21, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = datetime(2024, 12, 2, 22, 0, tzinfo=timezone.utc)
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         # Mock datetime.now() to make Dec 3 appear as "today"
         with patch('app.services.cache_service.datetime') as mock_datetime:
@@ -330,7 +357,7 @@ class TestSmartFreshnessChecker:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2024, 12, 3, 21, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = datetime(2024, 12, 3, 22, 0, tzinfo=timezone.utc)
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         # Mock datetime.now() to make Dec 3 appear as "today"
         with patch('app.services.cache_service.datetime') as mock_datetime:
@@ -364,7 +391,7 @@ class TestSmartFreshnessChecker:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2024, 12, 2, 21, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = datetime(2024, 12, 2, 22, 0, tzinfo=timezone.utc)
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         # Mock datetime.now() to make Dec 3 appear as "today"
         with patch('app.services.cache_service.datetime') as mock_datetime:
@@ -386,7 +413,7 @@ class TestSmartFreshnessChecker:
                         assert not freshness.is_fresh
                         assert freshness.needs_fetch is True
                         assert freshness.market_status == "after_hours"
-                        assert freshness.fetch_start_date == date(2024, 12, 2)
+                        assert freshness.fetch_start_date == date(2024, 12, 3)
                         assert "Missing data from" in freshness.reason
 
     @pytest.mark.asyncio
@@ -399,7 +426,7 @@ class TestSmartFreshnessChecker:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2024, 12, 6, 21, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = datetime(2024, 12, 6, 22, 0, tzinfo=timezone.utc)
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         with patch("app.services.cache_service.trading_calendar_service.get_market_status", return_value='closed'):
             with patch("app.services.cache_service.trading_calendar_service.get_last_complete_trading_day", return_value=date(2024, 12, 6)):
@@ -432,7 +459,7 @@ class TestSmartFreshnessChecker:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2025, 10, 31, 16, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = datetime(2025, 10, 31, 21, 0, tzinfo=timezone.utc)
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         # Setup: It's January 4, 2026 (today)
         with patch("app.services.cache_service.trading_calendar_service.get_market_status", return_value='closed'):
@@ -460,7 +487,8 @@ class TestIncrementalFetching:
     def mock_repository(self):
         """Create a mock repository."""
         repo = AsyncMock(spec=StockPriceRepository)
-        repo.get_price_data_by_date_range = AsyncMock(return_value=[])
+        repo.get_fetched_ranges = AsyncMock(return_value=[])
+        repo.get_price_coverage = AsyncMock(return_value=PriceCoverage.empty())
         return repo
 
     @pytest.fixture
@@ -479,7 +507,7 @@ class TestIncrementalFetching:
         mock_record_end = MagicMock()
         mock_record_end.timestamp = datetime(2024, 12, 2, 21, 0, tzinfo=timezone.utc)
         mock_record_end.last_fetched_at = datetime(2024, 12, 2, 22, 0, tzinfo=timezone.utc)
-        mock_repository.get_price_data_by_date_range.return_value = [mock_record_start, mock_record_end]
+        _mock_cache(mock_repository, [mock_record_start, mock_record_end])
 
         # Mock datetime.now() to make Dec 4 appear as "today"
         with patch('app.services.cache_service.datetime') as mock_datetime:
@@ -498,8 +526,9 @@ class TestIncrementalFetching:
                             interval="1d",
                         )
 
-                        # Should fetch from Dec 2 (small overlap is OK)
-                        assert freshness.fetch_start_date == date(2024, 12, 2)
+                        # Should fetch only the missing sessions, Dec 3-4
+                        assert freshness.fetch_start_date == date(2024, 12, 3)
+                        assert freshness.missing_ranges == [DateRange(date(2024, 12, 3), date(2024, 12, 4))]
                         assert freshness.last_data_date == date(2024, 12, 2)
                         assert freshness.last_complete_trading_day == date(2024, 12, 4)
 
@@ -523,12 +552,12 @@ class TestIncrementalFetching:
         mock_record3.timestamp = datetime(2024, 12, 3, 21, 0, tzinfo=timezone.utc)
         mock_record3.last_fetched_at = datetime(2024, 12, 3, 22, 0, tzinfo=timezone.utc)
 
-        mock_repository.get_price_data_by_date_range.return_value = [
+        _mock_cache(mock_repository, [
             mock_record_start,
             mock_record1,
             mock_record2,
             mock_record3,
-        ]
+        ])
 
         with patch("app.services.cache_service.trading_calendar_service.get_market_status", return_value='after_hours'):
             with patch("app.services.cache_service.trading_calendar_service.get_last_complete_trading_day", return_value=date(2024, 12, 5)):
@@ -539,7 +568,8 @@ class TestIncrementalFetching:
                     interval="1d",
                 )
 
-                # Should detect last_data_date as Dec 3
+                # Should detect last_data_date as Dec 3; the request ends
+                # Dec 5 00:00 UTC (Dec 4 ET), so only Dec 4 is missing
                 assert freshness.last_data_date == date(2024, 12, 3)
-                assert freshness.fetch_start_date == date(2024, 12, 3)
+                assert freshness.fetch_start_date == date(2024, 12, 4)
                 assert not freshness.is_fresh
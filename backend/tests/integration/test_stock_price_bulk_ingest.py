@@ -0,0 +1,122 @@
+"""Integration tests for StockPriceRepository.bulk_ingest (COPY + merge)."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.base import DatabaseError
+from app.repositories.stock_price import StockPriceRepository
+
+START = datetime(2024, 1, 2, 5, 0, tzinfo=timezone.utc)
+
+
+def _bar(symbol: str, day: int, close: float = 100.0) -> dict:
+    return {
+        "symbol": symbol,
+        "timestamp": START + timedelta(days=day),
+        "open_price": close,
+        "high_price": close + 1.0,
+        "low_price": close - 1.0,
+        "close_price": close,
+        "volume": 1000 + day,
+    }
+
+
+async def _rows(repo: StockPriceRepository, symbol: str):
+    return await repo.get_price_data_by_date_range(
+        symbol=symbol,
+        start_date=START - timedelta(days=1),
+        end_date=START + timedelta(days=60),
+        interval="1d",
+    )
+
+
+@pytest.fixture
+def price_repo(db_session: AsyncSession) -> StockPriceRepository:
+    return StockPriceRepository(db_session)
+
+
+class TestBulkIngest:
+    """Tests for the COPY-based ingestion path."""
+
+    @pytest.mark.asyncio
+    async def test_streams_chunks_and_merges_in_batches(
+        self, price_repo: StockPriceRepository, db_session: AsyncSession
+    ):
+        """Chunks from a generator are staged and merged every merge_every rows."""
+
+        def chunks():
+            for symbol in ("AAA", "BBB", "CCC"):
+                yield [_bar(symbol, day) for day in range(20)]
+
+        result = await price_repo.bulk_ingest(chunks(), merge_every=40)
+        await db_session.commit()
+
+        assert result.rows_copied == 60
+        assert result.rows_merged == 60
+        assert result.chunks == 3
+        assert result.merges == 2
+        assert result.rows_per_second > 0
+        for symbol in ("AAA", "BBB", "CCC"):
+            rows = await _rows(price_repo, symbol)
+            assert len(rows) == 20
+            assert rows[0].data_source == "yahoo_finance"
+
+    @pytest.mark.asyncio
+    async def test_updates_existing_rows_and_keeps_last_duplicate(
+        self, price_repo: StockPriceRepository, db_session: AsyncSession
+    ):
+        """Existing bars are updated; a bar staged twice keeps its last copy."""
+        await price_repo.sync_price_data("AAA", [_bar("AAA", 0, close=50.0)])
+        await db_session.commit()
+
+        result = await price_repo.bulk_ingest(
+            [[_bar("aaa", 0, close=60.0)], [_bar("AAA", 0, close=70.0), _bar("AAA", 1)]]
+        )
+        await db_session.commit()
+
+        rows = await _rows(price_repo, "AAA")
+        assert result.rows_copied == 3
+        assert result.rows_merged == 2
+        assert [float(r.close_price) for r in rows] == [70.0, 100.0]
+
+    @pytest.mark.asyncio
+    async def test_accepts_async_iterables(
+        self, price_repo: StockPriceRepository, db_session: AsyncSession
+    ):
+        """Async generators are consumed like sync ones."""
+
+        async def chunks():
+            yield [_bar("AAA", day) for day in range(5)]
+            yield []
+
+        result = await price_repo.bulk_ingest(chunks())
+        await db_session.commit()
+
+        assert result.chunks == 1
+        assert len(await _rows(price_repo, "AAA")) == 5
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, price_repo: StockPriceRepository):
+        """No chunks copies and merges nothing."""
+        result = await price_repo.bulk_ingest([])
+
+        assert (result.rows_copied, result.rows_merged, result.merges) == (0, 0, 0)
+        assert result.rows_per_second >= 0
+
+    @pytest.mark.asyncio
+    async def test_constraint_violation_raises_database_error(
+        self, price_repo: StockPriceRepository
+    ):
+        """Rows rejected by stock_prices constraints fail the merge."""
+        bad = {**_bar("AAA", 0), "high_price": 1.0}
+
+        with pytest.raises(DatabaseError):
+            await price_repo.bulk_ingest([[bad]])
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_merge_every(self, price_repo: StockPriceRepository):
+        """merge_every must be positive."""
+        with pytest.raises(ValueError, match="merge_every"):
+            await price_repo.bulk_ingest([], merge_every=0)
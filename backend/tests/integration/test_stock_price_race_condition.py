@@ -30,6 +30,7 @@ async def clean_stock_prices(test_session_factory):
     """Clean stock_prices before each test to prevent data leakage."""
     async with test_session_factory() as session:
         await session.execute(text("DELETE FROM stock_prices"))
+        await session.execute(text("DELETE FROM price_coverage"))
         await session.commit()
     yield
 
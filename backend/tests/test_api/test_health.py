@@ -174,6 +174,15 @@ class TestHealthCheckLogic:
         assert "message" in app_check
         assert "ready" in app_check["message"].lower()
 
+    @pytest.mark.asyncio
+    async def test_health_check_reports_price_hot_cache(self):
+        """Test that health check reports price hot tier metrics."""
+        result = await health_check()
+
+        hot_cache = result["checks"]["price_hot_cache"]
+        assert hot_cache["status"] == "healthy"
+        assert {"entries", "bars", "hits", "misses", "hit_rate"} <= hot_cache.keys()
+
 
 class TestHealthCheckErrorHandling:
     """Test error handling in health checks."""
@@ -10,18 +10,26 @@ Tests cover:
 - Concurrent operations and rate limiting
 - Edge cases and error scenarios
 - batch_prefetch_sectors() for bulk sector pre-population
+- get_price_data_batch() for multi-symbol price loads
+- The in-memory price hot tier in front of the database cache
+- Fetching only the missing session ranges of a stale request
 """
+from datetime import date, datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.core.exceptions import (
     APIError,
+    DataValidationError,
     SymbolNotFoundError,
 )
-from app.providers.base import SymbolInfo
+from app.providers.base import PriceDataPoint, SymbolInfo
 from app.providers.mock import MockMarketDataProvider
+from app.repositories.stock_price import DateRange
+from app.services.cache_service import FreshnessResult
 from app.services.data_service import DataService, DataServiceConfig
+from app.services.price_hot_cache import PriceHotCache
 
 
 class _MockSessionContext:
@@ -617,3 +625,297 @@ class TestBatchPrefetchSectors:
             sess.commit.assert_called_once()
         # Caller's session was never committed (it's the caller's responsibility)
         caller_session.commit.assert_not_called()
+
+
+class TestGetPriceDataBatch:
+    """Tests for get_price_data_batch() multi-symbol price loads."""
+
+    @pytest.fixture
+    def data_service(self):
+        """Create DataService with a mock session factory and provider."""
+        provider = AsyncMock(spec=MockMarketDataProvider)
+        provider.provider_name = "mock"
+        return DataService(
+            session_factory=_create_mock_session_factory(AsyncMock()),
+            provider=provider,
+            config=DataServiceConfig(max_retries=1),
+        )
+
+    @staticmethod
+    def _record(symbol: str) -> MagicMock:
+        """Build a cached price row."""
+        record = MagicMock()
+        record.symbol = symbol
+        record.timestamp = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        record.open_price = 100.0
+        record.high_price = 101.0
+        record.low_price = 99.0
+        record.close_price = 100.5
+        record.volume = 1000
+        return record
+
+    async def test_fresh_symbols_served_from_one_cache_query(self, data_service):
+        """Fresh symbols come from the batch queries; stale ones use get_price_data."""
+        fresh = FreshnessResult(
+            is_fresh=True,
+            reason="fresh",
+            market_status="closed",
+            recommended_ttl=3600,
+            last_data_date=None,
+            last_complete_trading_day=date(2024, 1, 2),
+            needs_fetch=False,
+            fetch_start_date=None,
+        )
+        stale = FreshnessResult(
+            is_fresh=False,
+            reason="No cached data",
+            market_status="closed",
+            recommended_ttl=3600,
+            last_data_date=None,
+            last_complete_trading_day=date(2024, 1, 2),
+            needs_fetch=True,
+            fetch_start_date=None,
+        )
+        msft_point = PriceDataPoint(
+            symbol="MSFT",
+            timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            open_price=200.0,
+            high_price=201.0,
+            low_price=199.0,
+            close_price=200.5,
+            volume=2000,
+        )
+        data_service.get_price_data = AsyncMock(return_value=[msft_point])
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 3, tzinfo=timezone.utc)
+
+        with patch(
+            "app.services.data_service.MarketDataCache.check_freshness_batch",
+            new=AsyncMock(return_value={"MSFT": stale, "AAPL": fresh}),
+        ) as check_batch, patch(
+            "app.services.data_service.StockPriceRepository.get_price_rows_for_symbols",
+            new=AsyncMock(return_value={"AAPL": [self._record("AAPL")]}),
+        ) as read_rows:
+            result = await data_service.get_price_data_batch(
+                ["msft", "AAPL", "MSFT"], start_date=start, end_date=end
+            )
+
+        check_batch.assert_awaited_once_with(
+            symbols=["MSFT", "AAPL"], start_date=start, end_date=end, interval="1d"
+        )
+        # Only the fresh symbol's rows are read
+        read_rows.assert_awaited_once_with(
+            symbols=["AAPL"], start_date=start, end_date=end, interval="1d"
+        )
+        data_service.get_price_data.assert_awaited_once_with(
+            symbol="MSFT", start_date=start, end_date=end, interval="1d"
+        )
+        assert list(result) == ["MSFT", "AAPL"]
+        assert result["MSFT"] == [msft_point]
+        assert [p.close_price for p in result["AAPL"]] == [100.5]
+
+    async def test_empty_symbols(self, data_service):
+        """No symbols returns an empty dict without querying the cache."""
+        assert await data_service.get_price_data_batch([]) == {}
+
+
+class TestGetPriceDataHotCache:
+    """Tests for the in-memory hot tier in get_price_data()."""
+
+    START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    END = datetime(2024, 1, 3, 15, 0, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def sessions(self):
+        """Record every session the service opens."""
+        return []
+
+    @pytest.fixture
+    def data_service(self, sessions):
+        """Create DataService with a private hot tier and a counting session factory."""
+        def factory():
+            session = AsyncMock()
+            sessions.append(session)
+            return _MockSessionContext(session)
+
+        provider = AsyncMock(spec=MockMarketDataProvider)
+        provider.provider_name = "mock"
+        return DataService(
+            session_factory=factory,
+            provider=provider,
+            config=DataServiceConfig(max_retries=1),
+            hot_cache=PriceHotCache(max_bars=1000),
+        )
+
+    @staticmethod
+    def _row(day: int, close: float) -> MagicMock:
+        """Build a price row for January 2024."""
+        row = MagicMock()
+        row.symbol = "SPY"
+        row.timestamp = datetime(2024, 1, day, 5, 0, tzinfo=timezone.utc)
+        row.open_price = row.high_price = row.low_price = row.close_price = close
+        row.volume = 1000
+        return row
+
+    @staticmethod
+    def _fresh() -> FreshnessResult:
+        return FreshnessResult(
+            is_fresh=True,
+            reason="fresh",
+            market_status="closed",
+            recommended_ttl=86400,
+            last_data_date=date(2024, 1, 3),
+            last_complete_trading_day=date(2024, 1, 3),
+            needs_fetch=False,
+            fetch_start_date=None,
+        )
+
+    async def test_warm_request_does_not_touch_database(self, data_service, sessions):
+        """A repeat request on the same days is served without opening a session."""
+        rows = [self._row(day, 400.0 + day) for day in (1, 2, 3, 4)]
+        with patch(
+            "app.services.data_service.MarketDataCache.check_freshness_smart",
+            new=AsyncMock(return_value=self._fresh()),
+        ), patch(
+            "app.services.data_service.StockPriceRepository.get_price_rows_by_date_range",
+            new=AsyncMock(return_value=rows),
+        ) as read_rows:
+            first = await data_service.get_price_data("spy", self.START, self.END)
+            second = await data_service.get_price_data(
+                "SPY", self.START, self.END.replace(hour=20)
+            )
+
+        # Whole days are loaded once; each request gets its exact range
+        assert read_rows.await_count == 1
+        assert read_rows.await_args.kwargs["end_date"] > self.END
+        assert len(sessions) == 1
+        assert [p.close_price for p in first] == [401.0, 402.0, 403.0]
+        assert [p.close_price for p in second] == [401.0, 402.0, 403.0]
+
+    async def test_store_invalidates_hot_tier(self, data_service):
+        """Storing fetched bars replaces the symbol's cached entries."""
+        with patch(
+            "app.services.data_service.MarketDataCache.check_freshness_smart",
+            new=AsyncMock(return_value=self._fresh()),
+        ), patch(
+            "app.services.data_service.StockPriceRepository.get_price_rows_by_date_range",
+            new=AsyncMock(return_value=[self._row(2, 400.0)]),
+        ):
+            await data_service.get_price_data("SPY", self.START, self.END)
+
+        data_service.provider.fetch_price_data.return_value = []
+        with patch(
+            "app.services.data_service.StockPriceRepository.sync_price_data",
+            new=AsyncMock(),
+        ), patch(
+            "app.services.data_service.StockPriceRepository.get_price_rows_by_date_range",
+            new=AsyncMock(return_value=[self._row(2, 401.0)]),
+        ):
+            refreshed = await data_service.get_price_data(
+                "SPY", self.START, self.END, force_refresh=True
+            )
+
+        cached = await data_service.get_price_data("SPY", self.START, self.END)
+
+        assert [p.close_price for p in refreshed] == [401.0]
+        assert [p.close_price for p in cached] == [401.0]
+        assert data_service._hot_cache.stats.invalidations == 1
+
+
+class TestGetPriceDataMissingRanges:
+    """Tests for fetching only the missing ranges in get_price_data()."""
+
+    START = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    END = datetime(2024, 1, 10, 23, 0, tzinfo=timezone.utc)
+    GAPS = [
+        DateRange(date(2024, 1, 2), date(2024, 1, 3)),
+        DateRange(date(2024, 1, 9), date(2024, 1, 10)),
+    ]
+
+    @pytest.fixture
+    def data_service(self):
+        """Create DataService with a mock session factory and provider."""
+        provider = AsyncMock(spec=MockMarketDataProvider)
+        provider.provider_name = "mock"
+        provider.fetch_price_data.return_value = []
+        return DataService(
+            session_factory=_create_mock_session_factory(AsyncMock()),
+            provider=provider,
+            config=DataServiceConfig(max_retries=1),
+            hot_cache=PriceHotCache(max_bars=0),
+        )
+
+    def _stale(self) -> FreshnessResult:
+        return FreshnessResult(
+            is_fresh=False,
+            reason="Historical data missing from 2024-01-02 to 2024-01-10 in 2 gaps",
+            market_status="closed",
+            recommended_ttl=0,
+            last_data_date=date(2024, 1, 8),
+            last_complete_trading_day=date(2024, 1, 10),
+            needs_fetch=True,
+            fetch_start_date=date(2024, 1, 2),
+            missing_ranges=self.GAPS,
+        )
+
+    async def _get(self, data_service) -> AsyncMock:
+        """Run a stale get_price_data and return the add_fetched_range mock."""
+        with patch(
+            "app.services.data_service.MarketDataCache.check_freshness_smart",
+            new=AsyncMock(return_value=self._stale()),
+        ), patch(
+            "app.services.data_service.StockPriceRepository.sync_price_data",
+            new=AsyncMock(),
+        ), patch(
+            "app.services.data_service.StockPriceRepository.add_fetched_range",
+            new=AsyncMock(),
+        ) as add_fetched, patch(
+            "app.services.data_service.StockPriceRepository.get_price_rows_by_date_range",
+            new=AsyncMock(return_value=[]),
+        ):
+            await data_service.get_price_data("SPY", self.START, self.END)
+        return add_fetched
+
+    async def test_fetches_each_missing_range(self, data_service):
+        """Only the missing sessions are requested, one request per gap."""
+        add_fetched = await self._get(data_service)
+
+        requests = [c.args[0] for c in data_service.provider.fetch_price_data.await_args_list]
+        assert [(r.start_date.date(), r.end_date.date()) for r in requests] == [
+            (date(2024, 1, 2), date(2024, 1, 3)),
+            (date(2024, 1, 9), date(2024, 1, 10)),
+        ]
+        # Recorded over the surrounding non-trading days (Jan 1 holiday, weekend)
+        recorded = [
+            (c.kwargs["start_date"], c.kwargs["end_date"]) for c in add_fetched.await_args_list
+        ]
+        assert recorded == [
+            (date(2023, 12, 30), date(2024, 1, 3)),
+            (date(2024, 1, 9), date(2024, 1, 10)),
+        ]
+
+    async def test_failed_range_falls_back_to_one_request(self, data_service):
+        """A range without provider data is retried as one request through the end."""
+        data_service.provider.fetch_price_data.side_effect = [
+            DataValidationError("No data returned"),
+            [],
+        ]
+
+        add_fetched = await self._get(data_service)
+
+        fallback = data_service.provider.fetch_price_data.await_args_list[-1].args[0]
+        assert fallback.start_date.date() == date(2024, 1, 2)
+        assert fallback.end_date == self.END
+        # Both gaps are recorded, so the empty range is not requested again
+        assert add_fetched.await_count == 2
+
+    async def test_single_request_failure_is_raised(self, data_service):
+        """A failing request that already spans to the end is not retried."""
+        data_service.provider.fetch_price_data.side_effect = APIError("down")
+
+        with pytest.raises(APIError):
+            await data_service.get_price_data(
+                "SPY", self.START, self.END, force_refresh=True
+            )
+
+        assert data_service.provider.fetch_price_data.await_count == 1
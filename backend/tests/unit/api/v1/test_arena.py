@@ -5,9 +5,15 @@ Tests for:
 - POST /api/v1/arena/simulations - Create simulation
 - GET /api/v1/arena/simulations - List simulations
 - GET /api/v1/arena/simulations/{id} - Get simulation details
+- GET /api/v1/arena/simulations/{id}/positions - Paginated positions
+- GET /api/v1/arena/simulations/{id}/snapshots - Paginated snapshots
+- GET /api/v1/arena/simulations/{id}/equity-curve - Equity curve (JSON or NDJSON)
+- GET /api/v1/arena/simulations/{id}/profile - Get simulation step profile
+- GET /api/v1/arena/simulations/{id}/snapshots/{day}/decisions - Get day decisions
 - DELETE /api/v1/arena/simulations/{id} - Cancel/delete simulation
 """
 
+import json
 from datetime import date, datetime
 from decimal import Decimal
 
@@ -22,6 +28,8 @@ from app.models.arena import (
     PositionStatus,
     SimulationStatus,
 )
+from app.services.arena.agent_protocol import AgentDecision
+from app.services.arena.decision_log import DecisionLog
 
 
 class TestListAgents:
@@ -109,6 +117,33 @@ class TestCreateSimulation:
         assert "id" in data
         assert "created_at" in data
 
+    @pytest.mark.asyncio
+    async def test_create_simulation_stores_record_decisions(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """record_decisions is stored in agent_config; invalid values are rejected."""
+        # Arrange
+        request_data = {
+            "symbols": ["AAPL"],
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "record_decisions": "buy",
+        }
+
+        # Act
+        response = await async_client.post("/api/v1/arena/simulations", json=request_data)
+        invalid = await async_client.post(
+            "/api/v1/arena/simulations", json={**request_data, "record_decisions": "none"}
+        )
+
+        # Assert
+        assert response.status_code == 202
+        sim = await db_session.get(ArenaSimulation, response.json()["id"])
+        assert sim.agent_config["record_decisions"] == "buy"
+        assert invalid.status_code == 422
+
     @pytest.mark.asyncio
     async def test_create_simulation_with_all_parameters(
         self,
@@ -1033,7 +1068,9 @@ class TestGetSimulation:
         await db_session.refresh(sim)
 
         # Act
-        response = await async_client.get(f"/api/v1/arena/simulations/{sim.id}")
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}", params={"include_decisions": True}
+        )
 
         # Assert
         assert response.status_code == 200
@@ -1048,6 +1085,573 @@ class TestGetSimulation:
         assert Decimal(snap["cumulative_return_pct"]) == Decimal("1.00")
         assert snap["decisions"]["AAPL"]["action"] == "hold"
 
+    @pytest.mark.asyncio
+    async def test_get_simulation_decodes_decision_log(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Snapshots with a compact decision log return decoded decisions."""
+        # Arrange
+        sim = ArenaSimulation(
+            name="Decision Log Sim",
+            symbols=["AAPL", "MSFT"],
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            initial_capital=Decimal("10000"),
+            position_size=Decimal("1000"),
+            agent_type="live20",
+            agent_config={},
+            status=SimulationStatus.RUNNING.value,
+        )
+        db_session.add(sim)
+        await db_session.flush()
+
+        log = DecisionLog(sim.symbols)
+        log.record(
+            "AAPL",
+            AgentDecision(symbol="AAPL", action="BUY", score=80, reasoning="Setup"),
+            has_position=False,
+        )
+        log.mark_selected("AAPL", True)
+        log.record_no_data("MSFT", has_history=False)
+        db_session.add(
+            ArenaSnapshot(
+                simulation_id=sim.id,
+                snapshot_date=date(2024, 1, 2),
+                day_number=0,
+                cash=Decimal("10000"),
+                positions_value=Decimal("0"),
+                total_equity=Decimal("10000"),
+                open_position_count=0,
+                decision_log=log.to_bytes(),
+            )
+        )
+        await db_session.commit()
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}", params={"include_decisions": True}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["snapshots"][0]["decisions"] == {
+            "AAPL": {"action": "BUY", "score": 80, "reasoning": None, "portfolio_selected": True},
+            "MSFT": {"action": "NO_DATA", "reasoning": "No price data"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_simulation_omits_decisions_by_default(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Snapshot decisions are opt-in."""
+        # Arrange
+        sim = await _create_simulation_with_history(db_session, days=1, positions=0)
+
+        # Act
+        response = await async_client.get(f"/api/v1/arena/simulations/{sim.id}")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["snapshots"][0]["decisions"] is None
+
+    @pytest.mark.asyncio
+    async def test_get_simulation_can_exclude_sub_resources(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """include_positions/include_snapshots=false return only the summary."""
+        # Arrange
+        sim = await _create_simulation_with_history(db_session, days=3, positions=2)
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}",
+            params={"include_positions": False, "include_snapshots": False},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["simulation"]["id"] == sim.id
+        assert data["positions"] == []
+        assert data["snapshots"] == []
+
+
+async def _create_simulation_with_history(
+    db_session: AsyncSession, days: int, positions: int
+) -> ArenaSimulation:
+    """Create a completed simulation with daily snapshots and closed positions.
+
+    Snapshots are on consecutive January 2024 dates starting 2024-01-02, with
+    day_number 0..days-1 and equity 10000 + 10 * day. Position i has
+    signal_date 2024-01-02 + i days; even positions are closed, odd ones open.
+    """
+    sim = ArenaSimulation(
+        name="History Sim",
+        symbols=["AAPL"],
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 3, 31),
+        initial_capital=Decimal("10000"),
+        position_size=Decimal("1000"),
+        agent_type="live20",
+        agent_config={},
+        status=SimulationStatus.COMPLETED.value,
+    )
+    db_session.add(sim)
+    await db_session.flush()
+
+    for day in range(days):
+        db_session.add(
+            ArenaSnapshot(
+                simulation_id=sim.id,
+                snapshot_date=date(2024, 1, 2 + day),
+                day_number=day,
+                cash=Decimal("10000"),
+                positions_value=Decimal(10 * day),
+                total_equity=Decimal(10000 + 10 * day),
+                open_position_count=0,
+                decisions={"AAPL": {"action": "NO_SIGNAL", "score": 10, "reasoning": "Weak"}},
+            )
+        )
+    for i in range(positions):
+        db_session.add(
+            ArenaPosition(
+                simulation_id=sim.id,
+                symbol="AAPL",
+                status=(PositionStatus.CLOSED if i % 2 == 0 else PositionStatus.OPEN).value,
+                signal_date=date(2024, 1, 2 + i),
+                entry_date=date(2024, 1, 3 + i),
+                entry_price=Decimal("150.00"),
+                shares=6,
+                trailing_stop_pct=Decimal("5.0"),
+            )
+        )
+    await db_session.commit()
+    return sim
+
+
+class TestListSimulationPositions:
+    """Tests for GET /api/v1/arena/simulations/{id}/positions endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_simulation_not_found(
+        self,
+        async_client: AsyncClient,
+    ):
+        """Unknown simulation returns 404."""
+        # Act
+        response = await async_client.get("/api/v1/arena/simulations/99999/positions")
+
+        # Assert
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_cursor(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Pages are returned in ID order and next_cursor is None on the last page."""
+        # Arrange
+        sim = await _create_simulation_with_history(db_session, days=0, positions=5)
+        url = f"/api/v1/arena/simulations/{sim.id}/positions"
+
+        # Act
+        first = (await async_client.get(url, params={"limit": 3})).json()
+        second = (
+            await async_client.get(url, params={"limit": 3, "cursor": first["next_cursor"]})
+        ).json()
+
+        # Assert
+        assert len(first["items"]) == 3
+        assert first["next_cursor"] == first["items"][-1]["id"]
+        assert len(second["items"]) == 2
+        assert second["next_cursor"] is None
+        ids = [p["id"] for p in first["items"] + second["items"]]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 5
+
+    @pytest.mark.asyncio
+    async def test_filters_by_status_and_signal_date(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """status and start_date/end_date narrow the positions returned."""
+        # Arrange
+        sim = await _create_simulation_with_history(db_session, days=0, positions=5)
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}/positions",
+            params={"status": "closed", "start_date": "2024-01-03", "end_date": "2024-01-06"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [p["signal_date"] for p in items] == ["2024-01-04", "2024-01-06"]
+        assert all(p["status"] == "closed" for p in items)
+
+
+class TestListSimulationSnapshots:
+    """Tests for GET /api/v1/arena/simulations/{id}/snapshots endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_simulation_not_found(
+        self,
+        async_client: AsyncClient,
+    ):
+        """Unknown simulation returns 404."""
+        # Act
+        response = await async_client.get("/api/v1/arena/simulations/99999/snapshots")
+
+        # Assert
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_day_number_cursor(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Snapshots are paged in day order using day_number as the cursor."""
+        # Arrange
+        sim = await _create_simulation_with_history(db_session, days=5, positions=0)
+        url = f"/api/v1/arena/simulations/{sim.id}/snapshots"
+
+        # Act
+        first = (await async_client.get(url, params={"limit": 2})).json()
+        rest = (
+            await async_client.get(url, params={"limit": 10, "cursor": first["next_cursor"]})
+        ).json()
+
+        # Assert
+        assert [s["day_number"] for s in first["items"]] == [0, 1]
+        assert first["next_cursor"] == 1
+        assert [s["day_number"] for s in rest["items"]] == [2, 3, 4]
+        assert rest["next_cursor"] is None
+        assert all(s["decisions"] is None for s in first["items"] + rest["items"])
+
+    @pytest.mark.asyncio
+    async def test_filters_by_date_and_includes_decisions(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Date bounds are inclusive; include_decisions returns each day's decisions."""
+        # Arrange
+        sim = await _create_simulation_with_history(db_session, days=5, positions=0)
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}/snapshots",
+            params={
+                "start_date": "2024-01-03",
+                "end_date": "2024-01-04",
+                "include_decisions": True,
+            },
+        )
+
+        # Assert
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [s["snapshot_date"] for s in items] == ["2024-01-03", "2024-01-04"]
+        assert items[0]["decisions"]["AAPL"]["action"] == "NO_SIGNAL"
+
+
+class TestGetSimulationEquityCurve:
+    """Tests for GET /api/v1/arena/simulations/{id}/equity-curve endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_simulation_not_found(
+        self,
+        async_client: AsyncClient,
+    ):
+        """Unknown simulation returns 404."""
+        # Act
+        response = await async_client.get("/api/v1/arena/simulations/99999/equity-curve")
+
+        # Assert
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_returns_json_curve_in_date_range(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """JSON format returns the points within the date range."""
+        # Arrange
+        sim = await _create_simulation_with_history(db_session, days=5, positions=0)
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}/equity-curve",
+            params={"start_date": "2024-01-04"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["simulation_id"] == sim.id
+        assert [p["snapshot_date"] for p in data["snapshots"]] == [
+            "2024-01-04",
+            "2024-01-05",
+            "2024-01-06",
+        ]
+        assert Decimal(data["snapshots"][0]["total_equity"]) == Decimal("10020")
+
+    @pytest.mark.asyncio
+    async def test_streams_ndjson(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """NDJSON format streams one JSON point per line."""
+        # Arrange
+        sim = await _create_simulation_with_history(db_session, days=3, positions=0)
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}/equity-curve",
+            params={"format": "ndjson"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["snapshot_date"] for line in lines] == [
+            "2024-01-02",
+            "2024-01-03",
+            "2024-01-04",
+        ]
+        assert [Decimal(line["total_equity"]) for line in lines] == [
+            Decimal("10000"),
+            Decimal("10010"),
+            Decimal("10020"),
+        ]
+
+
+class TestGetSimulationProfile:
+    """Tests for GET /api/v1/arena/simulations/{id}/profile endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_get_profile_not_found(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Profile of a non-existent simulation returns 404."""
+        # Act
+        response = await async_client.get("/api/v1/arena/simulations/99999/profile")
+
+        # Assert
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_get_profile_returns_phases_and_counters(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Stored profile is returned with per-call means."""
+        # Arrange
+        sim = ArenaSimulation(
+            name="Profiled Sim",
+            symbols=["AAPL"],
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            initial_capital=Decimal("10000"),
+            position_size=Decimal("1000"),
+            agent_type="live20",
+            agent_config={"trailing_stop_pct": 5.0},
+            status=SimulationStatus.RUNNING.value,
+            current_day=4,
+            total_days=20,
+            step_profile={
+                "phases": {"agent": {"total_ms": 12.0, "calls": 4}},
+                "counters": {"days": 4, "db_statements": 30},
+            },
+        )
+        db_session.add(sim)
+        await db_session.commit()
+        await db_session.refresh(sim)
+
+        # Act
+        response = await async_client.get(f"/api/v1/arena/simulations/{sim.id}/profile")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["simulation_id"] == sim.id
+        assert data["days"] == 4
+        assert data["phases"]["agent"] == {"total_ms": 12.0, "calls": 4, "mean_ms": 3.0}
+        assert data["counters"]["db_statements"] == 30
+
+    @pytest.mark.asyncio
+    async def test_get_profile_empty_before_first_day(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """A simulation without a stored profile returns an empty profile."""
+        # Arrange
+        sim = ArenaSimulation(
+            name="Pending Sim",
+            symbols=["AAPL"],
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            initial_capital=Decimal("10000"),
+            position_size=Decimal("1000"),
+            agent_type="live20",
+            agent_config={"trailing_stop_pct": 5.0},
+            status=SimulationStatus.PENDING.value,
+        )
+        db_session.add(sim)
+        await db_session.commit()
+        await db_session.refresh(sim)
+
+        # Act
+        response = await async_client.get(f"/api/v1/arena/simulations/{sim.id}/profile")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {
+            "simulation_id": sim.id,
+            "days": 0,
+            "phases": {},
+            "counters": {},
+        }
+
+
+class TestGetSnapshotDecisions:
+    """Tests for GET /api/v1/arena/simulations/{id}/snapshots/{day}/decisions endpoint."""
+
+    @staticmethod
+    async def _create_simulation(db_session: AsyncSession) -> ArenaSimulation:
+        sim = ArenaSimulation(
+            name="Decisions Sim",
+            symbols=["AAPL", "MSFT"],
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            initial_capital=Decimal("10000"),
+            position_size=Decimal("1000"),
+            agent_type="live20",
+            agent_config={},
+            status=SimulationStatus.RUNNING.value,
+        )
+        db_session.add(sim)
+        await db_session.flush()
+        return sim
+
+    @staticmethod
+    def _snapshot(sim: ArenaSimulation, **kwargs) -> ArenaSnapshot:
+        return ArenaSnapshot(
+            simulation_id=sim.id,
+            snapshot_date=date(2024, 1, 2),
+            day_number=0,
+            cash=Decimal("10000"),
+            positions_value=Decimal("0"),
+            total_equity=Decimal("10000"),
+            open_position_count=0,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_simulation_not_found(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Decisions of a non-existent simulation return 404."""
+        # Act
+        response = await async_client.get(
+            "/api/v1/arena/simulations/99999/snapshots/0/decisions"
+        )
+
+        # Assert
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_snapshot_not_found(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """A day without a snapshot returns 404."""
+        # Arrange
+        sim = await self._create_simulation(db_session)
+        await db_session.commit()
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}/snapshots/3/decisions"
+        )
+
+        # Assert
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Snapshot for day 3 not found"
+
+    @pytest.mark.asyncio
+    async def test_returns_legacy_json_decisions(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Snapshots written before the decision log return their stored JSON."""
+        # Arrange
+        sim = await self._create_simulation(db_session)
+        legacy = {"AAPL": {"action": "HOLD", "score": None, "reasoning": "Holding"}}
+        db_session.add(self._snapshot(sim, decisions=legacy))
+        await db_session.commit()
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}/snapshots/0/decisions"
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["simulation_id"] == sim.id
+        assert data["day_number"] == 0
+        assert data["snapshot_date"] == "2024-01-02"
+        assert data["decisions"] == legacy
+
+    @pytest.mark.asyncio
+    async def test_decodes_decision_log_without_agent_decisions(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """NO_DATA reasons come from the log itself; no prices are needed."""
+        # Arrange
+        sim = await self._create_simulation(db_session)
+        log = DecisionLog(sim.symbols)
+        log.record_no_data("AAPL", has_history=True)
+        log.record_no_data("MSFT", has_history=False)
+        db_session.add(self._snapshot(sim, decision_log=log.to_bytes()))
+        await db_session.commit()
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/simulations/{sim.id}/snapshots/0/decisions"
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["decisions"] == {
+            "AAPL": {"action": "NO_DATA", "reasoning": "No data for today"},
+            "MSFT": {"action": "NO_DATA", "reasoning": "No price data"},
+        }
+
 
 class TestCancelSimulation:
     """Tests for POST /api/v1/arena/simulations/{id}/cancel endpoint."""
@@ -0,0 +1,221 @@
+"""Unit tests for Arena parameter sweep API endpoints.
+
+Tests for:
+- POST /api/v1/arena/sweeps - Create a sweep (one simulation per grid combination)
+- GET /api/v1/arena/sweeps/{group_id} - Ranked sweep results
+"""
+
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.arena import ArenaSimulation, SimulationStatus
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+BASE_SWEEP_REQUEST = {
+    "symbols": ["AAPL", "MSFT"],
+    "start_date": "2024-01-01",
+    "end_date": "2024-06-30",
+    "parameter_grid": {
+        "trailing_stop_pct": [3.0, 5.0, 8.0],
+        "max_open_positions": [2, 4],
+    },
+}
+
+
+async def _complete(
+    db_session: AsyncSession, sim_id: int, total_return_pct: str, max_drawdown_pct: str
+) -> None:
+    """Mark a sweep simulation completed with the given metrics."""
+    sim = await db_session.get(ArenaSimulation, sim_id)
+    sim.status = SimulationStatus.COMPLETED.value
+    sim.total_return_pct = Decimal(total_return_pct)
+    sim.max_drawdown_pct = Decimal(max_drawdown_pct)
+    sim.final_equity = Decimal("10000") * (1 + Decimal(total_return_pct) / 100)
+    await db_session.commit()
+
+
+class TestCreateSweep:
+    """Tests for POST /api/v1/arena/sweeps endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_create_sweep_creates_one_simulation_per_combination(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """The cartesian product of the grid becomes simulations sharing a group_id."""
+        # Act
+        response = await async_client.post("/api/v1/arena/sweeps", json=BASE_SWEEP_REQUEST)
+
+        # Assert
+        assert response.status_code == 202
+        data = response.json()
+        sims = data["simulations"]
+        assert len(sims) == 6
+        assert {s["group_id"] for s in sims} == {data["group_id"]}
+        combos = {(float(s["trailing_stop_pct"]), s["max_open_positions"]) for s in sims}
+        assert combos == {(t, m) for t in (3.0, 5.0, 8.0) for m in (2, 4)}
+
+    @pytest.mark.asyncio
+    async def test_create_sweep_stores_swept_params(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Each simulation records its swept values and is named after them."""
+        # Arrange
+        request = {
+            **BASE_SWEEP_REQUEST,
+            "name": "Stops",
+            "parameter_grid": {"trailing_stop_pct": [4.0]},
+        }
+
+        # Act
+        response = await async_client.post("/api/v1/arena/sweeps", json=request)
+
+        # Assert
+        assert response.status_code == 202
+        sim_data = response.json()["simulations"][0]
+        assert sim_data["name"] == "Stops [trailing_stop_pct=4.0]"
+        sim = await db_session.get(ArenaSimulation, sim_data["id"])
+        assert sim.agent_config["sweep_params"] == {"trailing_stop_pct": 4.0}
+        assert sim.agent_config["trailing_stop_pct"] == 4.0
+
+    @pytest.mark.asyncio
+    async def test_create_sweep_rejects_unsweepable_parameter(
+        self,
+        async_client: AsyncClient,
+    ):
+        """Universe and date fields cannot be swept."""
+        # Arrange
+        request = {**BASE_SWEEP_REQUEST, "parameter_grid": {"start_date": ["2024-02-01"]}}
+
+        # Act
+        response = await async_client.post("/api/v1/arena/sweeps", json=request)
+
+        # Assert
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_create_sweep_rejects_invalid_combination(
+        self,
+        async_client: AsyncClient,
+    ):
+        """A combination failing simulation validation rejects the whole sweep."""
+        # Arrange: risk_based sizing requires ATR stops, base stop_type is fixed
+        request = {**BASE_SWEEP_REQUEST, "parameter_grid": {"sizing_mode": ["fixed", "risk_based"]}}
+
+        # Act
+        response = await async_client.post("/api/v1/arena/sweeps", json=request)
+
+        # Assert
+        assert response.status_code == 422
+        assert "risk_based" in response.text
+
+    @pytest.mark.asyncio
+    async def test_create_sweep_rejects_too_many_configs(
+        self,
+        async_client: AsyncClient,
+    ):
+        """Grids larger than arena_max_sweep_configs are rejected."""
+        # Arrange: 101 combinations with the default cap of 100
+        request = {
+            **BASE_SWEEP_REQUEST,
+            "parameter_grid": {"min_buy_score": list(range(20, 121))},
+        }
+
+        # Act
+        response = await async_client.post("/api/v1/arena/sweeps", json=request)
+
+        # Assert
+        assert response.status_code == 422
+
+
+class TestGetSweep:
+    """Tests for GET /api/v1/arena/sweeps/{group_id} endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_get_sweep_ranks_rows_by_metric(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Rows are best-first by sort_by; unfinished configs come last."""
+        # Arrange
+        request = {**BASE_SWEEP_REQUEST, "parameter_grid": {"trailing_stop_pct": [3.0, 5.0, 8.0]}}
+        create_response = await async_client.post("/api/v1/arena/sweeps", json=request)
+        data = create_response.json()
+        group_id = data["group_id"]
+        ids = [s["id"] for s in data["simulations"]]
+        await _complete(db_session, ids[0], total_return_pct="2.00", max_drawdown_pct="1.00")
+        await _complete(db_session, ids[1], total_return_pct="9.00", max_drawdown_pct="6.00")
+
+        # Act
+        response = await async_client.get(f"/api/v1/arena/sweeps/{group_id}")
+        by_drawdown = await async_client.get(
+            f"/api/v1/arena/sweeps/{group_id}", params={"sort_by": "max_drawdown_pct"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        summary = response.json()
+        assert summary["total_configs"] == 3
+        assert summary["completed_configs"] == 2
+        assert [row["simulation_id"] for row in summary["rows"]] == [ids[1], ids[0], ids[2]]
+        assert summary["rows"][0]["params"] == {"trailing_stop_pct": 5.0}
+        assert summary["top_results"] == []
+        assert [row["simulation_id"] for row in by_drawdown.json()["rows"]] == [
+            ids[0],
+            ids[1],
+            ids[2],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_sweep_returns_full_results_for_top_k(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """top_k returns detail responses for the best completed configurations."""
+        # Arrange
+        request = {**BASE_SWEEP_REQUEST, "parameter_grid": {"trailing_stop_pct": [3.0, 5.0]}}
+        create_response = await async_client.post("/api/v1/arena/sweeps", json=request)
+        data = create_response.json()
+        ids = [s["id"] for s in data["simulations"]]
+        await _complete(db_session, ids[0], total_return_pct="1.00", max_drawdown_pct="1.00")
+        await _complete(db_session, ids[1], total_return_pct="4.00", max_drawdown_pct="2.00")
+
+        # Act
+        response = await async_client.get(
+            f"/api/v1/arena/sweeps/{data['group_id']}", params={"top_k": 1}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        top = response.json()["top_results"]
+        assert len(top) == 1
+        assert top[0]["simulation"]["id"] == ids[1]
+        assert top[0]["positions"] == []
+        assert top[0]["snapshots"] == []
+
+    @pytest.mark.asyncio
+    async def test_get_sweep_returns_404_for_unknown_group(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Unknown group_id returns 404."""
+        # Act
+        response = await async_client.get(
+            "/api/v1/arena/sweeps/00000000-0000-0000-0000-000000000000"
+        )
+
+        # Assert
+        assert response.status_code == 404
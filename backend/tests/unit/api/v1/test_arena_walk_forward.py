@@ -0,0 +1,174 @@
+"""Unit tests for Arena walk-forward API endpoints.
+
+Tests for:
+- POST /api/v1/arena/walk-forward - Create train/test sub-simulations per window
+- GET /api/v1/arena/walk-forward/{group_id} - Per-window results and stitched curve
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.arena import ArenaSimulation, ArenaSnapshot, SimulationStatus
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+BASE_WALK_FORWARD_REQUEST = {
+    "symbols": ["AAPL", "MSFT"],
+    "start_date": "2024-01-01",
+    "end_date": "2024-03-31",
+    "train_days": 30,
+    "test_days": 30,
+}
+
+
+async def _complete_with_curve(
+    db_session: AsyncSession, sim_id: int, curve: list[tuple[date, str]]
+) -> None:
+    """Mark a sub-simulation completed with the given equity snapshots."""
+    sim = await db_session.get(ArenaSimulation, sim_id)
+    final_equity = Decimal(curve[-1][1])
+    sim.status = SimulationStatus.COMPLETED.value
+    sim.final_equity = final_equity
+    sim.total_return_pct = (final_equity - sim.initial_capital) / sim.initial_capital * 100
+    for day, (snapshot_date, equity) in enumerate(curve):
+        db_session.add(
+            ArenaSnapshot(
+                simulation_id=sim_id,
+                snapshot_date=snapshot_date,
+                day_number=day,
+                cash=Decimal(equity),
+                positions_value=Decimal("0"),
+                total_equity=Decimal(equity),
+                daily_pnl=Decimal("0"),
+                daily_return_pct=Decimal("0"),
+                cumulative_return_pct=Decimal("0"),
+                open_position_count=0,
+                decisions={},
+            )
+        )
+    await db_session.commit()
+
+
+class TestCreateWalkForward:
+    """Tests for POST /api/v1/arena/walk-forward endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_create_walk_forward_creates_train_and_test_per_window(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Each window becomes a train and a test simulation sharing a group_id."""
+        # Act
+        response = await async_client.post(
+            "/api/v1/arena/walk-forward", json=BASE_WALK_FORWARD_REQUEST
+        )
+
+        # Assert
+        assert response.status_code == 202
+        data = response.json()
+        sims = data["simulations"]
+        assert len(sims) == 6
+        assert {s["group_id"] for s in sims} == {data["group_id"]}
+        assert [(s["start_date"], s["end_date"]) for s in sims[:2]] == [
+            ("2024-01-01", "2024-01-30"),
+            ("2024-01-31", "2024-02-29"),
+        ]
+        assert sims[1]["name"] == "Walk-forward [w0 test]"
+
+    @pytest.mark.asyncio
+    async def test_create_walk_forward_stores_window_and_price_range(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Sub-simulations record their window and load the whole run's price range."""
+        # Act
+        response = await async_client.post(
+            "/api/v1/arena/walk-forward", json=BASE_WALK_FORWARD_REQUEST
+        )
+
+        # Assert
+        sim = await db_session.get(ArenaSimulation, response.json()["simulations"][3]["id"])
+        assert sim.agent_config["price_range"] == {"start": "2024-01-01", "end": "2024-03-31"}
+        assert sim.agent_config["walk_forward"]["window"] == 1
+        assert sim.agent_config["walk_forward"]["role"] == "test"
+
+    @pytest.mark.asyncio
+    async def test_create_walk_forward_rejects_range_without_window(
+        self,
+        async_client: AsyncClient,
+    ):
+        """A range shorter than one train period plus a test day is rejected."""
+        # Arrange
+        request = {**BASE_WALK_FORWARD_REQUEST, "end_date": "2024-01-20"}
+
+        # Act
+        response = await async_client.post("/api/v1/arena/walk-forward", json=request)
+
+        # Assert
+        assert response.status_code == 422
+
+
+class TestGetWalkForward:
+    """Tests for GET /api/v1/arena/walk-forward/{group_id} endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_get_walk_forward_stitches_completed_test_windows(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """The stitched curve chains the leading run of completed test windows."""
+        # Arrange
+        create_response = await async_client.post(
+            "/api/v1/arena/walk-forward", json=BASE_WALK_FORWARD_REQUEST
+        )
+        data = create_response.json()
+        test_ids = [s["id"] for s in data["simulations"][1::2]]
+        await _complete_with_curve(
+            db_session, test_ids[0], [(date(2024, 1, 31), "10000"), (date(2024, 2, 1), "11000")]
+        )
+        await _complete_with_curve(
+            db_session, test_ids[1], [(date(2024, 3, 1), "10000"), (date(2024, 3, 4), "10500")]
+        )
+
+        # Act
+        response = await async_client.get(f"/api/v1/arena/walk-forward/{data['group_id']}")
+
+        # Assert
+        assert response.status_code == 200
+        summary = response.json()
+        assert summary["total_windows"] == 3
+        assert summary["completed_windows"] == 2
+        assert summary["windows"][0]["test_simulation_id"] == test_ids[0]
+        assert summary["windows"][2]["test_status"] == SimulationStatus.PENDING.value
+        assert [Decimal(p["total_equity"]) for p in summary["equity_curve"]] == [
+            Decimal("10000"),
+            Decimal("11000"),
+            Decimal("11000"),
+            Decimal("11550"),
+        ]
+        assert Decimal(summary["stitched_return_pct"]) == Decimal("15.5")
+
+    @pytest.mark.asyncio
+    async def test_get_walk_forward_returns_404_for_unknown_group(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Unknown group_id returns 404."""
+        # Act
+        response = await async_client.get(
+            "/api/v1/arena/walk-forward/00000000-0000-0000-0000-000000000000"
+        )
+
+        # Assert
+        assert response.status_code == 404
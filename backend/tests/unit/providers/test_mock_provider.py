@@ -0,0 +1,80 @@
+"""Unit tests for MockMarketDataProvider synthetic (seeded) data."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.providers.base import PriceDataRequest
+from app.providers.mock import MockMarketDataProvider
+
+
+def _request(symbol: str, start: str, end: str) -> PriceDataRequest:
+    """Build a daily request between two ISO dates (UTC)."""
+    return PriceDataRequest(
+        symbol=symbol,
+        start_date=datetime.fromisoformat(start).replace(tzinfo=timezone.utc),
+        end_date=datetime.fromisoformat(end).replace(tzinfo=timezone.utc),
+        interval="1d",
+    )
+
+
+@pytest.mark.unit
+class TestSeededMockProvider:
+    """Tests for the seeded random-walk mode."""
+
+    async def test_bars_only_on_weekdays_within_range(self) -> None:
+        """Seeded bars skip weekends and stay inside the requested range."""
+        provider = MockMarketDataProvider(seed=7)
+
+        bars = await provider.fetch_price_data(_request("SYN0001", "2024-01-01", "2024-01-31"))
+
+        assert len(bars) == 23
+        assert all(bar.timestamp.weekday() < 5 for bar in bars)
+        assert bars[0].timestamp.date().isoformat() == "2024-01-01"
+        assert bars[-1].timestamp.date().isoformat() == "2024-01-31"
+
+    async def test_bars_are_consistent_ohlc(self) -> None:
+        """High and low bracket open and close; prices are cents."""
+        provider = MockMarketDataProvider(seed=7)
+
+        bars = await provider.fetch_price_data(_request("SYN0002", "2023-01-01", "2023-12-31"))
+
+        for bar in bars:
+            assert bar.low_price <= min(bar.open_price, bar.close_price)
+            assert bar.high_price >= max(bar.open_price, bar.close_price)
+            assert bar.close_price == bar.close_price.quantize(Decimal("0.01"))
+            assert bar.volume > 0
+
+    async def test_same_seed_gives_same_bars_for_any_range(self) -> None:
+        """A day's bar depends only on seed and symbol, not on the requested range."""
+        provider = MockMarketDataProvider(seed=7)
+        other = MockMarketDataProvider(seed=7)
+
+        long_range = await provider.fetch_price_data(
+            _request("SYN0003", "2022-01-01", "2024-06-30")
+        )
+        short_range = await other.fetch_price_data(_request("SYN0003", "2024-06-01", "2024-06-30"))
+
+        june = [bar for bar in long_range if bar.timestamp.strftime("%Y-%m") == "2024-06"]
+        assert short_range == june
+
+    async def test_symbols_and_seeds_differ(self) -> None:
+        """Different symbols or seeds produce different series."""
+        request_a = _request("SYN0004", "2024-01-01", "2024-03-31")
+        request_b = _request("SYN0005", "2024-01-01", "2024-03-31")
+
+        a = await MockMarketDataProvider(seed=7).fetch_price_data(request_a)
+        b = await MockMarketDataProvider(seed=7).fetch_price_data(request_b)
+        c = await MockMarketDataProvider(seed=8).fetch_price_data(request_a)
+
+        assert [bar.close_price for bar in a] != [bar.close_price for bar in b]
+        assert [bar.close_price for bar in a] != [bar.close_price for bar in c]
+
+    async def test_default_mode_unchanged(self) -> None:
+        """Without a seed every calendar day gets the fixed uptrend."""
+        provider = MockMarketDataProvider()
+
+        bars = await provider.fetch_price_data(_request("AAPL", "2024-01-06", "2024-01-07"))
+
+        assert [bar.open_price for bar in bars] == [Decimal("100.00"), Decimal("101.0000")]
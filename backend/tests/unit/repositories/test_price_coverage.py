@@ -0,0 +1,101 @@
+"""Unit tests for the fetched-range (price_coverage) index of StockPriceRepository."""
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.stock import PriceCoverageSegment
+from app.repositories.stock_price import DateRange, StockPriceRepository, merge_date_ranges
+
+
+class TestMergeDateRanges:
+    """Tests for merge_date_ranges."""
+
+    def test_merges_overlapping_and_adjacent_ranges(self):
+        """Overlapping and back-to-back ranges collapse; separated ones stay apart."""
+        ranges = [
+            DateRange(date(2024, 1, 10), date(2024, 1, 12)),
+            DateRange(date(2024, 1, 1), date(2024, 1, 5)),
+            DateRange(date(2024, 1, 4), date(2024, 1, 8)),
+            DateRange(date(2024, 1, 9), date(2024, 1, 9)),
+            DateRange(date(2024, 1, 20), date(2024, 1, 21)),
+        ]
+
+        assert merge_date_ranges(ranges) == [
+            DateRange(date(2024, 1, 1), date(2024, 1, 12)),
+            DateRange(date(2024, 1, 20), date(2024, 1, 21)),
+        ]
+
+    def test_contained_range_does_not_shrink(self):
+        """A range inside another keeps the outer end date."""
+        ranges = [
+            DateRange(date(2024, 1, 1), date(2024, 1, 31)),
+            DateRange(date(2024, 1, 5), date(2024, 1, 6)),
+        ]
+
+        assert merge_date_ranges(ranges) == [DateRange(date(2024, 1, 1), date(2024, 1, 31))]
+
+
+class TestAddFetchedRange:
+    """Tests for StockPriceRepository.add_fetched_range."""
+
+    @pytest.mark.asyncio
+    async def test_replaces_touching_segments_with_merged_one(self):
+        """Deleted neighbouring segments are folded into the inserted segment."""
+        session = AsyncMock()
+        session.add = MagicMock()
+        session.execute.return_value = [
+            SimpleNamespace(start_date=date(2024, 1, 1), end_date=date(2024, 1, 9)),
+            SimpleNamespace(start_date=date(2024, 1, 16), end_date=date(2024, 1, 31)),
+        ]
+        repo = StockPriceRepository(session)
+
+        merged = await repo.add_fetched_range("aapl", date(2024, 1, 10), date(2024, 1, 15))
+
+        assert merged == DateRange(date(2024, 1, 1), date(2024, 1, 31))
+        segment = session.add.call_args.args[0]
+        assert isinstance(segment, PriceCoverageSegment)
+        assert (segment.symbol, segment.interval) == ("AAPL", "1d")
+        assert (segment.start_date, segment.end_date) == (date(2024, 1, 1), date(2024, 1, 31))
+        session.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reads_merge_overlapping_segments(self):
+        """Segments left overlapping by concurrent writers are merged on read."""
+        session = AsyncMock()
+        session.execute.return_value = [
+            SimpleNamespace(symbol="AAPL", start_date=date(2024, 1, 5), end_date=date(2024, 1, 20)),
+            SimpleNamespace(symbol="AAPL", start_date=date(2024, 1, 1), end_date=date(2024, 1, 10)),
+            SimpleNamespace(symbol="MSFT", start_date=date(2024, 1, 1), end_date=date(2024, 1, 2)),
+        ]
+        repo = StockPriceRepository(session)
+
+        ranges = await repo.get_fetched_ranges_for_symbols(
+            ["AAPL", "MSFT", "TSLA"], date(2024, 1, 1), date(2024, 1, 31)
+        )
+
+        assert ranges == {
+            "AAPL": [DateRange(date(2024, 1, 1), date(2024, 1, 20))],
+            "MSFT": [DateRange(date(2024, 1, 1), date(2024, 1, 2))],
+        }
+
+
+class TestForgetFetchedRanges:
+    """Tests for StockPriceRepository.forget_fetched_ranges_through."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_then_trims_segments(self):
+        """Segments ending by the day are deleted; spanning ones start the day after."""
+        session = AsyncMock()
+        session.execute.side_effect = [SimpleNamespace(rowcount=2), SimpleNamespace(rowcount=1)]
+        repo = StockPriceRepository(session)
+
+        changed = await repo.forget_fetched_ranges_through(date(2024, 1, 10), ["5m"])
+
+        assert changed == 3
+        delete_stmt, update_stmt = (call.args[0] for call in session.execute.await_args_list)
+        assert delete_stmt.is_delete
+        assert update_stmt.is_update
+        params = update_stmt.compile().params
+        assert date(2024, 1, 11) in params.values()
@@ -1,7 +1,7 @@
 """Unit tests for Arena schema validation.
 
-Tests Pydantic-level validation for CreateSimulationRequest and
-CreateComparisonRequest — no DB or HTTP needed.
+Tests Pydantic-level validation for CreateSimulationRequest,
+CreateComparisonRequest and CreateWalkForwardRequest — no DB or HTTP needed.
 """
 
 from datetime import date
@@ -9,7 +9,11 @@ from datetime import date
 import pytest
 from pydantic import ValidationError
 
-from app.schemas.arena import CreateComparisonRequest, CreateSimulationRequest
+from app.schemas.arena import (
+    CreateComparisonRequest,
+    CreateSimulationRequest,
+    CreateWalkForwardRequest,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -187,3 +191,30 @@ class TestCreateComparisonSizingMode:
         msg = str(exc_info.value)
         assert "fixed_pct" in msg
         assert "position_size_pct" in msg
+
+
+# ===========================================================================
+# CreateWalkForwardRequest tests
+# ===========================================================================
+
+
+class TestCreateWalkForwardStepDays:
+    """Validate that walk-forward test periods cannot overlap."""
+
+    @pytest.mark.unit
+    def test_rejects_step_days_below_test_days(self) -> None:
+        """step_days < test_days would overlap consecutive test periods."""
+        with pytest.raises(ValidationError) as exc_info:
+            CreateWalkForwardRequest(**_sim_kwargs(train_days=30, test_days=20, step_days=10))
+
+        assert "step_days" in str(exc_info.value)
+
+    @pytest.mark.unit
+    def test_accepts_step_days_equal_to_or_above_test_days(self) -> None:
+        """Back-to-back or gapped test periods are valid."""
+        for step_days in (None, 20, 25):
+            req = CreateWalkForwardRequest(
+                **_sim_kwargs(train_days=30, test_days=20, step_days=step_days)
+            )
+
+            assert req.step_days == step_days
@@ -0,0 +1,123 @@
+"""Unit tests for the compact DecisionLog snapshot encoding."""
+
+import pytest
+
+from app.services.arena.agent_protocol import AgentDecision
+from app.services.arena.decision_log import DecisionLog, snapshot_decisions
+
+SYMBOLS = ["AAPL", "MSFT", "GOOGL", "NVDA", "TSLA"]
+
+
+def _decision(symbol: str, action: str, score: int | None = None) -> AgentDecision:
+    return AgentDecision(symbol=symbol, action=action, score=score, reasoning="text")
+
+
+def _sample_log(buy_only: bool = False) -> DecisionLog:
+    log = DecisionLog(SYMBOLS, buy_only=buy_only)
+    log.record("AAPL", _decision("AAPL", "BUY", 80), has_position=False)
+    log.record("MSFT", _decision("MSFT", "NO_SIGNAL", 40), has_position=False)
+    log.record("GOOGL", _decision("GOOGL", "HOLD"), has_position=True)
+    log.record_no_data("NVDA", has_history=True)
+    log.record_no_data("TSLA", has_history=False)
+    log.mark_selected("AAPL", True)
+    return log
+
+
+@pytest.mark.unit
+class TestDecisionLog:
+    """Tests for DecisionLog recording and serialization."""
+
+    def test_to_dict_matches_legacy_shape(self) -> None:
+        """Decoded entries use the JSON snapshot shape, without agent reasoning."""
+        assert _sample_log().to_dict() == {
+            "AAPL": {"action": "BUY", "score": 80, "reasoning": None, "portfolio_selected": True},
+            "MSFT": {"action": "NO_SIGNAL", "score": 40, "reasoning": None},
+            "GOOGL": {"action": "HOLD", "score": None, "reasoning": None},
+            "NVDA": {"action": "NO_DATA", "reasoning": "No data for today"},
+            "TSLA": {"action": "NO_DATA", "reasoning": "No price data"},
+        }
+
+    def test_round_trips_through_bytes(self) -> None:
+        """from_bytes restores every recorded row."""
+        log = _sample_log()
+        log.record("TSLA", _decision("TSLA", "BUY", 70), has_position=False)
+        log.mark_ibs_filtered("TSLA", 0.8123)
+
+        restored = DecisionLog.from_bytes(SYMBOLS, log.to_bytes())
+
+        assert restored.to_dict() == log.to_dict()
+        assert restored.to_dict()["TSLA"] == {
+            "action": "BUY",
+            "score": 70,
+            "reasoning": None,
+            "ibs_filtered": True,
+            "ibs_value": 0.8123,
+            "portfolio_selected": False,
+        }
+
+    def test_reasoning_is_filled_from_mapping(self) -> None:
+        """Reasoning passed to to_dict fills agent decisions only."""
+        decisions = _sample_log().to_dict({"AAPL": "Trend OK; score 80", "NVDA": "ignored"})
+
+        assert decisions["AAPL"]["reasoning"] == "Trend OK; score 80"
+        assert decisions["NVDA"]["reasoning"] == "No data for today"
+
+    def test_evaluated_yields_agent_decisions_with_position_flag(self) -> None:
+        """evaluated skips NO_DATA rows and reports whether the symbol was held."""
+        assert list(_sample_log().evaluated()) == [
+            ("AAPL", False),
+            ("MSFT", False),
+            ("GOOGL", True),
+        ]
+
+    def test_buy_only_records_only_buy_signals(self) -> None:
+        """buy_only drops non-BUY and NO_DATA decisions."""
+        assert _sample_log(buy_only=True).to_dict() == {
+            "AAPL": {"action": "BUY", "score": 80, "reasoning": None, "portfolio_selected": True},
+        }
+
+    def test_empty_log_round_trips(self) -> None:
+        """A day with nothing recorded decodes to an empty dict."""
+        blob = DecisionLog(SYMBOLS, buy_only=True).to_bytes()
+
+        assert DecisionLog.from_bytes(SYMBOLS, blob).to_dict() == {}
+
+    def test_blob_is_much_smaller_than_json(self) -> None:
+        """A 600-symbol day compresses to a few KB."""
+        symbols = [f"S{i:04d}" for i in range(600)]
+        log = DecisionLog(symbols)
+        for i, symbol in enumerate(symbols):
+            log.record(symbol, _decision(symbol, "NO_SIGNAL", i % 100), has_position=False)
+
+        assert len(log.to_bytes()) < 4000
+
+    def test_rejects_unknown_version(self) -> None:
+        """Blobs from a future format are rejected."""
+        import zlib
+
+        with pytest.raises(ValueError, match="version"):
+            DecisionLog.from_bytes(SYMBOLS, zlib.compress(b"\x09\x00\x00\x00\x00"))
+
+    def test_rejects_symbol_index_out_of_range(self) -> None:
+        """A log decoded against a shorter symbol list is rejected."""
+        blob = _sample_log().to_bytes()
+
+        with pytest.raises(ValueError, match="more symbols"):
+            DecisionLog.from_bytes(SYMBOLS[:2], blob)
+
+
+@pytest.mark.unit
+class TestSnapshotDecisions:
+    """Tests for snapshot_decisions."""
+
+    def test_prefers_decision_log(self) -> None:
+        """Snapshots with a decision log are decoded from it."""
+        blob = _sample_log().to_bytes()
+
+        assert snapshot_decisions(SYMBOLS, blob, {}) == _sample_log().to_dict()
+
+    def test_falls_back_to_legacy_json(self) -> None:
+        """Snapshots written before the decision log return their JSON decisions."""
+        legacy = {"AAPL": {"action": "HOLD", "score": None, "reasoning": "Holding"}}
+
+        assert snapshot_decisions(SYMBOLS, None, legacy) == legacy
@@ -0,0 +1,176 @@
+"""Unit tests for the vectorized arena exit rules."""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.models.arena import ExitReason
+from app.services.arena.exit_rules import (
+    EXIT_REASONS,
+    NO_EXIT,
+    ExitRules,
+    evaluate_exits,
+    price_units,
+)
+from app.services.arena.trailing_stop import (
+    FixedPercentTrailingStop,
+    from_price_units,
+    to_multiplier_units,
+    trail_multiplier_units,
+)
+
+
+def _units(*prices: str) -> np.ndarray:
+    return price_units(np.array([float(p) for p in prices]))
+
+
+def _evaluate(rules: ExitRules, rows: list[dict], trail_pct: str = "5.0", atr_pct=None):
+    """Evaluate rows of ``{open, high, low, close, entry, highest, stop[, hold]}``."""
+
+    def column(name: str) -> np.ndarray:
+        return _units(*(row[name] for row in rows))
+
+    return evaluate_exits(
+        rules,
+        open_=column("open"),
+        high=column("high"),
+        low=column("low"),
+        close=column("close"),
+        entry=column("entry"),
+        highest=column("highest"),
+        stop=column("stop"),
+        trail_multiplier=np.full(len(rows), trail_multiplier_units(Decimal(trail_pct))),
+        hold_days=np.array([row.get("hold", 0) for row in rows]),
+        atr_pct=None if atr_pct is None else np.array(atr_pct, dtype=np.float64),
+    )
+
+
+def _row(open_, high, low, close, entry="100", highest="100", stop="95", hold=0) -> dict:
+    return {
+        "open": open_, "high": high, "low": low, "close": close,
+        "entry": entry, "highest": highest, "stop": stop, "hold": hold,
+    }
+
+
+@pytest.mark.unit
+class TestEvaluateExits:
+    """Tests for evaluate_exits."""
+
+    def test_trailing_stop_matches_fixed_percent_stop(self) -> None:
+        """New highs, ties and triggers agree with FixedPercentTrailingStop.update()."""
+        rows = [
+            _row("106", "110", "105", "108"),  # New high raises stop
+            _row("106", "108", "105", "107", highest="110", stop="104.5"),  # No new high
+            _row("104", "106", "104.5", "105", highest="110", stop="104.5"),  # Low touches stop
+            _row("100", "100.003", "99", "100"),  # 95.002850 ties to even
+        ]
+        batch = _evaluate(ExitRules(), rows)
+        trailing = FixedPercentTrailingStop(Decimal("5.0"))
+
+        for i, row in enumerate(rows):
+            expected = trailing.update(
+                Decimal(row["high"]), Decimal(row["low"]),
+                Decimal(row["highest"]), Decimal(row["stop"]),
+            )
+            assert bool(batch.reason[i] != NO_EXIT) is expected.stop_triggered
+            assert from_price_units(int(batch.highest[i])) == expected.highest_price
+            assert from_price_units(int(batch.stop[i])) == expected.stop_price
+
+    def test_stop_fills_at_open_on_gap_down(self) -> None:
+        """A stop exit fills at min(stop, open)."""
+        batch = _evaluate(
+            ExitRules(),
+            [_row("96", "97", "94", "95"), _row("93", "94", "92", "93")],
+        )
+
+        assert [EXIT_REASONS[code] for code in batch.reason] == [ExitReason.STOP_HIT] * 2
+        assert batch.exit_price.tolist() == _units("95", "93").tolist()
+
+    def test_breakeven_and_ratchet_floors(self) -> None:
+        """Breakeven pins the stop at entry; the ratchet trails the high more tightly."""
+        rules = ExitRules(
+            breakeven_multiplier=to_multiplier_units(Decimal("1.02")),
+            ratchet_multiplier=to_multiplier_units(Decimal("1.05")),
+            ratchet_stop_multiplier=to_multiplier_units(Decimal("0.98")),
+        )
+        batch = _evaluate(
+            rules,
+            [
+                _row("101", "101.99", "100.5", "101"),  # Below the breakeven trigger
+                _row("101", "102", "100.5", "101"),  # Breakeven: stop -> entry
+                _row("104", "106", "103", "105"),  # Ratchet: 106 * 0.98
+            ],
+            trail_pct="10.0",
+        )
+
+        assert batch.stop.tolist() == _units("95", "100", "103.88").tolist()
+        assert (batch.reason == NO_EXIT).all()
+
+    def test_ratchet_stop_rounds_half_up(self) -> None:
+        """Ratchet stops round half-up, like the Numeric column they are stored in."""
+        rules = ExitRules(
+            ratchet_multiplier=to_multiplier_units(Decimal("1.01")),
+            ratchet_stop_multiplier=to_multiplier_units(Decimal("0.95")),
+        )
+
+        # 101.003 * 0.95 = 95.95285
+        batch = _evaluate(rules, [_row("101", "101.003", "100", "101")], trail_pct="10.0")
+
+        assert batch.stop.tolist() == _units("95.9529").tolist()
+
+    def test_take_profit_fills_at_open_on_gap_up(self) -> None:
+        """Take profit fires on the high; the fill floor is today's open."""
+        batch = _evaluate(
+            ExitRules(take_profit_pct=5.0),
+            [_row("101", "105", "100", "104"), _row("107", "108", "106", "107")],
+        )
+
+        assert [EXIT_REASONS[code] for code in batch.reason] == [ExitReason.TAKE_PROFIT] * 2
+        fills = [
+            max(batch.take_profit_price(i, Decimal("100")), from_price_units(int(price)))
+            for i, price in enumerate(batch.exit_price)
+        ]
+        assert fills == [Decimal("105"), Decimal("107")]
+
+    def test_stop_takes_precedence_over_take_profit(self) -> None:
+        """A triggered stop wins even when the high clears the take-profit target."""
+        batch = _evaluate(ExitRules(take_profit_pct=5.0), [_row("100", "110", "94", "100")])
+
+        assert EXIT_REASONS[batch.reason[0]] is ExitReason.STOP_HIT
+        assert np.isnan(batch.take_profit_pct[0])
+
+    def test_atr_take_profit_skips_missing_atr(self) -> None:
+        """ATR targets use each position's ATR%; NaN ATR never triggers."""
+        rows = [_row("101", "106", "100", "105"), _row("101", "106", "100", "105")]
+
+        batch = _evaluate(ExitRules(take_profit_atr_mult=2.0), rows, atr_pct=[2.5, np.nan])
+
+        assert EXIT_REASONS[batch.reason[0]] is ExitReason.TAKE_PROFIT
+        assert batch.take_profit_pct[0] == 5.0
+        assert batch.reason[1] == NO_EXIT
+
+    def test_max_hold_extends_for_profitable_positions(self) -> None:
+        """Positions closing above entry use max_hold_days_profit."""
+        rules = ExitRules(max_hold_days=5, max_hold_days_profit=8)
+        batch = _evaluate(
+            rules,
+            [
+                _row("99", "100", "98", "99", hold=5),  # Losing: exits at 5 days
+                _row("101", "102", "100", "101", hold=5),  # Profitable: holds
+                _row("101", "102", "100", "101.5", hold=8),  # Profitable: exits at 8 days
+            ],
+        )
+
+        assert [EXIT_REASONS[code] for code in batch.reason] == [
+            ExitReason.MAX_HOLD,
+            None,
+            ExitReason.MAX_HOLD,
+        ]
+        assert batch.exit_price[[0, 2]].tolist() == _units("99", "101.5").tolist()
+
+    def test_empty_batch(self) -> None:
+        """No open positions yields empty arrays."""
+        batch = _evaluate(ExitRules(take_profit_pct=5.0, max_hold_days=3), [])
+
+        assert len(batch.reason) == 0
@@ -4,14 +4,16 @@ Tests the Live20 mean reversion agent for arena simulations,
 ensuring it produces the same decisions as Live20Service.
 """
 
-from datetime import date
+import random
+from datetime import date, timedelta
 from decimal import Decimal
 
 import pytest
 
-from app.services.arena.agent_protocol import AgentDecision, PriceBar
+from app.models.recommendation import ScoringAlgorithm
+from app.services.arena.agent_protocol import AgentDecision, PriceBar, PriceWindow
 from app.services.arena.agents.live20_agent import Live20ArenaAgent
-from app.services.live20_evaluator import CriterionResult
+from app.services.live20_evaluator import CriterionResult, Live20Evaluator
 
 
 class TestLive20ArenaAgentProperties:
@@ -927,6 +929,233 @@ class TestLive20ArenaAgentConsistency:
         # Flat data typically results in NO_SIGNAL
         assert decision.action == "NO_SIGNAL"
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("scoring_algorithm", ["cci", "rsi2"])
+    async def test_long_history_matches_full_batch_evaluation(
+        self, scoring_algorithm: str
+    ) -> None:
+        """Evaluating only the trailing window gives the same criteria as full history."""
+        rng = random.Random(42)
+        agent = Live20ArenaAgent({"scoring_algorithm": scoring_algorithm, "min_buy_score": 25})
+        evaluator = Live20Evaluator()
+
+        for _ in range(50):
+            bars = []
+            price = 100.0
+            for i in range(90):
+                open_ = price * (1 + rng.gauss(0, 0.02))
+                close = open_ * (1 + rng.gauss(-0.003, 0.03))
+                high = max(open_, close) * (1 + abs(rng.gauss(0, 0.01)))
+                low = min(open_, close) * (1 - abs(rng.gauss(0, 0.01)))
+                bars.append(
+                    PriceBar(
+                        date=date(2024, 1, 1) + timedelta(days=i),
+                        open=Decimal(str(round(open_, 4))),
+                        high=Decimal(str(round(high, 4))),
+                        low=Decimal(str(round(low, 4))),
+                        close=Decimal(str(round(close, 4))),
+                        volume=rng.randint(100_000, 5_000_000),
+                    )
+                )
+                price = close
+
+            decision = await agent.evaluate(
+                symbol="AAPL",
+                price_history=bars,
+                current_date=bars[-1].date,
+                has_open_position=False,
+            )
+            criteria, _, momentum, _ = evaluator.evaluate_criteria(
+                [float(b.open) for b in bars],
+                [float(b.high) for b in bars],
+                [float(b.low) for b in bars],
+                [float(b.close) for b in bars],
+                [float(b.volume) for b in bars],
+                scoring_algorithm=ScoringAlgorithm(scoring_algorithm),
+            )
+            signal_criteria = [c for c in criteria if c.name != "trend"]
+            expected_score = sum(c.score_for_long for c in signal_criteria if c.aligned_for_long)
+
+            aligned = [c.name for c in signal_criteria if c.aligned_for_long]
+
+            assert decision.score == expected_score
+            assert f"Aligned: {', '.join(aligned) if aligned else 'none'}" in decision.reasoning
+            if decision.metadata is not None and scoring_algorithm == "cci":
+                assert decision.metadata["cci_value"] == momentum.value
+                assert decision.metadata["cci_direction"] == momentum.direction.value
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("scoring_algorithm", ["cci", "rsi2"])
+    async def test_precomputed_signals_match_per_day_evaluate(
+        self, scoring_algorithm: str
+    ) -> None:
+        """Precomputed decisions equal evaluate() on each day's history prefix."""
+        rng = random.Random(7)
+        agent = Live20ArenaAgent({"scoring_algorithm": scoring_algorithm, "min_buy_score": 50})
+        bars = []
+        price = 100.0
+        for i in range(80):
+            open_ = price * (1 + rng.gauss(0, 0.01))
+            close = open_ * (1 + rng.gauss(-0.003, 0.03))
+            bars.append(
+                PriceBar(
+                    date=date(2024, 1, 1) + timedelta(days=i),
+                    open=Decimal(str(round(open_, 4))),
+                    high=Decimal(str(round(max(open_, close) * 1.005, 4))),
+                    low=Decimal(str(round(min(open_, close) * 0.995, 4))),
+                    close=Decimal(str(round(close, 4))),
+                    volume=rng.randint(100_000, 5_000_000),
+                )
+            )
+            price = close
+
+        signals = agent.precompute_signals(PriceWindow.from_bars(bars))
+
+        for i, bar in enumerate(bars):
+            expected = await agent.evaluate("AAPL", bars[: i + 1], bar.date, False)
+            actual = signals.decide("AAPL", bar.date, False, i + 1)
+
+            assert actual == expected
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_short_circuit_trend_matches_per_day_evaluate(self) -> None:
+        """With the trend gate short-circuited, both paths still agree day by day."""
+        rng = random.Random(7)
+        agent = Live20ArenaAgent({"min_buy_score": 50, "short_circuit_trend": True})
+        bars = []
+        price = 100.0
+        for i in range(80):
+            open_ = price * (1 + rng.gauss(0, 0.01))
+            close = open_ * (1 + rng.gauss(-0.003, 0.03))
+            bars.append(
+                PriceBar(
+                    date=date(2024, 1, 1) + timedelta(days=i),
+                    open=Decimal(str(round(open_, 4))),
+                    high=Decimal(str(round(max(open_, close) * 1.005, 4))),
+                    low=Decimal(str(round(min(open_, close) * 0.995, 4))),
+                    close=Decimal(str(round(close, 4))),
+                    volume=rng.randint(100_000, 5_000_000),
+                )
+            )
+            price = close
+
+        signals = agent.precompute_signals(PriceWindow.from_bars(bars))
+        gated = 0
+
+        for i, bar in enumerate(bars):
+            expected = await agent.evaluate("AAPL", bars[: i + 1], bar.date, False)
+            actual = signals.decide("AAPL", bar.date, False, i + 1)
+
+            assert actual == expected
+            if i >= 24 and expected.score is None:
+                gated += 1
+        assert gated > 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_short_circuit_trend_skips_other_criteria(self) -> None:
+        """Symbols failing the trend gate get NO_SIGNAL without a score."""
+        agent = Live20ArenaAgent({"short_circuit_trend": True})
+        bars = [
+            PriceBar(
+                date=date(2024, 1, 1) + timedelta(days=i),
+                open=Decimal(str(100 + i)),
+                high=Decimal(str(101 + i)),
+                low=Decimal(str(99 + i)),
+                close=Decimal(str(100 + i)),
+                volume=1000000,
+            )
+            for i in range(30)
+        ]
+
+        decision = await agent.evaluate("AAPL", bars, bars[-1].date, False)
+
+        assert decision.action == "NO_SIGNAL"
+        assert decision.score is None
+        assert "other criteria not evaluated" in decision.reasoning
+
+    @pytest.mark.unit
+    def test_precomputed_signals_hold_and_unknown_date(self) -> None:
+        """Open positions HOLD; dates outside the history defer to evaluate()."""
+        agent = Live20ArenaAgent()
+        bars = [
+            PriceBar(
+                date=date(2024, 1, 1) + timedelta(days=i),
+                open=Decimal("100"),
+                high=Decimal("101"),
+                low=Decimal("99"),
+                close=Decimal("100"),
+                volume=1000000,
+            )
+            for i in range(30)
+        ]
+        signals = agent.precompute_signals(PriceWindow.from_bars(bars))
+
+        assert signals.decide("AAPL", date(2024, 1, 30), True, 30).action == "HOLD"
+        assert signals.decide("AAPL", date(2024, 3, 1), False, 30) is None
+
+    @pytest.mark.unit
+    def test_signal_key_ignores_min_buy_score(self) -> None:
+        """Only scoring inputs affect signal_key, so sweeps over thresholds share signals."""
+        base = Live20ArenaAgent({"min_buy_score": 60})
+
+        assert Live20ArenaAgent({"min_buy_score": 80}).signal_key == base.signal_key
+        assert Live20ArenaAgent({"scoring_algorithm": "rsi2"}).signal_key != base.signal_key
+        assert Live20ArenaAgent({"short_circuit_trend": True}).signal_key != base.signal_key
+
+    @pytest.mark.unit
+    def test_bound_signals_apply_new_agent_threshold(self) -> None:
+        """bind() reuses the criteria but decides with the bound agent's min_buy_score."""
+        rng = random.Random(11)
+        bars = []
+        price = 100.0
+        for i in range(80):
+            open_ = price * (1 + rng.gauss(0, 0.01))
+            close = open_ * (1 + rng.gauss(-0.003, 0.03))
+            bars.append(
+                PriceBar(
+                    date=date(2024, 1, 1) + timedelta(days=i),
+                    open=Decimal(str(round(open_, 4))),
+                    high=Decimal(str(round(max(open_, close) * 1.005, 4))),
+                    low=Decimal(str(round(min(open_, close) * 0.995, 4))),
+                    close=Decimal(str(round(close, 4))),
+                    volume=rng.randint(100_000, 5_000_000),
+                )
+            )
+            price = close
+        window = PriceWindow.from_bars(bars)
+        strict = Live20ArenaAgent({"min_buy_score": 80})
+
+        bound = Live20ArenaAgent({"min_buy_score": 40}).precompute_signals(window).bind(strict)
+        expected = strict.precompute_signals(window)
+
+        for i, bar in enumerate(bars):
+            assert bound.decide("AAPL", bar.date, False, i + 1) == expected.decide(
+                "AAPL", bar.date, False, i + 1
+            )
+
+    @pytest.mark.unit
+    def test_bind_rejects_different_signal_key(self) -> None:
+        """Signals scored with another algorithm cannot be rebound."""
+        bars = [
+            PriceBar(
+                date=date(2024, 1, 1) + timedelta(days=i),
+                open=Decimal("100"),
+                high=Decimal("101"),
+                low=Decimal("99"),
+                close=Decimal("100"),
+                volume=1000000,
+            )
+            for i in range(30)
+        ]
+        signals = Live20ArenaAgent().precompute_signals(PriceWindow.from_bars(bars))
+
+        with pytest.raises(ValueError, match="signal_key"):
+            signals.bind(Live20ArenaAgent({"scoring_algorithm": "rsi2"}))
+
 
 class TestLive20ArenaAgentMetadata:
     """Tests verifying enriched metadata is populated on BUY decisions.
@@ -0,0 +1,113 @@
+"""Unit tests for the precomputed market regime series."""
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.services.arena.agent_protocol import PriceBar, PriceWindow
+from app.services.arena.market_regime import regime_lookback_days, regime_on, regime_series
+
+
+def _window(closes: list[float], start: date = date(2024, 1, 1), step: int = 1) -> PriceWindow:
+    """Build a regime symbol window with one bar every ``step`` days."""
+    return PriceWindow.from_bars(
+        [
+            PriceBar(
+                date=start + timedelta(days=i * step),
+                open=Decimal(str(close)),
+                high=Decimal(str(close + 1)),
+                low=Decimal(str(close - 1)),
+                close=Decimal(str(close)),
+                volume=10_000_000,
+            )
+            for i, close in enumerate(closes)
+        ]
+    )
+
+
+def _per_day_regime(history: PriceWindow, current_date: date, sma_period: int) -> str:
+    """Reference: rebuild the lookback window and sum the SMA for one day."""
+    day = np.datetime64(current_date, "D")
+    start = day - np.timedelta64(regime_lookback_days(sma_period), "D")
+    mask = (history.dates >= start) & (history.dates <= day)
+    closes = history.closes[mask]
+    if len(closes) < sma_period:
+        return "neutral"
+    recent = closes[-sma_period:].tolist()
+    sma = sum(recent) / len(recent)
+    return "bull" if float(closes[-1]) > sma else "bear"
+
+
+@pytest.mark.unit
+class TestRegimeSeries:
+    """Tests for regime_series and regime_on."""
+
+    def test_bull_and_bear(self) -> None:
+        """Close above the SMA is bull; at or below it is bear."""
+        above = _window([100.0] * 19 + [150.0])
+        below = _window([100.0] * 19 + [50.0])
+        flat = _window([100.0] * 20)
+
+        assert regime_on(above, date(2024, 1, 20), 20) == "bull"
+        assert regime_on(below, date(2024, 1, 20), 20) == "bear"
+        assert regime_on(flat, date(2024, 1, 20), 20) == "bear"
+
+    def test_neutral_with_insufficient_bars(self) -> None:
+        """Fewer than sma_period bars up to the date is neutral."""
+        history = _window([100.0] * 25)
+
+        assert regime_on(history, date(2024, 1, 5), 20) == "neutral"
+        assert regime_on(history, date(2023, 12, 1), 20) == "neutral"
+        assert regime_on(PriceWindow.empty(), date(2024, 1, 5), 20) == "neutral"
+
+    def test_no_lookahead(self) -> None:
+        """Bars after the date do not affect its regime."""
+        history = _window([100.0] * 20 + [200.0] * 10)
+
+        assert regime_on(history, date(2024, 1, 20), 20) == "bear"
+        assert regime_on(history, date(2024, 1, 21), 20) == "bull"
+
+    def test_bars_older_than_lookback_window_are_ignored(self) -> None:
+        """A sparse history falls back to neutral, like the windowed lookup."""
+        # One bar a week: 5 bars fit in the 40-day window, sma_period=5
+        history = _window([100.0] * 10, step=7)
+
+        assert regime_on(history, date(2024, 2, 5), 5) == "bear"
+        # 16 days after the last bar, only 4 bars remain in the window
+        assert regime_on(history, date(2024, 3, 20), 5) == "neutral"
+
+    def test_matches_per_day_window(self) -> None:
+        """Every date agrees with the per-day window and sum()."""
+        rng = random.Random(3)
+        closes = []
+        price = 400.0
+        for _ in range(300):
+            price = round(price * (1 + rng.gauss(0, 0.01)), 4)
+            # Repeated closes exercise close == SMA ties
+            closes.append(closes[-1] if closes and rng.random() < 0.2 else price)
+        # Weekday bars only, so lookback windows span weekends
+        start = date(2023, 1, 2)
+        days = [start + timedelta(days=i) for i in range(420)]
+        trading = [d for d in days if d.weekday() < 5][: len(closes)]
+        history = PriceWindow.from_bars(
+            [
+                PriceBar(
+                    date=d,
+                    open=Decimal(str(c)),
+                    high=Decimal(str(c + 1)),
+                    low=Decimal(str(c - 1)),
+                    close=Decimal(str(c)),
+                    volume=1,
+                )
+                for d, c in zip(trading, closes)
+            ]
+        )
+        query = np.array(days, dtype="datetime64[D]")
+
+        for sma_period in (1, 5, 20, 50):
+            series = regime_series(history, query, sma_period)
+
+            assert series == [_per_day_regime(history, d, sma_period) for d in days]
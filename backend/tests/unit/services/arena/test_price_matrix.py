@@ -0,0 +1,283 @@
+"""Unit tests for the columnar PriceMatrix / PriceWindow price store."""
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.providers.base import PriceDataPoint
+from app.services.arena.agent_protocol import PriceBar, PriceWindow
+from app.services.arena.price_matrix import PriceMatrix
+
+
+def _bar(day: int, close: str, volume: int = 1_000_000) -> PriceBar:
+    """Build a PriceBar in January 2024 with a 1-point range around close."""
+    c = Decimal(close)
+    return PriceBar(
+        date=date(2024, 1, day),
+        open=c,
+        high=c + 1,
+        low=c - 1,
+        close=c,
+        volume=volume,
+    )
+
+
+def _record(symbol: str, day: int, close: str) -> PriceDataPoint:
+    """Build a PriceDataPoint with Numeric(12, 4)-style Decimals."""
+    c = Decimal(close).quantize(Decimal("0.0001"))
+    return PriceDataPoint(
+        symbol=symbol,
+        timestamp=datetime(2024, 1, day, tzinfo=timezone.utc),
+        open_price=c,
+        high_price=c + 1,
+        low_price=c - 1,
+        close_price=c,
+        volume=500,
+    )
+
+
+class TestPriceMatrixConstruction:
+    """Tests for building a PriceMatrix."""
+
+    @pytest.mark.unit
+    def test_from_bars_aligns_symbols_on_union_dates(self):
+        """Symbols with different dates share one sorted date index."""
+        matrix = PriceMatrix.from_bars(
+            {
+                "AAPL": [_bar(2, "100"), _bar(3, "101")],
+                "MSFT": [_bar(3, "200"), _bar(4, "201")],
+            }
+        )
+
+        assert list(matrix) == ["AAPL", "MSFT"]
+        assert matrix.trading_days(date(2024, 1, 1), date(2024, 1, 31)) == [
+            date(2024, 1, 2),
+            date(2024, 1, 3),
+            date(2024, 1, 4),
+        ]
+
+    @pytest.mark.unit
+    def test_from_records_round_trips_decimal_prices(self):
+        """Materialized bars equal the original Numeric(12, 4) values."""
+        matrix = PriceMatrix.from_records({"AAPL": [_record("AAPL", 2, "100.5")]})
+
+        bar = matrix.bar("AAPL", date(2024, 1, 2))
+
+        assert bar is not None
+        assert bar.close == Decimal("100.5000")
+        assert bar.high == Decimal("101.5000")
+        assert bar.volume == 500
+
+    @pytest.mark.unit
+    def test_from_records_rejects_invalid_bar(self):
+        """OHLC invariants are enforced for the whole column at load time."""
+        bad = PriceDataPoint(
+            symbol="AAPL",
+            timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            open_price=Decimal("100"),
+            high_price=Decimal("99"),
+            low_price=Decimal("98"),
+            close_price=Decimal("99"),
+            volume=1,
+        )
+
+        with pytest.raises(ValueError, match="High price"):
+            PriceMatrix.from_records({"AAPL": [bad]})
+
+    @pytest.mark.unit
+    def test_with_records_adds_symbol_without_mutating_original(self):
+        """Auxiliary symbols (e.g. SPY) produce a new matrix."""
+        matrix = PriceMatrix.from_records({"AAPL": [_record("AAPL", 3, "100")]})
+
+        merged = matrix.with_records("SPY", [_record("SPY", 2, "400")])
+
+        assert "SPY" not in matrix
+        assert "SPY" in merged
+        assert merged.bar("AAPL", date(2024, 1, 3)).close == Decimal("100")
+        assert merged.trading_days(date(2024, 1, 1), date(2024, 1, 31)) == [
+            date(2024, 1, 2),
+            date(2024, 1, 3),
+        ]
+
+    @pytest.mark.unit
+    def test_empty_matrix(self):
+        """An empty matrix returns empty windows and no bars."""
+        matrix = PriceMatrix.empty()
+
+        assert len(matrix) == 0
+        assert len(matrix.window("AAPL", date(2024, 1, 1), date(2024, 1, 31))) == 0
+        assert matrix.bar("AAPL", date(2024, 1, 2)) is None
+
+
+class TestPriceMatrixAccess:
+    """Tests for window and bar lookups."""
+
+    @pytest.mark.unit
+    def test_window_filters_inclusive_date_range(self):
+        """Window includes both endpoints and only the symbol's own bars."""
+        matrix = PriceMatrix.from_bars(
+            {"AAPL": [_bar(d, str(100 + d)) for d in range(2, 10)]}
+        )
+
+        window = matrix.window("AAPL", date(2024, 1, 4), date(2024, 1, 6))
+
+        assert len(window) == 3
+        assert window.closes.tolist() == [104.0, 105.0, 106.0]
+        assert window.last_date == date(2024, 1, 6)
+
+    @pytest.mark.unit
+    def test_window_is_read_only_view(self):
+        """Contiguous windows share memory with the matrix and cannot be written."""
+        matrix = PriceMatrix.from_bars({"AAPL": [_bar(d, "100") for d in range(2, 6)]})
+
+        window = matrix.window("AAPL", date(2024, 1, 2), date(2024, 1, 5))
+
+        assert not window.closes.flags.writeable
+        with pytest.raises(ValueError):
+            window.closes[0] = 1.0
+
+    @pytest.mark.unit
+    def test_window_skips_dates_symbol_does_not_trade(self):
+        """Dates present only for other symbols never appear as NaN bars."""
+        matrix = PriceMatrix.from_bars(
+            {
+                "AAPL": [_bar(2, "100"), _bar(4, "102")],
+                "MSFT": [_bar(2, "200"), _bar(3, "201"), _bar(4, "202")],
+            }
+        )
+
+        window = matrix.window("AAPL", date(2024, 1, 1), date(2024, 1, 31))
+
+        assert window.closes.tolist() == [100.0, 102.0]
+        assert not np.isnan(window.highs).any()
+        assert window.dates.tolist() == [date(2024, 1, 2), date(2024, 1, 4)]
+
+    @pytest.mark.unit
+    def test_window_unknown_symbol_is_empty(self):
+        """Unknown symbols return an empty window instead of raising."""
+        matrix = PriceMatrix.from_bars({"AAPL": [_bar(2, "100")]})
+
+        assert len(matrix.window("MSFT", date(2024, 1, 1), date(2024, 1, 31))) == 0
+
+    @pytest.mark.unit
+    def test_bar_returns_matching_bar(self):
+        """bar() returns a Decimal PriceBar for the requested date."""
+        matrix = PriceMatrix.from_bars({"AAPL": [_bar(15, "100.00"), _bar(16, "101.00")]})
+
+        result = matrix.bar("AAPL", date(2024, 1, 16))
+
+        assert result is not None
+        assert result.date == date(2024, 1, 16)
+        assert result.open == Decimal("101.00")
+
+    @pytest.mark.unit
+    def test_bar_returns_none_when_symbol_missing_that_date(self):
+        """A date that exists only for another symbol yields None."""
+        matrix = PriceMatrix.from_bars(
+            {"AAPL": [_bar(15, "100")], "MSFT": [_bar(15, "200"), _bar(16, "201")]}
+        )
+
+        assert matrix.bar("AAPL", date(2024, 1, 16)) is None
+        assert matrix.bar("AAPL", date(2024, 1, 20)) is None
+
+    @pytest.mark.unit
+    def test_close_returns_float_close(self):
+        """close() reads one close as a float, None where bar() would be None."""
+        matrix = PriceMatrix.from_bars(
+            {"AAPL": [_bar(15, "100.25")], "MSFT": [_bar(15, "200"), _bar(16, "201")]}
+        )
+
+        assert matrix.close("AAPL", date(2024, 1, 15)) == 100.25
+        assert matrix.close("AAPL", date(2024, 1, 16)) is None
+        assert matrix.close("GOOGL", date(2024, 1, 15)) is None
+
+    @pytest.mark.unit
+    def test_day_prices_gathers_symbols_on_one_date(self):
+        """day_prices returns aligned OHLC arrays with NaN for missing bars."""
+        matrix = PriceMatrix.from_bars(
+            {"AAPL": [_bar(15, "100.25")], "MSFT": [_bar(15, "200"), _bar(16, "201")]}
+        )
+
+        opens, highs, lows, closes = matrix.day_prices(["MSFT", "AAPL", "GOOGL"], date(2024, 1, 15))
+
+        assert closes[:2].tolist() == [200.0, 100.25]
+        assert highs[:2].tolist() == [201.0, 101.25]
+        assert np.isnan(closes[2]) and np.isnan(opens[2]) and np.isnan(lows[2])
+        assert np.isnan(matrix.day_prices(["AAPL"], date(2024, 1, 16))[3]).all()
+        assert np.isnan(matrix.day_prices(["AAPL"], date(2024, 1, 20))[0]).all()
+
+    @pytest.mark.unit
+    def test_window_bounds_on_non_trading_days(self):
+        """Bounds that fall on gaps or outside the index clamp like bisect."""
+        matrix = PriceMatrix.from_bars(
+            {"AAPL": [_bar(5, "100"), _bar(8, "101"), _bar(9, "102")]}
+        )
+
+        assert matrix.window("AAPL", date(2024, 1, 6), date(2024, 1, 7)).closes.tolist() == []
+        assert matrix.window("AAPL", date(2024, 1, 6), date(2024, 1, 8)).closes.tolist() == [
+            101.0
+        ]
+        assert matrix.window("AAPL", date(2023, 12, 1), date(2024, 2, 1)).closes.tolist() == [
+            100.0,
+            101.0,
+            102.0,
+        ]
+        assert len(matrix.window("AAPL", date(2024, 2, 1), date(2024, 3, 1))) == 0
+
+    @pytest.mark.unit
+    def test_row_for_date(self):
+        """row_for_date returns exact matches only."""
+        matrix = PriceMatrix.from_bars({"AAPL": [_bar(5, "100"), _bar(8, "101")]})
+
+        assert matrix.row_for_date(date(2024, 1, 5)) == 0
+        assert matrix.row_for_date(date(2024, 1, 8)) == 1
+        assert matrix.row_for_date(date(2024, 1, 6)) is None
+        assert matrix.row_for_date(date(2024, 1, 4)) is None
+        assert matrix.row_for_date(date(2024, 1, 9)) is None
+
+    @pytest.mark.unit
+    def test_history_returns_full_symbol_column(self):
+        """history() spans the symbol's own first to last bar."""
+        matrix = PriceMatrix.from_bars(
+            {
+                "AAPL": [_bar(3, "100"), _bar(4, "101")],
+                "MSFT": [_bar(2, "200"), _bar(3, "201"), _bar(5, "202")],
+            }
+        )
+
+        assert matrix.history("AAPL").closes.tolist() == [100.0, 101.0]
+        assert matrix.history("MSFT").dates.tolist() == [
+            date(2024, 1, 2),
+            date(2024, 1, 3),
+            date(2024, 1, 5),
+        ]
+        assert len(matrix.history("TSLA")) == 0
+
+    @pytest.mark.unit
+    def test_getitem_materializes_price_bars(self):
+        """Mapping access returns the symbol's bars as PriceBars."""
+        bars = [_bar(2, "100.25"), _bar(3, "101.75")]
+        matrix = PriceMatrix.from_bars({"AAPL": bars})
+
+        assert matrix["AAPL"] == bars
+
+
+class TestPriceWindow:
+    """Tests for the PriceWindow container."""
+
+    @pytest.mark.unit
+    def test_from_bars_and_bar_round_trip(self):
+        """Converting bars to a window and back preserves values."""
+        bars = [_bar(2, "50.1"), _bar(3, "50.3")]
+
+        window = PriceWindow.from_bars(bars)
+
+        assert len(window) == 2
+        assert window.bar(-1) == bars[-1]
+        assert window.bar(0).close == Decimal("50.1")
+
+    @pytest.mark.unit
+    def test_empty_window_has_no_last_date(self):
+        """Empty windows report no last date."""
+        assert PriceWindow.empty().last_date is None
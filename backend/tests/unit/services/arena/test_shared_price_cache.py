@@ -0,0 +1,224 @@
+"""Unit tests for the reference-counted SharedPriceCache."""
+import asyncio
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.services.arena.agent_protocol import PriceBar
+from app.services.arena.price_matrix import PriceMatrix
+from app.services.arena.shared_price_cache import PriceCacheKey, SharedPriceCache
+
+
+def _matrix(*symbols: str) -> PriceMatrix:
+    """Build a small two-day matrix for the given symbols."""
+    bars = [
+        PriceBar(
+            date=date(2024, 1, day),
+            open=Decimal("100"),
+            high=Decimal("101"),
+            low=Decimal("99"),
+            close=Decimal("100"),
+            volume=1_000,
+        )
+        for day in (2, 3)
+    ]
+    return PriceMatrix.from_bars({symbol: bars for symbol in symbols})
+
+
+def _key(*symbols: str) -> PriceCacheKey:
+    return PriceCacheKey(
+        symbols=tuple(sorted(symbols)),
+        data_start=date(2023, 11, 1),
+        end_date=date(2024, 1, 31),
+    )
+
+
+class _CountingLoader:
+    """Loader stand-in that records how often it ran."""
+
+    def __init__(self, matrix: PriceMatrix) -> None:
+        self.matrix = matrix
+        self.calls = 0
+
+    async def __call__(self) -> PriceMatrix:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.matrix
+
+
+class TestSharedPriceCache:
+    """Tests for sharing, reference counting and eviction."""
+
+    @pytest.mark.unit
+    async def test_same_key_shares_one_matrix(self):
+        """A second acquire of the same key reuses the first load."""
+        cache = SharedPriceCache()
+        loader = _CountingLoader(_matrix("AAPL"))
+
+        first = await cache.acquire(_key("AAPL"), loader)
+        second = await cache.acquire(_key("AAPL"), loader)
+
+        assert first is second
+        assert loader.calls == 1
+
+    @pytest.mark.unit
+    async def test_concurrent_acquires_load_once(self):
+        """Acquires racing on a key that is still loading wait for that load."""
+        cache = SharedPriceCache()
+        loader = _CountingLoader(_matrix("AAPL"))
+
+        results = await asyncio.gather(*(cache.acquire(_key("AAPL"), loader) for _ in range(6)))
+
+        assert loader.calls == 1
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.unit
+    async def test_different_keys_do_not_share(self):
+        """Different universes get separate matrices."""
+        cache = SharedPriceCache()
+
+        aapl = await cache.acquire(_key("AAPL"), _CountingLoader(_matrix("AAPL")))
+        both = await cache.acquire(_key("AAPL", "MSFT"), _CountingLoader(_matrix("AAPL", "MSFT")))
+
+        assert aapl is not both
+        assert len(cache) == 2
+
+    @pytest.mark.unit
+    async def test_zero_budget_evicts_when_last_user_releases(self):
+        """With no idle budget the matrix is dropped on the last release only."""
+        cache = SharedPriceCache(max_bytes=0)
+        key = _key("AAPL")
+        loader = _CountingLoader(_matrix("AAPL"))
+
+        await cache.acquire(key, loader)
+        await cache.acquire(key, loader)
+        cache.release(key)
+        assert key in cache
+
+        cache.release(key)
+        assert key not in cache
+
+    @pytest.mark.unit
+    async def test_idle_entries_kept_within_budget(self):
+        """Released matrices stay cached for later simulations while they fit."""
+        matrix = _matrix("AAPL")
+        cache = SharedPriceCache(max_bytes=matrix.nbytes)
+        key = _key("AAPL")
+        loader = _CountingLoader(matrix)
+
+        await cache.acquire(key, loader)
+        cache.release(key)
+        again = await cache.acquire(key, loader)
+
+        assert again is matrix
+        assert loader.calls == 1
+
+    @pytest.mark.unit
+    async def test_lru_evicts_least_recently_released(self):
+        """Over budget, the idle entry released longest ago goes first."""
+        matrix = _matrix("AAPL")
+        cache = SharedPriceCache(max_bytes=matrix.nbytes * 2)
+        keys = [_key("AAPL"), _key("MSFT"), _key("NVDA")]
+
+        for key in keys:
+            await cache.acquire(key, _CountingLoader(_matrix(*key.symbols)))
+        for key in keys:
+            cache.release(key)
+
+        assert keys[0] not in cache
+        assert keys[1] in cache
+        assert keys[2] in cache
+
+    @pytest.mark.unit
+    async def test_referenced_entries_are_never_evicted(self):
+        """Matrices still in use do not count against the idle budget."""
+        cache = SharedPriceCache(max_bytes=0)
+        held, idle = _key("AAPL"), _key("MSFT")
+
+        await cache.acquire(held, _CountingLoader(_matrix("AAPL")))
+        await cache.acquire(idle, _CountingLoader(_matrix("MSFT")))
+        cache.release(idle)
+
+        assert held in cache
+        assert idle not in cache
+
+    @pytest.mark.unit
+    async def test_failed_load_is_not_cached(self):
+        """A loader error propagates and the next acquire retries."""
+        cache = SharedPriceCache()
+        key = _key("AAPL")
+
+        async def failing() -> PriceMatrix:
+            raise ValueError("fetch failed")
+
+        with pytest.raises(ValueError, match="fetch failed"):
+            await cache.acquire(key, failing)
+        assert key not in cache
+
+        loader = _CountingLoader(_matrix("AAPL"))
+        await cache.acquire(key, loader)
+        assert loader.calls == 1
+
+    @pytest.mark.unit
+    async def test_release_of_unheld_key_is_ignored(self):
+        """Releasing a key that was never acquired does not raise."""
+        cache = SharedPriceCache()
+
+        cache.release(_key("AAPL"))
+
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_negative_budget_rejected(self):
+        """max_bytes must not be negative."""
+        with pytest.raises(ValueError, match="max_bytes"):
+            SharedPriceCache(max_bytes=-1)
+
+
+class TestSharedSignals:
+    """Tests for signals stored alongside cached matrices."""
+
+    @pytest.mark.unit
+    async def test_signals_shared_across_regime_fields(self):
+        """Matrices differing only in regime fields share stored signals."""
+        cache = SharedPriceCache(max_bytes=10**9)
+        plain = _key("AAPL")
+        with_regime = replace(plain, regime_symbol="SPY", regime_start=date(2023, 6, 1))
+        signals = {"AAPL": object()}
+
+        await cache.acquire(plain, _CountingLoader(_matrix("AAPL")))
+        await cache.acquire(with_regime, _CountingLoader(_matrix("AAPL", "SPY")))
+        cache.store_signals(plain, "live20", signals)
+
+        assert cache.get_signals(with_regime, "live20") is signals
+        assert cache.get_signals(with_regime, "other") is None
+
+    @pytest.mark.unit
+    async def test_signals_dropped_with_last_matrix_of_scope(self):
+        """Signals go once no matrix of their scope is cached."""
+        cache = SharedPriceCache(max_bytes=0)
+        plain = _key("AAPL")
+        with_regime = replace(plain, regime_symbol="SPY", regime_start=date(2023, 6, 1))
+
+        await cache.acquire(plain, _CountingLoader(_matrix("AAPL")))
+        await cache.acquire(with_regime, _CountingLoader(_matrix("AAPL", "SPY")))
+        cache.store_signals(plain, "live20", {"AAPL": object()})
+
+        cache.release(plain)
+        assert cache.get_signals(with_regime, "live20") is not None
+
+        cache.release(with_regime)
+        await cache.acquire(plain, _CountingLoader(_matrix("AAPL")))
+        assert cache.get_signals(plain, "live20") is None
+
+    @pytest.mark.unit
+    async def test_signals_need_a_cached_matrix(self):
+        """Signals are neither stored nor returned for keys not in the cache."""
+        cache = SharedPriceCache()
+        key = _key("AAPL")
+
+        cache.store_signals(key, "live20", {"AAPL": object()})
+
+        assert cache.get_signals(key, "live20") is None
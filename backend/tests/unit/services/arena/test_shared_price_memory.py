@@ -0,0 +1,93 @@
+"""Unit tests for price matrices published in shared memory."""
+import gc
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.services.arena.agent_protocol import PriceBar
+from app.services.arena.price_matrix import PriceMatrix
+from app.services.arena.shared_price_memory import SharedPriceMatrix
+
+
+def _matrix() -> PriceMatrix:
+    """Build a three-day matrix where MSFT misses the middle day."""
+
+    def bar(day: int, close: str) -> PriceBar:
+        return PriceBar(
+            date=date(2024, 1, day),
+            open=Decimal(close),
+            high=Decimal(close) + 1,
+            low=Decimal(close) - 1,
+            close=Decimal(close),
+            volume=1_000 * day,
+        )
+
+    return PriceMatrix.from_bars({
+        "AAPL": [bar(2, "100"), bar(3, "101"), bar(4, "102")],
+        "MSFT": [bar(2, "300"), bar(4, "302")],
+    })
+
+
+@pytest.mark.unit
+class TestSharedPriceMatrix:
+    """Tests for publishing and attaching matrices."""
+
+    def test_attached_matrix_matches_original(self):
+        """An attached matrix reads the same bars as the published one."""
+        original = _matrix()
+        published = SharedPriceMatrix.publish(original)
+
+        attached = SharedPriceMatrix.attach(published.ref)
+
+        assert attached.symbols == original.symbols
+        np.testing.assert_array_equal(attached.dates, original.dates)
+        for symbol in original.symbols:
+            expected = original.history(symbol)
+            actual = attached.history(symbol)
+            np.testing.assert_array_equal(actual.dates, expected.dates)
+            np.testing.assert_array_equal(actual.closes, expected.closes)
+            np.testing.assert_array_equal(actual.volumes, expected.volumes)
+        assert attached.bar("MSFT", date(2024, 1, 3)) is None
+        assert attached.bar("AAPL", date(2024, 1, 3)) == original.bar("AAPL", date(2024, 1, 3))
+
+    def test_attached_matrix_is_read_only(self):
+        """Pool processes cannot write through to the shared block."""
+        published = SharedPriceMatrix.publish(_matrix())
+        attached = SharedPriceMatrix.attach(published.ref)
+
+        closes = attached.history("AAPL").closes
+        with pytest.raises(ValueError):
+            closes[0] = 0.0
+
+    def test_block_unlinked_when_owner_dropped(self):
+        """The block goes away with the owner's matrix, so evicting frees it."""
+        published = SharedPriceMatrix.publish(_matrix())
+        ref = published.ref
+
+        del published
+        gc.collect()
+
+        with pytest.raises(FileNotFoundError):
+            SharedPriceMatrix.attach(ref)
+
+    def test_views_outlive_their_matrix(self):
+        """Windows stay readable after the matrix (and its block) is dropped."""
+        published = SharedPriceMatrix.publish(_matrix())
+        attached = SharedPriceMatrix.attach(published.ref)
+        closes = attached.window("AAPL", date(2024, 1, 2), date(2024, 1, 3)).closes
+
+        del published, attached
+        gc.collect()
+
+        np.testing.assert_array_equal(closes, [100.0, 101.0])
+
+    def test_empty_matrix(self):
+        """A matrix without symbols or dates can be shared too."""
+        published = SharedPriceMatrix.publish(PriceMatrix.empty())
+
+        attached = SharedPriceMatrix.attach(published.ref)
+
+        assert len(attached) == 0
+        assert len(attached.dates) == 0
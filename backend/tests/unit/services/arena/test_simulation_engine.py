@@ -8,6 +8,7 @@ from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 from sqlalchemy import select
 
@@ -20,7 +21,10 @@ from app.models.arena import (
     SimulationStatus,
 )
 from app.services.arena.agent_protocol import AgentDecision, PriceBar
-from app.services.arena.simulation_engine import SimulationEngine
+from app.services.arena.decision_log import DecisionLog
+from app.services.arena.price_matrix import PriceMatrix
+from app.services.arena.simulation_engine import SimulationEngine, _PortfolioState
+from app.utils.technical_indicators import calculate_atr_percentage
 
 
 class TestSimulationEngineInit:
@@ -38,6 +42,11 @@ class TestSimulationEngineInit:
         assert engine.data_service is not None
 
 
+def _snapshot_decisions(snapshot: ArenaSnapshot, symbols: list[str]) -> dict[str, dict]:
+    """Decode a snapshot's decision log."""
+    return DecisionLog.from_bytes(symbols, snapshot.decision_log).to_dict()
+
+
 @pytest.mark.usefixtures("db_session")
 class TestSimulationEngineInitializeSimulation:
     """Tests for SimulationEngine.initialize_simulation() method."""
@@ -372,9 +381,9 @@ class TestSimulationEngineStepDay:
         # Pre-populate caches instead of mocking methods
         trading_days = [bar.date for bar in sample_price_bars[:5]]
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: sample_price_bars for symbol in simulation.symbols
-        }
+        })
 
         # Mock dependencies
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
@@ -406,9 +415,9 @@ class TestSimulationEngineStepDay:
         # Pre-populate caches instead of mocking methods
         trading_days = [bar.date for bar in sample_price_bars[:5]]
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: sample_price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -436,15 +445,16 @@ class TestSimulationEngineStepDay:
         # Pre-populate caches instead of mocking methods
         trading_days = [bar.date for bar in sample_price_bars[:5]]
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: sample_price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             snapshot = await engine.step_day(simulation.id)
 
-        assert "AAPL" in snapshot.decisions
-        assert snapshot.decisions["AAPL"]["action"] == "NO_SIGNAL"
+        decisions = _snapshot_decisions(snapshot, simulation.symbols)
+        assert "AAPL" in decisions
+        assert decisions["AAPL"]["action"] == "NO_SIGNAL"
 
     @pytest.mark.unit
     async def test_step_day_handles_no_price_data(
@@ -465,14 +475,117 @@ class TestSimulationEngineStepDay:
 
         # Pre-populate caches with empty price data
         engine._trading_days_cache[simulation.id] = [date(2024, 1, 15)]
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: [] for symbol in simulation.symbols
+        })
+
+        with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
+            snapshot = await engine.step_day(simulation.id)
+
+        decisions = _snapshot_decisions(snapshot, simulation.symbols)
+        assert decisions["AAPL"] == {"action": "NO_DATA", "reasoning": "No price data"}
+
+    @pytest.mark.unit
+    async def test_step_day_records_only_buy_decisions_when_configured(
+        self,
+        db_session,
+        rollback_session_factory,
+        running_simulation_data,
+        sample_price_bars,
+        mock_agent,
+    ) -> None:
+        """record_decisions='buy' leaves non-BUY decisions out of the snapshot."""
+        running_simulation_data["agent_config"] = {
+            "trailing_stop_pct": 5.0,
+            "record_decisions": "buy",
         }
+        simulation = ArenaSimulation(**running_simulation_data)
+        db_session.add(simulation)
+        await db_session.commit()
+        await db_session.refresh(simulation)
+
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        engine._trading_days_cache[simulation.id] = [date(2024, 1, 15)]
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({"AAPL": sample_price_bars})
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             snapshot = await engine.step_day(simulation.id)
 
-        assert snapshot.decisions["AAPL"]["action"] == "NO_DATA"
+        assert snapshot.decisions == {}
+        assert _snapshot_decisions(snapshot, simulation.symbols) == {}
+
+    @pytest.mark.unit
+    async def test_explain_decisions_rebuilds_reasoning(
+        self,
+        db_session,
+        rollback_session_factory,
+        running_simulation_data,
+        sample_price_bars,
+        mock_agent,
+    ) -> None:
+        """Reasoning left out of the decision log is rebuilt by re-running the agent."""
+        simulation = ArenaSimulation(**running_simulation_data)
+        db_session.add(simulation)
+        await db_session.commit()
+        await db_session.refresh(simulation)
+
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        engine._trading_days_cache[simulation.id] = [date(2024, 1, 15)]
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({"AAPL": sample_price_bars})
+
+        with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
+            snapshot = await engine.step_day(simulation.id)
+            assert _snapshot_decisions(snapshot, simulation.symbols)["AAPL"]["reasoning"] is None
+
+            decisions = await engine.explain_decisions(simulation, snapshot)
+
+        assert decisions["AAPL"] == {
+            "action": "NO_SIGNAL",
+            "score": 40,
+            "reasoning": "Test reasoning",
+        }
+        _, _, eval_date, has_position = mock_agent.evaluate.call_args.args
+        assert eval_date == date(2024, 1, 15)
+        assert has_position is False
+        # Prices loaded for the explanation are released afterwards
+        assert simulation.id not in engine._price_cache
+
+    @pytest.mark.unit
+    async def test_step_day_records_step_profile(
+        self,
+        db_session,
+        rollback_session_factory,
+        running_simulation_data,
+        sample_price_bars,
+        mock_agent,
+    ) -> None:
+        """Test step_day accumulates phase timings and counters on the simulation."""
+        simulation = ArenaSimulation(**running_simulation_data)
+        db_session.add(simulation)
+        await db_session.commit()
+        await db_session.refresh(simulation)
+
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        engine._trading_days_cache[simulation.id] = [bar.date for bar in sample_price_bars[:5]]
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
+            symbol: sample_price_bars for symbol in simulation.symbols
+        })
+
+        with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
+            await engine.step_day(simulation.id)
+            await engine.step_day(simulation.id)
+
+        await db_session.refresh(simulation)
+        profile = simulation.step_profile
+        assert profile["counters"]["days"] == 2
+        assert profile["counters"]["symbols_evaluated"] == 2
+        assert profile["counters"]["signal_cache_misses"] == 2
+        assert profile["counters"]["db_statements"] > 0
+        assert profile["phases"]["agent"]["calls"] == 2
+        assert profile["phases"]["load_state"]["calls"] == 2
+        # The commit of the last day is stored with the next commit
+        assert profile["phases"]["commit"]["calls"] == 1
+        assert {"symbols", "selection", "snapshot"} <= profile["phases"].keys()
 
 
 @pytest.mark.usefixtures("db_session")
@@ -543,9 +656,9 @@ class TestSimulationEnginePositionManagement:
 
         # Pre-populate caches instead of mocking methods
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -601,9 +714,9 @@ class TestSimulationEnginePositionManagement:
 
         # Pre-populate caches instead of mocking methods
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -683,10 +796,10 @@ class TestSimulationEnginePositionManagement:
 
         # Pre-populate caches with different price bars per symbol
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             "AAPL": price_bars_aapl,
             "MSFT": price_bars_msft,
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -738,9 +851,9 @@ class TestSimulationEnginePositionManagement:
 
         # Pre-populate caches instead of mocking methods
         engine._trading_days_cache[simulation.id] = [date(2024, 1, 15)]
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -808,7 +921,7 @@ class TestSimulationEnginePositionManagement:
         )
 
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {"AAPL": price_bars}
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({"AAPL": price_bars})
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -873,7 +986,7 @@ class TestSimulationEnginePositionManagement:
         )
 
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {"AAPL": price_bars}
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({"AAPL": price_bars})
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -958,9 +1071,9 @@ class TestSimulationEngineTrailingStop:
 
         # Pre-populate caches instead of mocking methods
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -1019,9 +1132,9 @@ class TestSimulationEngineTrailingStop:
 
         # Pre-populate caches instead of mocking methods
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -1093,9 +1206,9 @@ class TestSimulationEngineTrailingStop:
 
         # Pre-populate caches instead of mocking methods
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             await engine.step_day(simulation.id)
@@ -1165,9 +1278,9 @@ class TestSimulationEngineRunToCompletion:
 
         # Pre-populate caches instead of mocking methods
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             result = await engine.run_to_completion(simulation.id)
@@ -1175,8 +1288,433 @@ class TestSimulationEngineRunToCompletion:
         assert result.status == SimulationStatus.COMPLETED.value
         assert result.current_day == 3
 
+    @staticmethod
+    async def _create_trading_simulation(db_session, name: str) -> ArenaSimulation:
+        """Create a 6-day simulation for batched/per-day comparisons."""
+        simulation = ArenaSimulation(
+            name=name,
+            symbols=["AAPL", "MSFT"],
+            start_date=date(2024, 1, 15),
+            end_date=date(2024, 1, 22),
+            initial_capital=Decimal("10000.00"),
+            position_size=Decimal("1000.00"),
+            agent_type="live20",
+            agent_config={"trailing_stop_pct": 3.3, "ratchet_trigger_pct": 2.0,
+                          "ratchet_trail_pct": 1.7},
+            status=SimulationStatus.RUNNING.value,
+            current_day=0,
+            total_days=6,
+        )
+        db_session.add(simulation)
+        await db_session.commit()
+        await db_session.refresh(simulation)
+        return simulation
+
+    @staticmethod
+    def _seed_trading_caches(engine: SimulationEngine, simulation_id: int) -> None:
+        """Seed caches with prices that open, ratchet and stop out positions."""
+        trading_days = [date(2024, 1, d) for d in (15, 16, 17, 18, 19, 22)]
+        closes = {
+            "AAPL": ["100.00", "101.37", "104.11", "106.93", "101.01", "103.33"],
+            "MSFT": ["200.00", "198.13", "203.77", "199.99", "207.41", "205.55"],
+        }
+        engine._trading_days_cache[simulation_id] = trading_days
+        engine._price_cache[simulation_id] = PriceMatrix.from_bars({
+            symbol: [
+                PriceBar(
+                    date=d,
+                    open=Decimal(close) - Decimal("0.37"),
+                    high=Decimal(close) + Decimal("1.13"),
+                    low=Decimal(close) - Decimal("1.29"),
+                    close=Decimal(close),
+                    volume=1000000,
+                )
+                for d, close in zip(trading_days, symbol_closes)
+            ]
+            for symbol, symbol_closes in closes.items()
+        })
+
+    @staticmethod
+    def _buy_agent() -> MagicMock:
+        """Agent that signals BUY whenever it holds no position."""
+        async def evaluate(symbol, price_history, current_date, has_open_position):
+            if has_open_position:
+                return AgentDecision(symbol=symbol, action="HOLD")
+            return AgentDecision(symbol=symbol, action="BUY", score=70, reasoning="Signal")
+
+        mock_agent = MagicMock()
+        mock_agent.required_lookback_days = 60
+        mock_agent.evaluate = AsyncMock(side_effect=evaluate)
+        return mock_agent
+
+    @pytest.mark.unit
+    async def test_run_to_completion_matches_step_day(
+        self, db_session, rollback_session_factory
+    ) -> None:
+        """Batched in-memory run persists the same positions and snapshots as stepping."""
+        stepped = await self._create_trading_simulation(db_session, "Stepped")
+        batched = await self._create_trading_simulation(db_session, "Batched")
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        self._seed_trading_caches(engine, stepped.id)
+        self._seed_trading_caches(engine, batched.id)
+
+        with patch(
+            "app.services.arena.simulation_engine.get_agent", return_value=self._buy_agent()
+        ):
+            while await engine.step_day(stepped.id) is not None:
+                pass
+            await engine.run_to_completion(batched.id, checkpoint_days=4)
+
+        async def persisted(simulation_id: int) -> tuple[list, list]:
+            positions = (
+                await db_session.execute(
+                    select(ArenaPosition)
+                    .where(ArenaPosition.simulation_id == simulation_id)
+                    .order_by(ArenaPosition.signal_date, ArenaPosition.symbol)
+                )
+            ).scalars().all()
+            snapshots = (
+                await db_session.execute(
+                    select(ArenaSnapshot)
+                    .where(ArenaSnapshot.simulation_id == simulation_id)
+                    .order_by(ArenaSnapshot.day_number)
+                )
+            ).scalars().all()
+            for row in (*positions, *snapshots):
+                await db_session.refresh(row)
+            return (
+                [
+                    (p.symbol, p.status, p.entry_price, p.current_stop, p.exit_price, p.exit_reason)
+                    for p in positions
+                ],
+                [(s.cash, s.total_equity, s.decision_log) for s in snapshots],
+            )
+
+        stepped_rows = await persisted(stepped.id)
+        assert stepped_rows == await persisted(batched.id)
+        assert len(stepped_rows[1]) == 6
+        assert any(row[5] == ExitReason.STOP_HIT.value for row in stepped_rows[0])
+        assert batched.status == SimulationStatus.COMPLETED.value
+        assert batched.total_trades == stepped.total_trades
+
+    @pytest.mark.unit
+    async def test_run_to_completion_cancel_at_checkpoint_then_resume(
+        self, db_session, rollback_session_factory
+    ) -> None:
+        """Cancellation stops at a checkpoint with all processed days committed."""
+        simulation = await self._create_trading_simulation(db_session, "Resumable")
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        self._seed_trading_caches(engine, simulation.id)
+        should_cancel = AsyncMock(side_effect=[False, True])
+
+        with patch(
+            "app.services.arena.simulation_engine.get_agent", return_value=self._buy_agent()
+        ):
+            result = await engine.run_to_completion(
+                simulation.id, checkpoint_days=2, should_cancel=should_cancel
+            )
+
+            assert result.status == SimulationStatus.RUNNING.value
+            assert result.current_day == 2
+            snapshot_count = len(await engine._get_all_snapshots(simulation.id))
+            assert snapshot_count == 2
+
+            # Resume from the checkpoint
+            result = await engine.run_to_completion(simulation.id, checkpoint_days=2)
+
+        assert result.status == SimulationStatus.COMPLETED.value
+        assert result.current_day == 6
+        assert should_cancel.await_count == 2
+
+    @pytest.mark.unit
+    async def test_step_day_keeps_portfolio_state_in_memory(
+        self, db_session, rollback_session_factory
+    ) -> None:
+        """Only the first step_day reads the portfolio state from the database."""
+        simulation = await self._create_trading_simulation(db_session, "In Memory")
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        self._seed_trading_caches(engine, simulation.id)
+
+        with (
+            patch(
+                "app.services.arena.simulation_engine.get_agent",
+                return_value=self._buy_agent(),
+            ),
+            patch.object(
+                engine, "_load_portfolio_state", wraps=engine._load_portfolio_state
+            ) as load_state,
+        ):
+            while await engine.step_day(simulation.id) is not None:
+                pass
+
+        assert simulation.status == SimulationStatus.COMPLETED.value
+        assert load_state.await_count == 1
+        assert simulation.id not in engine._portfolio_states
+
+    @pytest.mark.unit
+    async def test_step_day_reloads_stale_state(
+        self, db_session, rollback_session_factory
+    ) -> None:
+        """State for a different day than the simulation's current_day is reloaded."""
+        simulation = await self._create_trading_simulation(db_session, "Stale")
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        self._seed_trading_caches(engine, simulation.id)
+
+        with (
+            patch(
+                "app.services.arena.simulation_engine.get_agent",
+                return_value=self._buy_agent(),
+            ),
+            patch.object(
+                engine, "_load_portfolio_state", wraps=engine._load_portfolio_state
+            ) as load_state,
+        ):
+            await engine.step_day(simulation.id)
+            assert engine._portfolio_states[simulation.id].day == 1
+            # E.g. state left behind by a run that another engine continued
+            engine._portfolio_states[simulation.id].day = 0
+            await engine.step_day(simulation.id)
+
+        assert load_state.await_count == 2
+
+    @pytest.mark.unit
+    async def test_failed_day_discards_portfolio_state(
+        self, db_session, rollback_session_factory
+    ) -> None:
+        """A day that raises drops the in-memory state so the next day reloads it."""
+        simulation = await self._create_trading_simulation(db_session, "Failing")
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        self._seed_trading_caches(engine, simulation.id)
+        failing_agent = self._buy_agent()
+
+        with patch(
+            "app.services.arena.simulation_engine.get_agent", return_value=failing_agent
+        ):
+            await engine.step_day(simulation.id)
+            assert simulation.id in engine._portfolio_states
+
+            failing_agent.evaluate.side_effect = RuntimeError("agent failed")
+            with pytest.raises(RuntimeError, match="agent failed"):
+                await engine.step_day(simulation.id)
+
+        assert simulation.id not in engine._portfolio_states
+
+    @pytest.mark.unit
+    async def test_run_to_completion_rejects_invalid_checkpoint(
+        self, db_session, rollback_session_factory
+    ) -> None:
+        """checkpoint_days must be positive."""
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+
+        with pytest.raises(ValueError, match="checkpoint_days"):
+            await engine.run_to_completion(1, checkpoint_days=0)
+
+    @pytest.mark.unit
+    def test_round_carried_state_matches_column_scales(self) -> None:
+        """Carried values are rounded like a Numeric column write (half away from zero)."""
+        position = ArenaPosition(
+            symbol="AAPL",
+            status=PositionStatus.OPEN.value,
+            signal_date=date(2024, 1, 15),
+            entry_price=Decimal("100.5"),
+            shares=10,
+            trailing_stop_pct=Decimal("7.1251"),
+            highest_price=Decimal("108.06"),
+            current_stop=Decimal("106.222985"),
+        )
+        state = _PortfolioState(
+            cash=Decimal("1234.565"),
+            prev_equity=Decimal("-0.125"),
+            positions_by_symbol={"AAPL": position},
+            pending_by_symbol={},
+        )
+
+        SimulationEngine._round_carried_state(state)
+
+        assert state.cash == Decimal("1234.57")
+        assert state.prev_equity == Decimal("-0.13")
+        assert position.trailing_stop_pct == Decimal("7.13")
+        assert position.current_stop == Decimal("106.2230")
+        assert position.entry_price == Decimal("100.5")
+
 
 @pytest.mark.usefixtures("db_session")
+class TestIntegerAccounting:
+    """Regression tests: integer accounting reproduces the Decimal engine exactly."""
+
+    SYMBOLS = ["AAPL", "MSFT", "NVDA", "AMD", "TSLA", "META"]
+
+    # Reference configurations, covering every exit rule and sizing mode
+    REFERENCE_CONFIGS = {
+        "fixed_stop_ratchet": {
+            "trailing_stop_pct": 3.3,
+            "ratchet_trigger_pct": 2.0,
+            "ratchet_trail_pct": 1.7,
+        },
+        "breakeven_take_profit_max_hold": {
+            "trailing_stop_pct": 6.0,
+            "breakeven_trigger_pct": 1.5,
+            "take_profit_pct": 4.5,
+            "max_hold_days": 8,
+            "max_hold_days_profit": 12,
+        },
+        "atr_stop_atr_take_profit": {
+            "stop_type": "atr",
+            "atr_stop_multiplier": 2.0,
+            "atr_stop_min_pct": 2.0,
+            "atr_stop_max_pct": 9.0,
+            "take_profit_atr_mult": 3.0,
+        },
+        "fixed_pct_sizing": {
+            "trailing_stop_pct": 4.0,
+            "sizing_mode": "fixed_pct",
+            "position_size_pct": 15.0,
+        },
+    }
+
+    @staticmethod
+    def _random_walk_bars(seed: int, days: int) -> dict[str, list[PriceBar]]:
+        """Seeded daily random walks with 2-decimal prices, one per symbol."""
+        rng = np.random.default_rng(seed)
+        trading_days = [
+            d for d in (date(2024, 1, 1) + timedelta(days=i) for i in range(days * 2))
+            if d.weekday() < 5
+        ][:days]
+        bars: dict[str, list[PriceBar]] = {}
+        for j, symbol in enumerate(TestIntegerAccounting.SYMBOLS):
+            close = 40.0 + 35.0 * j
+            symbol_bars = []
+            for d in trading_days:
+                open_ = round(close * (1 + rng.normal(0, 0.01)), 2)
+                close = round(open_ * (1 + rng.normal(0.001, 0.025)), 2)
+                high = round(max(open_, close) * (1 + abs(rng.normal(0, 0.01))), 2)
+                low = round(min(open_, close) * (1 - abs(rng.normal(0, 0.01))), 2)
+                symbol_bars.append(
+                    PriceBar(
+                        date=d,
+                        open=Decimal(repr(open_)),
+                        high=Decimal(repr(high)),
+                        low=Decimal(repr(low)),
+                        close=Decimal(repr(close)),
+                        volume=1_000_000,
+                    )
+                )
+            bars[symbol] = symbol_bars
+        return bars
+
+    @staticmethod
+    async def _run(
+        db_session, rollback_session_factory, config: dict, accounting_mode: str, seed: int
+    ) -> ArenaSimulation:
+        """Run a 60-day reference simulation (20 days of warm-up history) to completion."""
+        bars = TestIntegerAccounting._random_walk_bars(seed, days=80)
+        trading_days = [bar.date for bar in bars["AAPL"][20:]]
+        simulation = ArenaSimulation(
+            name=f"Reference {accounting_mode}",
+            symbols=TestIntegerAccounting.SYMBOLS,
+            start_date=trading_days[0],
+            end_date=trading_days[-1],
+            initial_capital=Decimal("10000.00"),
+            position_size=Decimal("1500.00"),
+            agent_type="live20",
+            agent_config={**config, "accounting_mode": accounting_mode},
+            status=SimulationStatus.RUNNING.value,
+            current_day=0,
+            total_days=len(trading_days),
+        )
+        db_session.add(simulation)
+        await db_session.commit()
+        await db_session.refresh(simulation)
+
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        engine._trading_days_cache[simulation.id] = trading_days
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars(bars)
+        with patch(
+            "app.services.arena.simulation_engine.get_agent",
+            return_value=TestSimulationEngineRunToCompletion._buy_agent(),
+        ):
+            await engine.run_to_completion(simulation.id, checkpoint_days=7)
+        return simulation
+
+    @staticmethod
+    async def _persisted(db_session, simulation_id: int) -> tuple[list, list]:
+        """Positions and snapshots of a finished simulation, in a stable order."""
+        positions = (
+            await db_session.execute(
+                select(ArenaPosition)
+                .where(ArenaPosition.simulation_id == simulation_id)
+                .order_by(ArenaPosition.signal_date, ArenaPosition.symbol)
+            )
+        ).scalars().all()
+        snapshots = (
+            await db_session.execute(
+                select(ArenaSnapshot)
+                .where(ArenaSnapshot.simulation_id == simulation_id)
+                .order_by(ArenaSnapshot.day_number)
+            )
+        ).scalars().all()
+        for row in (*positions, *snapshots):
+            await db_session.refresh(row)
+        return list(positions), list(snapshots)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("config_name", list(REFERENCE_CONFIGS))
+    @pytest.mark.parametrize("seed", [7, 42])
+    async def test_integer_accounting_matches_decimal(
+        self, db_session, rollback_session_factory, config_name: str, seed: int
+    ) -> None:
+        """Every trade, snapshot and final result equals Decimal accounting's."""
+        config = self.REFERENCE_CONFIGS[config_name]
+        exact = await self._run(db_session, rollback_session_factory, config, "decimal", seed)
+        fast = await self._run(db_session, rollback_session_factory, config, "integer", seed)
+
+        exact_positions, exact_snapshots = await self._persisted(db_session, exact.id)
+        fast_positions, fast_snapshots = await self._persisted(db_session, fast.id)
+
+        assert exact.total_trades > 5
+        position_fields = (
+            "symbol", "signal_date", "status", "exit_reason", "exit_date", "shares",
+            "entry_price", "exit_price", "realized_pnl", "highest_price", "current_stop",
+        )
+        assert [tuple(getattr(p, name) for name in position_fields) for p in fast_positions] == [
+            tuple(getattr(p, name) for name in position_fields) for p in exact_positions
+        ]
+        assert [(s.cash, s.positions_value, s.total_equity) for s in fast_snapshots] == [
+            (s.cash, s.positions_value, s.total_equity) for s in exact_snapshots
+        ]
+        assert fast.final_equity == exact.final_equity
+        assert fast.total_trades == exact.total_trades
+        assert fast.winning_trades == exact.winning_trades
+
+    @pytest.mark.unit
+    async def test_step_day_stores_price_marks_before_commit(
+        self, db_session, rollback_session_factory
+    ) -> None:
+        """Open positions carry the integer mode's highest price and stop after each day."""
+        simulation = await TestSimulationEngineRunToCompletion._create_trading_simulation(
+            db_session, "Integer Marks"
+        )
+        simulation.agent_config = {**simulation.agent_config, "accounting_mode": "integer"}
+        await db_session.commit()
+        engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
+        TestSimulationEngineRunToCompletion._seed_trading_caches(engine, simulation.id)
+
+        with patch(
+            "app.services.arena.simulation_engine.get_agent",
+            return_value=TestSimulationEngineRunToCompletion._buy_agent(),
+        ):
+            for _ in range(3):
+                await engine.step_day(simulation.id)
+
+        state = engine._portfolio_states[simulation.id]
+        assert state.price_marks
+        for symbol, marks in state.price_marks.items():
+            position = state.positions_by_symbol[symbol]
+            await db_session.refresh(position)
+            assert position.highest_price == Decimal(marks.highest).scaleb(-4)
+            assert position.current_stop == Decimal(marks.stop).scaleb(-4)
+
+
 class TestSimulationEngineHelpers:
     """Tests for SimulationEngine helper methods."""
 
@@ -1278,58 +1816,6 @@ class TestSimulationEngineHelpers:
         assert len(result) == 1
         assert result[0].symbol == "AAPL"
 
-    @pytest.mark.unit
-    def test_find_bar_for_date_returns_matching_bar(self) -> None:
-        """Test _find_bar_for_date returns bar for target date."""
-        mock_session_factory = MagicMock()
-        engine = SimulationEngine(AsyncMock(), session_factory=mock_session_factory)
-
-        bars = [
-            PriceBar(
-                date=date(2024, 1, 15),
-                open=Decimal("100.00"),
-                high=Decimal("102.00"),
-                low=Decimal("98.00"),
-                close=Decimal("101.00"),
-                volume=1000000,
-            ),
-            PriceBar(
-                date=date(2024, 1, 16),
-                open=Decimal("101.00"),
-                high=Decimal("103.00"),
-                low=Decimal("99.00"),
-                close=Decimal("102.00"),
-                volume=1000000,
-            ),
-        ]
-
-        result = engine._find_bar_for_date(bars, date(2024, 1, 16))
-
-        assert result is not None
-        assert result.date == date(2024, 1, 16)
-        assert result.open == Decimal("101.00")
-
-    @pytest.mark.unit
-    def test_find_bar_for_date_returns_none_when_not_found(self) -> None:
-        """Test _find_bar_for_date returns None when date not found."""
-        mock_session_factory = MagicMock()
-        engine = SimulationEngine(AsyncMock(), session_factory=mock_session_factory)
-
-        bars = [
-            PriceBar(
-                date=date(2024, 1, 15),
-                open=Decimal("100.00"),
-                high=Decimal("102.00"),
-                low=Decimal("98.00"),
-                close=Decimal("101.00"),
-                volume=1000000,
-            ),
-        ]
-
-        result = engine._find_bar_for_date(bars, date(2024, 1, 20))
-
-        assert result is None
-
 
 @pytest.mark.usefixtures("db_session")
 class TestSimulationEngineCloseAllPositions:
@@ -1389,7 +1875,7 @@ class TestSimulationEngineCloseAllPositions:
         engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
 
         # Pre-populate price cache with closing prices
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             "AAPL": [
                 PriceBar(
                     date=date(2024, 1, 20),
@@ -1410,7 +1896,7 @@ class TestSimulationEngineCloseAllPositions:
                     volume=1000000,
                 )
             ],
-        }
+        })
 
         await engine._close_all_positions(
             simulation, date(2024, 1, 20), ExitReason.SIMULATION_END
@@ -1513,9 +1999,9 @@ class TestSimulationEngineValidation:
         # Pre-populate caches instead of mocking methods
         trading_days = [bar.date for bar in sample_price_bars[:5]]
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: sample_price_bars for symbol in simulation.symbols
-        }
+        })
 
         # Set up mocks for normal operation
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
@@ -1569,9 +2055,9 @@ class TestSimulationEngineValidation:
 
         # Pre-populate caches instead of mocking methods
         engine._trading_days_cache[simulation.id] = [date(2024, 1, 15)]
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: sample_price_bars for symbol in simulation.symbols
-        }
+        })
 
         # Use a mock that simulates a calculation bug resulting in negative positions_value
         # We'll patch the calculation by making the loop that sums positions_value
@@ -1618,9 +2104,9 @@ class TestSimulationEngineValidation:
         # Pre-populate caches instead of mocking methods
         trading_days = [bar.date for bar in sample_price_bars[:5]]
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: sample_price_bars for symbol in simulation.symbols
-        }
+        })
 
         # Run a normal step_day - should not raise any validation errors
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
@@ -1695,9 +2181,9 @@ class TestSimulationEngineValidation:
         # Pre-populate caches instead of mocking methods
         trading_days = [bar.date for bar in sample_price_bars[:5]]
         engine._trading_days_cache[simulation.id] = trading_days
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: sample_price_bars for symbol in simulation.symbols
-        }
+        })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             # Patch ArenaSnapshot in the simulation_engine module
@@ -1842,9 +2328,9 @@ class TestSimulationEngineCaching:
         # Mock _load_price_cache to track calls and populate cache
         async def mock_load_cache(*args, **kwargs):
             sim_id = args[0]
-            engine._price_cache[sim_id] = {
+            engine._price_cache[sim_id] = PriceMatrix.from_bars({
                 symbol: sample_price_bars for symbol in simulation.symbols
-            }
+            })
 
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
             with patch.object(
@@ -1910,9 +2396,9 @@ class TestSimulationEngineCaching:
         engine._trading_days_cache[simulation.id] = trading_days
 
         # Pre-populate price cache
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: sample_price_bars for symbol in simulation.symbols
-        }
+        })
 
         # Execute step_day which uses batch loading
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
@@ -2021,9 +2507,9 @@ class TestSimulationEngineCaching:
         engine._trading_days_cache[simulation.id] = trading_days
 
         # Pre-populate price cache
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: sample_price_bars for symbol in simulation.symbols
-        }
+        })
 
         # Run step_day which should lazy-load drawdown state
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent):
@@ -2187,9 +2673,9 @@ class TestSimulationEngineCaching:
                 volume=1000000,
             ),
         ]
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             symbol: price_bars for symbol in simulation.symbols
-        }
+        })
 
         # Execute step_day (this is the actual production code path)
         with patch("app.services.arena.simulation_engine.get_agent", return_value=mock_agent_no_signal):
@@ -2368,14 +2854,15 @@ class TestSimulationEngineCaching:
         ]
 
         # Populate cache
-        engine._price_cache[1] = {"AAPL": bars}
+        engine._price_cache[1] = PriceMatrix.from_bars({"AAPL": bars})
 
         # Test filtering
         result = engine._get_cached_price_history(1, "AAPL", date(2024, 1, 12), date(2024, 1, 18))
 
         # Should only return the middle bar
         assert len(result) == 1
-        assert result[0].date == date(2024, 1, 15)
+        assert result.last_date == date(2024, 1, 15)
+        assert result.closes.tolist() == [106.0]
 
     @pytest.mark.unit
     def test_cached_bar_for_date_returns_correct_bar(self) -> None:
@@ -2402,7 +2889,7 @@ class TestSimulationEngineCaching:
             ),
         ]
 
-        engine._price_cache[1] = {"AAPL": bars}
+        engine._price_cache[1] = PriceMatrix.from_bars({"AAPL": bars})
 
         result = engine._get_cached_bar_for_date(1, "AAPL", date(2024, 1, 16))
 
@@ -2427,12 +2914,51 @@ class TestSimulationEngineCaching:
             ),
         ]
 
-        engine._price_cache[1] = {"AAPL": bars}
+        engine._price_cache[1] = PriceMatrix.from_bars({"AAPL": bars})
 
         result = engine._get_cached_bar_for_date(1, "AAPL", date(2024, 1, 20))
 
         assert result is None
 
+    @pytest.mark.unit
+    def test_symbol_atr_pct_matches_windowed_calculation(self) -> None:
+        """Test precomputed ATR% lookups equal the 90-day window calculation."""
+        engine = SimulationEngine(AsyncMock(), session_factory=MagicMock())
+        bars = [
+            PriceBar(
+                date=date(2024, 1, 1) + timedelta(days=i),
+                open=Decimal(98 + (i * 5) % 6),
+                high=Decimal(99 + (i * 5) % 6 + (i * 7) % 3),
+                low=Decimal(97 + (i * 5) % 6 - (i * 3) % 4),
+                close=Decimal(98 + (i * 5) % 6),
+                volume=1000000,
+            )
+            for i in range(150)
+            if i % 7 not in (5, 6)
+        ]
+        engine._price_cache[1] = PriceMatrix.from_bars({"AAPL": bars})
+
+        for bar in bars:
+            window = engine._get_cached_price_history(
+                1, "AAPL", bar.date - timedelta(days=90), bar.date
+            )
+            expected = (
+                calculate_atr_percentage(window.highs, window.lows, window.closes)
+                if len(window) >= 15
+                else None
+            )
+            assert engine._calculate_symbol_atr_pct(1, "AAPL", bar.date) == expected
+
+        # A day without a bar falls back to the window ending on it
+        saturday = date(2024, 3, 2)
+        window = engine._get_cached_price_history(
+            1, "AAPL", saturday - timedelta(days=90), saturday
+        )
+        assert engine._calculate_symbol_atr_pct(1, "AAPL", saturday) == (
+            calculate_atr_percentage(window.highs, window.lows, window.closes)
+        )
+        assert engine._calculate_symbol_atr_pct(1, "MSFT", saturday) is None
+
     @pytest.mark.unit
     async def test_cache_cleared_on_finalization(
         self, db_session, rollback_session_factory
@@ -2456,7 +2982,7 @@ class TestSimulationEngineCaching:
         engine = SimulationEngine(db_session, session_factory=rollback_session_factory)
 
         # Populate caches
-        engine._price_cache[simulation.id] = {"AAPL": []}
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({"AAPL": []})
         engine._trading_days_cache[simulation.id] = []
         engine._peak_equity[simulation.id] = Decimal("10000")
         engine._max_drawdown[simulation.id] = Decimal("0")
@@ -2629,9 +3155,9 @@ class TestSimulationEnginePortfolioSelection:
         price_bars = self._make_price_bars(date(2024, 1, 14))
         trading_day = date(2024, 1, 15)
         engine._trading_days_cache[simulation.id] = [trading_day]
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             sym: price_bars for sym in simulation.symbols
-        }
+        })
         # No sector cache — FIFO selector doesn't need it, and missing cache
         # returns empty dict which means all sectors are None (never blocked).
         engine._sector_cache[simulation.id] = {}
@@ -2688,9 +3214,9 @@ class TestSimulationEnginePortfolioSelection:
         price_bars = self._make_price_bars(date(2024, 1, 14))
         trading_day = date(2024, 1, 15)
         engine._trading_days_cache[simulation.id] = [trading_day]
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             sym: price_bars for sym in simulation.symbols
-        }
+        })
         engine._sector_cache[simulation.id] = {
             "MSFT": "Technology",
             "AAPL": "Technology",
@@ -2721,8 +3247,9 @@ class TestSimulationEnginePortfolioSelection:
         assert pending_positions[0].agent_score == 90
 
         # Decisions snapshot must carry portfolio_selected flag
-        assert snapshot.decisions["AAPL"]["portfolio_selected"] is True
-        assert snapshot.decisions["MSFT"]["portfolio_selected"] is False
+        decisions = _snapshot_decisions(snapshot, simulation.symbols)
+        assert decisions["AAPL"]["portfolio_selected"] is True
+        assert decisions["MSFT"]["portfolio_selected"] is False
 
     @pytest.mark.unit
     async def test_max_per_sector_limits_positions_per_sector(
@@ -2746,9 +3273,9 @@ class TestSimulationEnginePortfolioSelection:
         price_bars = self._make_price_bars(date(2024, 1, 14))
         trading_day = date(2024, 1, 15)
         engine._trading_days_cache[simulation.id] = [trading_day]
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             sym: price_bars for sym in simulation.symbols
-        }
+        })
         engine._sector_cache[simulation.id] = {
             "AAPL": "Technology",
             "MSFT": "Technology",
@@ -2823,9 +3350,9 @@ class TestSimulationEnginePortfolioSelection:
         engine._trading_days_cache[simulation.id] = [trading_day]
         # Include price bars for the simulation symbols and the open-position symbols
         all_symbols = simulation.symbols + ["NVDA", "TSLA"]
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             sym: price_bars for sym in all_symbols
-        }
+        })
         engine._sector_cache[simulation.id] = {sym: None for sym in all_symbols}
 
         mock_agent = MagicMock()
@@ -2877,9 +3404,9 @@ class TestSimulationEnginePortfolioSelection:
         price_bars = self._make_price_bars(date(2024, 1, 14))
         trading_day = date(2024, 1, 15)
         engine._trading_days_cache[simulation.id] = [trading_day]
-        engine._price_cache[simulation.id] = {
+        engine._price_cache[simulation.id] = PriceMatrix.from_bars({
             sym: price_bars for sym in simulation.symbols
-        }
+        })
         engine._sector_cache[simulation.id] = {sym: None for sym in simulation.symbols}
 
         # AAPL and MSFT → BUY, GOOGL → NO_SIGNAL
@@ -2896,15 +3423,16 @@ class TestSimulationEnginePortfolioSelection:
             snapshot = await engine.step_day(simulation.id)
 
         # Both BUY signals must have portfolio_selected in their decision entry
-        assert "portfolio_selected" in snapshot.decisions["AAPL"]
-        assert "portfolio_selected" in snapshot.decisions["MSFT"]
+        decisions = _snapshot_decisions(snapshot, simulation.symbols)
+        assert "portfolio_selected" in decisions["AAPL"]
+        assert "portfolio_selected" in decisions["MSFT"]
         # Non-BUY (NO_SIGNAL) decisions must NOT have the key
-        assert "portfolio_selected" not in snapshot.decisions["GOOGL"]
+        assert "portfolio_selected" not in decisions["GOOGL"]
 
         # Exactly one of the two BUY signals was selected (FIFO + max_open_positions=1)
         buy_selected = [
             sym for sym in ["AAPL", "MSFT"]
-            if snapshot.decisions[sym]["portfolio_selected"]
+            if decisions[sym]["portfolio_selected"]
         ]
         assert len(buy_selected) == 1
 
@@ -2915,7 +3443,7 @@ class TestSimulationEnginePortfolioSelection:
         engine = SimulationEngine(AsyncMock(), session_factory=mock_session_factory)
 
         engine._sector_cache[42] = {"AAPL": "Technology"}
-        engine._price_cache[42] = {}
+        engine._price_cache[42] = PriceMatrix.from_bars({})
         engine._trading_days_cache[42] = []
         engine._peak_equity[42] = Decimal("10000")
         engine._max_drawdown[42] = Decimal("0")
@@ -2928,6 +3456,94 @@ class TestSimulationEnginePortfolioSelection:
         assert 42 not in engine._peak_equity
         assert 42 not in engine._max_drawdown
 
+    @pytest.mark.unit
+    async def test_engines_share_price_matrix_through_shared_cache(self) -> None:
+        """Simulations with the same load key fetch once and share one matrix."""
+        from app.providers.base import PriceDataPoint
+        from app.services.arena.shared_price_cache import SharedPriceCache
+
+        async def mock_get_price_data_batch(symbols, start_date, end_date, interval):
+            return {
+                symbol: [
+                    PriceDataPoint(
+                        symbol=symbol,
+                        timestamp=datetime(2024, 1, 15, tzinfo=timezone.utc) + timedelta(days=i),
+                        open_price=100.0,
+                        high_price=102.0,
+                        low_price=98.0,
+                        close_price=101.0,
+                        volume=1000000,
+                    )
+                    for i in range(5)
+                ]
+                for symbol in symbols
+            }
+
+        shared = SharedPriceCache()
+        engines = [
+            SimulationEngine(AsyncMock(), session_factory=MagicMock(), price_cache=shared)
+            for _ in range(2)
+        ]
+        fetch = AsyncMock(side_effect=mock_get_price_data_batch)
+        for engine in engines:
+            engine.data_service.get_price_data_batch = fetch
+
+        for sim_id, engine in enumerate(engines, start=1):
+            await engine._load_price_cache(
+                sim_id, ["MSFT", "AAPL"], date(2024, 1, 15), date(2024, 1, 20), 30
+            )
+
+        assert engines[0]._price_cache[1] is engines[1]._price_cache[2]
+        # One batch fetch for the universe, not one per simulation
+        assert fetch.await_count == 1
+        assert fetch.await_args.args[0] == ["AAPL", "MSFT"]
+
+        # The matrix survives until its last simulation releases it
+        engines[0].clear_simulation_cache(1)
+        assert len(shared) == 1
+        engines[1].clear_simulation_cache(2)
+        assert len(shared) == 0
+
+    @pytest.mark.unit
+    async def test_signals_shared_across_configs_with_same_signal_key(self) -> None:
+        """Sweep configs differing only in thresholds score each symbol once."""
+        from app.services.arena.agents.live20_agent import Live20ArenaAgent
+        from app.services.arena.shared_price_cache import SharedPriceCache
+
+        shared = SharedPriceCache()
+        matrix = PriceMatrix.from_bars({
+            "AAPL": [
+                PriceBar(
+                    date=date(2024, 1, 1) + timedelta(days=i),
+                    open=Decimal("100"),
+                    high=Decimal("101"),
+                    low=Decimal("99"),
+                    close=Decimal("100"),
+                    volume=1000000,
+                )
+                for i in range(30)
+            ]
+        })
+        engines = [
+            SimulationEngine(AsyncMock(), session_factory=MagicMock(), price_cache=shared)
+            for _ in range(2)
+        ]
+        for sim_id, engine in enumerate(engines, start=1):
+            with patch.object(engine, "_fetch_price_matrix", AsyncMock(return_value=matrix)):
+                await engine._load_price_cache(
+                    sim_id, ["AAPL"], date(2024, 1, 20), date(2024, 1, 30), 30
+                )
+
+        first = Live20ArenaAgent({"min_buy_score": 60})
+        second = Live20ArenaAgent({"min_buy_score": 80})
+        engines[0]._load_signal_cache(1, first, ["AAPL"])
+        with patch.object(second, "precompute_signals") as precompute:
+            engines[1]._load_signal_cache(2, second, ["AAPL"])
+
+        precompute.assert_not_called()
+        assert engines[1]._signal_cache[2]["AAPL"]._agent is second
+        assert engines[0]._signal_cache[1]["AAPL"]._agent is first
+
 
 # =============================================================================
 # Layer 4: ATR-Based Trailing Stop integration tests
@@ -3031,7 +3647,7 @@ class TestSimulationEngineAtrStop:
 
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[atr_simulation.id] = trading_days
-        engine._price_cache[atr_simulation.id] = {"AAPL": price_bars}
+        engine._price_cache[atr_simulation.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[atr_simulation.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3086,7 +3702,7 @@ class TestSimulationEngineAtrStop:
 
         trading_days = [date(2024, 1, 15), date(2024, 1, 16)]
         engine._trading_days_cache[atr_simulation.id] = trading_days
-        engine._price_cache[atr_simulation.id] = {"AAPL": price_bars}
+        engine._price_cache[atr_simulation.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[atr_simulation.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3185,7 +3801,7 @@ class TestSimulationEngineTakeProfit:
         ]
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3241,7 +3857,7 @@ class TestSimulationEngineTakeProfit:
         ]
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3295,7 +3911,7 @@ class TestSimulationEngineTakeProfit:
         ]
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3346,7 +3962,7 @@ class TestSimulationEngineTakeProfit:
         ]
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3395,7 +4011,7 @@ class TestSimulationEngineTakeProfit:
         ]
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3450,7 +4066,7 @@ class TestSimulationEngineTakeProfit:
         ]
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3504,7 +4120,7 @@ class TestSimulationEngineTakeProfit:
         ]
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3557,7 +4173,7 @@ class TestSimulationEngineTakeProfit:
         ]
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3608,7 +4224,7 @@ class TestSimulationEngineTakeProfit:
         ]
         trading_days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         # Mock ATR to return 3.0%
@@ -3714,7 +4330,7 @@ class TestSimulationEngineMaxHold:
         await db_session.commit()
 
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3769,7 +4385,7 @@ class TestSimulationEngineMaxHold:
         await db_session.commit()
 
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3834,7 +4450,7 @@ class TestSimulationEngineMaxHold:
         await db_session.commit()
 
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3886,7 +4502,7 @@ class TestSimulationEngineMaxHold:
         await db_session.commit()
 
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -3944,7 +4560,7 @@ class TestSimulationEngineMaxHold:
         await db_session.commit()
 
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -4003,7 +4619,7 @@ class TestSimulationEngineRegimeFilter:
         bars = self._spy_bars(closes)
         current_date = bars[-1].date
 
-        engine._price_cache[1] = {"SPY": bars}
+        engine._price_cache[1] = PriceMatrix.from_bars({"SPY": bars})
 
         regime = engine._detect_market_regime(1, current_date, "SPY", sma_period=20)
 
@@ -4021,7 +4637,7 @@ class TestSimulationEngineRegimeFilter:
         bars = self._spy_bars(closes)
         current_date = bars[-1].date
 
-        engine._price_cache[1] = {"SPY": bars}
+        engine._price_cache[1] = PriceMatrix.from_bars({"SPY": bars})
 
         regime = engine._detect_market_regime(1, current_date, "SPY", sma_period=20)
 
@@ -4038,7 +4654,7 @@ class TestSimulationEngineRegimeFilter:
         bars = self._spy_bars(closes)
         current_date = bars[-1].date
 
-        engine._price_cache[1] = {"SPY": bars}
+        engine._price_cache[1] = PriceMatrix.from_bars({"SPY": bars})
 
         regime = engine._detect_market_regime(1, current_date, "SPY", sma_period=20)
 
@@ -4056,7 +4672,7 @@ class TestSimulationEngineRegimeFilter:
         bars = self._spy_bars(closes)
         current_date = bars[19].date  # last bar before the future spike
 
-        engine._price_cache[1] = {"SPY": bars}
+        engine._price_cache[1] = PriceMatrix.from_bars({"SPY": bars})
 
         # On current_date the last close is 100 and SMA(20) of the last 20 bars is 100
         # so close == SMA → "bear" (not strictly above)
@@ -4118,12 +4734,12 @@ class TestSimulationEngineRegimeFilter:
         ]
 
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({
             "AAPL": stock_bars,
             "MSFT": stock_bars,
             "GOOG": stock_bars,
             "SPY": spy_bars,
-        }
+        })
         engine._sector_cache[sim.id] = {"AAPL": "Tech", "MSFT": "Tech", "GOOG": "Tech"}
 
         # Agent always says BUY for all 3 symbols
@@ -4186,11 +4802,11 @@ class TestSimulationEngineRegimeFilter:
         ]
 
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({
             "AAPL": stock_bars,
             "MSFT": stock_bars,
             "GOOG": stock_bars,
-        }
+        })
         engine._sector_cache[sim.id] = {"AAPL": "Tech", "MSFT": "Tech", "GOOG": "Tech"}
 
         mock_agent = MagicMock()
@@ -4263,7 +4879,7 @@ class TestSimulationEngineBreakevenAndRatchet:
         """Pre-populate caches with a single price bar."""
         trading_days = [date(2024, 1, 16), date(2024, 1, 17), date(2024, 1, 18)]
         engine._trading_days_cache[sim_id] = trading_days
-        engine._price_cache[sim_id] = {"AAPL": [price_bar]}
+        engine._price_cache[sim_id] = PriceMatrix.from_bars({"AAPL": [price_bar]})
         engine._sector_cache[sim_id] = {"AAPL": None}
 
     @pytest.mark.unit
@@ -4622,7 +5238,7 @@ class TestRiskBasedPositionSizing:
             close=Decimal("100.00"),
             volume=1_000_000,
         )
-        engine._price_cache[sim.id] = {"AAPL": atr_bars + [today_bar]}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": atr_bars + [today_bar]})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -4706,7 +5322,7 @@ class TestRiskBasedPositionSizing:
             close=Decimal("100.00"),
             volume=1_000_000,
         )
-        engine._price_cache[sim.id] = {"AAPL": sparse_bars + [today_bar]}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": sparse_bars + [today_bar]})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -4785,7 +5401,7 @@ class TestRiskBasedPositionSizing:
             close=Decimal("100.00"),
             volume=1_000_000,
         )
-        engine._price_cache[sim.id] = {"AAPL": atr_bars + [today_bar]}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": atr_bars + [today_bar]})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -4850,7 +5466,7 @@ class TestRiskBasedPositionSizing:
                 volume=1_000_000,
             )
         ]
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -4903,7 +5519,7 @@ class TestRiskBasedPositionSizing:
                 volume=1_000_000,
             )
         ]
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -5016,7 +5632,7 @@ class TestWinStreakTracking:
                 volume=1_000_000,
             ),
         ]
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -5071,7 +5687,7 @@ class TestWinStreakTracking:
                 volume=1_000_000,
             )
         ]
-        engine._price_cache[sim.id] = {"AAPL": price_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": price_bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -5544,7 +6160,7 @@ class TestRiskBasedSizingClampedAndCappedByCash:
             close=Decimal("100.00"),
             volume=1_000_000,
         )
-        engine._price_cache[sim.id] = {"AAPL": bars + [today_bar]}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": bars + [today_bar]})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -5604,7 +6220,7 @@ class TestRiskBasedSizingClampedAndCappedByCash:
             close=Decimal("100.00"),
             volume=1_000_000,
         )
-        engine._price_cache[sim.id] = {"AAPL": bars + [today_bar]}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": bars + [today_bar]})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -5702,10 +6318,10 @@ class TestRiskBasedSizingClampedAndCappedByCash:
             close=Decimal("100.00"),
             volume=1_000_000,
         )
-        engine._price_cache[sim.id] = {
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({
             "AAPL": bars + [today_bar],
             "MSFT": bars + [today_bar],
-        }
+        })
         engine._sector_cache[sim.id] = {"AAPL": None, "MSFT": None}
 
         mock_agent = MagicMock()
@@ -5796,7 +6412,7 @@ class TestSimulationEngineIBSFilter:
         bars = self._make_bars(close=close, high=high, low=low)
 
         engine._trading_days_cache[sim.id] = trading_days
-        engine._price_cache[sim.id] = {"AAPL": bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": bars})
         engine._sector_cache[sim.id] = {"AAPL": None}
 
         mock_agent = MagicMock()
@@ -5820,7 +6436,7 @@ class TestSimulationEngineIBSFilter:
             select(ArenaSnapshot).where(ArenaSnapshot.simulation_id == sim.id)
         )
         snapshot = snap_result.scalar_one_or_none()
-        decisions = snapshot.decisions if snapshot else {}
+        decisions = _snapshot_decisions(snapshot, sim.symbols) if snapshot else {}
 
         return len(pending), decisions
 
@@ -6003,7 +6619,7 @@ class TestSimulationEngineIBSFilter:
         aapl_bars = self._make_bars(close=55.0, high=60.0, low=40.0)  # IBS=0.75
         msft_bars = self._make_bars(close=42.0, high=60.0, low=40.0)  # IBS=0.10
 
-        engine._price_cache[sim.id] = {"AAPL": aapl_bars, "MSFT": msft_bars}
+        engine._price_cache[sim.id] = PriceMatrix.from_bars({"AAPL": aapl_bars, "MSFT": msft_bars})
         engine._sector_cache[sim.id] = {"AAPL": None, "MSFT": None}
 
         mock_agent = MagicMock()
@@ -6035,10 +6651,11 @@ class TestSimulationEngineIBSFilter:
         )
         snapshot = snap_result.scalar_one_or_none()
         assert snapshot is not None
-        aapl_decision = snapshot.decisions.get("AAPL", {})
+        decisions = _snapshot_decisions(snapshot, sim.symbols)
+        aapl_decision = decisions.get("AAPL", {})
         assert aapl_decision.get("ibs_filtered") is True
         assert aapl_decision.get("portfolio_selected") is False
 
         # MSFT should not have ibs_filtered set (it passed)
-        msft_decision = snapshot.decisions.get("MSFT", {})
+        msft_decision = decisions.get("MSFT", {})
         assert "ibs_filtered" not in msft_decision
@@ -0,0 +1,71 @@
+"""Unit tests for StepProfile phase timings and counters."""
+
+import pytest
+
+from app.services.arena.step_profile import StepProfile, counting_statements, _active_profile
+
+
+@pytest.mark.unit
+class TestStepProfile:
+    """Tests for StepProfile accumulation and serialization."""
+
+    def test_accumulates_time_and_calls_per_phase(self) -> None:
+        """Each add_time adds one call and its duration."""
+        profile = StepProfile()
+
+        profile.add_time("agent", 0.002)
+        profile.add_time("agent", 0.003)
+        profile.add_time("commit", 0.010)
+
+        assert profile.to_dict()["phases"] == {
+            "agent": {"total_ms": 5.0, "calls": 2},
+            "commit": {"total_ms": 10.0, "calls": 1},
+        }
+
+    def test_counts_counters(self) -> None:
+        """count adds to named counters, default increment 1."""
+        profile = StepProfile()
+
+        profile.count("days")
+        profile.count("symbols_evaluated", 600)
+        profile.count("symbols_evaluated", 600)
+
+        assert profile.to_dict()["counters"] == {"days": 1, "symbols_evaluated": 1200}
+
+    def test_continues_from_stored_profile(self) -> None:
+        """A profile built from to_dict() keeps accumulating (resume case)."""
+        stored = StepProfile()
+        stored.add_time("agent", 0.004)
+        stored.count("days", 3)
+
+        resumed = StepProfile(stored.to_dict())
+        resumed.add_time("agent", 0.001)
+        resumed.count("days")
+
+        assert resumed.to_dict() == {
+            "phases": {"agent": {"total_ms": 5.0, "calls": 2}},
+            "counters": {"days": 4},
+        }
+
+    def test_disabled_profile_records_nothing(self) -> None:
+        """With enabled=False all recording is a no-op."""
+        profile = StepProfile(enabled=False)
+
+        profile.add_time("agent", 0.5)
+        profile.count("days")
+
+        assert profile.to_dict() == {"phases": {}, "counters": {}}
+
+
+@pytest.mark.unit
+class TestCountingStatements:
+    """Tests for the counting_statements context manager."""
+
+    def test_sets_and_restores_active_profile(self) -> None:
+        """The profile is active only inside the block."""
+        profile = StepProfile()
+
+        with counting_statements(profile):
+            assert _active_profile.get() is profile
+
+        assert _active_profile.get() is None
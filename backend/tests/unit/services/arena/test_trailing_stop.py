@@ -12,6 +12,11 @@ from app.services.arena.trailing_stop import (
     AtrTrailingStop,
     FixedPercentTrailingStop,
     TrailingStopUpdate,
+    from_price_units,
+    scale_price_units,
+    to_multiplier_units,
+    to_price_units,
+    trail_multiplier_units,
 )
 
 
@@ -910,3 +915,90 @@ class TestAtrTrailingStopLifecycle:
         _, _, trail_pct = atr_stop.calculate_initial_stop(Decimal("100.00"), 9.0)
 
         assert trail_pct == Decimal("10.0")
+
+
+class TestTrailingStopUpdateUnits:
+    """Tests for update_units() on both trailing stops."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("high", "low", "previous_highest", "previous_stop"),
+        [
+            ("110.00", "105.00", "100.00", "95.0000"),  # New high raises stop
+            ("108.00", "106.00", "110.00", "104.5000"),  # No new high
+            ("108.00", "104.50", "110.00", "104.5000"),  # Low touches stop
+            ("123.4567", "119.31", "121.13", "115.0735"),  # Stop rounds to 4 places
+            ("100.0030", "99.00", "100.00", "95.0000"),  # 95.002850 ties to even
+        ],
+    )
+    def test_fixed_matches_decimal_update(
+        self, high: str, low: str, previous_highest: str, previous_stop: str
+    ) -> None:
+        """Integer updates give the same highest, stop and trigger as update()."""
+        stop = FixedPercentTrailingStop(Decimal("5.0"))
+
+        expected = stop.update(
+            Decimal(high), Decimal(low), Decimal(previous_highest), Decimal(previous_stop)
+        )
+        highest, stop_price, triggered = stop.update_units(
+            to_price_units(Decimal(high)),
+            to_price_units(Decimal(low)),
+            to_price_units(Decimal(previous_highest)),
+            to_price_units(Decimal(previous_stop)),
+        )
+
+        assert triggered is expected.stop_triggered
+        assert from_price_units(highest) == expected.highest_price
+        assert from_price_units(stop_price) == expected.stop_price
+
+    @pytest.mark.unit
+    def test_atr_uses_position_trail_multiplier(self) -> None:
+        """ATR integer updates trail by the per-position percentage."""
+        atr_stop = AtrTrailingStop(atr_multiplier=2.0, min_pct=2.0, max_pct=10.0)
+
+        highest, stop_price, triggered = atr_stop.update_units(
+            current_high=1_100_000,
+            current_low=1_050_000,
+            previous_highest=1_000_000,
+            previous_stop=930_000,
+            trail_multiplier=trail_multiplier_units(Decimal("7.0")),
+        )
+
+        assert triggered is False
+        assert highest == 1_100_000
+        assert stop_price == 1_023_000  # 110 * 0.93
+
+    @pytest.mark.unit
+    def test_atr_trigger_returns_previous_stop(self) -> None:
+        """A triggered integer update keeps the previous high and stop."""
+        atr_stop = AtrTrailingStop(atr_multiplier=2.0, min_pct=2.0, max_pct=10.0)
+        multiplier = trail_multiplier_units(Decimal("7.0"))
+
+        assert atr_stop.update_units(1_080_000, 1_020_000, 1_100_000, 1_023_000, multiplier) == (
+            1_100_000,
+            1_023_000,
+            True,
+        )
+
+
+class TestPriceUnits:
+    """Tests for the integer price unit helpers."""
+
+    @pytest.mark.unit
+    def test_price_units_round_trip(self) -> None:
+        """Prices with up to 4 decimal places convert exactly."""
+        assert to_price_units(Decimal("123.4567")) == 1_234_567
+        assert to_price_units(Decimal("5")) == 50_000
+        assert from_price_units(1_234_567) == Decimal("123.4567")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("half_even", "expected"),
+        [(True, 950_028), (False, 950_029)],
+    )
+    def test_scale_price_units_ties(self, half_even: bool, expected: int) -> None:
+        """Exact ties round to even or away from zero, like Decimal and Numeric."""
+        # 100.0030 * 0.95 = 95.002850
+        multiplier = to_multiplier_units(Decimal("0.95"))
+
+        assert scale_price_units(1_000_030, multiplier, half_even) == expected
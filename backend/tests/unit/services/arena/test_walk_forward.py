@@ -0,0 +1,134 @@
+"""Unit tests for walk-forward window building and equity stitching."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.services.arena.walk_forward import (
+    WalkForwardWindow,
+    build_walk_forward_windows,
+    stitch_equity_curves,
+)
+
+
+@pytest.mark.unit
+class TestBuildWalkForwardWindows:
+    """Tests for build_walk_forward_windows."""
+
+    def test_back_to_back_test_periods_by_default(self) -> None:
+        """Without step_days, test periods follow each other with no gap."""
+        windows = build_walk_forward_windows(date(2024, 1, 1), date(2024, 3, 31), 30, 30)
+
+        assert windows == [
+            WalkForwardWindow(
+                index=0,
+                train_start=date(2024, 1, 1),
+                train_end=date(2024, 1, 30),
+                test_start=date(2024, 1, 31),
+                test_end=date(2024, 2, 29),
+            ),
+            WalkForwardWindow(
+                index=1,
+                train_start=date(2024, 1, 31),
+                train_end=date(2024, 2, 29),
+                test_start=date(2024, 3, 1),
+                test_end=date(2024, 3, 30),
+            ),
+            WalkForwardWindow(
+                index=2,
+                train_start=date(2024, 3, 1),
+                train_end=date(2024, 3, 30),
+                test_start=date(2024, 3, 31),
+                test_end=date(2024, 3, 31),
+            ),
+        ]
+
+    def test_step_days_controls_window_spacing(self) -> None:
+        """step_days moves each window start by that many days."""
+        windows = build_walk_forward_windows(
+            date(2024, 1, 1), date(2024, 2, 29), 30, 20, step_days=10
+        )
+
+        assert [w.test_start for w in windows] == [
+            date(2024, 1, 31),
+            date(2024, 2, 10),
+            date(2024, 2, 20),
+        ]
+        assert windows[-1].test_end == date(2024, 2, 29)
+
+    def test_range_shorter_than_train_period_yields_no_windows(self) -> None:
+        """No window fits when the train period already covers the range."""
+        assert build_walk_forward_windows(date(2024, 1, 1), date(2024, 1, 20), 30, 10) == []
+
+    def test_rejects_non_positive_lengths(self) -> None:
+        """Period lengths below one day raise ValueError."""
+        with pytest.raises(ValueError, match="must be >= 1"):
+            build_walk_forward_windows(date(2024, 1, 1), date(2024, 6, 1), 30, 0)
+
+
+@pytest.mark.unit
+class TestStitchEquityCurves:
+    """Tests for stitch_equity_curves."""
+
+    def test_compounds_windows_from_previous_end(self) -> None:
+        """Each window is rescaled to start where the previous one ended."""
+        capital = Decimal("10000")
+        curves = [
+            [(date(2024, 1, 2), Decimal("10000")), (date(2024, 1, 3), Decimal("11000"))],
+            [(date(2024, 1, 4), Decimal("10000")), (date(2024, 1, 5), Decimal("10500"))],
+        ]
+
+        stitched = stitch_equity_curves(curves, capital)
+
+        assert stitched == [
+            (date(2024, 1, 2), Decimal("10000.00")),
+            (date(2024, 1, 3), Decimal("11000.00")),
+            (date(2024, 1, 4), Decimal("11000.00")),
+            (date(2024, 1, 5), Decimal("11550.00")),
+        ]
+
+    def test_skips_overlapping_dates_and_empty_windows(self) -> None:
+        """Dates already covered are dropped and empty windows are ignored."""
+        capital = Decimal("1000")
+        curves = [
+            [(date(2024, 1, 2), Decimal("1000")), (date(2024, 1, 3), Decimal("900"))],
+            [],
+            [(date(2024, 1, 3), Decimal("1000")), (date(2024, 1, 4), Decimal("1100"))],
+        ]
+
+        stitched = stitch_equity_curves(curves, capital)
+
+        assert stitched == [
+            (date(2024, 1, 2), Decimal("1000.00")),
+            (date(2024, 1, 3), Decimal("900.00")),
+            (date(2024, 1, 4), Decimal("990.00")),
+        ]
+
+    def test_overlapping_window_is_rebased_on_last_skipped_date(self) -> None:
+        """Only returns after the already-covered dates are compounded."""
+        capital = Decimal("1000")
+        curves = [
+            [(date(2024, 1, 2), Decimal("1000")), (date(2024, 1, 3), Decimal("900"))],
+            [
+                (date(2024, 1, 2), Decimal("1000")),
+                (date(2024, 1, 3), Decimal("1200")),
+                (date(2024, 1, 4), Decimal("1320")),
+            ],
+            [(date(2024, 1, 5), Decimal("1000")), (date(2024, 1, 8), Decimal("1100"))],
+        ]
+
+        stitched = stitch_equity_curves(curves, capital)
+
+        # Window 1 gains 10% after Jan 3 (1200 -> 1320), not 32% from its start
+        assert stitched == [
+            (date(2024, 1, 2), Decimal("1000.00")),
+            (date(2024, 1, 3), Decimal("900.00")),
+            (date(2024, 1, 4), Decimal("990.00")),
+            (date(2024, 1, 5), Decimal("990.00")),
+            (date(2024, 1, 8), Decimal("1089.00")),
+        ]
+
+    def test_no_curves_returns_empty(self) -> None:
+        """Nothing to stitch gives an empty curve."""
+        assert stitch_equity_curves([], Decimal("10000")) == []
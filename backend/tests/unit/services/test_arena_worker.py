@@ -3,16 +3,32 @@
 Tests the worker that processes arena simulation jobs from the queue.
 """
 
+import asyncio
 import logging
-from datetime import date, datetime, timezone
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.models.arena import ArenaSimulation, ArenaSnapshot, SimulationStatus
-from app.services.arena.arena_worker import ArenaWorker
+from app.services.arena.agent_protocol import PriceBar
+from app.services.arena.arena_worker import (
+    ArenaWorker,
+    SharedPrices,
+    _init_pool_process,
+    precompute_signals_in_process,
+    run_simulation_in_process,
+)
+from app.services.arena.price_matrix import PriceMatrix
+from app.services.arena.shared_price_cache import PriceCacheKey, SharedPriceCache
+from app.services.arena.shared_price_memory import SharedPriceMatrix
 from app.services.job_queue_service import JobQueueService
+from app.services.job_worker import JobInterrupted
 
 
 async def create_arena_simulation(
@@ -63,6 +79,7 @@ def mock_queue_service():
     service = MagicMock(spec=JobQueueService)
     service.worker_id = "arena-worker-test"
     service.is_cancelled = AsyncMock(return_value=False)
+    service.release_job = AsyncMock(return_value=True)
     return service
 
 
@@ -71,7 +88,7 @@ def mock_simulation_engine():
     """Create a mock SimulationEngine."""
     mock = MagicMock()
     mock.initialize_simulation = AsyncMock()
-    mock.step_day = AsyncMock()
+    mock.run_to_completion = AsyncMock()
     return mock
 
 
@@ -90,10 +107,268 @@ def create_mock_engine_with_immediate_completion():
     """Create a mock SimulationEngine that immediately completes."""
     mock_engine = MagicMock()
     mock_engine.initialize_simulation = AsyncMock()
-    mock_engine.step_day = AsyncMock(return_value=None)
+    mock_engine.run_to_completion = AsyncMock(return_value=MagicMock(
+        status=SimulationStatus.COMPLETED.value, current_day=0
+    ))
     return mock_engine
 
 
+def fake_run_to_completion(mock_engine_cls, processed_days: list[int] | None = None):
+    """Build a run_to_completion stand-in that advances one day at a time.
+
+    Mirrors the engine contract: checks should_cancel before each day,
+    commits current_day on the worker's engine session, and marks the
+    simulation COMPLETED at the end.
+    """
+
+    async def run(sim_id, should_cancel=None):
+        session = mock_engine_cls.call_args.args[0]
+        sim = await session.get(ArenaSimulation, sim_id)
+        while sim.current_day < sim.total_days:
+            if should_cancel is not None and await should_cancel():
+                return sim
+            if processed_days is not None:
+                processed_days.append(sim.current_day)
+            sim.current_day += 1
+            await session.commit()
+        sim.status = SimulationStatus.COMPLETED.value
+        await session.commit()
+        return sim
+
+    return run
+
+
+@pytest.mark.unit
+class TestArenaWorkerInit:
+    """Tests for ArenaWorker construction."""
+
+    def test_default_runs_in_process(self, rollback_session_factory, mock_queue_service):
+        """Should run one simulation at a time on the event loop by default."""
+        worker = ArenaWorker(rollback_session_factory, mock_queue_service)
+
+        assert worker.processes == 0
+        assert worker.max_concurrent_jobs == 1
+
+    def test_processes_sets_concurrency(self, rollback_session_factory, mock_queue_service):
+        """Should claim as many concurrent jobs as there are pool processes."""
+        worker = ArenaWorker(rollback_session_factory, mock_queue_service, processes=6)
+
+        assert worker.processes == 6
+        assert worker.max_concurrent_jobs == 6
+
+    def test_negative_processes_raises(self, rollback_session_factory, mock_queue_service):
+        """Should reject a negative process count."""
+        with pytest.raises(ValueError, match="processes must be >= 0"):
+            ArenaWorker(rollback_session_factory, mock_queue_service, processes=-1)
+
+
+@pytest.mark.unit
+class TestArenaWorkerLanes:
+    """Tests for choosing the pool lane a simulation runs in."""
+
+    def test_takes_least_busy_lane(self, mock_queue_service):
+        """Sweep configurations and other simulations alike spread over idle lanes."""
+        worker = ArenaWorker(MagicMock(), mock_queue_service, processes=3)
+        worker._lane_loads = [2, 0, 1]
+
+        assert worker._pick_lane() == 1
+
+
+@pytest.mark.unit
+class TestArenaWorkerSharedPrices:
+    """Tests for sharing price matrices and signals with pool processes."""
+
+    @staticmethod
+    def _simulation(
+        simulation_id: int, agent_config: dict, group_id: str | None = None
+    ) -> ArenaSimulation:
+        return ArenaSimulation(
+            id=simulation_id,
+            symbols=["MSFT", "AAPL"],
+            start_date=date(2024, 1, 15),
+            end_date=date(2024, 2, 15),
+            agent_type="live20",
+            agent_config=agent_config,
+            group_id=group_id,
+        )
+
+    async def test_simulations_on_same_prices_share_one_matrix(self, mock_queue_service):
+        """A comparison group's strategies load and publish their prices once."""
+        worker = ArenaWorker(MagicMock(), mock_queue_service, processes=2)
+        load = AsyncMock(return_value=PriceMatrix.empty())
+
+        with patch("app.services.arena.arena_worker.load_price_matrix", load):
+            first = await worker._share_prices(self._simulation(1, {"trailing_stop_pct": 5.0}))
+            second = await worker._share_prices(self._simulation(2, {"trailing_stop_pct": 8.0}))
+
+        assert load.await_count == 1
+        assert first.key == second.key
+        assert first.matrix.name == second.matrix.name
+
+        worker._shared_prices.release(first.key)
+        worker._shared_prices.release(second.key)
+        await worker.stop()
+        assert len(worker._shared_prices) == 0
+
+    async def test_failed_load_leaves_loading_to_pool_process(self, mock_queue_service):
+        """A load error is not raised here; the pool process reports it as usual."""
+        worker = ArenaWorker(MagicMock(), mock_queue_service, processes=2)
+
+        with patch(
+            "app.services.arena.arena_worker.load_price_matrix",
+            AsyncMock(side_effect=ValueError("no data for MSFT")),
+        ):
+            prices = await worker._share_prices(self._simulation(1, {}))
+
+        assert prices is None
+        assert len(worker._shared_prices) == 0
+
+    async def test_group_signals_computed_once(self, mock_queue_service):
+        """Sweep configurations scoring alike get one set of signals, computed in a lane."""
+        worker = ArenaWorker(MagicMock(), mock_queue_service, processes=2)
+        worker._lanes = [ThreadPoolExecutor(max_workers=1) for _ in range(2)]
+        signals = {"AAPL": MagicMock(), "MSFT": MagicMock()}
+        sweep = "7d2f6c1e-0b9a-4e53-9f0a-2c1d8e4b6a35"
+        shared = []
+
+        try:
+            with patch(
+                "app.services.arena.arena_worker.load_price_matrix",
+                AsyncMock(return_value=PriceMatrix.empty()),
+            ), patch(
+                "app.services.arena.arena_worker.precompute_signals_in_process",
+                return_value=signals,
+            ) as compute:
+                shared = await asyncio.gather(
+                    *(
+                        worker._share_prices(
+                            self._simulation(i, {"min_buy_score": score}, sweep)
+                        )
+                        for i, score in enumerate((60, 70, 80), start=1)
+                    )
+                )
+
+            compute.assert_called_once()
+            assert all(prices.signals is signals for prices in shared)
+            assert len({prices.signal_key for prices in shared}) == 1
+            assert worker._lane_loads == [0, 0]
+        finally:
+            for prices in shared:
+                worker._shared_prices.release(prices.key)
+            await worker.stop()
+
+    async def test_ungrouped_simulation_computes_own_signals(self, mock_queue_service):
+        """A standalone simulation's pool process computes its signals, as before."""
+        worker = ArenaWorker(MagicMock(), mock_queue_service, processes=2)
+
+        with patch(
+            "app.services.arena.arena_worker.load_price_matrix",
+            AsyncMock(return_value=PriceMatrix.empty()),
+        ), patch(
+            "app.services.arena.arena_worker.precompute_signals_in_process"
+        ) as compute:
+            prices = await worker._share_prices(self._simulation(1, {}))
+
+        compute.assert_not_called()
+        assert prices.signals is None
+        worker._shared_prices.release(prices.key)
+
+    async def test_failed_signal_computation_leaves_it_to_pool_process(
+        self, mock_queue_service
+    ):
+        """Prices are still shared when the group's signals could not be computed."""
+        worker = ArenaWorker(MagicMock(), mock_queue_service, processes=2)
+        worker._lanes = [ThreadPoolExecutor(max_workers=1) for _ in range(2)]
+
+        try:
+            with patch(
+                "app.services.arena.arena_worker.load_price_matrix",
+                AsyncMock(return_value=PriceMatrix.empty()),
+            ), patch(
+                "app.services.arena.arena_worker.precompute_signals_in_process",
+                side_effect=RuntimeError("boom"),
+            ):
+                prices = await worker._share_prices(self._simulation(1, {}, "group"))
+
+            assert prices is not None
+            assert prices.signals is None
+            worker._shared_prices.release(prices.key)
+        finally:
+            await worker.stop()
+
+    def test_precompute_signals_in_process(self):
+        """The lane entry point scores the traded symbols on the published matrix."""
+        bars = [
+            PriceBar(
+                date=date(2024, 1, 1) + timedelta(days=i),
+                open=Decimal("100"),
+                high=Decimal("101"),
+                low=Decimal("99"),
+                close=Decimal("100"),
+                volume=1_000_000,
+            )
+            for i in range(30)
+        ]
+        published = SharedPriceMatrix.publish(PriceMatrix.from_bars({"AAPL": bars, "SPY": bars}))
+        key = PriceCacheKey(
+            symbols=("AAPL",),
+            data_start=date(2024, 1, 1),
+            end_date=date(2024, 1, 30),
+            regime_symbol="SPY",
+            regime_start=date(2024, 1, 1),
+        )
+
+        signals = precompute_signals_in_process(
+            SharedPrices(key, published.ref), "live20", {"min_buy_score": 60}
+        )
+
+        assert list(signals) == ["AAPL"]
+
+    def test_pool_process_attaches_published_matrix(self):
+        """The pool process runs on the published matrix instead of loading its own."""
+        bar = PriceBar(
+            date=date(2024, 1, 2),
+            open=Decimal("100"),
+            high=Decimal("101"),
+            low=Decimal("99"),
+            close=Decimal("100"),
+            volume=1_000,
+        )
+        published = SharedPriceMatrix.publish(PriceMatrix.from_bars({"AAPL": [bar]}))
+        key = PriceCacheKey(
+            symbols=("AAPL",), data_start=date(2023, 11, 1), end_date=date(2024, 1, 31)
+        )
+        cache = SharedPriceCache()
+        seen = {}
+
+        signals = {"AAPL": MagicMock()}
+
+        async def run(session_factory, queue_service, simulation_id, should_stop):
+            seen["matrix"] = await cache.acquire(key, AsyncMock(side_effect=AssertionError))
+            seen["signals"] = cache.get_signals(key, "signal-key")
+            cache.release(key)
+            return False
+
+        with patch(
+            "app.services.arena.arena_worker.get_shared_price_cache", return_value=cache
+        ), patch(
+            "app.services.arena.arena_worker.create_async_engine",
+            return_value=MagicMock(dispose=AsyncMock()),
+        ), patch(
+            "app.services.arena.arena_worker.run_simulation", side_effect=run
+        ):
+            stopped = run_simulation_in_process(
+                1, "arena-worker-test", SharedPrices(key, published.ref, "signal-key", signals)
+            )
+
+        assert stopped is False
+        assert isinstance(seen["matrix"], SharedPriceMatrix)
+        assert seen["matrix"].ref.name == published.ref.name
+        assert seen["signals"] is signals
+        # Released after the run
+        assert key not in cache
+
+
 @pytest.mark.unit
 class TestArenaWorkerProcessJob:
     """Tests for the process_job method."""
@@ -124,13 +399,16 @@ class TestArenaWorkerProcessJob:
                     await session.commit()
 
             mock_engine.initialize_simulation = AsyncMock(side_effect=mock_init)
-            mock_engine.step_day = AsyncMock(return_value=None)  # Immediately complete
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
 
             # Verify initialization was called
             mock_engine.initialize_simulation.assert_called_once_with(simulation.id)
+            mock_engine.run_to_completion.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_process_job_skips_initialization_for_resumed_simulation(
@@ -150,7 +428,9 @@ class TestArenaWorkerProcessJob:
         ) as MockEngine:
             mock_engine = MagicMock()
             mock_engine.initialize_simulation = AsyncMock()
-            mock_engine.step_day = AsyncMock(return_value=None)  # Immediately complete
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
@@ -159,9 +439,9 @@ class TestArenaWorkerProcessJob:
             mock_engine.initialize_simulation.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_process_job_checks_cancellation_before_each_day(
+    async def test_process_job_passes_cancellation_check_to_engine(
         self, rollback_session_factory, mock_queue_service    ):
-        """Should check for cancellation before each day's processing."""
+        """Should let the engine poll the queue for cancellation between days."""
         simulation = await create_arena_simulation(
             rollback_session_factory,
             status=SimulationStatus.RUNNING.value,
@@ -181,28 +461,20 @@ class TestArenaWorkerProcessJob:
         ) as MockEngine:
             mock_engine = MagicMock()
             mock_engine.initialize_simulation = AsyncMock()
-
-            # Create a mock snapshot that updates current_day
-            step_count = [0]
-            async def mock_step_day(sim_id):
-                step_count[0] += 1
-                # Update simulation state
-                async with rollback_session_factory() as session:
-                    sim = await session.get(ArenaSimulation, sim_id)
-                    sim.current_day = step_count[0]
-                    await session.commit()
-                # Return mock snapshot
-                mock_snapshot = MagicMock()
-                mock_snapshot.total_equity = Decimal("10000.00")
-                return mock_snapshot
-
-            mock_engine.step_day = AsyncMock(side_effect=mock_step_day)
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
 
         # Should have checked cancellation 3 times (False, False, True)
         assert mock_queue_service.is_cancelled.call_count == 3
+        mock_queue_service.is_cancelled.assert_called_with(simulation.id)
+
+        updated = await get_simulation_by_id(rollback_session_factory, simulation.id)
+        assert updated.current_day == 2
+        assert updated.status == SimulationStatus.RUNNING.value
 
     @pytest.mark.asyncio
     async def test_process_job_stops_on_cancellation(
@@ -219,29 +491,34 @@ class TestArenaWorkerProcessJob:
         mock_queue_service.is_cancelled = AsyncMock(return_value=True)
 
         worker = ArenaWorker(rollback_session_factory, mock_queue_service)
+        processed_days: list[int] = []
 
         with patch(
             "app.services.arena.arena_worker.SimulationEngine"
         ) as MockEngine:
             mock_engine = MagicMock()
             mock_engine.initialize_simulation = AsyncMock()
-            mock_engine.step_day = AsyncMock()
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine, processed_days)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
 
-            # step_day should not be called due to immediate cancellation
-            mock_engine.step_day.assert_not_called()
+        # No day should be processed due to immediate cancellation
+        assert processed_days == []
+        # The shared price matrix is released even though the run stopped early
+        mock_engine.clear_simulation_cache.assert_called_once_with(simulation.id)
 
     @pytest.mark.asyncio
-    async def test_process_job_completes_all_days(
+    async def test_process_job_releases_price_cache_on_failure(
         self, rollback_session_factory, mock_queue_service    ):
-        """Should process all days until completion."""
+        """Should release the engine's shared price matrix when the run raises."""
         simulation = await create_arena_simulation(
             rollback_session_factory,
             status=SimulationStatus.RUNNING.value,
             current_day=0,
-            total_days=3,
+            total_days=5,
         )
 
         worker = ArenaWorker(rollback_session_factory, mock_queue_service)
@@ -250,34 +527,83 @@ class TestArenaWorkerProcessJob:
             "app.services.arena.arena_worker.SimulationEngine"
         ) as MockEngine:
             mock_engine = MagicMock()
-            mock_engine.initialize_simulation = AsyncMock()
+            mock_engine.run_to_completion = AsyncMock(side_effect=RuntimeError("boom"))
+            MockEngine.return_value = mock_engine
 
-            # Mock step_day to update current_day and eventually return None
-            step_count = [0]
-            async def mock_step_day(sim_id):
-                step_count[0] += 1
-                # Update simulation state
-                async with rollback_session_factory() as session:
-                    sim = await session.get(ArenaSimulation, sim_id)
-                    sim.current_day = step_count[0]
-                    await session.commit()
+            with pytest.raises(RuntimeError, match="boom"):
+                await worker.process_job(simulation)
 
-                if step_count[0] >= 3:
-                    # Simulation complete
-                    return None
+        mock_engine.clear_simulation_cache.assert_called_once_with(simulation.id)
 
-                # Return mock snapshot
-                mock_snapshot = MagicMock()
-                mock_snapshot.total_equity = Decimal("10000.00")
-                return mock_snapshot
+    @pytest.mark.asyncio
+    async def test_process_job_completes_all_days(
+        self, rollback_session_factory, mock_queue_service    ):
+        """Should process all days until completion."""
+        simulation = await create_arena_simulation(
+            rollback_session_factory,
+            status=SimulationStatus.RUNNING.value,
+            current_day=0,
+            total_days=3,
+        )
+
+        worker = ArenaWorker(rollback_session_factory, mock_queue_service)
+        processed_days: list[int] = []
 
-            mock_engine.step_day = AsyncMock(side_effect=mock_step_day)
+        with patch(
+            "app.services.arena.arena_worker.SimulationEngine"
+        ) as MockEngine:
+            mock_engine = MagicMock()
+            mock_engine.initialize_simulation = AsyncMock()
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine, processed_days)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
 
-            # Should have called step_day 3 times
-            assert mock_engine.step_day.call_count == 3
+        assert processed_days == [0, 1, 2]
+        updated = await get_simulation_by_id(rollback_session_factory, simulation.id)
+        assert updated.status == SimulationStatus.COMPLETED.value
+
+    @pytest.mark.asyncio
+    async def test_process_job_dispatches_to_pool_when_processes_set(
+        self, rollback_session_factory, mock_queue_service    ):
+        """Should hand the simulation to the process pool instead of running inline."""
+        simulation = await create_arena_simulation(
+            rollback_session_factory,
+            status=SimulationStatus.RUNNING.value,
+            current_day=0,
+            total_days=5,
+        )
+
+        worker = ArenaWorker(rollback_session_factory, mock_queue_service, processes=2)
+        # A thread pool stands in for the process pool: same executor API,
+        # and the patched entry point records the call instead of running.
+        worker._lanes = [ThreadPoolExecutor(max_workers=1) for _ in range(2)]
+
+        try:
+            with patch(
+                "app.services.arena.arena_worker.run_simulation_in_process",
+                return_value=False,
+            ) as mock_entry, patch(
+                "app.services.arena.arena_worker.run_simulation"
+            ) as mock_inline, patch(
+                "app.services.arena.arena_worker.load_price_matrix",
+                AsyncMock(return_value=PriceMatrix.empty()),
+            ):
+                await worker.process_job(simulation)
+
+            mock_entry.assert_called_once()
+            simulation_id, worker_id, prices = mock_entry.call_args.args
+            assert (simulation_id, worker_id) == (simulation.id, "arena-worker-test")
+            assert isinstance(prices, SharedPrices)
+            mock_inline.assert_not_called()
+        finally:
+            await worker.stop()
+
+        assert worker._lanes == []
+        assert worker._lane_loads == [0, 0]
+        assert len(worker._shared_prices) == 0
 
 
 @pytest.mark.unit
@@ -304,7 +630,9 @@ class TestArenaWorkerLogging:
             "app.services.arena.arena_worker.SimulationEngine"
         ) as MockEngine:
             mock_engine = MagicMock()
-            mock_engine.step_day = AsyncMock(return_value=None)
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
@@ -312,6 +640,8 @@ class TestArenaWorkerLogging:
         log_messages = [record.message for record in caplog.records]
         # Should log something about starting at day 2/5
         assert any("day 2/5" in msg for msg in log_messages)
+        assert any("processed days 2-5" in msg for msg in log_messages)
+        assert any("completed" in msg for msg in log_messages)
 
     @pytest.mark.asyncio
     async def test_logs_cancellation(
@@ -335,6 +665,9 @@ class TestArenaWorkerLogging:
             "app.services.arena.arena_worker.SimulationEngine"
         ) as MockEngine:
             mock_engine = MagicMock()
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
@@ -370,7 +703,9 @@ class TestArenaWorkerLogging:
                     await session.commit()
 
             mock_engine.initialize_simulation = AsyncMock(side_effect=mock_init)
-            mock_engine.step_day = AsyncMock(return_value=None)
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
@@ -398,37 +733,22 @@ class TestArenaWorkerResumeCapability:
         )
 
         worker = ArenaWorker(rollback_session_factory, mock_queue_service)
-        processed_days = []
+        processed_days: list[int] = []
 
         with patch(
             "app.services.arena.arena_worker.SimulationEngine"
         ) as MockEngine:
             mock_engine = MagicMock()
             mock_engine.initialize_simulation = AsyncMock()
-
-            async def mock_step_day(sim_id):
-                # Track which day we're processing
-                async with rollback_session_factory() as session:
-                    sim = await session.get(ArenaSimulation, sim_id)
-                    processed_days.append(sim.current_day)
-                    sim.current_day += 1
-                    await session.commit()
-
-                # Return None when complete
-                if len(processed_days) >= 2:  # Days 3 and 4
-                    return None
-
-                mock_snapshot = MagicMock()
-                mock_snapshot.total_equity = Decimal("10000.00")
-                return mock_snapshot
-
-            mock_engine.step_day = AsyncMock(side_effect=mock_step_day)
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine, processed_days)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
 
         # Should have processed days 3 and 4 (not 0, 1, 2)
-        assert 3 in processed_days
+        assert processed_days == [3, 4]
         # Initialization should NOT have been called (total_days > 0)
         mock_engine.initialize_simulation.assert_not_called()
 
@@ -450,7 +770,9 @@ class TestArenaWorkerResumeCapability:
         ) as MockEngine:
             mock_engine = MagicMock()
             mock_engine.initialize_simulation = AsyncMock()
-            mock_engine.step_day = AsyncMock(return_value=None)
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine)
+            )
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
@@ -489,14 +811,14 @@ class TestArenaWorkerEdgeCases:
                     await session.commit()
 
             mock_engine.initialize_simulation = AsyncMock(side_effect=mock_init)
-            mock_engine.step_day = AsyncMock(return_value=None)
+            mock_engine.run_to_completion = AsyncMock()
             MockEngine.return_value = mock_engine
 
             # Should not raise
             await worker.process_job(simulation)
 
-            # step_day should not be called (current_day=0 >= total_days=0)
-            mock_engine.step_day.assert_not_called()
+            # run_to_completion should not be called (current_day=0 >= total_days=0)
+            mock_engine.run_to_completion.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_simulation_already_at_final_day(
@@ -516,10 +838,182 @@ class TestArenaWorkerEdgeCases:
         ) as MockEngine:
             mock_engine = MagicMock()
             mock_engine.initialize_simulation = AsyncMock()
-            mock_engine.step_day = AsyncMock()
+            mock_engine.run_to_completion = AsyncMock()
             MockEngine.return_value = mock_engine
 
             await worker.process_job(simulation)
 
-            # step_day should not be called (current_day >= total_days)
-            mock_engine.step_day.assert_not_called()
+            # run_to_completion should not be called (current_day >= total_days)
+            mock_engine.run_to_completion.assert_not_called()
+
+
+@pytest.mark.unit
+class TestArenaWorkerShutdown:
+    """Tests for stopping running simulations when the worker stops."""
+
+    @pytest.mark.asyncio
+    async def test_in_process_run_is_interrupted_when_stopping(
+        self, rollback_session_factory, mock_queue_service
+    ):
+        """A stopping worker does not start the next days and interrupts the job."""
+        simulation = await create_arena_simulation(
+            rollback_session_factory,
+            status=SimulationStatus.RUNNING.value,
+            current_day=1,
+            total_days=5,
+        )
+
+        worker = ArenaWorker(rollback_session_factory, mock_queue_service)
+        worker._stopping = True
+        processed_days: list[int] = []
+
+        with patch(
+            "app.services.arena.arena_worker.SimulationEngine"
+        ) as MockEngine:
+            mock_engine = MagicMock()
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine, processed_days)
+            )
+            MockEngine.return_value = mock_engine
+
+            with pytest.raises(JobInterrupted, match="worker shutdown"):
+                await worker.process_job(simulation)
+
+        assert processed_days == []
+        mock_queue_service.is_cancelled.assert_not_called()
+        updated = await get_simulation_by_id(rollback_session_factory, simulation.id)
+        assert updated.current_day == 1
+        assert updated.status == SimulationStatus.RUNNING.value
+
+    @pytest.mark.asyncio
+    async def test_stop_during_run_ends_at_next_checkpoint(
+        self, rollback_session_factory, mock_queue_service
+    ):
+        """A stop requested mid-run ends it at the next checkpoint with progress kept."""
+        simulation = await create_arena_simulation(
+            rollback_session_factory,
+            status=SimulationStatus.RUNNING.value,
+            current_day=0,
+            total_days=5,
+        )
+
+        worker = ArenaWorker(rollback_session_factory, mock_queue_service)
+        processed_days: list[int] = []
+
+        async def cancel_check(sim_id):
+            # The stop arrives after day 0, while day 1 is being processed
+            if len(processed_days) == 1:
+                worker._stopping = True
+            return False
+
+        mock_queue_service.is_cancelled = AsyncMock(side_effect=cancel_check)
+
+        with patch(
+            "app.services.arena.arena_worker.SimulationEngine"
+        ) as MockEngine:
+            mock_engine = MagicMock()
+            mock_engine.run_to_completion = AsyncMock(
+                side_effect=fake_run_to_completion(MockEngine, processed_days)
+            )
+            MockEngine.return_value = mock_engine
+
+            with pytest.raises(JobInterrupted):
+                await worker.process_job(simulation)
+
+        assert processed_days == [0, 1]
+        updated = await get_simulation_by_id(rollback_session_factory, simulation.id)
+        assert updated.current_day == 2
+
+    @pytest.mark.asyncio
+    async def test_terminated_pool_process_interrupts_job(
+        self, rollback_session_factory, mock_queue_service
+    ):
+        """A pool process killed on shutdown surfaces as JobInterrupted."""
+        simulation = await create_arena_simulation(
+            rollback_session_factory,
+            status=SimulationStatus.RUNNING.value,
+            current_day=0,
+            total_days=5,
+        )
+
+        worker = ArenaWorker(rollback_session_factory, mock_queue_service, processes=2)
+        worker._lanes = [ThreadPoolExecutor(max_workers=1) for _ in range(2)]
+        worker._stopping = True
+
+        try:
+            with patch(
+                "app.services.arena.arena_worker.run_simulation_in_process",
+                side_effect=BrokenProcessPool("terminated"),
+            ), patch(
+                "app.services.arena.arena_worker.load_price_matrix",
+                AsyncMock(return_value=PriceMatrix.empty()),
+            ):
+                with pytest.raises(JobInterrupted):
+                    await worker.process_job(simulation)
+        finally:
+            await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_signals_pool_and_terminates_lingering_processes(
+        self, mock_queue_service
+    ):
+        """stop() sets the stop event, then kills processes still running after the wait."""
+        worker = ArenaWorker(MagicMock(), mock_queue_service, processes=2)
+        stop_event = MagicMock()
+        process = MagicMock(pid=1234)
+        # Terminating the process ends the job, as the broken pool would
+        process.terminate.side_effect = lambda: worker._active_jobs.clear()
+        unrelated = MagicMock(pid=4321)
+        started = MagicMock()
+        started.empty.side_effect = [False, True]
+        started.get.return_value = 1234
+        executor = MagicMock()
+        worker._stop_event = stop_event
+        worker._started = started
+        worker._lanes = [executor, MagicMock()]
+        worker._active_jobs = {7: MagicMock()}
+
+        shutdown_settings = MagicMock(worker_shutdown_iterations=2, worker_shutdown_sleep=0)
+        with patch("app.services.job_worker.settings", shutdown_settings), patch(
+            "app.services.arena.arena_worker.get_settings", return_value=shutdown_settings
+        ), patch(
+            "app.services.arena.arena_worker.multiprocessing.active_children",
+            return_value=[process, unrelated],
+        ):
+            await worker.stop()
+
+        stop_event.set.assert_called_once()
+        process.terminate.assert_called_once()
+        unrelated.terminate.assert_not_called()
+        executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        started.close.assert_called_once()
+        assert worker._lanes == []
+
+    def test_pool_process_reports_its_pid(self):
+        """Pool processes report their PID, which stop() terminates them by."""
+        started = queue.SimpleQueue()
+
+        with patch("app.utils.structured_logging.configure_structured_logging"), patch(
+            "app.services.arena.arena_worker._pool_stop_event", None
+        ):
+            _init_pool_process(None, started)
+
+        assert started.get_nowait() == os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_stop_does_not_terminate_when_jobs_finished(self, mock_queue_service):
+        """Processes are left alone when every job stopped within the wait."""
+        worker = ArenaWorker(MagicMock(), mock_queue_service, processes=2)
+        process = MagicMock(pid=1234)
+        executor = MagicMock()
+        worker._stop_event = MagicMock()
+        worker._lanes = [executor]
+
+        with patch(
+            "app.services.arena.arena_worker.multiprocessing.active_children",
+            return_value=[process],
+        ):
+            await worker.stop()
+
+        process.terminate.assert_not_called()
+        executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
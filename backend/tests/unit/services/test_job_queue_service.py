@@ -364,6 +364,46 @@ class TestResetStrandedJobs:
         assert count == 0
 
 
+@pytest.mark.unit
+class TestReleaseJob:
+    """Tests for release_job method."""
+
+    @pytest.mark.asyncio
+    async def test_release_job_resets_own_running_job_to_pending(
+        self, rollback_session_factory):
+        """Should reset this worker's running job without counting a retry."""
+        run = await create_live20_run(
+            rollback_session_factory, status="running", worker_id="worker-a"
+        )
+
+        service = JobQueueService(rollback_session_factory, Live20Run, worker_id="worker-a")
+        released = await service.release_job(run.id)
+
+        assert released is True
+        updated = await get_run_by_id(rollback_session_factory, run.id)
+        assert updated.status == "pending"
+        assert updated.worker_id is None
+        assert updated.claimed_at is None
+        assert updated.retry_count == 0
+        assert "resumed" in updated.last_error
+
+    @pytest.mark.asyncio
+    async def test_release_job_ignores_job_claimed_by_another_worker(
+        self, rollback_session_factory):
+        """Should leave a job alone once another worker has claimed it."""
+        run = await create_live20_run(
+            rollback_session_factory, status="running", worker_id="worker-b"
+        )
+
+        service = JobQueueService(rollback_session_factory, Live20Run, worker_id="worker-a")
+        released = await service.release_job(run.id)
+
+        assert released is False
+        updated = await get_run_by_id(rollback_session_factory, run.id)
+        assert updated.status == "running"
+        assert updated.worker_id == "worker-b"
+
+
 @pytest.mark.unit
 class TestUpdateHeartbeat:
     """Tests for update_heartbeat method."""
@@ -10,7 +10,7 @@ import pytest
 
 from app.models.live20_run import Live20Run
 from app.services.job_queue_service import JobQueueService
-from app.services.job_worker import JobWorker
+from app.services.job_worker import JobInterrupted, JobWorker
 
 
 class ConcreteWorker(JobWorker[Live20Run]):
@@ -46,6 +46,7 @@ def mock_queue_service(mock_session_factory):
     service.update_heartbeat = AsyncMock()
     service.mark_completed = AsyncMock()
     service.mark_failed = AsyncMock()
+    service.release_job = AsyncMock(return_value=True)
     service.reset_stale_jobs = AsyncMock(return_value=0)
     return service
 
@@ -84,6 +85,18 @@ class TestJobWorkerInitialization:
         worker = ConcreteWorker(mock_session_factory, mock_queue_service)
         assert worker._current_job_id is None
 
+    def test_init_default_max_concurrent_jobs(self, mock_session_factory, mock_queue_service):
+        """Should process one job at a time by default."""
+        worker = ConcreteWorker(mock_session_factory, mock_queue_service)
+        assert worker.max_concurrent_jobs == 1
+
+    def test_init_rejects_invalid_max_concurrent_jobs(
+        self, mock_session_factory, mock_queue_service
+    ):
+        """Should reject max_concurrent_jobs below 1."""
+        with pytest.raises(ValueError, match="max_concurrent_jobs must be at least 1"):
+            ConcreteWorker(mock_session_factory, mock_queue_service, max_concurrent_jobs=0)
+
 
 @pytest.mark.unit
 class TestJobWorkerStart:
@@ -196,6 +209,36 @@ class TestJobWorkerStart:
         except asyncio.CancelledError:
             pass
 
+    @pytest.mark.asyncio
+    async def test_start_releases_interrupted_job(self, mock_session_factory, mock_queue_service):
+        """Should release a job interrupted by shutdown instead of completing or failing it."""
+        mock_job = MagicMock()
+        mock_job.id = 3
+        mock_queue_service.claim_next_job = AsyncMock(
+            side_effect=[mock_job, None, None, None]
+        )
+
+        worker = ConcreteWorker(
+            mock_session_factory,
+            mock_queue_service,
+            poll_interval=0.01,
+            process_job_side_effect=JobInterrupted("stopping"),
+        )
+
+        start_task = asyncio.create_task(worker.start())
+        await asyncio.sleep(0.1)
+
+        mock_queue_service.release_job.assert_called_once_with(3)
+        mock_queue_service.mark_completed.assert_not_called()
+        mock_queue_service.mark_failed.assert_not_called()
+
+        worker._running = False
+        start_task.cancel()
+        try:
+            await start_task
+        except asyncio.CancelledError:
+            pass
+
     @pytest.mark.asyncio
     async def test_start_sets_current_job_id_during_processing(
         self, mock_session_factory, mock_queue_service
@@ -259,6 +302,91 @@ class TestJobWorkerStart:
             pass
 
 
+@pytest.mark.unit
+class TestJobWorkerConcurrency:
+    """Tests for processing several jobs at once."""
+
+    @pytest.mark.asyncio
+    async def test_processes_jobs_concurrently(self, mock_session_factory, mock_queue_service):
+        """Should run up to max_concurrent_jobs jobs at the same time."""
+        jobs = [MagicMock(id=job_id) for job_id in (1, 2, 3)]
+        mock_queue_service.claim_next_job = AsyncMock(side_effect=[*jobs] + [None] * 100)
+
+        running: set[int] = set()
+        peak = [0]
+        release = asyncio.Event()
+
+        async def block_until_released(job):
+            running.add(job.id)
+            peak[0] = max(peak[0], len(running))
+            await release.wait()
+            running.discard(job.id)
+
+        worker = ConcreteWorker(
+            mock_session_factory,
+            mock_queue_service,
+            poll_interval=0.01,
+            max_concurrent_jobs=2,
+            process_job_side_effect=block_until_released,
+        )
+
+        start_task = asyncio.create_task(worker.start())
+        await asyncio.sleep(0.05)
+
+        # Two jobs claimed and running; the third waits for a free slot
+        assert peak[0] == 2
+        assert set(worker._active_jobs) == {1, 2}
+        assert mock_queue_service.claim_next_job.call_count == 2
+
+        release.set()
+        await asyncio.sleep(0.1)
+
+        assert [job.id for job in worker.processed_jobs] == [1, 2, 3]
+        assert mock_queue_service.mark_completed.call_count == 3
+        assert worker._active_jobs == {}
+
+        await worker.stop()
+        start_task.cancel()
+        try:
+            await start_task
+        except asyncio.CancelledError:
+            pass
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failure_does_not_affect_other_jobs(
+        self, mock_session_factory, mock_queue_service
+    ):
+        """Should mark only the failing job as failed."""
+        jobs = [MagicMock(id=job_id) for job_id in (1, 2)]
+        mock_queue_service.claim_next_job = AsyncMock(side_effect=[*jobs] + [None] * 100)
+
+        async def fail_first(job):
+            await asyncio.sleep(0.01)
+            if job.id == 1:
+                raise RuntimeError("boom")
+
+        worker = ConcreteWorker(
+            mock_session_factory,
+            mock_queue_service,
+            poll_interval=0.01,
+            max_concurrent_jobs=2,
+            process_job_side_effect=fail_first,
+        )
+
+        start_task = asyncio.create_task(worker.start())
+        await asyncio.sleep(0.1)
+
+        mock_queue_service.mark_failed.assert_called_once_with(1, "boom")
+        mock_queue_service.mark_completed.assert_called_once_with(2)
+
+        await worker.stop()
+        start_task.cancel()
+        try:
+            await start_task
+        except asyncio.CancelledError:
+            pass
+
+
 @pytest.mark.unit
 class TestJobWorkerStop:
     """Tests for the stop method."""
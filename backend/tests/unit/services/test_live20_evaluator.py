@@ -1,5 +1,7 @@
 """Unit tests for Live20Evaluator shared module."""
 
+import random
+
 import pytest
 
 from app.services.live20_evaluator import (
@@ -764,3 +766,81 @@ class TestCriterionNames:
         names = [c.name for c in criteria]
         expected = ["trend", "ma20_distance", "candle", "volume", "momentum"]
         assert names == expected
+
+
+class TestEvaluateCriteriaSeries:
+    """Batch criteria evaluation must match per-call evaluate_criteria bar for bar."""
+
+    @pytest.fixture
+    def evaluator(self):
+        return Live20Evaluator()
+
+    @staticmethod
+    def _random_ohlcv(seed: int, n: int = 70):
+        rng = random.Random(seed)
+        opens, highs, lows, closes, volumes = [], [], [], [], []
+        price = 100.0
+        for _ in range(n):
+            open_ = round(price * (1 + rng.gauss(0, 0.01)), 4)
+            close = round(open_ * (1 + rng.gauss(-0.002, 0.025)), 4)
+            opens.append(open_)
+            closes.append(close)
+            highs.append(round(max(open_, close) * (1 + abs(rng.gauss(0, 0.005))), 4))
+            lows.append(round(min(open_, close) * (1 - abs(rng.gauss(0, 0.005))), 4))
+            # Occasional zero volume exercises the 1.0x ratio fallback
+            volumes.append(0.0 if rng.random() < 0.05 else float(rng.randint(100_000, 5_000_000)))
+            price = close
+        return opens, highs, lows, closes, volumes
+
+    @pytest.mark.parametrize("algorithm", [ScoringAlgorithm.CCI, ScoringAlgorithm.RSI2])
+    def test_series_matches_per_call_evaluation(self, evaluator, algorithm):
+        """Every evaluated bar equals evaluate_criteria on the history ending there."""
+        for seed in range(5):
+            ohlcv = self._random_ohlcv(seed)
+            series = evaluator.evaluate_criteria_series(*ohlcv, scoring_algorithm=algorithm)
+
+            for i in range(len(ohlcv[0])):
+                if i < evaluator.REQUIRED_BARS - 1:
+                    assert not series.evaluated[i]
+                    continue
+                prefix = [values[: i + 1] for values in ohlcv]
+                criteria, volume_signal, momentum, _ = evaluator.evaluate_criteria(
+                    *prefix, scoring_algorithm=algorithm
+                )
+                by_name = {c.name: c for c in criteria}
+                _, score = evaluator.determine_direction_and_score(criteria)
+
+                assert series.evaluated[i]
+                assert series.trend_aligned[i] == by_name["trend"].aligned_for_long
+                assert series.ma20_aligned[i] == by_name["ma20_distance"].aligned_for_long
+                assert series.ma20_distance[i] == evaluator.get_ma20_distance(prefix[3])
+                assert series.candle_pattern[i] == by_name["candle"].value
+                assert series.candle_aligned[i] == by_name["candle"].aligned_for_long
+                assert series.volume_aligned[i] == by_name["volume"].aligned_for_long
+                assert series.rvol[i] == volume_signal.rvol
+                assert series.momentum_aligned[i] == by_name["momentum"].aligned_for_long
+                assert series.momentum_value[i] == momentum.value
+                assert series.score[i] == score
+
+    def test_short_history_is_not_evaluated(self, evaluator):
+        """Histories shorter than REQUIRED_BARS produce no evaluated bars."""
+        ohlcv = self._random_ohlcv(0, n=10)
+
+        series = evaluator.evaluate_criteria_series(*ohlcv)
+
+        assert not series.evaluated.any()
+        assert not series.score.any()
+
+    def test_short_circuit_matches_full_evaluation_on_trend_aligned_bars(self, evaluator):
+        """Short-circuiting only blanks bars that fail the trend gate."""
+        for seed in range(5):
+            ohlcv = self._random_ohlcv(seed)
+            full = evaluator.evaluate_criteria_series(*ohlcv)
+            gated = evaluator.evaluate_criteria_series(*ohlcv, short_circuit=True)
+            aligned = full.trend_aligned
+
+            assert (gated.trend_aligned == aligned).all()
+            assert (gated.score[aligned] == full.score[aligned]).all()
+            assert (gated.candle_aligned[aligned] == full.candle_aligned[aligned]).all()
+            assert (gated.momentum_aligned[aligned] == full.momentum_aligned[aligned]).all()
+            assert not gated.score[~aligned].any()
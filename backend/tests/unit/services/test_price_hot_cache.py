@@ -0,0 +1,169 @@
+"""Unit tests for the in-process price hot tier."""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.providers.base import PriceDataPoint
+from app.services.price_hot_cache import HotCacheKey, PriceHotCache, points_in_range
+
+NOW = datetime(2024, 12, 3, 13, 0, tzinfo=timezone.utc)
+LATER = NOW + timedelta(hours=1)
+
+
+def _points(symbol: str, days: list[int]) -> list[PriceDataPoint]:
+    """Daily points in December 2024 stamped at 05:00 UTC (midnight ET)."""
+    return [
+        PriceDataPoint(
+            symbol=symbol,
+            timestamp=datetime(2024, 12, day, 5, 0, tzinfo=timezone.utc),
+            open_price=100.0,
+            high_price=101.0,
+            low_price=99.0,
+            close_price=100.0 + day,
+            volume=1000,
+        )
+        for day in days
+    ]
+
+
+def _key(symbol: str = "SPY", start_day: int = 1, end_day: int = 3) -> HotCacheKey:
+    return HotCacheKey(symbol, "1d", date(2024, 12, start_day), date(2024, 12, end_day))
+
+
+def _range(start_day: int, end_day: int) -> tuple[datetime, datetime]:
+    return (
+        datetime(2024, 12, start_day, tzinfo=timezone.utc),
+        datetime(2024, 12, end_day, 23, 0, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.unit
+class TestHotCacheKey:
+    """Tests for HotCacheKey."""
+
+    def test_requests_on_the_same_days_share_a_key(self):
+        """Times within the same start (UTC) and end (Eastern) days share a key."""
+        a = HotCacheKey.for_request(
+            "SPY", "1d",
+            datetime(2024, 10, 4, 9, 0, tzinfo=timezone.utc),
+            datetime(2024, 12, 3, 15, 0, tzinfo=timezone.utc),
+        )
+        b = HotCacheKey.for_request(
+            "SPY", "1d",
+            datetime(2024, 10, 4, 20, 0, tzinfo=timezone.utc),
+            datetime(2024, 12, 4, 1, 0, tzinfo=timezone.utc),  # Dec 3, 8 PM ET
+        )
+
+        assert a == b
+        assert a.end_day == date(2024, 12, 3)
+
+    def test_load_range_covers_whole_days(self):
+        """The load range spans the UTC start day through the Eastern end day."""
+        start, end = _key(start_day=1, end_day=3).load_range()
+
+        assert start == datetime(2024, 12, 1, tzinfo=timezone.utc)
+        assert end == datetime(2024, 12, 4, 4, 59, 59, 999999, tzinfo=timezone.utc)
+
+
+@pytest.mark.unit
+class TestPriceHotCache:
+    """Tests for PriceHotCache."""
+
+    def test_hit_slices_requested_range(self):
+        """A hit returns only points inside the exact requested range."""
+        cache = PriceHotCache(max_bars=100)
+        cache.put(_key(), _points("SPY", [1, 2, 3]), expires_at=LATER, generation=0)
+
+        result = cache.get(_key(), *_range(2, 3), now=NOW)
+
+        assert [p.timestamp.day for p in result] == [2, 3]
+        assert cache.stats.hits == 1
+
+    def test_miss_and_expiry(self):
+        """Unknown and expired keys miss; expired entries are dropped."""
+        cache = PriceHotCache(max_bars=100)
+        cache.put(_key(), _points("SPY", [1, 2]), expires_at=LATER, generation=0)
+
+        assert cache.get(_key("QQQ"), *_range(1, 3), now=NOW) is None
+        assert cache.get(_key(), *_range(1, 3), now=LATER) is None
+        assert len(cache) == 0
+        assert cache.stats.misses == 2
+        assert cache.stats.expirations == 1
+
+    def test_evicts_least_recently_used_over_bar_budget(self):
+        """Entries are evicted oldest-use first once the bar budget is exceeded."""
+        cache = PriceHotCache(max_bars=4)
+        cache.put(_key("SPY"), _points("SPY", [1, 2]), expires_at=LATER, generation=0)
+        cache.put(_key("QQQ"), _points("QQQ", [1, 2]), expires_at=LATER, generation=0)
+        cache.get(_key("SPY"), *_range(1, 3), now=NOW)  # SPY is now most recent
+
+        cache.put(_key("XLK"), _points("XLK", [1, 2]), expires_at=LATER, generation=0)
+
+        assert cache.get(_key("QQQ"), *_range(1, 3), now=NOW) is None
+        assert cache.get(_key("SPY"), *_range(1, 3), now=NOW) is not None
+        assert cache.stats.evictions == 1
+
+    def test_entry_larger_than_budget_is_not_cached(self):
+        """A single entry over the bar budget is skipped."""
+        cache = PriceHotCache(max_bars=2)
+        cache.put(_key(), _points("SPY", [1, 2, 3]), expires_at=LATER, generation=0)
+
+        assert len(cache) == 0
+
+    def test_invalidate_drops_symbol_and_rejects_older_loads(self):
+        """Invalidation drops the symbol's entries and stale in-flight puts."""
+        cache = PriceHotCache(max_bars=100)
+        cache.put(_key("SPY", end_day=2), _points("SPY", [1, 2]), expires_at=LATER, generation=0)
+        cache.put(_key("SPY", end_day=3), _points("SPY", [1, 2]), expires_at=LATER, generation=0)
+        cache.put(_key("QQQ"), _points("QQQ", [1]), expires_at=LATER, generation=0)
+        generation = cache.generation("SPY")
+
+        assert cache.invalidate("SPY") == 2
+        # Loaded before the write: not cached
+        cache.put(_key("SPY"), _points("SPY", [1]), expires_at=LATER, generation=generation)
+
+        assert cache.get(_key("SPY"), *_range(1, 3), now=NOW) is None
+        assert cache.get(_key("QQQ"), *_range(1, 3), now=NOW) is not None
+        assert cache.generation("SPY") == generation + 1
+
+    def test_disabled_cache(self):
+        """max_bars=0 never stores or counts lookups."""
+        cache = PriceHotCache(max_bars=0)
+        cache.put(_key(), _points("SPY", [1]), expires_at=LATER, generation=0)
+
+        assert cache.get(_key(), *_range(1, 3), now=NOW) is None
+        assert cache.snapshot()["misses"] == 0
+
+    def test_snapshot_reports_hit_rate(self):
+        """snapshot() reports size and hit-rate metrics."""
+        cache = PriceHotCache(max_bars=100)
+        cache.put(_key(), _points("SPY", [1, 2]), expires_at=LATER, generation=0)
+        cache.get(_key(), *_range(1, 3), now=NOW)
+        cache.get(_key("QQQ"), *_range(1, 3), now=NOW)
+        cache.get(_key(), *_range(1, 3), now=NOW)
+
+        snapshot = cache.snapshot()
+
+        assert snapshot["entries"] == 1
+        assert snapshot["bars"] == 2
+        assert snapshot["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+
+    def test_negative_budget_rejected(self):
+        """Negative budgets raise ValueError."""
+        with pytest.raises(ValueError, match="max_bars"):
+            PriceHotCache(max_bars=-1)
+
+
+@pytest.mark.unit
+def test_points_in_range_is_inclusive():
+    """points_in_range keeps both endpoints and returns a new list."""
+    points = _points("SPY", [1, 2, 3])
+
+    result = points_in_range(
+        points,
+        datetime(2024, 12, 2, 5, 0, tzinfo=timezone.utc),
+        datetime(2024, 12, 3, 5, 0, tzinfo=timezone.utc),
+    )
+
+    assert [p.timestamp.day for p in result] == [2, 3]
+    assert points_in_range(points, *_range(1, 3)) is not points
@@ -1,14 +1,18 @@
 """Tests for trading calendar service."""
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
 from app.services.trading_calendar_service import (
+    SessionIndex,
     count_trading_days_in_range,
     get_first_trading_day_on_or_after,
     get_last_complete_trading_day,
+    get_last_trading_day_on_or_before,
     get_market_status,
+    get_next_market_transition,
     get_next_trading_day,
+    get_nyse_calendar,
     get_trading_days_in_range,
     is_trading_day,
 )
@@ -262,3 +266,110 @@ class TestGetFirstTradingDayOnOrAfter:
         """Thanksgiving should return next trading day (Friday)."""
         # Thanksgiving 2024 (Nov 28, Thursday) -> Nov 29 (Friday, market open)
         assert get_first_trading_day_on_or_after(date(2024, 11, 28)) == date(2024, 11, 29)
+
+
+@pytest.mark.unit
+class TestGetLastTradingDayOnOrBefore:
+    """Test last trading day on or before calculation."""
+
+    def test_trading_day_returns_same(self) -> None:
+        """Trading day should return itself."""
+        assert get_last_trading_day_on_or_before(date(2024, 12, 2)) == date(2024, 12, 2)
+
+    def test_weekend_returns_friday(self) -> None:
+        """Sunday should return Friday."""
+        assert get_last_trading_day_on_or_before(date(2024, 12, 8)) == date(2024, 12, 6)
+
+    def test_new_years_returns_dec_31(self) -> None:
+        """New Year's Day should return the previous trading day."""
+        assert get_last_trading_day_on_or_before(date(2025, 1, 1)) == date(2024, 12, 31)
+
+
+@pytest.mark.unit
+class TestGetNextMarketTransition:
+    """Test next session open/close calculation."""
+
+    def test_pre_market_returns_open(self) -> None:
+        """Before the open, the next transition is today's open."""
+        timestamp = datetime(2024, 12, 2, 13, 0, tzinfo=timezone.utc)  # 8 AM ET
+        assert get_next_market_transition(timestamp) == datetime(2024, 12, 2, 14, 30, tzinfo=timezone.utc)
+
+    def test_market_open_returns_close(self) -> None:
+        """During the session, the next transition is today's close."""
+        timestamp = datetime(2024, 12, 2, 16, 0, tzinfo=timezone.utc)
+        assert get_next_market_transition(timestamp) == datetime(2024, 12, 2, 21, 0, tzinfo=timezone.utc)
+
+    def test_weekend_returns_monday_open(self) -> None:
+        """On a weekend, the next transition is Monday's open."""
+        timestamp = datetime(2024, 12, 7, 16, 0, tzinfo=timezone.utc)
+        assert get_next_market_transition(timestamp) == datetime(2024, 12, 9, 14, 30, tzinfo=timezone.utc)
+
+    def test_early_close(self) -> None:
+        """Early close days close at 1 PM ET."""
+        timestamp = datetime(2024, 11, 29, 16, 0, tzinfo=timezone.utc)
+        assert get_next_market_transition(timestamp) == datetime(2024, 11, 29, 18, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.unit
+class TestSessionIndex:
+    """Test SessionIndex date queries."""
+
+    # Mon Dec 2 .. Fri Dec 6, then Mon Dec 9 (weekend gap)
+    SESSIONS = [date(2024, 12, d) for d in (2, 3, 4, 5, 6, 9)]
+
+    def test_is_session_and_position(self) -> None:
+        """Sessions are found by position; other days are not sessions."""
+        index = SessionIndex(reversed(self.SESSIONS))
+
+        assert len(index) == 6
+        assert index.position(date(2024, 12, 2)) == 0
+        assert index.position(date(2024, 12, 9)) == 5
+        assert index.position(date(2024, 12, 7)) is None
+        assert not index.is_session(date(2024, 12, 1))
+        assert not index.is_session(date(2024, 12, 10))
+
+    def test_next_and_previous_session(self) -> None:
+        """Neighbouring sessions skip gaps; None past either end."""
+        index = SessionIndex(self.SESSIONS)
+
+        assert index.next_session(date(2024, 12, 6)) == date(2024, 12, 9)
+        assert index.next_session(date(2024, 12, 7)) == date(2024, 12, 9)
+        assert index.next_session(date(2024, 12, 9)) is None
+        assert index.previous_session(date(2024, 12, 9)) == date(2024, 12, 6)
+        assert index.previous_session(date(2024, 12, 2)) is None
+        assert index.session_on_or_before(date(2024, 12, 8)) == date(2024, 12, 6)
+        assert index.session_on_or_after(date(2024, 11, 1)) == date(2024, 12, 2)
+
+    def test_count_and_range(self) -> None:
+        """Counts and ranges are inclusive and clamp to the indexed span."""
+        index = SessionIndex(self.SESSIONS)
+
+        assert index.count_between(date(2024, 12, 3), date(2024, 12, 9)) == 5
+        assert index.count_between(date(2024, 11, 1), date(2025, 1, 1)) == 6
+        assert index.count_between(date(2024, 12, 7), date(2024, 12, 8)) == 0
+        assert index.count_between(date(2024, 12, 9), date(2024, 12, 2)) == 0
+        assert index.sessions_in_range(date(2024, 12, 5), date(2024, 12, 8)) == [
+            date(2024, 12, 5),
+            date(2024, 12, 6),
+        ]
+
+    def test_empty_index(self) -> None:
+        """An empty index has no sessions."""
+        index = SessionIndex([])
+
+        assert not index.covers(date(2024, 12, 2))
+        assert index.position(date(2024, 12, 2)) is None
+        assert index.next_session(date(2024, 12, 2)) is None
+        assert index.count_between(date(2024, 1, 1), date(2024, 12, 31)) == 0
+
+    def test_nyse_index_matches_calendar(self) -> None:
+        """The NYSE index agrees with exchange_calendars over a year."""
+        start = date(2024, 1, 1)
+        calendar_days = [
+            start + timedelta(days=i)
+            for i in range(366)
+            if get_nyse_calendar().is_session((start + timedelta(days=i)).isoformat())
+        ]
+
+        assert get_trading_days_in_range(start, date(2024, 12, 31)) == calendar_days
+        assert count_trading_days_in_range(start, date(2024, 12, 31)) == len(calendar_days)
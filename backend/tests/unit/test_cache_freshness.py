@@ -4,8 +4,44 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from app.repositories.stock_price import StockPriceRepository
-from app.services.cache_service import CacheTTLConfig, MarketDataCache
+from app.repositories.stock_price import DateRange, PriceCoverage, StockPriceRepository
+from app.services.cache_service import (
+    CacheTTLConfig,
+    MarketDataCache,
+    coverage_span,
+    find_missing_ranges,
+    hot_tier_expiry,
+)
+
+
+def _coverage(records) -> PriceCoverage:
+    """Summarize mock price records the way the coverage query does."""
+    if not records:
+        return PriceCoverage.empty()
+    return PriceCoverage(
+        first_timestamp=min(r.timestamp for r in records),
+        last_timestamp=max(r.timestamp for r in records),
+        last_fetched_at=max(r.last_fetched_at for r in records),
+        row_count=len(records),
+    )
+
+
+def _fetched(records) -> list[DateRange]:
+    """Fetched ranges for mock records: their first through last day."""
+    if not records:
+        return []
+    days = [r.timestamp.date() for r in records]
+    return [DateRange(min(days), max(days))]
+
+
+def _mock_cache(repository, records) -> None:
+    """Serve mock records through the fetched-range and today's-rows queries."""
+    repository.get_fetched_ranges.return_value = _fetched(records)
+    repository.get_price_coverage.side_effect = (
+        lambda symbol, start_date, end_date, interval: _coverage(
+            [r for r in records if start_date <= r.timestamp <= end_date]
+        )
+    )
 
 
 class MockStockPrice:
@@ -40,7 +76,7 @@ class TestSmartFreshnessChecking:
     ):
         """No cached data should return stale with needs_fetch=True."""
         # Setup: No data in cache
-        mock_repository.get_price_data_by_date_range.return_value = []
+        _mock_cache(mock_repository, [])
 
         # Execute
         start_date = datetime(2024, 12, 1, tzinfo=timezone.utc)
@@ -86,7 +122,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2024, 12, 2, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Execute (with mocked time)
         with patch("app.services.cache_service.datetime") as mock_datetime:
@@ -132,7 +168,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2024, 12, 1, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Execute
         result = await cache_service.check_freshness_smart(
@@ -149,8 +185,9 @@ class TestSmartFreshnessChecking:
         assert result.last_complete_trading_day == date(2024, 12, 3)
         # Reason can be either "missing data before" (start not covered) or "Missing data from" (end not covered)
         assert "missing" in result.reason.lower()
-        # fetch_start_date is last_data_date for incremental fetch (start is covered after normalization)
-        assert result.fetch_start_date == date(2024, 12, 1)
+        # Only the missing sessions are fetched
+        assert result.fetch_start_date == date(2024, 12, 2)
+        assert result.missing_ranges == [DateRange(date(2024, 12, 2), date(2024, 12, 3))]
 
     @pytest.mark.asyncio
     @patch("app.services.cache_service.trading_calendar_service.get_market_status")
@@ -177,7 +214,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=now - timedelta(minutes=2),  # 2 min ago
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Execute (with mocked time)
         with patch("app.services.cache_service.datetime") as mock_datetime:
@@ -223,7 +260,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=now - timedelta(minutes=10),  # 10 min ago (stale)
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Execute (with mocked time)
         with patch("app.services.cache_service.datetime") as mock_datetime:
@@ -264,7 +301,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2024, 12, 1, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Execute (with mocked time)
         with patch("app.services.cache_service.datetime") as mock_datetime:
@@ -311,7 +348,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2024, 12, 2, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Execute (with mocked time)
         with patch("app.services.cache_service.datetime") as mock_datetime:
@@ -358,7 +395,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2024, 12, 1, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Execute (with mocked time)
         with patch("app.services.cache_service.datetime") as mock_datetime:
@@ -381,8 +418,9 @@ class TestSmartFreshnessChecking:
         # Reason can be "missing data before" (start not covered) or "Missing data from" (end not covered)
         assert "missing" in result.reason.lower()
         assert result.last_data_date == date(2024, 12, 1)
-        # fetch_start_date is last_data_date for incremental fetch (start is covered after normalization)
-        assert result.fetch_start_date == date(2024, 12, 1)
+        # Only the missing session is fetched
+        assert result.fetch_start_date == date(2024, 12, 2)
+        assert result.missing_ranges == [DateRange(date(2024, 12, 2), date(2024, 12, 2))]
 
     @pytest.mark.asyncio
     @patch("app.services.cache_service.trading_calendar_service.get_market_status")
@@ -410,7 +448,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2024, 12, 6, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Execute (with mocked time)
         with patch("app.services.cache_service.datetime") as mock_datetime:
@@ -456,7 +494,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2024, 12, 5, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Execute
         result = await cache_service.check_freshness_smart(
@@ -473,8 +511,9 @@ class TestSmartFreshnessChecking:
         # Reason can be "missing data before" (start not covered) or "Missing data from" (end not covered)
         assert "missing" in result.reason.lower()
         assert result.last_data_date == date(2024, 12, 5)
-        # fetch_start_date is last_data_date for incremental fetch (missing end data)
-        assert result.fetch_start_date == date(2024, 12, 5)
+        # Only Friday is fetched
+        assert result.fetch_start_date == date(2024, 12, 6)
+        assert result.missing_ranges == [DateRange(date(2024, 12, 6), date(2024, 12, 6))]
 
     @pytest.mark.asyncio
     @patch("app.services.cache_service.trading_calendar_service.get_market_status")
@@ -505,7 +544,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2025, 1, 15, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Request data from Dec 1, 2024 to Jan 15, 2025
         result = await cache_service.check_freshness_smart(
@@ -518,9 +557,12 @@ class TestSmartFreshnessChecking:
         # Verify: Should be STALE because Dec 1-31 is missing
         assert result.is_fresh is False
         assert result.needs_fetch is True
-        assert result.fetch_start_date == date(2024, 12, 1)  # Fetch from requested start
-        assert "missing" in result.reason.lower() or "before" in result.reason.lower()
-        assert result.last_data_date == date(2025, 1, 15)
+        # Fetch from the first trading day of the request up to the cached range
+        assert result.fetch_start_date == date(2024, 12, 2)
+        assert result.missing_ranges == [DateRange(date(2024, 12, 2), date(2024, 12, 31))]
+        assert "missing" in result.reason.lower()
+        # Request ends Jan 15 00:00 UTC (Jan 14 ET): usable data ends Jan 14
+        assert result.last_data_date == date(2025, 1, 14)
 
     @pytest.mark.asyncio
     @patch("app.services.cache_service.trading_calendar_service.get_market_status")
@@ -546,7 +588,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2025, 1, 15, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Request data from Dec 1, 2024 to Jan 15, 2025
         result = await cache_service.check_freshness_smart(
@@ -559,7 +601,8 @@ class TestSmartFreshnessChecking:
         # Verify: Should be FRESH because full range is covered
         assert result.is_fresh is True
         assert result.needs_fetch is False
-        assert result.last_data_date == date(2025, 1, 15)
+        # Request ends Jan 15 00:00 UTC (Jan 14 ET): usable data ends Jan 14
+        assert result.last_data_date == date(2025, 1, 14)
 
     @pytest.mark.asyncio
     @patch("app.services.cache_service.trading_calendar_service.get_market_status")
@@ -593,7 +636,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2025, 10, 31, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Request historical data: Sept 1 to Oct 31, 2025
         result = await cache_service.check_freshness_smart(
@@ -636,7 +679,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2025, 9, 15, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Request historical data: Sept 1 to Oct 31, 2025
         result = await cache_service.check_freshness_smart(
@@ -678,7 +721,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2026, 1, 3, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Request data up to TODAY (live request)
         # Note: We mock datetime.now in the service
@@ -726,7 +769,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2026, 1, 7, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Mock datetime.now to return Wednesday 10am EST (15:00 UTC)
         with patch("app.services.cache_service.datetime") as mock_datetime:
@@ -777,7 +820,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2025, 10, 31, 21, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         with patch("app.services.cache_service.datetime") as mock_datetime:
             mock_datetime.now.return_value = datetime(2025, 11, 3, 15, 0, tzinfo=timezone.utc)
@@ -830,7 +873,7 @@ class TestSmartFreshnessChecking:
                 last_fetched_at=datetime(2026, 1, 5, 22, 0, tzinfo=timezone.utc),
             ),
         ]
-        mock_repository.get_price_data_by_date_range.return_value = mock_records
+        _mock_cache(mock_repository, mock_records)
 
         # Request data starting Jan 1 (holiday) through Jan 5
         with patch("app.services.cache_service.datetime") as mock_datetime:
@@ -849,3 +892,142 @@ class TestSmartFreshnessChecking:
         # Should be FRESH - cache covers from first trading day (Jan 2) through Jan 5
         assert result.is_fresh is True, f"Expected fresh but got stale: {result.reason}"
         assert result.needs_fetch is False
+
+
+class TestBatchFreshnessChecking:
+    """Test check_freshness_batch against the single-symbol check."""
+
+    @pytest.mark.asyncio
+    @patch("app.services.cache_service.trading_calendar_service.get_market_status")
+    @patch("app.services.cache_service.trading_calendar_service.get_last_complete_trading_day")
+    async def test_batch_matches_single_symbol_checks(
+        self, mock_last_complete, mock_market_status, cache_service, mock_repository
+    ):
+        """Each symbol gets the same verdict as check_freshness_smart, from one query."""
+        now = datetime(2024, 12, 3, 13, 0, tzinfo=timezone.utc)  # 8:00 AM ET
+        mock_market_status.return_value = "pre_market"
+        mock_last_complete.return_value = date(2024, 12, 2)
+
+        def records(symbol: str, days: list[int]) -> list[MockStockPrice]:
+            return [
+                MockStockPrice(
+                    symbol=symbol,
+                    timestamp=datetime(2024, 12, day, 16, 0, tzinfo=timezone.utc),
+                    last_fetched_at=datetime(2024, 12, day, 21, 0, tzinfo=timezone.utc),
+                )
+                for day in days
+            ]
+
+        cached = {"AAPL": records("AAPL", [1, 2]), "MSFT": records("MSFT", [1])}
+        mock_repository.get_fetched_ranges_for_symbols.return_value = {
+            symbol: _fetched(rows) for symbol, rows in cached.items()
+        }
+        request = {
+            "start_date": datetime(2024, 12, 1, tzinfo=timezone.utc),
+            "end_date": datetime(2024, 12, 3, 16, 0, tzinfo=timezone.utc),
+            "interval": "1d",
+        }
+
+        with patch("app.services.cache_service.datetime") as mock_datetime:
+            mock_datetime.now.return_value = now
+            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
+            mock_datetime.combine = datetime.combine
+            mock_datetime.min = datetime.min
+
+            batch = await cache_service.check_freshness_batch(
+                symbols=["AAPL", "MSFT", "TSLA"], **request
+            )
+            single = {}
+            for symbol in ["AAPL", "MSFT", "TSLA"]:
+                _mock_cache(mock_repository, cached.get(symbol, []))
+                single[symbol] = await cache_service.check_freshness_smart(
+                    symbol=symbol, **request
+                )
+
+        mock_repository.get_fetched_ranges_for_symbols.assert_awaited_once()
+        # Outside market hours today's rows are not summarized
+        mock_repository.get_price_coverage_for_symbols.assert_not_awaited()
+        assert list(batch) == ["AAPL", "MSFT", "TSLA"]
+        assert batch["AAPL"].is_fresh is True
+        assert batch["MSFT"].is_fresh is False
+        assert batch["TSLA"].reason == "No cached data"
+        for symbol, result in batch.items():
+            assert result == single[symbol]
+
+
+class TestFetchedRanges:
+    """Test gap detection against the fetched-range index."""
+
+    def test_find_missing_ranges_groups_consecutive_sessions(self):
+        """Uncovered sessions are grouped into runs, including holes mid-range."""
+        sessions = [date(2024, 12, d) for d in (2, 3, 4, 5, 6, 9, 10, 11)]
+        fetched = [
+            DateRange(date(2024, 12, 3), date(2024, 12, 4)),
+            DateRange(date(2024, 12, 7), date(2024, 12, 9)),
+        ]
+
+        assert find_missing_ranges(fetched, sessions) == [
+            DateRange(date(2024, 12, 2), date(2024, 12, 2)),
+            DateRange(date(2024, 12, 5), date(2024, 12, 6)),
+            DateRange(date(2024, 12, 10), date(2024, 12, 11)),
+        ]
+        assert find_missing_ranges([DateRange(date(2024, 12, 1), date(2024, 12, 31))], sessions) == []
+
+    def test_coverage_span_extends_over_non_trading_days(self):
+        """Spans reach the neighbouring sessions so they merge across weekends and holidays."""
+        # Fri Nov 29 (after the Thanksgiving holiday) through Fri Dec 6
+        span = coverage_span(DateRange(date(2024, 11, 29), date(2024, 12, 6)))
+
+        assert span == DateRange(date(2024, 11, 28), date(2024, 12, 8))
+
+    @pytest.mark.asyncio
+    @patch("app.services.cache_service.trading_calendar_service.get_market_status")
+    @patch("app.services.cache_service.trading_calendar_service.get_last_complete_trading_day")
+    async def test_hole_in_middle_of_range_is_stale(
+        self, mock_last_complete, mock_market_status, cache_service, mock_repository
+    ):
+        """A gap between fetched ranges is found even though both ends are covered."""
+        mock_market_status.return_value = "closed"
+        mock_last_complete.return_value = date(2024, 12, 13)
+        mock_repository.get_fetched_ranges.return_value = [
+            DateRange(date(2024, 11, 30), date(2024, 12, 4)),
+            DateRange(date(2024, 12, 7), date(2024, 12, 15)),
+        ]
+
+        with patch("app.services.cache_service.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 12, 14, 16, 0, tzinfo=timezone.utc)
+
+            result = await cache_service.check_freshness_smart(
+                symbol="AAPL",
+                start_date=datetime(2024, 12, 2, tzinfo=timezone.utc),
+                end_date=datetime(2024, 12, 14, 16, 0, tzinfo=timezone.utc),
+                interval="1d",
+            )
+
+        assert result.is_fresh is False
+        assert result.missing_ranges == [DateRange(date(2024, 12, 5), date(2024, 12, 6))]
+        assert result.fetch_start_date == date(2024, 12, 5)
+        assert result.last_data_date == date(2024, 12, 13)
+        mock_repository.get_price_coverage.assert_not_awaited()
+
+
+class TestHotTierExpiry:
+    """Test hot_tier_expiry bounds."""
+
+    def test_market_open_uses_market_hours_ttl(self):
+        """During market hours, entries expire after the market-hours TTL."""
+        now = datetime(2024, 12, 2, 16, 0, tzinfo=timezone.utc)  # 11 AM ET
+
+        assert hot_tier_expiry(CacheTTLConfig(), now) == now + timedelta(seconds=300)
+
+    def test_market_hours_ttl_capped_at_close(self):
+        """The TTL never runs past the session close."""
+        now = datetime(2024, 12, 2, 20, 58, tzinfo=timezone.utc)  # 3:58 PM ET
+
+        assert hot_tier_expiry(CacheTTLConfig(), now) == datetime(2024, 12, 2, 21, 0, tzinfo=timezone.utc)
+
+    def test_outside_market_hours_expires_at_next_transition(self):
+        """After hours, entries last until the next session open."""
+        now = datetime(2024, 12, 6, 22, 0, tzinfo=timezone.utc)  # Friday 5 PM ET
+
+        assert hot_tier_expiry(CacheTTLConfig(), now) == datetime(2024, 12, 9, 14, 30, tzinfo=timezone.utc)
@@ -6,6 +6,7 @@ import pytest
 from app.utils.technical_indicators import (
     calculate_atr,
     calculate_atr_percentage,
+    calculate_rolling_atr_percentage,
     calculate_sma,
 )
 
@@ -189,3 +190,72 @@ class TestCalculateAtrPercentage:
 
         # Results should differ when override is used
         assert result_default != result_override
+
+
+class TestCalculateRollingAtrPercentage:
+    """Tests for calculate_rolling_atr_percentage."""
+
+    @staticmethod
+    def _windowed(dates, highs, lows, closes, window_days=90):
+        """Reference: calculate_atr_percentage over each bar's trailing window."""
+        expected = []
+        for i, end in enumerate(dates):
+            start = np.searchsorted(dates, end - np.timedelta64(window_days, "D"))
+            expected.append(
+                calculate_atr_percentage(
+                    highs[start : i + 1], lows[start : i + 1], closes[start : i + 1]
+                )
+            )
+        return expected
+
+    def test_matches_windowed_calculation_exactly(self):
+        """Test every value is bit-identical to the per-window function."""
+        rng = np.random.default_rng(7)
+        # Weekdays with random holidays and one multi-week gap
+        days = np.arange("2023-01-02", "2024-06-28", dtype="datetime64[D]")
+        days = days[np.is_busday(days)]
+        days = days[rng.random(len(days)) > 0.05]
+        days = days[(days < np.datetime64("2023-08-01")) | (days > np.datetime64("2023-09-15"))]
+        closes = 50.0 + np.cumsum(rng.normal(0, 1.0, len(days)))
+        highs = closes + rng.uniform(0.1, 2.0, len(days))
+        lows = closes - rng.uniform(0.1, 2.0, len(days))
+
+        result = calculate_rolling_atr_percentage(days, highs, lows, closes)
+        expected = self._windowed(days, highs, lows, closes)
+
+        assert len(result) == len(days)
+        for value, reference in zip(result, expected):
+            if reference is None:
+                assert np.isnan(value)
+            else:
+                assert value == reference
+
+    def test_warm_up_bars_are_nan(self):
+        """Test bars with fewer than period + 1 bars in their window are NaN."""
+        days = np.arange("2024-01-01", "2024-01-21", dtype="datetime64[D]")
+        closes = np.full(20, 100.0)
+
+        result = calculate_rolling_atr_percentage(days, closes + 1.0, closes - 1.0, closes)
+
+        assert np.isnan(result[:14]).all()
+        assert result[14:] == pytest.approx(2.0)
+
+    def test_gap_longer_than_window_restarts_warm_up(self):
+        """Test a gap longer than the window leaves too few bars to compute."""
+        days = np.concatenate([
+            np.arange("2024-01-01", "2024-01-21", dtype="datetime64[D]"),
+            np.arange("2024-06-01", "2024-06-06", dtype="datetime64[D]"),
+        ])
+        closes = np.full(25, 100.0)
+
+        result = calculate_rolling_atr_percentage(days, closes + 1.0, closes - 1.0, closes)
+
+        assert not np.isnan(result[19])
+        assert np.isnan(result[20:]).all()
+
+    def test_empty_input(self):
+        """Test empty input returns an empty array."""
+        result = calculate_rolling_atr_percentage(
+            np.array([], dtype="datetime64[D]"), [], [], []
+        )
+        assert len(result) == 0
@@ -1,8 +1,23 @@
-import { describe, expect, it, vi } from 'vitest';
+import { beforeEach, describe, expect, it, vi } from 'vitest';
 import { fireEvent, render, screen } from '@testing-library/react';
 import { ArenaDecisionLog } from './ArenaDecisionLog';
 import type { DecisionEntry, Snapshot } from '../../types/arena';
 
+const mockGetSnapshotDecisions = vi.fn();
+vi.mock('../../services/arenaService', () => ({
+  getSnapshotDecisions: (...args: unknown[]) => mockGetSnapshotDecisions(...args),
+}));
+
+/** Make the decisions endpoint return the given decisions for any day */
+const serveDecisions = (decisions: Record<string, DecisionEntry>) => {
+  mockGetSnapshotDecisions.mockImplementation(async (simulationId: number, dayNumber: number) => ({
+    simulation_id: simulationId,
+    day_number: dayNumber,
+    snapshot_date: '2024-01-10',
+    decisions,
+  }));
+};
+
 const mockDecisions: Record<string, DecisionEntry> = {
   AAPL: {
     action: 'BUY',
@@ -37,7 +52,6 @@ const mockSnapshot: Snapshot = {
   daily_return_pct: '1.40',
   cumulative_return_pct: '8.30',
   open_position_count: 2,
-  decisions: mockDecisions,
 };
 
 const mockSnapshots: Snapshot[] = [
@@ -52,7 +66,6 @@ const mockSnapshots: Snapshot[] = [
     daily_return_pct: '0',
     cumulative_return_pct: '0',
     open_position_count: 1,
-    decisions: { AAPL: { action: 'HOLD', score: null, reasoning: 'Holding' } },
   },
   {
     id: 2,
@@ -65,124 +78,146 @@ const mockSnapshots: Snapshot[] = [
     daily_return_pct: '2.0',
     cumulative_return_pct: '2.0',
     open_position_count: 2,
-    decisions: { NVDA: { action: 'BUY', score: 60, reasoning: 'Buy signal' } },
   },
   mockSnapshot,
 ];
 
+const renderLog = (snapshot: Snapshot | null, snapshots: Snapshot[] = mockSnapshots) => {
+  const onSelectSnapshot = vi.fn();
+  render(
+    <ArenaDecisionLog
+      simulationId={1}
+      snapshot={snapshot}
+      snapshots={snapshots}
+      onSelectSnapshot={onSelectSnapshot}
+    />
+  );
+  return onSelectSnapshot;
+};
+
 describe('ArenaDecisionLog', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    serveDecisions(mockDecisions);
+  });
+
   it('should show empty state when no snapshot', () => {
-    const mockOnSelect = vi.fn();
-    render(
-      <ArenaDecisionLog
-        snapshot={null}
-        snapshots={[]}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+    renderLog(null, []);
 
     expect(screen.getByText('Decision Log')).toBeInTheDocument();
     expect(screen.getByText('No decisions yet')).toBeInTheDocument();
+    expect(mockGetSnapshotDecisions).not.toHaveBeenCalled();
   });
 
   it('should render decision log card with title', () => {
-    const mockOnSelect = vi.fn();
-    render(
-      <ArenaDecisionLog
-        snapshot={mockSnapshot}
-        snapshots={mockSnapshots}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+    renderLog(mockSnapshot);
 
     expect(screen.getByText('Decision Log')).toBeInTheDocument();
   });
 
   it('should display day selector', () => {
-    const mockOnSelect = vi.fn();
-    render(
-      <ArenaDecisionLog
-        snapshot={mockSnapshot}
-        snapshots={mockSnapshots}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+    renderLog(mockSnapshot);
 
     // Should have a select trigger
     const trigger = screen.getByRole('combobox');
     expect(trigger).toBeInTheDocument();
   });
 
-  it('should display all symbols from decisions', () => {
-    const mockOnSelect = vi.fn();
-    render(
+  it('should fetch decisions for the selected day only', async () => {
+    renderLog(mockSnapshot);
+
+    await screen.findByText('AAPL');
+    expect(mockGetSnapshotDecisions).toHaveBeenCalledTimes(1);
+    expect(mockGetSnapshotDecisions).toHaveBeenCalledWith(1, 9);
+  });
+
+  it('should show loading state while decisions are fetched', () => {
+    mockGetSnapshotDecisions.mockImplementation(() => new Promise(() => {}));
+
+    renderLog(mockSnapshot);
+
+    expect(screen.getByText('Loading decisions...')).toBeInTheDocument();
+  });
+
+  it('should show error state when decisions fail to load', async () => {
+    mockGetSnapshotDecisions.mockRejectedValue(new Error('API Error'));
+
+    renderLog(mockSnapshot);
+
+    expect(await screen.findByText('Failed to load decisions')).toBeInTheDocument();
+  });
+
+  it('should not refetch a day that was already loaded', async () => {
+    const { rerender } = render(
       <ArenaDecisionLog
+        simulationId={1}
         snapshot={mockSnapshot}
         snapshots={mockSnapshots}
-        onSelectSnapshot={mockOnSelect}
+        onSelectSnapshot={vi.fn()}
       />
     );
+    await screen.findByText('AAPL');
 
-    expect(screen.getByText('AAPL')).toBeInTheDocument();
-    expect(screen.getByText('NVDA')).toBeInTheDocument();
-    expect(screen.getByText('TSLA')).toBeInTheDocument();
-    expect(screen.getByText('AMD')).toBeInTheDocument();
-  });
-
-  it('should display action badges', () => {
-    const mockOnSelect = vi.fn();
-    render(
+    rerender(
+      <ArenaDecisionLog
+        simulationId={1}
+        snapshot={mockSnapshots[0]}
+        snapshots={mockSnapshots}
+        onSelectSnapshot={vi.fn()}
+      />
+    );
+    await screen.findByText('AAPL');
+    rerender(
       <ArenaDecisionLog
+        simulationId={1}
         snapshot={mockSnapshot}
         snapshots={mockSnapshots}
-        onSelectSnapshot={mockOnSelect}
+        onSelectSnapshot={vi.fn()}
       />
     );
+    await screen.findByText('AAPL');
+
+    expect(mockGetSnapshotDecisions.mock.calls).toEqual([
+      [1, 9],
+      [1, 7],
+    ]);
+  });
 
-    expect(screen.getByText('BUY')).toBeInTheDocument();
+  it('should display all symbols from decisions', async () => {
+    renderLog(mockSnapshot);
+
+    expect(await screen.findByText('AAPL')).toBeInTheDocument();
+    expect(screen.getByText('NVDA')).toBeInTheDocument();
+    expect(screen.getByText('TSLA')).toBeInTheDocument();
+    expect(screen.getByText('AMD')).toBeInTheDocument();
+  });
+
+  it('should display action badges', async () => {
+    renderLog(mockSnapshot);
+
+    expect(await screen.findByText('BUY')).toBeInTheDocument();
     expect(screen.getByText('HOLD')).toBeInTheDocument();
     expect(screen.getByText('NO_SIGNAL')).toBeInTheDocument();
     expect(screen.getByText('NO_DATA')).toBeInTheDocument();
   });
 
-  it('should display score when available', () => {
-    const mockOnSelect = vi.fn();
-    render(
-      <ArenaDecisionLog
-        snapshot={mockSnapshot}
-        snapshots={mockSnapshots}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+  it('should display score when available', async () => {
+    renderLog(mockSnapshot);
 
     // Score is displayed as "80/100" within a span
-    expect(screen.getByText('80/100')).toBeInTheDocument();
+    expect(await screen.findByText('80/100')).toBeInTheDocument();
     expect(screen.getByText('40/100')).toBeInTheDocument();
   });
 
-  it('should display reasoning when available', () => {
-    const mockOnSelect = vi.fn();
-    render(
-      <ArenaDecisionLog
-        snapshot={mockSnapshot}
-        snapshots={mockSnapshots}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+  it('should display reasoning when available', async () => {
+    renderLog(mockSnapshot);
 
-    expect(screen.getByText(/4\/5 criteria aligned/)).toBeInTheDocument();
+    expect(await screen.findByText(/4\/5 criteria aligned/)).toBeInTheDocument();
     expect(screen.getByText('Already holding position')).toBeInTheDocument();
   });
 
   it('should call onSelectSnapshot when day is changed', async () => {
-    const mockOnSelect = vi.fn();
-    render(
-      <ArenaDecisionLog
-        snapshot={mockSnapshot}
-        snapshots={mockSnapshots}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+    const mockOnSelect = renderLog(mockSnapshot);
 
     // Open the select dropdown
     const trigger = screen.getByRole('combobox');
@@ -195,100 +230,56 @@ describe('ArenaDecisionLog', () => {
     expect(mockOnSelect).toHaveBeenCalledWith(mockSnapshots[0]);
   });
 
-  it('should show empty decisions message when snapshot has no decisions', () => {
-    const mockOnSelect = vi.fn();
-    const emptySnapshot: Snapshot = {
-      ...mockSnapshot,
-      decisions: {},
-    };
-    render(
-      <ArenaDecisionLog
-        snapshot={emptySnapshot}
-        snapshots={[emptySnapshot]}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+  it('should show empty decisions message when snapshot has no decisions', async () => {
+    serveDecisions({});
+
+    renderLog(mockSnapshot, [mockSnapshot]);
 
-    expect(screen.getByText('No decisions for this day')).toBeInTheDocument();
+    expect(await screen.findByText('No decisions for this day')).toBeInTheDocument();
   });
 
-  it('should highlight BUY decision cards with green border', () => {
-    const mockOnSelect = vi.fn();
-    const buyOnlySnapshot: Snapshot = {
-      ...mockSnapshot,
-      decisions: {
-        AAPL: { action: 'BUY', score: 80, reasoning: 'Buy signal' },
-      },
-    };
-    render(
-      <ArenaDecisionLog
-        snapshot={buyOnlySnapshot}
-        snapshots={[buyOnlySnapshot]}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+  it('should highlight BUY decision cards with green border', async () => {
+    serveDecisions({
+      AAPL: { action: 'BUY', score: 80, reasoning: 'Buy signal' },
+    });
+
+    renderLog(mockSnapshot, [mockSnapshot]);
 
     // Find the decision card (div with border and rounded-lg classes)
-    const aaplCard = screen.getByText('AAPL').closest('.rounded-lg');
+    const aaplCard = (await screen.findByText('AAPL')).closest('.rounded-lg');
     expect(aaplCard).toHaveClass('border-accent-bullish/30');
   });
 
-  it('should show IBS FILTERED badge when ibs_filtered is true', () => {
-    const mockOnSelect = vi.fn();
-    const ibsFilteredSnapshot: Snapshot = {
-      ...mockSnapshot,
-      decisions: {
-        AAPL: { action: 'BUY', score: 75, reasoning: null, ibs_filtered: true, ibs_value: 0.72 },
-      },
-    };
-    render(
-      <ArenaDecisionLog
-        snapshot={ibsFilteredSnapshot}
-        snapshots={[ibsFilteredSnapshot]}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+  it('should show IBS FILTERED badge when ibs_filtered is true', async () => {
+    serveDecisions({
+      AAPL: { action: 'BUY', score: 75, reasoning: null, ibs_filtered: true, ibs_value: 0.72 },
+    });
+
+    renderLog(mockSnapshot, [mockSnapshot]);
 
-    expect(screen.getByText('IBS FILTERED')).toBeInTheDocument();
+    expect(await screen.findByText('IBS FILTERED')).toBeInTheDocument();
   });
 
-  it('should display ibs_value when present in decision entry', () => {
-    const mockOnSelect = vi.fn();
-    const ibsValueSnapshot: Snapshot = {
-      ...mockSnapshot,
-      decisions: {
-        NVDA: { action: 'BUY', score: 65, reasoning: null, ibs_filtered: true, ibs_value: 0.72 },
-      },
-    };
-    render(
-      <ArenaDecisionLog
-        snapshot={ibsValueSnapshot}
-        snapshots={[ibsValueSnapshot]}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+  it('should display ibs_value when present in decision entry', async () => {
+    serveDecisions({
+      NVDA: { action: 'BUY', score: 65, reasoning: null, ibs_filtered: true, ibs_value: 0.72 },
+    });
 
-    expect(screen.getByText('0.72')).toBeInTheDocument();
+    renderLog(mockSnapshot, [mockSnapshot]);
+
+    expect(await screen.findByText('0.72')).toBeInTheDocument();
     // The IBS value is rendered with a label prefix
     expect(screen.getByText(/IBS:/)).toBeInTheDocument();
   });
 
-  it('should not show IBS FILTERED badge when ibs_filtered is absent', () => {
-    const mockOnSelect = vi.fn();
-    const normalSnapshot: Snapshot = {
-      ...mockSnapshot,
-      decisions: {
-        AAPL: { action: 'BUY', score: 80, reasoning: 'Buy signal' },
-      },
-    };
-    render(
-      <ArenaDecisionLog
-        snapshot={normalSnapshot}
-        snapshots={[normalSnapshot]}
-        onSelectSnapshot={mockOnSelect}
-      />
-    );
+  it('should not show IBS FILTERED badge when ibs_filtered is absent', async () => {
+    serveDecisions({
+      AAPL: { action: 'BUY', score: 80, reasoning: 'Buy signal' },
+    });
+
+    renderLog(mockSnapshot, [mockSnapshot]);
 
+    await screen.findByText('AAPL');
     expect(screen.queryByText('IBS FILTERED')).not.toBeInTheDocument();
   });
 });
@@ -3,7 +3,10 @@
  *
  * Displays agent decisions for each symbol, organized by snapshot/day.
  * Allows selecting different days to view historical decisions.
+ * Decisions with reasoning are fetched for the selected day only.
  */
+import { useEffect, useState } from 'react';
+import { Loader2 } from 'lucide-react';
 import { Badge } from '../ui/badge';
 import { Card, CardContent, CardHeader, CardTitle } from '../ui/card';
 import {
@@ -14,9 +17,12 @@ import {
   SelectValue,
 } from '../ui/select';
 import { cn } from '../../lib/utils';
-import type { Snapshot } from '../../types/arena';
+import { getSnapshotDecisions } from '../../services/arenaService';
+import type { DecisionEntry, Snapshot } from '../../types/arena';
 
 interface ArenaDecisionLogProps {
+  /** Simulation the snapshots belong to */
+  simulationId: number;
   /** Currently selected snapshot (or null if none) */
   snapshot: Snapshot | null;
   /** All available snapshots for day selection */
@@ -49,12 +55,42 @@ const getActionBadgeClass = (action: string): string => {
  * - Decision cards for each symbol showing action, score, reasoning
  * - Color-coded action badges (BUY=green, HOLD=blue, etc.)
  * - Scrollable decision list
+ * - Lazy loading: a day's decisions are requested when it is selected and
+ *   kept for revisits
  */
 export const ArenaDecisionLog = ({
+  simulationId,
   snapshot,
   snapshots,
   onSelectSnapshot,
 }: ArenaDecisionLogProps) => {
+  // Loaded decisions keyed by `${simulationId}:${day_number}`
+  const [loadedDays, setLoadedDays] = useState<Record<string, Record<string, DecisionEntry>>>({});
+  const [failedDayKey, setFailedDayKey] = useState<string | null>(null);
+
+  const dayNumber = snapshot?.day_number ?? null;
+  const dayKey = dayNumber === null ? null : `${simulationId}:${dayNumber}`;
+
+  useEffect(() => {
+    if (dayNumber === null || dayKey === null || loadedDays[dayKey]) return;
+
+    let cancelled = false;
+    setFailedDayKey(null);
+    getSnapshotDecisions(simulationId, dayNumber)
+      .then((data) => {
+        if (!cancelled) {
+          setLoadedDays((prev) => ({ ...prev, [dayKey]: data.decisions }));
+        }
+      })
+      .catch(() => {
+        if (!cancelled) setFailedDayKey(dayKey);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [simulationId, dayNumber, dayKey, loadedDays]);
+
   // Empty state - no snapshots yet
   if (!snapshot) {
     return (
@@ -71,7 +107,8 @@ export const ArenaDecisionLog = ({
     );
   }
 
-  const decisions = Object.entries(snapshot.decisions);
+  const dayDecisions = dayKey === null ? undefined : loadedDays[dayKey];
+  const decisions = dayDecisions ? Object.entries(dayDecisions) : [];
 
   return (
     <Card>
@@ -103,7 +140,16 @@ export const ArenaDecisionLog = ({
       </CardHeader>
       <CardContent>
         <div className="max-h-[300px] overflow-y-auto space-y-3">
-          {decisions.length === 0 ? (
+          {failedDayKey === dayKey ? (
+            <p className="text-sm text-destructive text-center py-4">
+              Failed to load decisions
+            </p>
+          ) : !dayDecisions ? (
+            <div className="flex items-center justify-center gap-2 py-4 text-sm text-muted-foreground">
+              <Loader2 className="h-4 w-4 animate-spin" />
+              Loading decisions...
+            </div>
+          ) : decisions.length === 0 ? (
             <p className="text-sm text-muted-foreground text-center py-4">
               No decisions for this day
             </p>
@@ -22,10 +22,11 @@ import { useChartTheme } from '../../hooks/useChartTheme';
 import { CHART_COLORS } from '../../constants/chartColors';
 import { getBenchmarkData } from '../../services/arenaService';
 import { ToggleGroup, ToggleGroupItem } from '../ui/toggle-group';
-import type { Snapshot } from '../../types/arena';
+import type { EquityCurvePoint } from '../../types/arena';
 
 interface ArenaEquityChartProps {
-  snapshots: Snapshot[];
+  /** Daily equity points (snapshots or GET /simulations/{id}/equity-curve) */
+  snapshots: EquityCurvePoint[];
   simulationId: number;
 }
 
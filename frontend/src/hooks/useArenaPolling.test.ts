@@ -2,14 +2,49 @@ import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { renderHook, act } from '@testing-library/react';
 import { useArenaPolling } from './useArenaPolling';
 import * as arenaService from '../services/arenaService';
-import type { SimulationDetail } from '../types/arena';
+import type { Position, SimulationDetail, Snapshot } from '../types/arena';
 
 // Mock the arena service
 vi.mock('../services/arenaService', () => ({
   getSimulation: vi.fn(),
+  listSimulationPositions: vi.fn(),
+  listSimulationSnapshots: vi.fn(),
   cancelSimulation: vi.fn(),
 }));
 
+const makeSnapshot = (dayNumber: number): Snapshot => ({
+  id: dayNumber + 1,
+  snapshot_date: `2024-01-${String(dayNumber + 2).padStart(2, '0')}`,
+  day_number: dayNumber,
+  cash: '10000',
+  positions_value: '0',
+  total_equity: '10000',
+  daily_pnl: '0',
+  daily_return_pct: '0',
+  cumulative_return_pct: '0',
+  open_position_count: 0,
+});
+
+const mockPosition: Position = {
+  id: 1,
+  symbol: 'AAPL',
+  status: 'open',
+  signal_date: '2024-01-05',
+  entry_date: '2024-01-06',
+  entry_price: '195.00',
+  shares: 5,
+  highest_price: '198.50',
+  current_stop: '185.25',
+  exit_date: null,
+  exit_price: null,
+  exit_reason: null,
+  realized_pnl: null,
+  return_pct: null,
+  agent_reasoning: null,
+  agent_score: 80,
+  sector: null,
+};
+
 const mockDetail: SimulationDetail = {
   simulation: {
     id: 1,
@@ -65,6 +100,14 @@ describe('useArenaPolling', () => {
   beforeEach(() => {
     vi.useFakeTimers();
     vi.clearAllMocks();
+    (arenaService.listSimulationPositions as ReturnType<typeof vi.fn>).mockResolvedValue({
+      items: [],
+      next_cursor: null,
+    });
+    (arenaService.listSimulationSnapshots as ReturnType<typeof vi.fn>).mockResolvedValue({
+      items: [],
+      next_cursor: null,
+    });
   });
 
   afterEach(() => {
@@ -97,6 +140,62 @@ describe('useArenaPolling', () => {
     expect(result.current.error).toBeNull();
   });
 
+  it('should page through positions and snapshots', async () => {
+    (arenaService.getSimulation as ReturnType<typeof vi.fn>).mockResolvedValue(mockCompletedDetail);
+    (arenaService.listSimulationSnapshots as ReturnType<typeof vi.fn>)
+      .mockResolvedValueOnce({ items: [makeSnapshot(0), makeSnapshot(1)], next_cursor: 1 })
+      .mockResolvedValueOnce({ items: [makeSnapshot(2)], next_cursor: null });
+    (arenaService.listSimulationPositions as ReturnType<typeof vi.fn>).mockResolvedValue({
+      items: [mockPosition],
+      next_cursor: null,
+    });
+
+    const { result } = renderHook(() => useArenaPolling(1));
+
+    await act(async () => {
+      await vi.runOnlyPendingTimersAsync();
+    });
+
+    expect(arenaService.listSimulationSnapshots).toHaveBeenCalledWith(1, null);
+    expect(arenaService.listSimulationSnapshots).toHaveBeenCalledWith(1, 1);
+    expect(result.current.detail?.snapshots.map((s) => s.day_number)).toEqual([0, 1, 2]);
+    expect(result.current.detail?.positions).toEqual([mockPosition]);
+  });
+
+  it('should fetch only new snapshots and reload positions when the day advances', async () => {
+    const getSimulation = arenaService.getSimulation as ReturnType<typeof vi.fn>;
+    const listSnapshots = arenaService.listSimulationSnapshots as ReturnType<typeof vi.fn>;
+    const listPositions = arenaService.listSimulationPositions as ReturnType<typeof vi.fn>;
+    getSimulation.mockResolvedValue(mockDetail);
+    listSnapshots.mockResolvedValueOnce({ items: [makeSnapshot(0)], next_cursor: null });
+
+    const { result } = renderHook(() => useArenaPolling(1));
+
+    await act(async () => {
+      await vi.runOnlyPendingTimersAsync();
+    });
+
+    // Same day: no new snapshots, positions not reloaded
+    await act(async () => {
+      await vi.advanceTimersByTimeAsync(2000);
+    });
+    expect(listSnapshots).toHaveBeenLastCalledWith(1, 0);
+    expect(listPositions).toHaveBeenCalledTimes(1);
+
+    // Next day: the new snapshot is appended and positions are reloaded
+    getSimulation.mockResolvedValue({
+      ...mockDetail,
+      simulation: { ...mockDetail.simulation, current_day: 11 },
+    });
+    listSnapshots.mockResolvedValueOnce({ items: [makeSnapshot(1)], next_cursor: null });
+    await act(async () => {
+      await vi.advanceTimersByTimeAsync(2000);
+    });
+
+    expect(result.current.detail?.snapshots.map((s) => s.day_number)).toEqual([0, 1]);
+    expect(listPositions).toHaveBeenCalledTimes(2);
+  });
+
   it('should stop polling when simulation is completed', async () => {
     (arenaService.getSimulation as ReturnType<typeof vi.fn>).mockResolvedValue(mockCompletedDetail);
 
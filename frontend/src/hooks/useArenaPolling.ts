@@ -2,13 +2,43 @@
  * Arena Polling Hook
  *
  * Polls a simulation's status until it reaches a terminal state.
+ * Positions and snapshots are read through the cursor-paginated endpoints.
  */
 import { useCallback, useEffect, useRef, useState } from 'react';
-import { cancelSimulation, getSimulation } from '../services/arenaService';
-import type { SimulationDetail } from '../types/arena';
+import {
+  cancelSimulation,
+  getSimulation,
+  listSimulationPositions,
+  listSimulationSnapshots,
+} from '../services/arenaService';
+import type { Position, SimulationDetail, Snapshot } from '../types/arena';
 
 const POLL_INTERVAL_MS = 2000; // 2 seconds
 
+/** Positions and snapshots loaded so far for one simulation */
+interface LoadedRows {
+  simulationId: number;
+  /** `${status}:${current_day}` when positions were loaded */
+  positionsProgress: string;
+  positions: Position[];
+  snapshots: Snapshot[];
+}
+
+/** Load every page of a cursor-paginated list, starting after `cursor` */
+const fetchAllPages = async <T>(
+  fetchPage: (cursor: number | null) => Promise<{ items: T[]; next_cursor: number | null }>,
+  cursor: number | null = null,
+): Promise<T[]> => {
+  const items: T[] = [];
+  let next = cursor;
+  do {
+    const page = await fetchPage(next);
+    items.push(...page.items);
+    next = page.next_cursor;
+  } while (next !== null);
+  return items;
+};
+
 interface UseArenaPollingReturn {
   /** Current simulation detail (null if no simulation) */
   detail: SimulationDetail | null;
@@ -29,6 +59,8 @@ interface UseArenaPollingReturn {
  *
  * Automatically polls the simulation status every 2 seconds until the
  * simulation reaches one of the terminal states: 'completed', 'cancelled', or 'failed'.
+ * Each poll fetches only snapshots after the last one loaded (snapshots are
+ * append-only) and reloads positions only when the simulation advanced.
  *
  * @param simulationId - Simulation ID to poll (null to disable polling)
  * @returns Object with detail data, polling state, cancel function, and error state
@@ -52,6 +84,7 @@ export const useArenaPolling = (
   const [error, setError] = useState<Error | null>(null);
   const [isCancelling, setIsCancelling] = useState(false);
   const pollingIntervalRef = useRef<NodeJS.Timeout | null>(null);
+  const loadedRef = useRef<LoadedRows | null>(null);
 
   // Clear polling interval
   const clearPolling = useCallback(() => {
@@ -68,7 +101,38 @@ export const useArenaPolling = (
 
     try {
       const data = await getSimulation(simulationId);
-      setDetail(data);
+      const { simulation } = data;
+
+      const previous = loadedRef.current;
+      const loaded: LoadedRows =
+        previous !== null && previous.simulationId === simulationId
+          ? previous
+          : { simulationId, positionsProgress: '', positions: [], snapshots: [] };
+
+      const lastDay = loaded.snapshots.at(-1)?.day_number ?? null;
+      const newSnapshots = await fetchAllPages(
+        (cursor) => listSimulationSnapshots(simulationId, cursor),
+        lastDay,
+      );
+
+      const progress = `${simulation.status}:${simulation.current_day}`;
+      const positions =
+        progress === loaded.positionsProgress
+          ? loaded.positions
+          : await fetchAllPages((cursor) => listSimulationPositions(simulationId, cursor));
+
+      // Re-read: an overlapping poll may have appended meanwhile
+      const latest = loadedRef.current;
+      const current =
+        latest !== null && latest.simulationId === simulationId ? latest : loaded;
+      const currentLastDay = current.snapshots.at(-1)?.day_number ?? -1;
+      const appended = newSnapshots.filter((s) => s.day_number > currentLastDay);
+      const snapshots = appended.length
+        ? [...current.snapshots, ...appended]
+        : current.snapshots;
+
+      loadedRef.current = { simulationId, positionsProgress: progress, positions, snapshots };
+      setDetail({ ...data, positions, snapshots });
       setError(null);
 
       // Stop polling if simulation reached terminal state
@@ -101,6 +165,7 @@ export const useArenaPolling = (
   // Start/stop polling based on simulationId
   useEffect(() => {
     // Reset state when simulationId changes
+    loadedRef.current = null;
     if (!simulationId) {
       clearPolling();
       setDetail(null);
@@ -3,7 +3,13 @@ import { fireEvent, render, screen, waitFor } from '@testing-library/react';
 import userEvent from '@testing-library/user-event';
 import { MemoryRouter, Route, Routes } from 'react-router-dom';
 import { ArenaSimulationDetail } from './ArenaSimulationDetail';
-import type { Position, Simulation, SimulationDetail, Snapshot } from '../types/arena';
+import type {
+  Position,
+  Simulation,
+  SimulationDetail,
+  Snapshot,
+  SnapshotDecisions,
+} from '../types/arena';
 
 // Mock useNavigate
 const mockNavigate = vi.fn();
@@ -19,8 +25,16 @@ vi.mock('react-router-dom', async () => {
 const mockGetSimulation = vi.fn();
 const mockCancelSimulation = vi.fn();
 const mockDeleteSimulation = vi.fn();
+const mockGetSnapshotDecisions = vi.fn();
+const mockListSimulationPositions = vi.fn();
+const mockListSimulationSnapshots = vi.fn();
+const mockGetSimulationEquityCurve = vi.fn();
 vi.mock('../services/arenaService', () => ({
   getSimulation: (...args: unknown[]) => mockGetSimulation(...args),
+  listSimulationPositions: (...args: unknown[]) => mockListSimulationPositions(...args),
+  listSimulationSnapshots: (...args: unknown[]) => mockListSimulationSnapshots(...args),
+  getSimulationEquityCurve: (...args: unknown[]) => mockGetSimulationEquityCurve(...args),
+  getSnapshotDecisions: (...args: unknown[]) => mockGetSnapshotDecisions(...args),
   cancelSimulation: (...args: unknown[]) => mockCancelSimulation(...args),
   deleteSimulation: (...args: unknown[]) => mockDeleteSimulation(...args),
 }));
@@ -102,17 +116,24 @@ const mockSnapshots: Snapshot[] = [
     daily_return_pct: '1.40',
     cumulative_return_pct: '8.30',
     open_position_count: 1,
-    decisions: {
-      AAPL: { action: 'HOLD', score: null, reasoning: 'Already holding' },
-      NVDA: { action: 'BUY', score: 80, reasoning: 'Score: 80/100' },
-    },
   },
 ];
 
+const mockSnapshotDecisions: SnapshotDecisions = {
+  simulation_id: 1,
+  day_number: 9,
+  snapshot_date: '2024-01-10',
+  decisions: {
+    AAPL: { action: 'HOLD', score: null, reasoning: 'Already holding' },
+    NVDA: { action: 'BUY', score: 80, reasoning: 'Score: 80/100' },
+  },
+};
+
+// Positions and snapshots come from the paginated endpoints, not the detail
 const mockSimulationDetail: SimulationDetail = {
   simulation: mockSimulation,
-  positions: mockPositions,
-  snapshots: mockSnapshots,
+  positions: [],
+  snapshots: [],
 };
 
 const renderWithRouter = (simulationId: string = '1') => {
@@ -129,6 +150,14 @@ describe('ArenaSimulationDetail', () => {
   beforeEach(() => {
     vi.clearAllMocks();
     mockGetSimulation.mockResolvedValue(mockSimulationDetail);
+    mockGetSnapshotDecisions.mockResolvedValue(mockSnapshotDecisions);
+    mockListSimulationPositions.mockResolvedValue({ items: mockPositions, next_cursor: null });
+    mockListSimulationSnapshots.mockResolvedValue({ items: mockSnapshots, next_cursor: null });
+    mockGetSimulationEquityCurve.mockResolvedValue({
+      simulation_id: 1,
+      portfolio_strategy: null,
+      snapshots: [{ snapshot_date: '2024-01-10', total_equity: '10830.00' }],
+    });
     mockCancelSimulation.mockResolvedValue(undefined);
     mockDeleteSimulation.mockResolvedValue(undefined);
   });
@@ -215,6 +244,43 @@ describe('ArenaSimulationDetail', () => {
     });
     // Check for day selector
     expect(screen.getByRole('combobox')).toBeInTheDocument();
+    // Reasoning comes from the selected (latest) day's decisions
+    expect(await screen.findByText('Already holding')).toBeInTheDocument();
+    expect(mockGetSnapshotDecisions).toHaveBeenCalledWith(1, 9);
+  });
+
+  it('should load summary, positions and snapshots without inline rows', async () => {
+    renderWithRouter();
+
+    await waitFor(() => {
+      expect(screen.getByText('Test Simulation')).toBeInTheDocument();
+    });
+
+    expect(mockGetSimulation).toHaveBeenCalledWith(1);
+    expect(mockListSimulationPositions).toHaveBeenCalledWith(1, null);
+    expect(mockListSimulationSnapshots).toHaveBeenCalledWith(1, null);
+  });
+
+  it('should load the equity curve for completed simulations', async () => {
+    renderWithRouter();
+
+    await waitFor(() => {
+      expect(mockGetSimulationEquityCurve).toHaveBeenCalledWith(1);
+    });
+  });
+
+  it('should not load the equity curve while running', async () => {
+    mockGetSimulation.mockResolvedValue({
+      ...mockSimulationDetail,
+      simulation: { ...mockSimulation, status: 'running', current_day: 10 },
+    });
+
+    renderWithRouter();
+
+    await waitFor(() => {
+      expect(screen.getByText('Processing in background...')).toBeInTheDocument();
+    });
+    expect(mockGetSimulationEquityCurve).not.toHaveBeenCalled();
   });
 
   it('should show progress bar for running simulation', async () => {
@@ -451,6 +517,14 @@ describe('ArenaSimulationDetail replay', () => {
   beforeEach(() => {
     vi.clearAllMocks();
     mockGetSimulation.mockResolvedValue(mockSimulationDetail);
+    mockGetSnapshotDecisions.mockResolvedValue(mockSnapshotDecisions);
+    mockListSimulationPositions.mockResolvedValue({ items: mockPositions, next_cursor: null });
+    mockListSimulationSnapshots.mockResolvedValue({ items: mockSnapshots, next_cursor: null });
+    mockGetSimulationEquityCurve.mockResolvedValue({
+      simulation_id: 1,
+      portfolio_strategy: null,
+      snapshots: [{ snapshot_date: '2024-01-10', total_equity: '10830.00' }],
+    });
     mockCancelSimulation.mockResolvedValue(undefined);
     mockDeleteSimulation.mockResolvedValue(undefined);
   });
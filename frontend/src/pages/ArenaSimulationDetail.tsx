@@ -29,9 +29,13 @@ import { Button } from '../components/ui/button';
 import { Card, CardContent } from '../components/ui/card';
 import { Progress } from '../components/ui/progress';
 import { useArenaPolling } from '../hooks/useArenaPolling';
-import { cancelSimulation, deleteSimulation } from '../services/arenaService';
+import {
+  cancelSimulation,
+  deleteSimulation,
+  getSimulationEquityCurve,
+} from '../services/arenaService';
 import { getPositionsForSnapshot, getStatusBadgeClass } from '../utils/arena';
-import type { Snapshot } from '../types/arena';
+import type { EquityCurvePoint, Snapshot } from '../types/arena';
 
 /**
  * Arena Simulation Detail Page
@@ -56,6 +60,9 @@ export const ArenaSimulationDetail = () => {
   // Track currently selected snapshot for decision log
   const [currentSnapshot, setCurrentSnapshot] = useState<Snapshot | null>(null);
 
+  // Equity curve for the chart, loaded once the simulation completes
+  const [equityCurve, setEquityCurve] = useState<EquityCurvePoint[]>([]);
+
   // Cancel/Delete state
   const [showCancelDialog, setShowCancelDialog] = useState(false);
   const [showDeleteDialog, setShowDeleteDialog] = useState(false);
@@ -68,6 +75,25 @@ export const ArenaSimulationDetail = () => {
     }
   }, [detail?.snapshots]);
 
+  // Load the equity curve when the simulation is complete
+  const simulationStatus = detail?.simulation.status;
+  useEffect(() => {
+    if (!simulationId || simulationStatus !== 'completed') return;
+
+    let cancelled = false;
+    getSimulationEquityCurve(simulationId)
+      .then((curve) => {
+        if (!cancelled) setEquityCurve(curve.snapshots);
+      })
+      .catch(() => {
+        if (!cancelled) setEquityCurve([]);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [simulationId, simulationStatus]);
+
   // Show completion toast
   useEffect(() => {
     if (detail?.simulation.status === 'completed' && !isPolling) {
@@ -286,6 +312,7 @@ export const ArenaSimulationDetail = () => {
           snapshot={currentSnapshot}
         />
         <ArenaDecisionLog
+          simulationId={simulation.id}
           snapshot={currentSnapshot}
           snapshots={snapshots}
           onSelectSnapshot={setCurrentSnapshot}
@@ -310,11 +337,11 @@ export const ArenaSimulationDetail = () => {
       )}
 
       {/* Equity Curve Chart */}
-      {isComplete && snapshots.length > 0 && (
+      {isComplete && equityCurve.length > 0 && (
         <Card>
           <CardContent className="pt-6">
             <h2 className="text-sm font-semibold mb-4">Portfolio Equity</h2>
-            <ArenaEquityChart snapshots={snapshots} simulationId={simulation.id} />
+            <ArenaEquityChart snapshots={equityCurve} simulationId={simulation.id} />
           </CardContent>
         </Card>
       )}
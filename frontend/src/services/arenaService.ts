@@ -12,9 +12,13 @@ import type {
   ComparisonResponse,
   CreateComparisonRequest,
   CreateSimulationRequest,
+  PositionPage,
   Simulation,
   SimulationDetail,
+  SimulationEquityCurve,
   SimulationListResponse,
+  SnapshotDecisions,
+  SnapshotPage,
 } from '../types/arena';
 
 const API_BASE = '/v1/arena';
@@ -63,14 +67,91 @@ export const listSimulations = async (
 };
 
 /**
- * Get simulation detail with positions and snapshots
+ * Get simulation summary
+ *
+ * Positions and snapshots are left out (empty arrays); load them with
+ * listSimulationPositions / listSimulationSnapshots.
  *
  * @param id - Simulation ID
- * @returns Promise resolving to simulation detail
+ * @returns Promise resolving to simulation detail without positions and snapshots
  */
 export const getSimulation = async (id: number): Promise<SimulationDetail> => {
   const response = await apiClient.get<SimulationDetail>(
-    `${API_BASE}/simulations/${id}`
+    `${API_BASE}/simulations/${id}`,
+    { params: { include_positions: false, include_snapshots: false } }
+  );
+  return response.data;
+};
+
+/**
+ * List one page of a simulation's positions, oldest first
+ *
+ * @param id - Simulation ID
+ * @param cursor - next_cursor of the previous page (null for the first page)
+ * @param limit - Maximum positions per page (default: 1000)
+ * @returns Promise resolving to the page and the next page's cursor
+ */
+export const listSimulationPositions = async (
+  id: number,
+  cursor: number | null = null,
+  limit = 1000,
+): Promise<PositionPage> => {
+  const response = await apiClient.get<PositionPage>(
+    `${API_BASE}/simulations/${id}/positions`,
+    { params: { limit, ...(cursor !== null && { cursor }) } },
+  );
+  return response.data;
+};
+
+/**
+ * List one page of a simulation's daily snapshots, without decisions
+ *
+ * @param id - Simulation ID
+ * @param cursor - Day number to continue after (null for the first page)
+ * @param limit - Maximum snapshots per page (default: 1000)
+ * @returns Promise resolving to the page and the next page's cursor
+ */
+export const listSimulationSnapshots = async (
+  id: number,
+  cursor: number | null = null,
+  limit = 1000,
+): Promise<SnapshotPage> => {
+  const response = await apiClient.get<SnapshotPage>(
+    `${API_BASE}/simulations/${id}/snapshots`,
+    { params: { limit, ...(cursor !== null && { cursor }) } },
+  );
+  return response.data;
+};
+
+/**
+ * Get a simulation's equity curve (snapshot_date + total_equity per day)
+ *
+ * @param id - Simulation ID
+ * @returns Promise resolving to the equity curve
+ */
+export const getSimulationEquityCurve = async (id: number): Promise<SimulationEquityCurve> => {
+  const response = await apiClient.get<SimulationEquityCurve>(
+    `${API_BASE}/simulations/${id}/equity-curve`,
+  );
+  return response.data;
+};
+
+/**
+ * Get one simulation day's decisions with the agent's reasoning
+ *
+ * Snapshots store decisions without reasoning, so the backend re-runs the
+ * agent for that day; fetch only for the day being viewed.
+ *
+ * @param id - Simulation ID
+ * @param dayNumber - Snapshot day number (0-indexed)
+ * @returns Promise resolving to the day's decisions keyed by symbol
+ */
+export const getSnapshotDecisions = async (
+  id: number,
+  dayNumber: number,
+): Promise<SnapshotDecisions> => {
+  const response = await apiClient.get<SnapshotDecisions>(
+    `${API_BASE}/simulations/${id}/snapshots/${dayNumber}/decisions`,
   );
   return response.data;
 };
@@ -138,15 +138,46 @@ export interface Snapshot {
   daily_return_pct: string;
   cumulative_return_pct: string;
   open_position_count: number;
+  /** Agent decisions keyed by symbol, without reasoning (only with include_decisions=true) */
+  decisions?: Record<string, DecisionEntry> | null;
+}
+
+/** One simulation day's agent decisions, with reasoning */
+export interface SnapshotDecisions {
+  simulation_id: number;
+  day_number: number;
+  snapshot_date: string;
   /** Agent decisions keyed by symbol */
   decisions: Record<string, DecisionEntry>;
 }
 
+/** Regime filter's market regime on one trading day */
+export interface RegimePoint {
+  date: string;
+  regime: 'bull' | 'bear' | 'neutral';
+}
+
+/** One page of a simulation's positions, oldest first */
+export interface PositionPage {
+  items: Position[];
+  /** Cursor for the next page (null on the last page) */
+  next_cursor: number | null;
+}
+
+/** One page of a simulation's daily snapshots, in day order */
+export interface SnapshotPage {
+  items: Snapshot[];
+  /** Cursor for the next page (null on the last page) */
+  next_cursor: number | null;
+}
+
 /** Full simulation detail with positions and snapshots */
 export interface SimulationDetail {
   simulation: Simulation;
   positions: Position[];
   snapshots: Snapshot[];
+  /** Market regime per trading day; only present with include_regime=true */
+  regime?: RegimePoint[] | null;
 }
 
 /** Request body for creating a new simulation */
@@ -17,7 +17,8 @@
  * queries. Tests assert the chart container div is present, not canvas internals.
  *
  * Route: /arena/:id (maps to ArenaSimulationDetail component)
- * API calls: GET /api/v1/arena/simulations/:id
+ * API calls: GET /api/v1/arena/simulations/:id (summary only), /positions,
+ * /snapshots, /equity-curve and /snapshots/:day/decisions
  */
 
 import { test, expect } from '@playwright/test';
@@ -183,10 +184,11 @@ const buildMockSnapshots = () => {
 
 const mockSnapshots = buildMockSnapshots();
 
+// Requested with include_positions=false&include_snapshots=false
 const mockSimulationDetail = {
   simulation: mockCompletedSimulation,
-  positions: mockClosedPositions,
-  snapshots: mockSnapshots,
+  positions: [],
+  snapshots: [],
 };
 
 // ---------------------------------------------------------------------------
@@ -196,7 +198,7 @@ const mockSimulationDetail = {
 const setupMocks = async (page: import('@playwright/test').Page) => {
   // Mock the simulation detail endpoint: GET /api/v1/arena/simulations/1
   // The route /arena/1 in the app maps to ArenaSimulationDetail with id=1
-  await page.route('**/api/v1/arena/simulations/1', async (route) => {
+  await page.route(/\/api\/v1\/arena\/simulations\/1(\?.*)?$/, async (route) => {
     if (route.request().method() === 'GET') {
       await route.fulfill({
         status: 200,
@@ -208,6 +210,53 @@ const setupMocks = async (page: import('@playwright/test').Page) => {
     }
   });
 
+  // Positions and snapshots are read through the cursor-paginated endpoints
+  await page.route('**/api/v1/arena/simulations/1/positions**', async (route) => {
+    await route.fulfill({
+      status: 200,
+      contentType: 'application/json',
+      body: JSON.stringify({ items: mockClosedPositions, next_cursor: null }),
+    });
+  });
+  await page.route(/\/api\/v1\/arena\/simulations\/1\/snapshots(\?.*)?$/, async (route) => {
+    await route.fulfill({
+      status: 200,
+      contentType: 'application/json',
+      body: JSON.stringify({ items: mockSnapshots, next_cursor: null }),
+    });
+  });
+
+  // Decisions of the selected day (the latest one on load)
+  await page.route('**/api/v1/arena/simulations/1/snapshots/*/decisions', async (route) => {
+    const last = mockSnapshots[mockSnapshots.length - 1];
+    await route.fulfill({
+      status: 200,
+      contentType: 'application/json',
+      body: JSON.stringify({
+        simulation_id: 1,
+        day_number: last.day_number,
+        snapshot_date: last.snapshot_date,
+        decisions: {},
+      }),
+    });
+  });
+
+  // The equity chart reads the lightweight equity curve
+  await page.route('**/api/v1/arena/simulations/1/equity-curve**', async (route) => {
+    await route.fulfill({
+      status: 200,
+      contentType: 'application/json',
+      body: JSON.stringify({
+        simulation_id: 1,
+        portfolio_strategy: null,
+        snapshots: mockSnapshots.map(({ snapshot_date, total_equity }) => ({
+          snapshot_date,
+          total_equity,
+        })),
+      }),
+    });
+  });
+
   // Mock benchmark requests (triggered when SPY/QQQ toggle is clicked)
   await page.route('**/api/v1/arena/simulations/1/benchmark**', async (route) => {
     await route.fulfill({